@@ -2,20 +2,77 @@
 
 import logging
 import uuid as uuid_lib
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+from apps.core.services.index_writer import get_index_writer
 from apps.core.services.s3_model_storage import S3ModelStorage
 
 logger = logging.getLogger(__name__)
 
+# Counters summed over every scan in stats.json
+STAT_FIELDS = ('total_issues', 'critical_issues', 'warning_issues', 'info_issues', 'score')
+# Newest scans kept in stats.json; more than the dashboard shows so deletes rarely drain it
+RECENT_SCANS_KEPT = 20
+# Issues kept per recent scan
+RECENT_ISSUES_PER_SCAN = 50
+# Score histogram buckets: 0-9, 10-19, ..., 90-100
+SCORE_BUCKETS = 10
+# Rebuilds retried when a concurrent stats update lands mid-rebuild
+REBUILD_ATTEMPTS = 3
+
+
+def _score_bucket(score) -> int:
+    return max(0, min(int(score or 0) // 10, SCORE_BUCKETS - 1))
+
+
+def _recent_entry(scan: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact summary of a scan for the recent-scans list."""
+    return {
+        'scan_id': scan.get('scan_id') or scan.get('uuid'),
+        'url': scan.get('url', ''),
+        'score': scan.get('score', 0),
+        'total_issues': scan.get('total_issues', 0),
+        'critical_issues': scan.get('critical_issues', 0),
+        'warning_issues': scan.get('warning_issues', 0),
+        'info_issues': scan.get('info_issues', 0),
+        'scanned_by': scan.get('scanned_by'),
+        'created_at': scan.get('created_at', ''),
+        'issues': (scan.get('issues') or [])[:RECENT_ISSUES_PER_SCAN],
+    }
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {
+        'count': 0,
+        'sums': {field: 0 for field in STAT_FIELDS},
+        'score_histogram': [0] * SCORE_BUCKETS,
+        'recent': [],
+    }
+
+
+def _apply_scans(stats: Dict[str, Any], scans: List[Dict[str, Any]], sign: int) -> None:
+    """Add (sign=1) or remove (sign=-1) scans' contribution to the aggregates."""
+    stats['count'] += sign * len(scans)
+    for scan in scans:
+        for field in STAT_FIELDS:
+            stats['sums'][field] += sign * (scan.get(field) or 0)
+        stats['score_histogram'][_score_bucket(scan.get('score'))] += sign
+
 
 class AccessibilityScanStorageService(S3ModelStorage):
-    """Storage service for accessibility scans using S3 JSON storage."""
+    """
+    Storage service for accessibility scans using S3 JSON storage.
+    
+    Alongside the index, ``stats.json`` holds running aggregates (scan count,
+    issue and score sums, score histogram) and the newest scans, updated on
+    every create/update/delete, so the dashboard needs a single read.
+    """
     
     def __init__(self):
         """Initialize accessibility scan storage service."""
         super().__init__(model_name='accessibility_scans')
+        self.stats_key = f"{self.models_prefix}stats.json"
     
     def _extract_metadata(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract metadata fields for scan index."""
@@ -26,6 +83,8 @@ class AccessibilityScanStorageService(S3ModelStorage):
             'score': data.get('score', 0),
             'total_issues': data.get('total_issues', 0),
             'critical_issues': data.get('critical_issues', 0),
+            'warning_issues': data.get('warning_issues', 0),
+            'info_issues': data.get('info_issues', 0),
             'scanned_by': data.get('scanned_by'),  # UUID string
             'created_at': data.get('created_at', ''),
         }
@@ -69,3 +128,140 @@ class AccessibilityScanStorageService(S3ModelStorage):
     def delete_scan(self, scan_id: str) -> bool:
         """Delete a scan."""
         return self.delete(scan_id)
+    
+    def create(self, data: Dict[str, Any], item_uuid: Optional[str] = None) -> Dict[str, Any]:
+        created = super().create(data, item_uuid)
+        self._update_stats(added=[created])
+        return created
+    
+    def _on_item_replaced(
+        self,
+        item_uuid: str,
+        previous: Optional[Dict[str, Any]],
+        current: Optional[Dict[str, Any]]
+    ) -> None:
+        # ``previous`` is the index entry this write replaced, so two racing
+        # updates each remove the version they actually overwrote
+        self._update_stats(added=[current], removed=[previous])
+    
+    def batch_create(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        created = super().batch_create(items)
+        self._update_stats(added=created)
+        return created
+    
+    def batch_delete(self, item_uuids: List[str]) -> int:
+        # Index metadata carries every aggregated field, so no item reads are needed
+        wanted = set(item_uuids)
+        removed = [meta for meta in self._read_index().get('items', []) if meta.get('uuid') in wanted]
+        deleted = super().batch_delete(item_uuids)
+        if deleted:
+            self._update_stats(removed=removed)
+        return deleted
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Aggregates over all scans plus the newest ones.
+        
+        Returns:
+            ``{'count', 'sums': {field: total}, 'average_score',
+            'score_histogram': [10 buckets], 'recent': [scan summaries]}``
+        """
+        stats = self.s3_json_storage.read_json(self.stats_key, readonly=True)
+        if stats is None or len(stats.get('recent', [])) < min(stats.get('count', 0), RECENT_SCANS_KEPT // 2):
+            # Missing (first use, failed update) or drained by deletes
+            stats = self.rebuild_stats()
+        count = stats.get('count', 0)
+        return {
+            **stats,
+            'average_score': stats['sums']['score'] / count if count else 0,
+        }
+    
+    def rebuild_stats(self) -> Dict[str, Any]:
+        """
+        Recompute stats.json from index.json.
+        
+        Reads only the index plus the newest scans (for their issues); index
+        entries written before warning/info counts were indexed fall back to
+        reading the scan.
+        
+        The result is committed through the stats IndexWriter only if
+        stats.json still has the version seen before the index was read;
+        otherwise an update landed in between and the rebuild starts over.
+        """
+        for _ in range(REBUILD_ATTEMPTS):
+            seen, _etag = self.s3_json_storage.read_json_versioned(self.stats_key)
+            seen_version = (seen or {}).get('version', 0)
+            stats = self._compute_stats()
+            stats['version'] = seen_version + 1
+            outcome = {'committed': False}
+            
+            def mutate(current: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+                outcome['committed'] = (current or {}).get('version', 0) == seen_version
+                return stats if outcome['committed'] else current
+            
+            get_index_writer(self.s3_json_storage, self.stats_key).submit(self.s3_json_storage, mutate)
+            if outcome['committed']:
+                logger.info(f"Rebuilt {self.model_name} stats: {stats['count']} scans")
+                return stats
+        logger.warning(f"Stats of {self.model_name} kept changing during rebuild; serving an unsaved rebuild")
+        return stats
+    
+    def _compute_stats(self) -> Dict[str, Any]:
+        stats = _empty_stats()
+        metas = self._read_index().get('items', [])
+        scans = []
+        for meta in metas:
+            if 'warning_issues' not in meta or 'info_issues' not in meta:
+                meta = self.get(meta.get('uuid')) or meta
+            scans.append(meta)
+        _apply_scans(stats, scans, 1)
+        
+        newest = sorted(scans, key=lambda s: s.get('created_at') or '', reverse=True)[:RECENT_SCANS_KEPT]
+        stats['recent'] = [_recent_entry(self.get(s.get('uuid')) or s) for s in newest]
+        stats['updated_at'] = datetime.utcnow().isoformat()
+        return stats
+    
+    def _update_stats(
+        self,
+        added: Optional[List[Dict[str, Any]]] = None,
+        removed: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Apply scan changes to stats.json through the model's IndexWriter.
+        
+        An update is a removal of the old version plus an addition of the new
+        one. If stats.json does not exist yet it is left for get_stats to
+        build; if the write fails it is removed so it gets rebuilt.
+        """
+        added = [scan for scan in added or [] if scan]
+        removed = [scan for scan in removed or [] if scan]
+        if not added and not removed:
+            return
+        removed_ids = {scan.get('scan_id') or scan.get('uuid') for scan in removed}
+        entries = [_recent_entry(scan) for scan in added]
+        
+        def mutate(stats: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            if stats is None:
+                return None
+            _apply_scans(stats, removed, -1)
+            _apply_scans(stats, added, 1)
+            added_ids = {entry['scan_id'] for entry in entries}
+            recent = [
+                entry for entry in stats.get('recent', [])
+                if entry.get('scan_id') not in removed_ids and entry.get('scan_id') not in added_ids
+            ]
+            recent.extend(entries)
+            recent.sort(key=lambda entry: entry.get('created_at') or '', reverse=True)
+            stats['recent'] = recent[:RECENT_SCANS_KEPT]
+            stats['updated_at'] = datetime.utcnow().isoformat()
+            stats['version'] = stats.get('version', 0) + 1
+            return stats
+        
+        try:
+            get_index_writer(self.s3_json_storage, self.stats_key).submit(self.s3_json_storage, mutate)
+        except Exception as e:
+            logger.warning(f"Stats update failed for {self.model_name}: {e}")
+            try:
+                self.s3_json_storage.delete_json(self.stats_key)
+            except Exception:
+                pass
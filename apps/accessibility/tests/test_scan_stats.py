@@ -0,0 +1,97 @@
+"""Tests for the pre-aggregated accessibility scan statistics."""
+from django.test import SimpleTestCase
+
+from apps.accessibility.services.scan_storage_service import AccessibilityScanStorageService
+from apps.core.tests.test_s3_model_batch import CountingJSONStorage
+
+
+def _issues(critical=0, serious=0, minor=0):
+    return (
+        [{'severity': 'critical'}] * critical
+        + [{'severity': 'serious'}] * serious
+        + [{'severity': 'minor'}] * minor
+    )
+
+
+class ScanStatsTest(SimpleTestCase):
+
+    def setUp(self):
+        self.storage = AccessibilityScanStorageService()
+        self.storage.model_name = self.storage.cache_prefix = f'scans-{id(self)}:'
+        self.json = self.storage.s3_json_storage = CountingJSONStorage()
+
+    def _seed(self):
+        self.first = self.storage.create_scan('https://a.test', _issues(critical=2, minor=1), score=95)
+        self.storage.get_stats()  # materialize stats.json
+        self.second = self.storage.create_scan('https://b.test', _issues(serious=3), score=40)
+
+    def test_stats_are_maintained_on_create_update_delete(self):
+        self._seed()
+        stats = self.storage.get_stats()
+        self.assertEqual(stats['count'], 2)
+        self.assertEqual(stats['sums']['total_issues'], 6)
+        self.assertEqual(stats['sums']['critical_issues'], 2)
+        self.assertEqual(stats['sums']['warning_issues'], 3)
+        self.assertEqual(stats['average_score'], 67.5)
+        self.assertEqual(stats['score_histogram'][9], 1)
+        self.assertEqual([s['url'] for s in stats['recent']], ['https://b.test', 'https://a.test'])
+
+        self.storage.update(self.second['scan_id'], {'score': 100})
+        stats = self.storage.get_stats()
+        self.assertEqual((stats['score_histogram'][4], stats['score_histogram'][9]), (0, 2))
+        self.assertEqual(stats['recent'][0]['score'], 100)
+
+        self.storage.delete_scan(self.first['scan_id'])
+        stats = self.storage.get_stats()
+        self.assertEqual((stats['count'], stats['sums']['total_issues']), (1, 3))
+        self.assertEqual([s['scan_id'] for s in stats['recent']], [self.second['scan_id']])
+
+    def test_dashboard_stats_read_no_scan_objects(self):
+        self._seed()
+        self.storage.batch_create([{'url': f'https://{n}.test', 'score': 50, 'total_issues': 1} for n in range(30)])
+        self.json.reads.clear()
+        stats = self.storage.get_stats()
+        self.assertEqual(self.json.reads, [self.storage.stats_key])
+        self.assertEqual(stats['count'], 32)
+        self.assertEqual(len(stats['recent']), 20)
+
+    def test_missing_stats_are_rebuilt_from_the_index(self):
+        self._seed()
+        expected = self.storage.get_stats()
+        del self.json.objects[self.storage.stats_key]
+        rebuilt = self.storage.get_stats()
+        self.assertEqual(rebuilt['sums'], expected['sums'])
+        self.assertEqual(rebuilt['score_histogram'], expected['score_histogram'])
+        self.assertEqual(len(rebuilt['recent'][1]['issues']), 3)
+
+    def test_update_and_delete_read_the_scan_once(self):
+        self._seed()
+        scan_key = self.storage._get_item_key(self.second['scan_id'])
+        self.json.reads.clear()
+        self.storage.update(self.second['scan_id'], {'score': 100})
+        self.storage.delete_scan(self.second['scan_id'])
+        self.assertEqual(self.json.reads.count(scan_key), 2)
+        stats = self.storage.get_stats()
+        self.assertEqual((stats['count'], stats['sums']['score']), (1, 95))
+
+    def test_rebuild_retries_when_an_update_lands_mid_rebuild(self):
+        self._seed()
+        del self.json.objects[self.storage.stats_key]
+        self.storage.get_stats()
+        read_index = self.storage._read_index
+        calls = []
+
+        def racing_read_index():
+            index = read_index()
+            if not calls:
+                # Another process applies an update after this index read
+                stats = self.json.objects[self.storage.stats_key]
+                self.json.objects[self.storage.stats_key] = {**stats, 'version': stats['version'] + 1}
+            calls.append(1)
+            return index
+
+        self.storage._read_index = racing_read_index
+        stats = self.storage.rebuild_stats()
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.json.objects[self.storage.stats_key]['version'], stats['version'])
+        self.assertEqual(stats['count'], 2)
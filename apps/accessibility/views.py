@@ -9,20 +9,10 @@ def accessibility_view(request):
     """Accessibility testing dashboard."""
     storage = AccessibilityScanStorageService()
     
-    # Get recent scans
-    scans_result = storage.list(limit=10, offset=0, order_by='created_at', reverse=True)
-    scans = scans_result.get('items', [])
-    
-    # Calculate stats from all scans
-    all_scans = storage.list(limit=None, offset=0)
-    total_issues = sum(scan.get('total_issues', 0) for scan in all_scans.get('items', []))
-    critical = sum(scan.get('critical_issues', 0) for scan in all_scans.get('items', []))
-    warning = sum(scan.get('warning_issues', 0) for scan in all_scans.get('items', []))
-    info = sum(scan.get('info_issues', 0) for scan in all_scans.get('items', []))
-    
-    # Calculate compliance score (average of all scan scores)
-    scan_scores = [scan.get('score', 0) for scan in all_scans.get('items', [])]
-    compliance_score = sum(scan_scores) / len(scan_scores) if scan_scores else 0
+    # Aggregates and newest scans come from one pre-computed stats document
+    scan_stats = storage.get_stats()
+    scans = scan_stats['recent'][:10]
+    sums = scan_stats['sums']
     
     # Collect all issues
     issues = []
@@ -33,11 +23,12 @@ def accessibility_view(request):
         'scans': scans,
         'issues': issues[:50],  # Limit to 50 most recent issues
         'stats': {
-            'total_issues': total_issues,
-            'critical': critical,
-            'warning': warning,
-            'info': info,
-            'compliance_score': f'{compliance_score:.1f}%'
+            'total_issues': sums['total_issues'],
+            'critical': sums['critical_issues'],
+            'warning': sums['warning_issues'],
+            'info': sums['info_issues'],
+            'compliance_score': f"{scan_stats['average_score']:.1f}%",
+            'score_histogram': scan_stats['score_histogram'],
         }
     }
     return render(request, 'accessibility/dashboard.html', context)
@@ -3,17 +3,63 @@ Logs API Client - HTTP client for Lambda logs.api REST endpoints.
 
 Uses X-API-Key authentication. When LOGS_API_URL and LOGS_API_KEY are configured,
 admin logs page fetches from Lambda logs.api instead of GraphQL.
+
+All instances share one keep-alive ``httpx.Client`` (HTTP/2 when the h2 package
+is installed), GET responses are cached briefly in the Django cache, and
+``fetch_parallel`` issues the several calls a page needs concurrently.
 """
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 import httpx
 from django.conf import settings
+from django.core.cache import cache
 
 from apps.core.exceptions import LambdaAPIError
 
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_http_clients: Dict[float, httpx.Client] = {}
+_http_clients_lock = threading.Lock()
+
+
+def get_http_client(timeout: float) -> httpx.Client:
+    """The process-wide pooled client for the logs API (one per timeout)."""
+    client = _http_clients.get(timeout)
+    if client is None:
+        with _http_clients_lock:
+            client = _http_clients.get(timeout)
+            if client is None:
+                max_connections = getattr(settings, "LOGS_API_MAX_CONNECTIONS", 20)
+                client = httpx.Client(
+                    timeout=timeout,
+                    http2=HTTP2_AVAILABLE and getattr(settings, "LOGS_API_HTTP2", True),
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_connections,
+                    ),
+                )
+                _http_clients[timeout] = client
+    return client
+
+
+def reset_http_clients() -> None:
+    """Close and drop the pooled clients (tests, settings changes)."""
+    with _http_clients_lock:
+        for client in _http_clients.values():
+            client.close()
+        _http_clients.clear()
+
 
 class LogsApiClient:
     """Client for Lambda logs.api REST endpoints."""
@@ -43,54 +89,80 @@ class LogsApiClient:
         path: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
+        cache_ttl: int = 0,
+    ) -> Dict[str, Any]:
+        """Send a request; responses are cached for ``cache_ttl`` seconds when set."""
+        cache_key = None
+        if cache_ttl > 0:
+            fingerprint = json.dumps(
+                [self.base_url, self.api_key, method, path, params, json_data],
+                sort_keys=True,
+                default=str,
+            )
+            cache_key = f"logs_api:{hashlib.sha256(fingerprint.encode()).hexdigest()}"
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        data = self._send(method, path, params, json_data)
+        if cache_key:
+            cache.set(cache_key, data, cache_ttl)
+        return data
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
     ) -> Dict[str, Any]:
         url = f"{self.base_url}{path}"
-        with httpx.Client(timeout=self.timeout) as client:
-            try:
-                resp = client.request(
-                    method=method,
-                    url=url,
-                    headers=self._headers(),
-                    params=params,
-                    json=json_data,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                if not isinstance(data, dict):
-                    raise LambdaAPIError(
-                        "Invalid response format",
-                        endpoint=path,
-                        status_code=resp.status_code,
-                    )
-                if not data.get("success", True):
-                    raise LambdaAPIError(
-                        data.get("detail", "Request failed"),
-                        endpoint=path,
-                        status_code=resp.status_code,
-                    )
-                return data
-            except httpx.HTTPStatusError as e:
-                detail = "Unknown error"
-                try:
-                    err_body = e.response.json()
-                    if isinstance(err_body, dict) and "detail" in err_body:
-                        detail = (
-                            err_body["detail"]
-                            if isinstance(err_body["detail"], str)
-                            else str(err_body["detail"])
-                        )
-                except Exception:
-                    detail = e.response.text or str(e)
+        client = get_http_client(self.timeout)
+        try:
+            resp = client.request(
+                method=method,
+                url=url,
+                headers=self._headers(),
+                params=params,
+                json=json_data,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            if not isinstance(data, dict):
                 raise LambdaAPIError(
-                    detail,
+                    "Invalid response format",
                     endpoint=path,
-                    status_code=e.response.status_code,
-                ) from e
-            except httpx.RequestError as e:
+                    status_code=resp.status_code,
+                )
+            if not data.get("success", True):
                 raise LambdaAPIError(
-                    str(e),
+                    data.get("detail", "Request failed"),
                     endpoint=path,
-                ) from e
+                    status_code=resp.status_code,
+                )
+            return data
+        except httpx.HTTPStatusError as e:
+            detail = "Unknown error"
+            try:
+                err_body = e.response.json()
+                if isinstance(err_body, dict) and "detail" in err_body:
+                    detail = (
+                        err_body["detail"]
+                        if isinstance(err_body["detail"], str)
+                        else str(err_body["detail"])
+                    )
+            except Exception:
+                detail = e.response.text or str(e)
+            raise LambdaAPIError(
+                detail,
+                endpoint=path,
+                status_code=e.response.status_code,
+            ) from e
+        except httpx.RequestError as e:
+            raise LambdaAPIError(
+                str(e),
+                endpoint=path,
+            ) from e
 
     def get_statistics(
         self,
@@ -111,6 +183,7 @@ class LogsApiClient:
             "GET",
             "/logs/statistics",
             params={"time_range": time_range, "period": period},
+            cache_ttl=getattr(settings, "LOGS_API_STATS_CACHE_TTL", 60),
         )
         d = data.get("data") or {}
         return {
@@ -173,7 +246,12 @@ class LogsApiClient:
         if end_time:
             params["end_time"] = end_time
 
-        data = self._request("GET", "/logs/", params=params)
+        data = self._request(
+            "GET",
+            "/logs/",
+            params=params,
+            cache_ttl=getattr(settings, "LOGS_API_QUERY_CACHE_TTL", 15),
+        )
         d = data.get("data") or {}
         items = d.get("items") or []
         total = d.get("total", 0)
@@ -220,7 +298,12 @@ class LogsApiClient:
         if end_time:
             params["end_time"] = end_time
 
-        data = self._request("GET", "/logs/search", params=params)
+        data = self._request(
+            "GET",
+            "/logs/search",
+            params=params,
+            cache_ttl=getattr(settings, "LOGS_API_QUERY_CACHE_TTL", 15),
+        )
         d = data.get("data") or {}
         items = d.get("items") or []
         total = d.get("total", 0)
@@ -228,3 +311,20 @@ class LogsApiClient:
             "items": [self._normalize_log(x) for x in items],
             "total": total,
         }
+
+    def fetch_parallel(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """Run several independent calls concurrently over the shared pool.
+
+        Args:
+            calls: Name -> zero-argument callable (e.g. a lambda around
+                get_statistics or query_logs)
+
+        Returns:
+            Name -> result. The first failure (in ``calls`` order) is raised
+            after all calls have finished.
+        """
+        if len(calls) <= 1:
+            return {name: call() for name, call in calls.items()}
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = {name: executor.submit(call) for name, call in calls.items()}
+        return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,84 @@
+"""Tests for the pooled, cached logs API client."""
+import threading
+import time
+from unittest import mock
+
+import httpx
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from apps.admin.services import logs_api_client
+from apps.admin.services.logs_api_client import LogsApiClient, get_http_client, reset_http_clients
+from apps.admin.utils import time_range_to_iso
+from apps.core.exceptions import LambdaAPIError
+
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'logs-api-tests'}}
+
+
+@override_settings(CACHES=LOCMEM, LOGS_API_STATS_CACHE_TTL=60, LOGS_API_QUERY_CACHE_TTL=15)
+class LogsApiClientTest(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        reset_http_clients()
+        self.requests = []
+        self.delay = 0
+        transport = httpx.MockTransport(self._handle)
+        real_client = httpx.Client
+        patcher = mock.patch.object(
+            logs_api_client.httpx, 'Client', lambda **kwargs: real_client(transport=transport, **kwargs)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(reset_http_clients)
+        self.client = LogsApiClient(base_url='https://logs.test', api_key='key')
+
+    def _handle(self, request):
+        self.requests.append((request.url.path, threading.get_ident()))
+        time.sleep(self.delay)
+        if request.url.path == '/logs/statistics':
+            return httpx.Response(200, json={'data': {'total_logs': 7}})
+        if request.url.params.get('level') == 'broken':
+            return httpx.Response(500, json={'detail': 'boom'})
+        return httpx.Response(200, json={'data': {'items': [{'id': '1', 'message': 'hi'}], 'total': 1}})
+
+    def test_clients_share_one_pool(self):
+        other = LogsApiClient(base_url='https://logs.test', api_key='key')
+        self.assertIs(get_http_client(self.client.timeout), get_http_client(other.timeout))
+
+    def test_identical_queries_are_cached(self):
+        self.assertEqual(self.client.get_statistics()['total_logs'], 7)
+        self.assertEqual(self.client.get_statistics()['total_logs'], 7)
+        self.client.query_logs(level='ERROR', limit=10)
+        self.client.query_logs(level='ERROR', limit=10)
+        self.client.query_logs(level='INFO', limit=10)
+        self.assertEqual([path for path, _ in self.requests], ['/logs/statistics', '/logs/', '/logs/'])
+
+    @override_settings(LOGS_API_QUERY_CACHE_TTL=0)
+    def test_cache_can_be_disabled(self):
+        self.client.search_logs('hi')
+        self.client.search_logs('hi')
+        self.assertEqual(len(self.requests), 2)
+
+    def test_fetch_parallel_overlaps_calls_and_raises_failures(self):
+        self.delay = 0.2
+        started = time.monotonic()
+        fetched = self.client.fetch_parallel({
+            'stats': lambda: self.client.get_statistics(),
+            'logs': lambda: self.client.query_logs(),
+        })
+        self.assertLess(time.monotonic() - started, 0.35)
+        self.assertEqual(fetched['logs']['total'], 1)
+        self.assertEqual(len({thread for _, thread in self.requests}), 2)
+
+        self.delay = 0
+        with self.assertRaises(LambdaAPIError):
+            self.client.fetch_parallel({
+                'stats': lambda: self.client.get_statistics(time_range='7d'),
+                'logs': lambda: self.client.query_logs(level='broken'),
+            })
+
+    def test_aligned_time_windows_repeat(self):
+        start, end = time_range_to_iso('1h', align_seconds=3600)
+        self.assertEqual((start, end), time_range_to_iso('1h', align_seconds=3600))
+        self.assertTrue(end.endswith(':00:00+00:00'))
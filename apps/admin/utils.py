@@ -18,11 +18,14 @@ TIME_RANGE_DELTAS = {
 
 def time_range_to_iso(
     time_range: str,
+    align_seconds: int = 0,
 ) -> Tuple[Optional[str], Optional[str]]:
     """Convert time_range (1h, 24h, 7d, 30d) to (start_time, end_time) ISO strings.
 
     Args:
         time_range: One of '1h', '24h', '7d', '30d'
+        align_seconds: Round the end time down to a multiple of this many
+            seconds, so repeated requests produce identical (cacheable) windows
 
     Returns:
         Tuple of (start_time_iso, end_time_iso) or (None, None) if invalid
@@ -30,6 +33,10 @@ def time_range_to_iso(
     if time_range not in TIME_RANGE_DELTAS:
         return None, None
     now = datetime.now(timezone.utc)
+    if align_seconds > 0:
+        now = datetime.fromtimestamp(
+            int(now.timestamp()) // align_seconds * align_seconds, timezone.utc
+        )
     delta = TIME_RANGE_DELTAS[time_range]
     start = now - delta
     return start.isoformat(), now.isoformat()
@@ -136,31 +136,31 @@ def logs_view(request):
     try:
         if LOGS_API_ENABLED:
             logs_client = LogsApiClient()
-            context["log_stats"] = logs_client.get_statistics(
-                time_range=time_range, period="hourly"
+            start_time, end_time = time_range_to_iso(
+                time_range, align_seconds=getattr(settings, "LOGS_API_QUERY_CACHE_TTL", 15)
             )
-            start_time, end_time = time_range_to_iso(time_range)
+            filters = {
+                "level": level or None,
+                "logger_filter": logger_filter or None,
+                "user_id": user_id or None,
+                "start_time": start_time,
+                "end_time": end_time,
+                "limit": per_page,
+                "skip": skip,
+            }
             if search:
-                result = logs_client.search_logs(
-                    query=search,
-                    level=level or None,
-                    logger_filter=logger_filter or None,
-                    user_id=user_id or None,
-                    start_time=start_time,
-                    end_time=end_time,
-                    limit=per_page,
-                    skip=skip,
-                )
+                fetch_logs = lambda: logs_client.search_logs(query=search, **filters)
             else:
-                result = logs_client.query_logs(
-                    level=level or None,
-                    logger_filter=logger_filter or None,
-                    user_id=user_id or None,
-                    start_time=start_time,
-                    end_time=end_time,
-                    limit=per_page,
-                    skip=skip,
-                )
+                fetch_logs = lambda: logs_client.query_logs(**filters)
+            # Statistics and the log page are independent: fetch both at once
+            fetched = logs_client.fetch_parallel({
+                "stats": lambda: logs_client.get_statistics(
+                    time_range=time_range, period="hourly"
+                ),
+                "logs": fetch_logs,
+            })
+            context["log_stats"] = fetched["stats"]
+            result = fetched["logs"]
         else:
             client = _get_client(request)
             context["log_stats"] = client.get_log_statistics(time_range=time_range)
@@ -6,6 +6,8 @@ app_name = 'ai_agent_api'
 
 urlpatterns = [
     path('chat/', views.chat_api, name='chat'),
+    path('chat/stream/', views.chat_stream_api, name='chat_stream'),
+    path('chat/cancel/', views.chat_cancel_api, name='chat_cancel'),
     path('sessions/', views.sessions_api, name='sessions'),
     path('sessions/<str:session_id>/', views.session_detail_api, name='session_detail'),
 ]
@@ -6,11 +6,16 @@ from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.utils import timezone
 from apps.core.decorators.auth import require_super_admin
-from apps.ai_agent.services.ai_service import AIService
+from apps.ai_agent.services.ai_service import get_ai_service
+from apps.ai_agent.services.chat_stream import (
+    prepare_chat_turn,
+    request_cancel,
+    sse_response,
+    stream_chat_reply,
+)
 from apps.ai_agent.services.session_storage_service import AISessionStorageService
 
 logger = logging.getLogger(__name__)
-ai_service = AIService()
 
 
 @require_super_admin
@@ -50,9 +55,8 @@ def chat_api(request):
         
         # Build messages from storage
         messages_list = []
-        db_messages = storage.get_messages(session_id)
         
-        for msg in db_messages[-20:]:  # Last 20 messages
+        for msg in storage.get_messages(session_id, limit=20):  # Last 20 messages
             messages_list.append({
                 'role': msg.get('role'),
                 'content': msg.get('content')
@@ -64,6 +68,7 @@ def chat_api(request):
         })
         
         # Get AI response
+        ai_service = get_ai_service()
         context = data.get('context', [])
         if not context:
             context = ai_service.retrieve_context(prompt, limit=5)
@@ -71,26 +76,19 @@ def chat_api(request):
         response = ai_service.chat_completion(messages_list, context=context)
         
         if response:
-            # Save messages
-            storage.add_message(
-                session_id,
-                role='user',
-                content=prompt,
-                created_by=user_uuid
-            )
-            
-            storage.add_message(
-                session_id,
-                role='assistant',
-                content=response.get('content', ''),
-                created_by=user_uuid,
-                metadata={
-                    'groundingSources': response.get('groundingSources', []),
-                    **response.get('metadata', {})
-                }
-            )
-            
-            storage.update_session(session_id, updated_at=timezone.now().isoformat())
+            # Save the user/assistant pair in one append (also bumps updated_at)
+            storage.append_messages(session_id, [
+                {'role': 'user', 'content': prompt, 'created_by': user_uuid},
+                {
+                    'role': 'assistant',
+                    'content': response.get('content', ''),
+                    'created_by': user_uuid,
+                    'metadata': {
+                        'groundingSources': response.get('groundingSources', []),
+                        **response.get('metadata', {})
+                    }
+                },
+            ])
             
             return JsonResponse({
                 'text': response.get('content', ''),
@@ -108,6 +106,56 @@ def chat_api(request):
         return JsonResponse({'error': 'Internal server error'}, status=500)
 
 
+@require_super_admin
+@csrf_exempt
+@require_http_methods(["POST"])
+def chat_stream_api(request):
+    """Stream an AI chat reply as Server-Sent Events (same body as chat_api)."""
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    
+    prompt = data.get('prompt', '')
+    if not prompt:
+        return JsonResponse({'error': 'Prompt is required'}, status=400)
+    
+    # Get user UUID from token
+    user_uuid = None
+    if hasattr(request, 'appointment360_user'):
+        user_uuid = request.appointment360_user.get('uuid')
+    
+    storage = AISessionStorageService()
+    turn = prepare_chat_turn(storage, data.get('session_id'), user_uuid, prompt)
+    if turn is None:
+        return JsonResponse({'error': 'Session not found'}, status=404)
+    session_id, messages_list = turn
+    
+    ai_service = get_ai_service()
+    context = data.get('context') or ai_service.retrieve_context(prompt, limit=5)
+    return sse_response(stream_chat_reply(
+        ai_service, storage, session_id, user_uuid, prompt, messages_list,
+        context=context, stream_id=data.get('stream_id')
+    ))
+
+
+@require_super_admin
+@csrf_exempt
+@require_http_methods(["POST"])
+def chat_cancel_api(request):
+    """Stop a running chat stream by the stream_id from its ``start`` event."""
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    
+    stream_id = data.get('stream_id')
+    if not stream_id:
+        return JsonResponse({'error': 'stream_id is required'}, status=400)
+    request_cancel(str(stream_id))
+    return JsonResponse({'success': True, 'stream_id': stream_id})
+
+
 @require_super_admin
 @require_http_methods(["GET"])
 def sessions_api(request):
@@ -125,7 +173,7 @@ def sessions_api(request):
     
     sessions_data = []
     for session in sessions_result.get('items', []):
-        message_count = len(session.get('messages', []))
+        message_count = storage.message_count(session)
         sessions_data.append({
             'session_id': session.get('session_id'),
             'session_name': session.get('session_name'),
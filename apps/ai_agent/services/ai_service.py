@@ -2,6 +2,8 @@
 
 import logging
 import re
+import threading
+import time
 from typing import Optional, Dict, Any, List, Iterator
 from django.conf import settings
 from django.core.cache import cache
@@ -28,44 +30,29 @@ from apps.ai_agent.services.media_loader import MediaFileLoaderService
 from apps.ai_agent.services.semantic_search import SemanticSearchService
 from apps.ai_agent.services.postman_parser import PostmanCollectionParser
 from apps.ai_agent.services.project_docs_loader import ProjectDocsLoader
+from apps.ai_agent.services.llm_pool import get_llm_pool, get_response_cache
 
 logger = logging.getLogger(__name__)
 
+# (expires_at, text) of the documentation system context shared by all instances
+_shared_system_context = None
+_system_context_lock = threading.Lock()
+
 
 class AIService:
     """Service for AI operations using OpenAI, Gemini, and Lambda AI API."""
     
     def __init__(self):
         """Initialize AI service."""
-        # OpenAI client
-        if OPENAI_AVAILABLE and Config.is_openai_enabled():
-            try:
-                openai.api_key = settings.OPENAI_API_KEY
-                logger.info("OpenAI client initialized")
-            except Exception as e:
-                logger.warning(f"Failed to initialize OpenAI: {e}")
+        # Provider clients are configured once per process and shared
+        pool = get_llm_pool()
+        pool.openai_ready(openai if OPENAI_AVAILABLE else None)
         
         # Gemini AI client
-        self.gemini_model = None
-        if GEMINI_AVAILABLE and Config.is_gemini_enabled():
-            try:
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                self.gemini_model = genai.GenerativeModel('gemini-pro')
-                logger.info("Gemini AI client initialized")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Gemini: {e}")
+        self.gemini_model = pool.gemini_model(genai if GEMINI_AVAILABLE else None)
         
         # Lambda AI API client
-        self.lambda_client = None
-        if Config.is_lambda_enabled():
-            try:
-                self.lambda_client = APIClient(
-                    base_url=settings.LAMBDA_AI_API_URL,
-                    api_key=settings.LAMBDA_AI_API_KEY
-                )
-                logger.info("Lambda AI client initialized")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Lambda AI client: {e}")
+        self.lambda_client = pool.lambda_client(APIClient)
         
         # Media file services
         self.media_loader = MediaFileLoaderService()
@@ -73,8 +60,24 @@ class AIService:
         self.postman_parser = PostmanCollectionParser(self.media_loader)
         self.project_docs_loader = ProjectDocsLoader(self.media_loader)
         
-        # System context about available documentation
-        self.system_context = self._build_system_context()
+        self._system_context = None
+    
+    @property
+    def system_context(self) -> str:
+        """System context about available documentation (shared, refreshed after a TTL)."""
+        if self._system_context is not None:
+            return self._system_context
+        global _shared_system_context
+        now = time.monotonic()
+        with _system_context_lock:
+            if _shared_system_context is None or _shared_system_context[0] <= now:
+                ttl = getattr(settings, 'AI_SYSTEM_CONTEXT_TTL', 300)
+                _shared_system_context = (now + ttl, self._build_system_context())
+            return _shared_system_context[1]
+    
+    @system_context.setter
+    def system_context(self, value: str) -> None:
+        self._system_context = value
     
     def _build_system_context(self) -> str:
         """Build system context about available documentation.
@@ -112,7 +115,9 @@ You can help users understand:
         messages: List[Dict[str, str]],
         context: Optional[List[str]] = None,
         model: str = 'gpt-3.5-turbo',
-        stream: bool = False
+        stream: bool = False,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Get chat completion from AI.
@@ -124,26 +129,14 @@ You can help users understand:
             context: Additional context strings to include
             model: AI model to use
             stream: Whether to stream the response
+            temperature: Sampling temperature
+            max_tokens: Optional cap on generated tokens
             
         Returns:
             Response dictionary with 'content' and 'metadata', or None if error
         """
         try:
-            # Add system context about available documentation
-            if self.system_context:
-                system_message = {
-                    'role': 'system',
-                    'content': self.system_context
-                }
-                messages = [system_message] + messages
-            
-            # Add context if provided
-            if context:
-                context_message = {
-                    'role': 'system',
-                    'content': f"Additional context:\n" + "\n".join(context)
-                }
-                messages = [context_message] + messages
+            messages = self._prepare_messages(messages, context)
             
             # Try OpenAI first
             if OPENAI_AVAILABLE and Config.is_openai_enabled():
@@ -151,11 +144,15 @@ You can help users understand:
                     return self._openai_stream(messages, model)
                 else:
                     try:
-                        response = openai.ChatCompletion.create(
-                            model=model,
-                            messages=messages,
-                            temperature=0.7
-                        )
+                        options = {'temperature': temperature}
+                        if max_tokens:
+                            options['max_tokens'] = max_tokens
+                        with get_llm_pool().slot('openai'):
+                            response = openai.ChatCompletion.create(
+                                model=model,
+                                messages=messages,
+                                **options
+                            )
                         return {
                             'content': response.choices[0].message.content,
                             'metadata': {
@@ -173,27 +170,28 @@ You can help users understand:
                     # Get the last user message
                     user_message = messages[-1].get('content', '') if messages else ''
                     
+                    generation_config = {'temperature': temperature}
+                    if max_tokens:
+                        generation_config['max_output_tokens'] = max_tokens
+                    
                     # Use generate_content with Google Search tool for grounding sources
-                    try:
-                        # Try with googleSearch tool (requires newer Gemini API)
-                        from google.generativeai import types
-                        response = self.gemini_model.generate_content(
-                            user_message,
-                            generation_config=types.GenerationConfig(
-                                temperature=0.7,
-                            ),
-                            tools=[types.Tool.from_google_search_retrieval(
-                                types.GoogleSearchRetrieval()
-                            )]
-                        )
-                    except (ImportError, AttributeError, TypeError):
-                        # Fallback to basic generate_content if tool not available
-                        response = self.gemini_model.generate_content(
-                            user_message,
-                            generation_config={
-                                'temperature': 0.7,
-                            }
-                        )
+                    with get_llm_pool().slot('gemini'):
+                        try:
+                            # Try with googleSearch tool (requires newer Gemini API)
+                            from google.generativeai import types
+                            response = self.gemini_model.generate_content(
+                                user_message,
+                                generation_config=types.GenerationConfig(**generation_config),
+                                tools=[types.Tool.from_google_search_retrieval(
+                                    types.GoogleSearchRetrieval()
+                                )]
+                            )
+                        except (ImportError, AttributeError, TypeError):
+                            # Fallback to basic generate_content if tool not available
+                            response = self.gemini_model.generate_content(
+                                user_message,
+                                generation_config=generation_config
+                            )
                     
                     # Extract grounding sources from response
                     grounding_sources = []
@@ -231,28 +229,233 @@ You can help users understand:
             logger.error(f"Error in chat completion: {str(e)}")
             return None
     
-    def _openai_stream(self, messages: List[Dict[str, str]], model: str) -> Iterator[str]:
-        """Stream OpenAI chat completion.
+    def _prepare_messages(
+        self,
+        messages: List[Dict[str, str]],
+        context: Optional[List[str]] = None
+    ) -> List[Dict[str, str]]:
+        """Prepend the documentation system context and any extra context."""
+        # Add system context about available documentation
+        if self.system_context:
+            system_message = {
+                'role': 'system',
+                'content': self.system_context
+            }
+            messages = [system_message] + messages
+        
+        # Add context if provided
+        if context:
+            context_message = {
+                'role': 'system',
+                'content': f"Additional context:\n" + "\n".join(context)
+            }
+            messages = [context_message] + messages
+        return messages
+    
+    def _provider_chain(self) -> str:
+        """Providers that would answer, in priority order (part of cache keys)."""
+        chain = []
+        if OPENAI_AVAILABLE and Config.is_openai_enabled():
+            chain.append('openai')
+        if self.gemini_model:
+            chain.append('gemini')
+        if self.lambda_client:
+            chain.append('lambda')
+        return '+'.join(chain)
+    
+    def _cached_response(
+        self,
+        task: str,
+        prompt: str,
+        context: Optional[List[str]],
+        compute
+    ) -> Optional[str]:
+        """
+        Serve a one-shot prompt from the process-wide response cache.
+        
+        ``compute`` runs on a miss; empty results are not cached so a
+        provider outage is retried on the next call.
+        """
+        response_cache = get_response_cache()
+        key = response_cache.make_key(self._provider_chain(), task, prompt, context)
+        cached = response_cache.get(key)
+        if cached is not None:
+            return cached
+        result = compute()
+        response_cache.put(key, result)
+        return result
+    
+    def _complete_text(
+        self,
+        system_prompt: Optional[str],
+        prompt: str,
+        **options
+    ) -> Optional[str]:
+        messages = []
+        if system_prompt:
+            messages.append({'role': 'system', 'content': system_prompt})
+        messages.append({'role': 'user', 'content': prompt})
+        response = self.chat_completion(messages, **options)
+        if response:
+            return response.get('content')
+        return None
+    
+    def get_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        model: str = 'gpt-3.5-turbo',
+        use_cache: bool = True
+    ) -> str:
+        """
+        One-shot completion for a single prompt (workflow agent nodes).
+        
+        Identical prompts with the same system prompt and sampling options are
+        answered from the response cache unless ``use_cache`` is False.
         
         Args:
-            messages: List of messages
-            model: Model name
+            prompt: User prompt
+            system_prompt: Optional system instruction
+            temperature: Sampling temperature
+            max_tokens: Optional cap on generated tokens
+            model: AI model to use (OpenAI)
+            use_cache: Whether to read and populate the response cache
+            
+        Returns:
+            Completion text
+            
+        Raises:
+            RuntimeError: if no provider produced a response
+        """
+        def compute():
+            return self._complete_text(
+                system_prompt, prompt, model=model, temperature=temperature, max_tokens=max_tokens
+            )
+        
+        if use_cache:
+            options = [system_prompt or '', f'temperature={temperature}', f'max_tokens={max_tokens}']
+            content = self._cached_response(f'completion:{model}', prompt, options, compute)
+        else:
+            content = compute()
+        if content is None:
+            raise RuntimeError('Failed to get AI response')
+        return content
+    
+    def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        context: Optional[List[str]] = None,
+        model: str = 'gpt-3.5-turbo'
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a chat completion as it is generated.
+        
+        Same provider priority as chat_completion (OpenAI → Gemini → Lambda
+        AI); a provider failing before its first token falls through to the
+        next one. Lambda AI does not stream and is relayed as one chunk.
+        Closing the generator closes the upstream provider stream.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            context: Additional context strings to include
+            model: AI model to use (OpenAI)
             
         Yields:
-            Response chunks
+            ``{'type': 'token', 'content': str}`` per chunk, then either
+            ``{'type': 'done', 'metadata': {...}, 'groundingSources': [...]}``
+            or ``{'type': 'error', 'error': str}``
         """
+        messages = self._prepare_messages(messages, context)
+        
+        providers = []
+        if OPENAI_AVAILABLE and Config.is_openai_enabled():
+            providers.append(('openai', model, lambda: self._openai_chunks(messages, model)))
+        if self.gemini_model:
+            providers.append(('gemini', 'gemini-pro', lambda: self._gemini_chunks(messages)))
+        
+        for provider, provider_model, open_stream in providers:
+            emitted = False
+            chunks = None
+            try:
+                with get_llm_pool().slot(provider):
+                    chunks = open_stream()
+                    for text in chunks:
+                        if text:
+                            emitted = True
+                            yield {'type': 'token', 'content': text}
+                yield {
+                    'type': 'done',
+                    'metadata': {'model': provider_model, 'provider': provider},
+                    'groundingSources': []
+                }
+                return
+            except Exception as e:
+                if emitted:
+                    logger.error(f"{provider} stream failed mid-response: {e}")
+                    yield {'type': 'error', 'error': str(e)}
+                    return
+                logger.warning(f"{provider} streaming failed, trying next provider: {e}")
+            finally:
+                close = getattr(chunks, 'close', None)
+                if close:
+                    close()
+        
+        response = self._lambda_chat(messages, context)
+        if response is None:
+            yield {'type': 'error', 'error': 'Failed to get AI response'}
+            return
+        if response.get('content'):
+            yield {'type': 'token', 'content': response['content']}
+        yield {
+            'type': 'done',
+            'metadata': response.get('metadata', {}),
+            'groundingSources': response.get('groundingSources', [])
+        }
+    
+    def _openai_chunks(self, messages: List[Dict[str, str]], model: str) -> Iterator[str]:
+        """Content deltas of a streamed OpenAI completion (errors propagate)."""
+        response = openai.ChatCompletion.create(
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            stream=True
+        )
         try:
-            response = openai.ChatCompletion.create(
-                model=model,
-                messages=messages,
-                temperature=0.7,
-                stream=True
-            )
             for chunk in response:
                 if 'choices' in chunk and len(chunk['choices']) > 0:
                     delta = chunk['choices'][0].get('delta', {})
                     if 'content' in delta:
                         yield delta['content']
+        finally:
+            close = getattr(response, 'close', None)
+            if close:
+                close()
+    
+    def _gemini_chunks(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Text chunks of a streamed Gemini response for the last user message."""
+        user_message = messages[-1].get('content', '') if messages else ''
+        response = self.gemini_model.generate_content(
+            user_message,
+            generation_config={'temperature': 0.7},
+            stream=True
+        )
+        for chunk in response:
+            yield getattr(chunk, 'text', '')
+    
+    def _openai_stream(self, messages: List[Dict[str, str]], model: str) -> Iterator[str]:
+        """Stream OpenAI chat completion.
+        
+        Args:
+            messages: List of messages
+            model: Model name
+            
+        Yields:
+            Response chunks
+        """
+        try:
+            yield from self._openai_chunks(messages, model)
         except Exception as e:
             logger.error(f"Error in OpenAI streaming: {str(e)}")
             yield f"Error: {str(e)}"
@@ -275,10 +478,11 @@ You can help users understand:
             return None
         
         try:
-            response = self.lambda_client.post("/chat", json_data={
-                'messages': messages,
-                'context': context or []
-            })
+            with get_llm_pool().slot('lambda'):
+                response = self.lambda_client.post("/chat", json_data={
+                    'messages': messages,
+                    'context': context or []
+                })
             return {
                 'content': response.get('content', ''),
                 'metadata': {
@@ -363,7 +567,12 @@ You can help users understand:
         """
         # Detect references in code
         code_context = self._extract_code_references(code)
-        
+        return self._cached_response(
+            f'explain_code:{language}', code, [code_context],
+            lambda: self._explain_code(code, language, code_context)
+        )
+    
+    def _explain_code(self, code: str, language: str, code_context: str) -> Optional[str]:
         # Try Gemini first if available
         if self.gemini_model:
             try:
@@ -371,7 +580,8 @@ You can help users understand:
                 if code_context:
                     prompt += f"\n\nRelevant Documentation:\n{code_context}"
                 
-                response = self.gemini_model.generate_content(prompt)
+                with get_llm_pool().slot('gemini'):
+                    response = self.gemini_model.generate_content(prompt)
                 return response.text
             except Exception as e:
                 logger.warning(f"Gemini explain_code failed, falling back: {e}")
@@ -453,7 +663,12 @@ You can help users understand:
         """
         # Find similar pages/endpoints
         similar_context = self._find_similar_documentation(code)
-        
+        return self._cached_response(
+            f'generate_documentation:{language}', code, [similar_context],
+            lambda: self._generate_documentation(code, language, similar_context)
+        )
+    
+    def _generate_documentation(self, code: str, language: str, similar_context: str) -> Optional[str]:
         # Try Gemini first if available
         if self.gemini_model:
             try:
@@ -461,7 +676,8 @@ You can help users understand:
                 if similar_context:
                     prompt += f"\n\nSimilar existing documentation patterns:\n{similar_context}"
                 
-                response = self.gemini_model.generate_content(prompt)
+                with get_llm_pool().slot('gemini'):
+                    response = self.gemini_model.generate_content(prompt)
                 return response.text
             except Exception as e:
                 logger.warning(f"Gemini generate_documentation failed, falling back: {e}")
@@ -527,22 +743,10 @@ You can help users understand:
             Suggestions text, or None if error
         """
         system_prompt = f'You are a code review assistant. Analyze the following {language} code and suggest best practices, improvements, and potential issues.'
-        
-        messages = [
-            {
-                'role': 'system',
-                'content': system_prompt
-            },
-            {
-                'role': 'user',
-                'content': code
-            }
-        ]
-        
-        response = self.chat_completion(messages)
-        if response:
-            return response.get('content')
-        return None
+        return self._cached_response(
+            'suggest_best_practices', code, [system_prompt],
+            lambda: self._complete_text(system_prompt, code)
+        )
     
     def generate_chat_response(
         self,
@@ -594,6 +798,13 @@ You can help users understand:
         Returns:
             Analysis text
         """
+        analysis = self._cached_response(
+            'analyze_project_structure', '\n'.join(file_names[:100]), None,
+            lambda: self._analyze_project_structure(file_names)
+        )
+        return analysis or "Analysis failed to generate."
+    
+    def _analyze_project_structure(self, file_names: List[str]) -> Optional[str]:
         if self.gemini_model:
             try:
                 prompt = f"""Based on the following list of files in a repository, provide a concise senior engineer's overview of the project architecture, likely tech stack, and key modules.
@@ -603,7 +814,8 @@ Files:
 
 Format your response as a professional executive summary."""
                 
-                response = self.gemini_model.generate_content(prompt)
+                with get_llm_pool().slot('gemini'):
+                    response = self.gemini_model.generate_content(prompt)
                 return response.text
             except Exception as e:
                 logger.error(f"Project analysis failed: {e}")
@@ -623,6 +835,19 @@ Format your response as a professional executive summary."""
         
         response = self.chat_completion(messages)
         if response:
-            return response.get('content', 'Analysis failed to generate.')
-        
-        return "Analysis failed to generate."
+            return response.get('content')
+        return None
+
+
+_ai_service = None
+_ai_service_lock = threading.Lock()
+
+
+def get_ai_service() -> AIService:
+    """Get or create the process-wide AIService."""
+    global _ai_service
+    if _ai_service is None:
+        with _ai_service_lock:
+            if _ai_service is None:
+                _ai_service = AIService()
+    return _ai_service
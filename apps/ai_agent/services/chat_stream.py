@@ -0,0 +1,232 @@
+"""Server-Sent Events relay for streamed AI chat replies."""
+
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+CANCEL_CACHE_PREFIX = 'ai_chat_stream_cancel:'
+# Cancellation flags outlive any stream by a wide margin
+CANCEL_TTL = 600
+# How often (seconds) a running stream checks its cancellation flag
+CANCEL_POLL_INTERVAL = 0.5
+# Shortest wait (seconds) for the provider between deadline/cancel checks
+MIN_EVENT_WAIT = 0.01
+
+# Queued by the provider pump after its last event
+_PUMP_DONE = object()
+
+# Cancellations requested in this process; the cache carries them to other
+# workers when it is shared (Redis)
+_local_cancels = set()
+_local_cancels_lock = threading.Lock()
+
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def request_cancel(stream_id: str) -> None:
+    """Ask a running stream to stop after its current chunk."""
+    with _local_cancels_lock:
+        _local_cancels.add(stream_id)
+    cache.set(f'{CANCEL_CACHE_PREFIX}{stream_id}', True, CANCEL_TTL)
+
+
+def is_cancelled(stream_id: str) -> bool:
+    with _local_cancels_lock:
+        if stream_id in _local_cancels:
+            return True
+    return bool(cache.get(f'{CANCEL_CACHE_PREFIX}{stream_id}'))
+
+
+def _clear_cancel(stream_id: str) -> None:
+    with _local_cancels_lock:
+        _local_cancels.discard(stream_id)
+    cache.delete(f'{CANCEL_CACHE_PREFIX}{stream_id}')
+
+
+def _pump_events(events: Iterator[Dict[str, Any]], events_queue: queue.Queue, stop: threading.Event) -> None:
+    """
+    Move provider events onto ``events_queue`` from a worker thread.
+
+    The provider may block for a long time (connecting, or before its first
+    token); running it here lets the relay keep enforcing its deadline and
+    cancellation meanwhile. The provider stream is closed once ``stop`` is
+    set, at its next chunk at the latest.
+    """
+    try:
+        for event in events:
+            events_queue.put(event)
+            if stop.is_set() or event['type'] != 'token':
+                break
+    except Exception as e:
+        events_queue.put({'type': 'error', 'error': str(e)})
+    finally:
+        events.close()
+        events_queue.put(_PUMP_DONE)
+
+
+def prepare_chat_turn(storage, session_id: Optional[str], user_uuid: Optional[str], prompt: str):
+    """
+    Resolve (or create) the caller's session and build the message history.
+
+    Returns:
+        ``(session_id, messages_list)``, or None when ``session_id`` is not
+        one of the caller's sessions
+    """
+    if session_id:
+        session = storage.get_session(session_id)
+        if not session or session.get('created_by') != user_uuid:
+            return None
+    else:
+        session = storage.create_session(
+            session_name=f'Chat {timezone.now().strftime("%Y-%m-%d %H:%M")}',
+            created_by=user_uuid,
+            patterns_learned={}
+        )
+        session_id = session.get('session_id')
+        storage.update_session(session_id, status='running', started_at=timezone.now().isoformat())
+    
+    # Last 20 messages for context
+    messages_list = [
+        {'role': msg.get('role'), 'content': msg.get('content')}
+        for msg in storage.get_messages(session_id, limit=20)
+    ]
+    messages_list.append({'role': 'user', 'content': prompt})
+    return session_id, messages_list
+
+
+def stream_chat_reply(
+    ai_service,
+    storage,
+    session_id: str,
+    user_uuid: Optional[str],
+    prompt: str,
+    messages_list: List[Dict[str, str]],
+    context: Optional[List[str]] = None,
+    stream_id: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Relay ``AIService.stream_chat_completion`` as SSE frames.
+
+    Frames: ``start`` (session_id, stream_id), ``token`` per chunk, then one
+    of ``done``, ``cancelled`` or ``error``. The stream stops early when
+    ``request_cancel(stream_id)`` is called, when AI_CHAT_STREAM_MAX_SECONDS
+    elapses, or when the client disconnects (the server closes this
+    generator, which closes the provider stream). The provider runs in a
+    worker thread, so the deadline and cancellation also apply while it has
+    not produced a token yet. Once the stream ends for
+    any reason the user message and the reply produced so far are saved to
+    the session, with ``metadata.cancelled`` set for partial replies.
+    """
+    stream_id = stream_id or str(uuid.uuid4())
+    max_seconds = getattr(settings, 'AI_CHAT_STREAM_MAX_SECONDS', 25)
+    started = time.monotonic()
+    next_cancel_check = started + CANCEL_POLL_INTERVAL
+    parts: List[str] = []
+    outcome: Dict[str, Any] = {'status': 'cancelled', 'metadata': {}, 'groundingSources': []}
+
+    events = ai_service.stream_chat_completion(messages_list, context=context)
+    events_queue: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    pump = threading.Thread(
+        target=_pump_events, args=(events, events_queue, stop), name=f'chat-stream-{stream_id}', daemon=True
+    )
+    pump.start()
+    deadline = started + max_seconds
+    try:
+        yield sse_event('start', {'session_id': session_id, 'stream_id': stream_id})
+        while True:
+            wait = min(deadline, next_cancel_check) - time.monotonic()
+            try:
+                event = events_queue.get(timeout=max(wait, MIN_EVENT_WAIT))
+            except queue.Empty:
+                event = None
+            if event is _PUMP_DONE:
+                break
+            if event is not None:
+                if event['type'] == 'token':
+                    parts.append(event['content'])
+                    yield sse_event('token', {'content': event['content']})
+                elif event['type'] == 'done':
+                    outcome.update(status='done', metadata=event.get('metadata', {}),
+                                   groundingSources=event.get('groundingSources', []))
+                    break
+                else:
+                    outcome.update(status='error', error=event.get('error', 'Failed to get AI response'))
+                    break
+
+            now = time.monotonic()
+            if now >= deadline:
+                outcome['reason'] = 'timeout'
+                break
+            if now >= next_cancel_check:
+                next_cancel_check = now + CANCEL_POLL_INTERVAL
+                if is_cancelled(stream_id):
+                    outcome['reason'] = 'cancelled'
+                    break
+
+        content = ''.join(parts)
+        if outcome['status'] == 'done':
+            yield sse_event('done', {
+                'content': content,
+                'metadata': outcome['metadata'],
+                'groundingSources': outcome['groundingSources'],
+                'session_id': session_id,
+            })
+        elif outcome['status'] == 'error':
+            yield sse_event('error', {'error': outcome['error'], 'session_id': session_id})
+        else:
+            yield sse_event('cancelled', {
+                'content': content,
+                'reason': outcome.get('reason', 'cancelled'),
+                'session_id': session_id,
+            })
+    finally:
+        # Runs on normal completion and when the client disconnects
+        # (GeneratorExit at a yield): stop the provider, then persist.
+        # A provider still blocked on its first chunk is left to the daemon
+        # pump, which closes it when the call returns.
+        stop.set()
+        pump.join(timeout=CANCEL_POLL_INTERVAL)
+        _clear_cancel(stream_id)
+        if outcome['status'] == 'cancelled':
+            outcome.setdefault('reason', 'disconnected')
+        _persist_reply(storage, session_id, user_uuid, prompt, ''.join(parts), outcome)
+
+
+def _persist_reply(storage, session_id, user_uuid, prompt, content, outcome) -> None:
+    if outcome['status'] == 'error' and not content:
+        return
+    try:
+        metadata = {'groundingSources': outcome['groundingSources'], **outcome['metadata']}
+        if outcome['status'] != 'done':
+            metadata['cancelled'] = True
+            metadata['reason'] = outcome.get('reason') or outcome['status']
+        storage.append_messages(session_id, [
+            {'role': 'user', 'content': prompt, 'created_by': user_uuid},
+            {'role': 'assistant', 'content': content, 'created_by': user_uuid, 'metadata': metadata},
+        ])
+    except Exception as e:
+        logger.error(f"Failed to save streamed chat reply for session {session_id}: {e}", exc_info=True)
+
+
+def sse_response(frames: Iterator[str]) -> StreamingHttpResponse:
+    """StreamingHttpResponse for SSE frames, unbuffered through proxies."""
+    response = StreamingHttpResponse(frames, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Tell reverse proxies (nginx) not to buffer the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,216 @@
+"""
+Process-wide LLM provider clients, concurrency limits and response cache.
+
+``AIService`` used to configure OpenAI, build a Gemini ``GenerativeModel``
+and open a Lambda AI HTTP client on every construction. ``LLMProviderPool``
+does that once per process and hands out the shared clients, plus one
+bounded semaphore per provider so request threads and workflow loops cannot
+stampede a provider. ``ResponseCache`` is a content-addressed LRU for
+one-shot prompts (code explanation, documentation, workflow agent nodes).
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from django.conf import settings
+
+from apps.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+PROVIDERS = ('openai', 'gemini', 'lambda')
+
+
+class ProviderBusyError(RuntimeError):
+    """No concurrency slot for a provider became free in time."""
+
+
+class LLMProviderPool:
+    """Shared, lazily configured provider clients with per-provider slots."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._openai_configured = False
+        self._gemini_configured = False
+        self._gemini_models: Dict[str, Any] = {}
+        self._lambda_client = None
+        self._lambda_initialized = False
+        self._slots = {
+            provider: threading.BoundedSemaphore(max(1, int(getattr(
+                settings, f'AI_{provider.upper()}_MAX_CONCURRENCY', 4
+            ))))
+            for provider in PROVIDERS
+        }
+
+    def openai_ready(self, openai_module) -> bool:
+        """Configure the OpenAI module once; False when it is unavailable."""
+        if openai_module is None or not Config.is_openai_enabled():
+            return False
+        if not self._openai_configured:
+            with self._lock:
+                if not self._openai_configured:
+                    try:
+                        openai_module.api_key = settings.OPENAI_API_KEY
+                        logger.info("OpenAI client initialized")
+                    except Exception as e:
+                        logger.warning(f"Failed to initialize OpenAI: {e}")
+                        return False
+                    self._openai_configured = True
+        return True
+
+    def gemini_model(self, genai_module, model_name: str = 'gemini-pro'):
+        """Shared ``GenerativeModel`` per model name, or None when unavailable."""
+        if genai_module is None or not Config.is_gemini_enabled():
+            return None
+        model = self._gemini_models.get(model_name)
+        if model is None:
+            with self._lock:
+                model = self._gemini_models.get(model_name)
+                if model is None:
+                    try:
+                        if not self._gemini_configured:
+                            genai_module.configure(api_key=settings.GEMINI_API_KEY)
+                            self._gemini_configured = True
+                        model = genai_module.GenerativeModel(model_name)
+                        logger.info("Gemini AI client initialized")
+                    except Exception as e:
+                        logger.warning(f"Failed to initialize Gemini: {e}")
+                        return None
+                    self._gemini_models[model_name] = model
+        return model
+
+    def lambda_client(self, client_factory):
+        """Shared Lambda AI ``APIClient`` (one pooled HTTP client), or None."""
+        if not self._lambda_initialized:
+            with self._lock:
+                if not self._lambda_initialized:
+                    if Config.is_lambda_enabled():
+                        try:
+                            self._lambda_client = client_factory(
+                                base_url=settings.LAMBDA_AI_API_URL,
+                                api_key=settings.LAMBDA_AI_API_KEY
+                            )
+                            logger.info("Lambda AI client initialized")
+                        except Exception as e:
+                            logger.warning(f"Failed to initialize Lambda AI client: {e}")
+                    self._lambda_initialized = True
+        return self._lambda_client
+
+    @contextmanager
+    def slot(self, provider: str) -> Iterator[None]:
+        """
+        Hold one of the provider's concurrency slots for the duration of a call.
+
+        Raises:
+            ProviderBusyError: if none frees up within AI_PROVIDER_ACQUIRE_TIMEOUT
+        """
+        semaphore = self._slots[provider]
+        timeout = float(getattr(settings, 'AI_PROVIDER_ACQUIRE_TIMEOUT', 10))
+        if not semaphore.acquire(timeout=timeout):
+            raise ProviderBusyError(f"{provider} is at its concurrency limit")
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
+def _normalize_prompt(text: str) -> str:
+    return ' '.join((text or '').split())
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU of LLM responses with a TTL.
+
+    Keys are SHA-256 digests of (provider, model, normalized prompt, context
+    digest), so whitespace-only differences in a prompt hit the same entry.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, max_value_chars: int = 100_000):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_value_chars = max_value_chars
+        self._entries: 'OrderedDict[str, Tuple[float, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, context: Optional[Iterable[str]] = None) -> str:
+        context_digest = hashlib.sha256(
+            '\x1e'.join(_normalize_prompt(c) for c in (context or ())).encode('utf-8')
+        ).hexdigest()
+        material = '\x1f'.join((provider, model, _normalize_prompt(prompt), context_digest))
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, value: Optional[str]) -> None:
+        if not self.enabled or not value or len(value) > self.max_value_chars:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_pool: Optional[LLMProviderPool] = None
+_cache: Optional[ResponseCache] = None
+_singleton_lock = threading.Lock()
+
+
+def get_llm_pool() -> LLMProviderPool:
+    """Get or create the process-wide provider pool."""
+    global _pool
+    if _pool is None:
+        with _singleton_lock:
+            if _pool is None:
+                _pool = LLMProviderPool()
+    return _pool
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the process-wide LLM response cache."""
+    global _cache
+    if _cache is None:
+        with _singleton_lock:
+            if _cache is None:
+                _cache = ResponseCache(
+                    max_entries=int(getattr(settings, 'AI_RESPONSE_CACHE_MAX_ENTRIES', 512)),
+                    ttl=float(getattr(settings, 'AI_RESPONSE_CACHE_TTL', 3600)),
+                )
+    return _cache
+
+
+def reset_llm_pool() -> None:
+    """Drop the shared pool and cache (tests, settings changes)."""
+    global _pool, _cache
+    with _singleton_lock:
+        _pool = None
+        _cache = None
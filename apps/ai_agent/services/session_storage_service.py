@@ -1,6 +1,7 @@
 """AI Agent session storage service using S3 JSON storage."""
 
 import logging
+import math
 import uuid as uuid_lib
 from typing import Optional, Dict, Any, List
 from datetime import datetime
@@ -11,7 +12,26 @@ logger = logging.getLogger(__name__)
 
 
 class AISessionStorageService(S3ModelStorage):
-    """Storage service for AI learning sessions using S3 JSON storage."""
+    """
+    Storage service for AI learning sessions using S3 JSON storage.
+    
+    Chat messages are kept out of the session document in an append-only
+    log of fixed-size segments::
+    
+      models/ai_sessions/{session_id}/messages/000000.json   # messages 0..19
+      models/ai_sessions/{session_id}/messages/000001.json   # messages 20..39
+    
+    The session document carries ``message_count`` and ``message_tail``,
+    the last ``MESSAGE_SEGMENT_SIZE`` messages. The open segment is always a
+    suffix of the tail, so appending writes it without reading it back, and
+    prompt assembly (last 20 messages) needs no segment reads. A turn costs
+    the same number and size of writes regardless of history length.
+    Sessions created before the log keep an embedded ``messages`` list until
+    their next append moves it into segments.
+    """
+    
+    # Messages per segment; also the size of the tail kept on the session
+    MESSAGE_SEGMENT_SIZE = 20
     
     def __init__(self):
         """Initialize AI session storage service."""
@@ -49,7 +69,8 @@ class AISessionStorageService(S3ModelStorage):
             'updated_at': now,
             'started_at': None,
             'completed_at': None,
-            'messages': [],  # Chat messages stored as nested list
+            'message_count': 0,
+            'message_tail': [],  # Last MESSAGE_SEGMENT_SIZE messages; full log in segments
         }
         
         return self.create(session_data, item_uuid=session_id)
@@ -71,6 +92,17 @@ class AISessionStorageService(S3ModelStorage):
         
         return self.update(session_id, kwargs)
     
+    def _segment_key(self, session_id: str, segment: int) -> str:
+        """S3 key of one message log segment."""
+        return f"{self.models_prefix}{session_id}/messages/{segment:06d}.json"
+    
+    @staticmethod
+    def message_count(session: Dict[str, Any]) -> int:
+        """Number of messages in a session document (log or legacy embedded list)."""
+        if 'message_count' in session:
+            return session['message_count']
+        return len(session.get('messages') or [])
+    
     def add_message(
         self,
         session_id: str,
@@ -80,31 +112,116 @@ class AISessionStorageService(S3ModelStorage):
         metadata: Optional[Dict] = None
     ) -> Optional[Dict[str, Any]]:
         """Add a chat message to a session."""
+        return self.append_messages(session_id, [{
+            'role': role,
+            'content': content,
+            'created_by': created_by,
+            'metadata': metadata,
+        }])
+    
+    def append_messages(
+        self,
+        session_id: str,
+        messages: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Append messages (e.g. a user/assistant pair) to a session in one write.
+        
+        Args:
+            session_id: Session ID
+            messages: Dicts with 'role', 'content' and optional 'created_by'
+                and 'metadata'
+            
+        Returns:
+            Updated session data, or None if the session does not exist
+        """
         session = self.get(session_id)
         if not session:
             return None
         
-        message_id = str(uuid_lib.uuid4())
         now = datetime.utcnow().isoformat()
+        new_messages = [
+            {
+                'message_id': str(uuid_lib.uuid4()),
+                'role': message.get('role'),
+                'content': message.get('content'),
+                'metadata': message.get('metadata') or {},
+                'created_by': message.get('created_by'),
+                'created_at': now,
+            }
+            for message in messages
+        ]
         
-        message = {
-            'message_id': message_id,
-            'role': role,
-            'content': content,
-            'metadata': metadata or {},
-            'created_by': created_by,
-            'created_at': now,
-        }
+        if 'message_count' in session:
+            count = session['message_count']
+            tail = list(session.get('message_tail') or [])
+        else:
+            # Legacy session: move the embedded list into the log now
+            count, tail = 0, []
+            new_messages = list(session.get('messages') or []) + new_messages
+        if not new_messages:
+            return session
         
-        # Add message to session's messages list
-        messages = session.get('messages', [])
-        messages.append(message)
+        # Rewrite the open segment and write any new ones. Every message they
+        # hold is in tail + new_messages, which starts at index `base`.
+        size = self.MESSAGE_SEGMENT_SIZE
+        window = tail + new_messages
+        base = count - len(tail)
+        total = count + len(new_messages)
+        for segment in range(count // size, (total - 1) // size + 1):
+            start, end = segment * size, min((segment + 1) * size, total)
+            self.s3_json_storage.write_json(self._segment_key(session_id, segment), {
+                'session_id': session_id,
+                'segment': segment,
+                'messages': window[start - base:end - base],
+            })
         
-        return self.update(session_id, {'messages': messages})
+        update = {
+            'message_count': total,
+            'message_tail': window[-size:],
+        }
+        if 'messages' in session:
+            update['messages'] = []
+        return self.update(session_id, update)
     
-    def get_messages(self, session_id: str) -> List[Dict[str, Any]]:
-        """Get all messages for a session."""
+    def get_messages(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get messages for a session, oldest first.
+        
+        Args:
+            session_id: Session ID
+            limit: Only the last ``limit`` messages; up to MESSAGE_SEGMENT_SIZE
+                are served from the session document without segment reads
+            
+        Returns:
+            List of message dictionaries
+        """
         session = self.get(session_id)
         if not session:
             return []
-        return session.get('messages', [])
+        if 'message_count' not in session:
+            messages = session.get('messages') or []
+            return messages[-limit:] if limit else messages
+        
+        count = session['message_count']
+        tail = session.get('message_tail') or []
+        if count <= len(tail) or (limit and limit <= len(tail)):
+            return tail[-limit:] if limit else list(tail)
+        
+        size = self.MESSAGE_SEGMENT_SIZE
+        first_index = max(0, count - limit) if limit else 0
+        messages = []
+        for segment in range(first_index // size, math.ceil(count / size)):
+            data = self.s3_json_storage.read_json(self._segment_key(session_id, segment)) or {}
+            messages.extend(data.get('messages', []))
+        skip = first_index - (first_index // size) * size
+        return messages[skip:]
+    
+    def delete(self, item_uuid: str) -> bool:
+        """Delete a session and its message log segments."""
+        session = self.get(item_uuid)
+        deleted = super().delete(item_uuid)
+        if deleted and session and 'message_count' in session:
+            for segment in range(math.ceil(self.message_count(session) / self.MESSAGE_SEGMENT_SIZE)):
+                self.s3_json_storage.delete_json(self._segment_key(item_uuid, segment))
+        return deleted
@@ -0,0 +1,142 @@
+"""Tests for SSE streaming of AI chat replies."""
+import json
+import threading
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.ai_agent.services import chat_stream
+from apps.ai_agent.services.ai_service import AIService
+
+
+def _frames(chunks):
+    """Parse SSE frames into (event, data) pairs."""
+    parsed = []
+    for frame in chunks:
+        event, data = frame.strip().split('\n')
+        parsed.append((event[len('event: '):], json.loads(data[len('data: '):])))
+    return parsed
+
+
+class FakeAIService:
+    """Streams the given tokens and records whether the stream was closed."""
+
+    def __init__(self, tokens, final=None):
+        self.tokens = tokens
+        self.final = final or {'type': 'done', 'metadata': {'provider': 'openai'}, 'groundingSources': []}
+        self.closed = False
+
+    def stream_chat_completion(self, messages, context=None):
+        try:
+            for token in self.tokens:
+                yield {'type': 'token', 'content': token}
+            yield self.final
+        finally:
+            self.closed = True
+
+
+class StalledAIService:
+    """Blocks before its first token until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def stream_chat_completion(self, messages, context=None):
+        self.release.wait(5)
+        yield {'type': 'token', 'content': 'late'}
+        yield {'type': 'done', 'metadata': {}, 'groundingSources': []}
+
+
+class StreamChatReplyTest(SimpleTestCase):
+
+    def setUp(self):
+        self.storage = Mock()
+
+    def _stream(self, ai_service, **kwargs):
+        return chat_stream.stream_chat_reply(
+            ai_service, self.storage, 's1', 'u1', 'Hi', [{'role': 'user', 'content': 'Hi'}], **kwargs
+        )
+
+    def _saved_reply(self):
+        self.storage.append_messages.assert_called_once()
+        session_id, (user, reply) = self.storage.append_messages.call_args.args
+        self.assertEqual((session_id, user['content']), ('s1', 'Hi'))
+        return reply
+
+    def test_tokens_are_relayed_then_reply_saved(self):
+        frames = _frames(self._stream(FakeAIService(['Hel', 'lo']), stream_id='abc'))
+        self.assertEqual([e for e, _ in frames], ['start', 'token', 'token', 'done'])
+        self.assertEqual(frames[0][1], {'session_id': 's1', 'stream_id': 'abc'})
+        self.assertEqual(frames[-1][1]['content'], 'Hello')
+        reply = self._saved_reply()
+        self.assertEqual(reply['content'], 'Hello')
+        self.assertEqual(reply['metadata'], {'groundingSources': [], 'provider': 'openai'})
+
+    def test_client_disconnect_closes_provider_and_saves_partial(self):
+        ai_service = FakeAIService(['a', 'b', 'c'])
+        stream = self._stream(ai_service)
+        next(stream)
+        next(stream)
+        stream.close()
+        self.assertTrue(ai_service.closed)
+        reply = self._saved_reply()
+        self.assertEqual(reply['content'], 'a')
+        self.assertEqual(reply['metadata']['reason'], 'disconnected')
+
+    @patch.object(chat_stream, 'CANCEL_POLL_INTERVAL', 0)
+    def test_cancel_request_stops_stream(self):
+        stream = self._stream(FakeAIService(['a', 'b', 'c']), stream_id='xyz')
+        self.assertEqual(_frames([next(stream)])[0][0], 'start')
+        chat_stream.request_cancel('xyz')
+        frames = _frames(stream)
+        self.assertEqual(frames[-1], ('cancelled', {'content': 'a', 'reason': 'cancelled', 'session_id': 's1'}))
+        self.assertFalse(chat_stream.is_cancelled('xyz'))
+        self.assertTrue(self._saved_reply()['metadata']['cancelled'])
+
+    @override_settings(AI_CHAT_STREAM_MAX_SECONDS=0.05)
+    def test_deadline_applies_before_first_token(self):
+        ai_service = StalledAIService()
+        self.addCleanup(ai_service.release.set)
+        frames = _frames(self._stream(ai_service))
+        self.assertEqual(frames[-1], ('cancelled', {'content': '', 'reason': 'timeout', 'session_id': 's1'}))
+        self.assertEqual(self._saved_reply()['metadata']['reason'], 'timeout')
+
+    @patch.object(chat_stream, 'CANCEL_POLL_INTERVAL', 0)
+    def test_cancel_applies_before_first_token(self):
+        ai_service = StalledAIService()
+        self.addCleanup(ai_service.release.set)
+        stream = self._stream(ai_service, stream_id='early')
+        next(stream)
+        chat_stream.request_cancel('early')
+        self.assertEqual(_frames(stream)[-1][1]['reason'], 'cancelled')
+
+    def test_done_frame_carries_grounding_sources(self):
+        sources = [{'title': 'Guide', 'uri': 'https://docs.test/guide'}]
+        final = {'type': 'done', 'metadata': {}, 'groundingSources': sources}
+        frames = _frames(self._stream(FakeAIService(['ok'], final=final)))
+        self.assertEqual(frames[-1][1]['groundingSources'], sources)
+        self.assertEqual(self._saved_reply()['metadata']['groundingSources'], sources)
+
+    def test_error_without_content_is_not_saved(self):
+        frames = _frames(self._stream(FakeAIService([], final={'type': 'error', 'error': 'boom'})))
+        self.assertEqual(frames[-1][0], 'error')
+        self.storage.append_messages.assert_not_called()
+
+
+class StreamChatCompletionTest(SimpleTestCase):
+
+    def setUp(self):
+        self.service = AIService.__new__(AIService)
+        self.service.system_context = ''
+        self.service.lambda_client = None
+        self.service.gemini_model = Mock()
+
+    @patch('apps.ai_agent.services.ai_service.Config.is_openai_enabled', return_value=True)
+    @patch('apps.ai_agent.services.ai_service.OPENAI_AVAILABLE', True)
+    def test_falls_back_to_gemini_before_first_token(self, _enabled):
+        self.service._openai_chunks = Mock(side_effect=RuntimeError('rate limited'))
+        self.service.gemini_model.generate_content.return_value = [Mock(text='Hi'), Mock(text=' there')]
+        events = list(self.service.stream_chat_completion([{'role': 'user', 'content': 'Hello'}]))
+        self.assertEqual([e.get('content') for e in events[:-1]], ['Hi', ' there'])
+        self.assertEqual(events[-1]['metadata']['provider'], 'gemini')
+        self.assertTrue(self.service.gemini_model.generate_content.call_args.kwargs['stream'])
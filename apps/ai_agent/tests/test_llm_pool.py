@@ -0,0 +1,78 @@
+"""Tests for the shared LLM provider pool and response cache."""
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.ai_agent.services import llm_pool
+from apps.ai_agent.services.ai_service import AIService
+
+
+class ResponseCacheTest(SimpleTestCase):
+
+    def test_key_ignores_whitespace_but_not_context(self):
+        key = llm_pool.ResponseCache.make_key
+        self.assertEqual(key('openai', 'm', 'explain  this\n code'), key('openai', 'm', 'explain this code'))
+        self.assertNotEqual(key('openai', 'm', 'p', ['a']), key('openai', 'm', 'p', ['b']))
+        self.assertNotEqual(key('openai', 'm', 'p'), key('gemini', 'm', 'p'))
+
+    def test_lru_eviction_and_ttl(self):
+        cache = llm_pool.ResponseCache(max_entries=2, ttl=60)
+        cache.put('a', 'A')
+        cache.put('b', 'B')
+        self.assertEqual(cache.get('a'), 'A')
+        cache.put('c', 'C')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.get('a'), cache.get('c')), ('A', 'C'))
+        with patch.object(llm_pool.time, 'monotonic', return_value=llm_pool.time.monotonic() + 61):
+            self.assertIsNone(cache.get('a'))
+        cache.put('empty', '')
+        self.assertIsNone(cache.get('empty'))
+
+
+class ProviderPoolTest(SimpleTestCase):
+
+    @override_settings(AI_GEMINI_MAX_CONCURRENCY=1, AI_PROVIDER_ACQUIRE_TIMEOUT=0)
+    def test_slot_limit_raises_busy(self):
+        pool = llm_pool.LLMProviderPool()
+        with pool.slot('gemini'):
+            with self.assertRaises(llm_pool.ProviderBusyError):
+                with pool.slot('gemini'):
+                    pass
+        with pool.slot('gemini'):
+            pass
+
+    @patch('apps.ai_agent.services.llm_pool.Config.is_gemini_enabled', return_value=True)
+    def test_gemini_model_is_built_once(self, _enabled):
+        genai = Mock()
+        pool = llm_pool.LLMProviderPool()
+        self.assertIs(pool.gemini_model(genai), pool.gemini_model(genai))
+        genai.configure.assert_called_once()
+        genai.GenerativeModel.assert_called_once_with('gemini-pro')
+
+
+class GetCompletionCacheTest(SimpleTestCase):
+
+    def setUp(self):
+        llm_pool.reset_llm_pool()
+        self.addCleanup(llm_pool.reset_llm_pool)
+        self.service = AIService.__new__(AIService)
+        self.service.system_context = ''
+        self.service.gemini_model = None
+        self.service.lambda_client = None
+        self.service.chat_completion = Mock(return_value={'content': 'summary'})
+
+    def test_identical_prompts_hit_cache(self):
+        for prompt in ('Summarize  this', 'Summarize this'):
+            self.assertEqual(self.service.get_completion(prompt, system_prompt='Be brief', temperature=0.3),
+                             'summary')
+        self.service.chat_completion.assert_called_once()
+        self.service.get_completion('Summarize this', system_prompt='Be brief', temperature=0.9)
+        self.service.get_completion('Summarize this', system_prompt='Be brief', temperature=0.3, use_cache=False)
+        self.assertEqual(self.service.chat_completion.call_count, 3)
+
+    def test_failures_raise_and_are_not_cached(self):
+        self.service.chat_completion.return_value = None
+        with self.assertRaises(RuntimeError):
+            self.service.get_completion('Summarize this')
+        self.service.chat_completion.return_value = {'content': 'ok'}
+        self.assertEqual(self.service.get_completion('Summarize this'), 'ok')
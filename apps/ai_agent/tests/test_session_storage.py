@@ -0,0 +1,62 @@
+"""Tests for the append-only chat message log of AISessionStorageService."""
+from django.test import SimpleTestCase
+
+from apps.ai_agent.services.session_storage_service import AISessionStorageService
+from apps.core.tests.helpers import FakeJSONStorage
+
+
+class MessageLogTest(SimpleTestCase):
+
+    def setUp(self):
+        self.storage = AISessionStorageService()
+        self.storage.MESSAGE_SEGMENT_SIZE = 4
+        self.storage.model_name = self.storage.cache_prefix = f'ai-sessions-test-{id(self)}:'
+        self.json = self.storage.s3_json_storage = FakeJSONStorage()
+        self.session_id = self.storage.create_session('Chat', created_by='u1')['session_id']
+
+    def _turn(self, n):
+        return self.storage.append_messages(self.session_id, [
+            {'role': 'user', 'content': f'q{n}'},
+            {'role': 'assistant', 'content': f'a{n}', 'metadata': {'provider': 'test'}},
+        ])
+
+    def _segments(self):
+        return sorted(k for k in self.json.objects if '/messages/' in k)
+
+    def test_turns_write_bounded_segments_and_tail(self):
+        for n in range(5):
+            session = self._turn(n)
+        self.assertEqual(session['message_count'], 10)
+        self.assertEqual([m['content'] for m in session['message_tail']], ['q3', 'a3', 'q4', 'a4'])
+        self.assertEqual(len(self._segments()), 3)
+        self.assertEqual(
+            [m['content'] for m in self.json.objects[self._segments()[-1]]['messages']], ['q4', 'a4']
+        )
+
+        all_messages = self.storage.get_messages(self.session_id)
+        self.assertEqual([m['content'] for m in all_messages], [c for n in range(5) for c in (f'q{n}', f'a{n}')])
+        self.assertEqual(all_messages[1]['metadata'], {'provider': 'test'})
+        self.assertEqual([m['content'] for m in self.storage.get_messages(self.session_id, limit=7)],
+                         ['a1', 'q2', 'a2', 'q3', 'a3', 'q4', 'a4'])
+
+        self.json.reads.clear()
+        self.assertEqual(len(self.storage.get_messages(self.session_id, limit=3)), 3)
+        self.assertFalse([k for k in self.json.reads if '/messages/' in k])
+
+    def test_legacy_embedded_messages_move_into_log(self):
+        legacy = [{'role': 'user', 'content': f'old{n}'} for n in range(6)]
+        self.storage.update(self.session_id, {'messages': legacy})
+        session = self.storage.get(self.session_id)
+        del session['message_count']
+        self.storage.s3_json_storage.write_json(self.storage._get_item_key(self.session_id), session)
+
+        self.assertEqual(len(self.storage.get_messages(self.session_id)), 6)
+        session = self._turn(0)
+        self.assertEqual((session['message_count'], session['messages']), (8, []))
+        self.assertEqual([m['content'] for m in self.storage.get_messages(self.session_id)][-3:], ['old5', 'q0', 'a0'])
+
+    def test_delete_removes_segments(self):
+        for n in range(3):
+            self._turn(n)
+        self.assertTrue(self.storage.delete(self.session_id))
+        self.assertEqual(self._segments(), [])
@@ -12,4 +12,5 @@ urlpatterns = [
     path('sessions/', views.list_sessions_view, name='sessions'),
     path('sessions/<str:session_id>/', views.session_detail_view, name='session_detail'),
     path('api/chat/', views.chat_completion_api, name='chat_completion_api'),
+    path('api/chat/stream/', views.chat_stream_api, name='chat_stream_api'),
 ]
@@ -11,7 +11,8 @@ from django.contrib import messages
 from django.utils import timezone
 
 from apps.core.decorators.auth import require_super_admin
-from apps.ai_agent.services.ai_service import AIService
+from apps.ai_agent.services.ai_service import get_ai_service
+from apps.ai_agent.services.chat_stream import prepare_chat_turn, sse_response, stream_chat_reply
 from apps.ai_agent.services.session_storage_service import AISessionStorageService
 
 logger = logging.getLogger(__name__)
@@ -83,7 +84,7 @@ def chat_completion_api(request):
         if hasattr(request, 'appointment360_user'):
             user_uuid = request.appointment360_user.get('uuid')
         
-        ai_service = AIService()
+        ai_service = get_ai_service()
         storage = AISessionStorageService()
         
         # Retrieve context from local JSON files if not provided
@@ -107,10 +108,9 @@ def chat_completion_api(request):
         
         # Build messages for chat from storage
         messages_list = []
-        db_messages = storage.get_messages(session_id)
         
         # Get last 20 messages for context
-        for msg in db_messages[-20:]:
+        for msg in storage.get_messages(session_id, limit=20):
             messages_list.append({
                 'role': msg.get('role'),
                 'content': msg.get('content')
@@ -128,28 +128,19 @@ def chat_completion_api(request):
             # Extract grounding sources from response
             grounding_sources = response.get('groundingSources', [])
             
-            # Save user message
-            storage.add_message(
-                session_id,
-                role='user',
-                content=message,
-                created_by=user_uuid
-            )
-            
-            # Save assistant message
-            storage.add_message(
-                session_id,
-                role='assistant',
-                content=response.get('content', ''),
-                created_by=user_uuid,
-                metadata={
-                    'groundingSources': grounding_sources,
-                    **response.get('metadata', {})
-                }
-            )
-            
-            # Update session
-            storage.update_session(session_id, updated_at=timezone.now().isoformat())
+            # Save user and assistant messages in one append (also bumps updated_at)
+            storage.append_messages(session_id, [
+                {'role': 'user', 'content': message, 'created_by': user_uuid},
+                {
+                    'role': 'assistant',
+                    'content': response.get('content', ''),
+                    'created_by': user_uuid,
+                    'metadata': {
+                        'groundingSources': grounding_sources,
+                        **response.get('metadata', {})
+                    }
+                },
+            ])
             
             return JsonResponse({
                 'success': True,
@@ -166,6 +157,48 @@ def chat_completion_api(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@require_super_admin
+@require_http_methods(["POST"])
+@csrf_exempt
+def chat_stream_api(request):
+    """
+    Streaming chat completion (text/event-stream).
+    
+    Same request body as chat_completion_api; tokens are sent as SSE
+    ``token`` events as the model produces them and the reply is saved to
+    the session when the stream ends (see chat_stream.stream_chat_reply).
+    """
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    
+    message = data.get('message', '')
+    if not message:
+        return JsonResponse({'error': 'Message is required'}, status=400)
+    
+    # Get user UUID from token
+    user_uuid = None
+    if hasattr(request, 'appointment360_user'):
+        user_uuid = request.appointment360_user.get('uuid')
+    
+    ai_service = get_ai_service()
+    storage = AISessionStorageService()
+    
+    turn = prepare_chat_turn(storage, data.get('session_id'), user_uuid, message)
+    if turn is None:
+        return JsonResponse({'error': 'Session not found'}, status=404)
+    session_id, messages_list = turn
+    
+    # Retrieve context from local JSON files if not provided
+    context = data.get('context') or ai_service.retrieve_context(message, limit=5)
+    
+    return sse_response(stream_chat_reply(
+        ai_service, storage, session_id, user_uuid, message, messages_list,
+        context=context, stream_id=data.get('stream_id')
+    ))
+
+
 @require_super_admin
 def list_sessions_view(request):
     """List all AI sessions."""
@@ -181,7 +214,7 @@ def list_sessions_view(request):
     
     sessions_list = []
     for session in all_sessions.get('items', []):
-        message_count = len(session.get('messages', []))
+        message_count = storage.message_count(session)
         sessions_list.append({
             'session': session,
             'message_count': message_count
@@ -1,13 +1,88 @@
-"""Codebase analysis service for scanning and analyzing codebases."""
+"""
+Codebase analysis service for scanning and analyzing codebases.
+
+Per-file analysis runs in a process pool for large batches and is cached per
+process, keyed by (path, mtime, size, content hash): a re-scan only stats
+unchanged files, re-hashes files whose stat changed, and re-parses only
+files whose content actually changed.
+"""
 
 import os
 import ast
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
 
+from django.conf import settings
+
 logger = logging.getLogger(__name__)
 
+SKIP_DIRS = {'.git', '__pycache__', 'node_modules', '.venv', 'venv', '.cursor'}
+LANGUAGES = {'.py': 'Python', '.js': 'JavaScript', '.jsx': 'JavaScript', '.ts': 'JavaScript', '.tsx': 'JavaScript'}
+
+# path -> (mtime_ns, size, sha1 of content, file_info)
+_file_cache: Dict[str, Tuple[int, int, str, Dict[str, Any]]] = {}
+_file_cache_lock = threading.Lock()
+
+
+def analyze_source(file_path: str, file_ext: str, content: bytes) -> Dict[str, Any]:
+    """
+    Analyze one file's content (process pool worker; no Django access).
+
+    Python files are parsed once and walked once for classes, functions and
+    imports.
+    """
+    text = content.decode('utf-8', errors='ignore')
+    file_info = {
+        'path': file_path,
+        'name': os.path.basename(file_path),
+        'extension': file_ext,
+        'language': LANGUAGES.get(file_ext, 'Unknown'),
+        'lines': len(text.split('\n')),
+        'size': len(content),
+    }
+    if file_ext == '.py':
+        try:
+            tree = ast.parse(text)
+        except SyntaxError:
+            file_info['parse_error'] = True
+            return file_info
+        classes = functions = 0
+        imports = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                classes += 1
+            elif isinstance(node, ast.FunctionDef):
+                functions += 1
+            elif isinstance(node, ast.Import):
+                imports.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                imports.append(node.module)
+        file_info['classes'] = classes
+        file_info['functions'] = functions
+        file_info['imports'] = imports
+    return file_info
+
+
+def analyze_batch(batch: List[Tuple[str, str, bytes]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Analyze (path, ext, content) triples; returns (path, file_info) pairs."""
+    results = []
+    for file_path, file_ext, content in batch:
+        try:
+            results.append((file_path, analyze_source(file_path, file_ext, content)))
+        except Exception as e:
+            logger.error(f"Error analyzing file {file_path}: {str(e)}")
+    return results
+
+
+def clear_file_cache() -> None:
+    """Forget cached per-file results (tests, or after bulk checkouts)."""
+    with _file_cache_lock:
+        _file_cache.clear()
+
 
 class CodebaseAnalysisService:
     """Service for analyzing codebases."""
@@ -17,20 +92,40 @@ class CodebaseAnalysisService:
     JAVASCRIPT_EXTENSIONS = {'.js', '.jsx', '.ts', '.tsx'}
     SUPPORTED_EXTENSIONS = PYTHON_EXTENSIONS | JAVASCRIPT_EXTENSIONS
     
-    def __init__(self):
-        """Initialize codebase analysis service."""
-        pass
+    # Below this many changed files the pool start-up cost outweighs the parallelism
+    MIN_FILES_FOR_POOL = 32
+    BATCH_SIZE = 64
     
-    def scan_directory(self, target_path: str, analysis_type: str = 'full_scan') -> Dict[str, Any]:
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize codebase analysis service.
+        
+        Args:
+            max_workers: Process pool size (default: CODEBASE_SCAN_MAX_WORKERS, then CPU count)
+        """
+        self.max_workers = (
+            max_workers
+            or getattr(settings, 'CODEBASE_SCAN_MAX_WORKERS', 0)
+            or os.cpu_count()
+            or 1
+        )
+    
+    def scan_directory(
+        self,
+        target_path: str,
+        analysis_type: str = 'full_scan',
+        on_file: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
         """
         Scan a directory and analyze the codebase.
         
         Args:
             target_path: Path to the directory to scan
             analysis_type: Type of analysis to perform
+            on_file: Called with each file's analysis as soon as it is available
             
         Returns:
-            Analysis results dictionary
+            Analysis results dictionary (files sorted by path)
         """
         results = {
             'files': [],
@@ -45,25 +140,17 @@ class CodebaseAnalysisService:
             logger.error(f"Target path does not exist: {target_path}")
             return results
         
-        # Scan files
-        for root, dirs, files in os.walk(target_path):
-            # Skip common directories
-            dirs[:] = [d for d in dirs if d not in {'.git', '__pycache__', 'node_modules', '.venv', 'venv', '.cursor'}]
+        for file_info in self.iter_file_results(target_path):
+            results['files'].append(file_info)
+            results['total_files'] += 1
+            results['total_lines'] += file_info.get('lines', 0)
             
-            for file in files:
-                file_path = os.path.join(root, file)
-                file_ext = os.path.splitext(file)[1]
-                
-                if file_ext in self.SUPPORTED_EXTENSIONS:
-                    file_info = self._analyze_file(file_path, file_ext)
-                    if file_info:
-                        results['files'].append(file_info)
-                        results['total_files'] += 1
-                        results['total_lines'] += file_info.get('lines', 0)
-                        
-                        # Track languages
-                        lang = self._get_language(file_ext)
-                        results['languages'][lang] = results['languages'].get(lang, 0) + 1
+            # Track languages
+            lang = file_info.get('language') or self._get_language(file_info.get('extension', ''))
+            results['languages'][lang] = results['languages'].get(lang, 0) + 1
+            if on_file is not None:
+                on_file(file_info)
+        results['files'].sort(key=lambda f: f['path'])
         
         # Detect dependencies
         results['dependencies'] = self._detect_dependencies(target_path)
@@ -73,6 +160,77 @@ class CodebaseAnalysisService:
         
         return results
     
+    def _discover_files(self, target_path: str) -> Iterator[Tuple[str, str]]:
+        """Yield (path, extension) for every supported file under target_path."""
+        for root, dirs, files in os.walk(target_path):
+            # Skip common directories
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for file in files:
+                file_ext = os.path.splitext(file)[1]
+                if file_ext in self.SUPPORTED_EXTENSIONS:
+                    yield os.path.join(root, file), file_ext
+    
+    def iter_file_results(self, target_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield per-file analyses, cached ones first, then changed files as they complete.
+        
+        Unchanged files (same mtime and size) are served from the cache without
+        being read; files whose stat changed are read and hashed, and only
+        those whose content hash changed are parsed.
+        """
+        pending: List[Tuple[str, str, bytes]] = []
+        stats: Dict[str, Tuple[int, int, str]] = {}
+        for file_path, file_ext in self._discover_files(target_path):
+            try:
+                stat = os.stat(file_path)
+            except OSError as e:
+                logger.error(f"Error analyzing file {file_path}: {str(e)}")
+                continue
+            with _file_cache_lock:
+                cached = _file_cache.get(file_path)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                yield cached[3]
+                continue
+            try:
+                with open(file_path, 'rb') as f:
+                    content = f.read()
+            except OSError as e:
+                logger.error(f"Error analyzing file {file_path}: {str(e)}")
+                continue
+            digest = hashlib.sha1(content).hexdigest()
+            if cached and cached[2] == digest:
+                with _file_cache_lock:
+                    _file_cache[file_path] = (stat.st_mtime_ns, stat.st_size, digest, cached[3])
+                yield cached[3]
+                continue
+            stats[file_path] = (stat.st_mtime_ns, stat.st_size, digest)
+            pending.append((file_path, file_ext, content))
+        
+        for file_path, file_info in self._analyze_pending(pending):
+            mtime_ns, size, digest = stats[file_path]
+            with _file_cache_lock:
+                _file_cache[file_path] = (mtime_ns, size, digest, file_info)
+            yield file_info
+    
+    def _analyze_pending(self, pending: List[Tuple[str, str, bytes]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Analyze changed files, in a process pool when the batch is large enough."""
+        if self.max_workers <= 1 or len(pending) < self.MIN_FILES_FOR_POOL:
+            yield from analyze_batch(pending)
+            return
+        
+        batches = [pending[i:i + self.BATCH_SIZE] for i in range(0, len(pending), self.BATCH_SIZE)]
+        done = set()
+        try:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+                futures = [executor.submit(analyze_batch, batch) for batch in batches]
+                for future in as_completed(futures):
+                    for file_path, file_info in future.result():
+                        done.add(file_path)
+                        yield file_path, file_info
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Process pool unavailable ({e}), analyzing files sequentially")
+            yield from analyze_batch([item for item in pending if item[0] not in done])
+    
     def _analyze_file(self, file_path: str, file_ext: str) -> Optional[Dict[str, Any]]:
         """
         Analyze a single file.
@@ -85,30 +243,9 @@ class CodebaseAnalysisService:
             File analysis dictionary, or None if error
         """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            with open(file_path, 'rb') as f:
                 content = f.read()
-                lines = content.split('\n')
-            
-            file_info = {
-                'path': file_path,
-                'name': os.path.basename(file_path),
-                'extension': file_ext,
-                'language': self._get_language(file_ext),
-                'lines': len(lines),
-                'size': os.path.getsize(file_path)
-            }
-            
-            # Parse code if Python
-            if file_ext == '.py':
-                try:
-                    tree = ast.parse(content)
-                    file_info['classes'] = len([node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)])
-                    file_info['functions'] = len([node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)])
-                    file_info['imports'] = self._extract_imports(tree)
-                except SyntaxError:
-                    file_info['parse_error'] = True
-            
-            return file_info
+            return analyze_source(file_path, file_ext, content)
         except Exception as e:
             logger.error(f"Error analyzing file {file_path}: {str(e)}")
             return None
@@ -121,18 +258,6 @@ class CodebaseAnalysisService:
             return 'JavaScript'
         return 'Unknown'
     
-    def _extract_imports(self, tree: ast.AST) -> List[str]:
-        """Extract import statements from AST."""
-        imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append(node.module)
-        return imports
-    
     def _detect_dependencies(self, target_path: str) -> List[str]:
         """
         Detect dependencies from requirements.txt, package.json, etc.
@@ -220,18 +345,25 @@ class CodebaseAnalysisService:
         
         return patterns
     
-    def create_analysis(self, target_path: str, name: str = None) -> Dict[str, Any]:
+    def create_analysis(
+        self,
+        target_path: str,
+        name: str = None,
+        on_file: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
         """
         Create a new codebase analysis.
         
         Args:
             target_path: Path to analyze
             name: Optional analysis name
+            on_file: Receives each file's analysis as it completes (e.g. to
+                append it to a stored analysis record while the scan runs)
             
         Returns:
             Analysis data dictionary
         """
-        scan_results = self.scan_directory(target_path)
+        scan_results = self.scan_directory(target_path, on_file=on_file)
         
         analysis_data = {
             'name': name or os.path.basename(target_path),
@@ -0,0 +1 @@
+"""Codebase tests."""
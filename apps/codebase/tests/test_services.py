@@ -0,0 +1,61 @@
+"""Tests for the cached, parallel codebase scanner."""
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from apps.codebase import services
+from apps.codebase.services import CodebaseAnalysisService, clear_file_cache
+
+
+class CodebaseScanTest(SimpleTestCase):
+
+    def setUp(self):
+        clear_file_cache()
+        self.addCleanup(clear_file_cache)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        (self.root / 'app_service.py').write_text(
+            "import django\nfrom os import path\n\nclass A:\n    def f(self):\n        pass\n"
+        )
+        (self.root / 'broken.py').write_text("def (:\n")
+        (self.root / 'node_modules').mkdir()
+        (self.root / 'node_modules' / 'skip.js').write_text("x")
+        (self.root / 'view.tsx').write_text("export const X = 1;\n")
+
+    def test_single_pass_analysis(self):
+        results = CodebaseAnalysisService(max_workers=1).scan_directory(str(self.root))
+        self.assertEqual([f['name'] for f in results['files']], ['app_service.py', 'broken.py', 'view.tsx'])
+        service_file = results['files'][0]
+        self.assertEqual((service_file['classes'], service_file['functions']), (1, 1))
+        self.assertEqual(service_file['imports'], ['django', 'os'])
+        self.assertTrue(results['files'][1]['parse_error'])
+        self.assertEqual(results['languages'], {'Python': 2, 'JavaScript': 1})
+        self.assertEqual({p['name'] for p in results['patterns']}, {'Django', 'React', 'Service Layer'})
+
+    def test_rescan_only_parses_changed_content(self):
+        service = CodebaseAnalysisService(max_workers=1)
+        service.scan_directory(str(self.root))
+        target = self.root / 'view.tsx'
+        stat = target.stat()
+        # Touched but identical content: re-hashed, not re-parsed
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        (self.root / 'broken.py').write_text("x = 1\n")
+
+        streamed = []
+        with patch.object(services, 'analyze_source', wraps=services.analyze_source) as analyze:
+            results = service.scan_directory(str(self.root), on_file=streamed.append)
+        self.assertEqual([c.args[0] for c in analyze.call_args_list], [str(self.root / 'broken.py')])
+        self.assertEqual(len(streamed), 3)
+        self.assertNotIn('parse_error', results['files'][1])
+
+    def test_process_pool_matches_sequential(self):
+        for i in range(40):
+            (self.root / f'mod_{i}.py').write_text(f"def f{i}():\n    return {i}\n")
+        sequential = CodebaseAnalysisService(max_workers=1).scan_directory(str(self.root))
+        clear_file_cache()
+        parallel = CodebaseAnalysisService(max_workers=2).scan_directory(str(self.root))
+        self.assertEqual(parallel, sequential)
@@ -22,7 +22,8 @@ def cache_response(
     namespace: Optional[str] = None,
     vary_on_headers: Optional[list] = None,
     vary_on_query_params: Optional[list] = None,
-    condition: Optional[Callable[[Any], bool]] = None
+    condition: Optional[Callable[[Any], bool]] = None,
+    vary_on: Optional[Callable[[Any], str]] = None
 ):
     """
     Decorator to cache API responses using RedisCacheManager.
@@ -34,6 +35,7 @@ def cache_response(
         vary_on_headers: List of headers to include in cache key
         vary_on_query_params: List of query parameters to include in cache key
         condition: Optional function to determine if response should be cached
+        vary_on: Optional function of the request whose result is added to the cache key
     
     Usage:
         @cache_response(timeout=600, vary_on_query_params=['page_type', 'status'])
@@ -77,6 +79,9 @@ def cache_response(
             if kwargs:
                 cache_key_parts.append(json.dumps(kwargs, sort_keys=True))
             
+            if vary_on:
+                cache_key_parts.append(vary_on(request))
+            
             # Create hash for cache key
             cache_key_str = ':'.join(str(part) for part in cache_key_parts)
             cache_key_hash = hashlib.md5(cache_key_str.encode()).hexdigest()
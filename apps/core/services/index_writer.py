@@ -0,0 +1,138 @@
+"""
+Write-combining, compare-and-swap writer for shared S3 JSON documents.
+
+S3ModelStorage keeps one ``index.json`` (and optionally ``search_index.json``)
+per model, which every create/update/delete rewrites. Two problems follow:
+
+- Writers in different processes (gunicorn workers, Django-Q clusters) doing
+  read-modify-write silently overwrite each other's changes.
+- Writers in one process all queue on the same object anyway.
+
+``IndexWriter`` fixes both. Callers submit *mutations*: functions that take
+the current document (or None) and return the new one (or None to leave it
+absent). The first caller to arrive becomes the leader. It waits
+``S3_INDEX_WRITE_COALESCE_MS`` for more mutations and then applies the whole
+queue in one read-modify-write. Everyone else waits for that commit. Each
+commit reads the document with its ETag and writes it back conditionally
+(If-Match, or If-None-Match for a new document). When another process wins
+the race, the commit re-reads and re-applies the same mutations, retrying up
+to ``S3_INDEX_WRITE_MAX_RETRIES`` times with jittered backoff.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from apps.core.exceptions import S3Error
+
+logger = logging.getLogger(__name__)
+
+Mutation = Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+
+
+class _Pending:
+    __slots__ = ('mutation', 'done', 'error')
+
+    def __init__(self, mutation: Mutation):
+        self.mutation = mutation
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class IndexWriter:
+    """Coalesces and commits mutations of one S3 JSON document."""
+
+    def __init__(self, s3_key: str):
+        self.s3_key = s3_key
+        self._queue: List[_Pending] = []
+        self._lock = threading.Lock()
+        self._leader_active = False
+        self.commits = 0
+        self.conflicts = 0
+
+    def submit(self, json_storage, mutation: Mutation) -> None:
+        """
+        Apply ``mutation`` to the document and return once it is durable.
+
+        Raises:
+            S3Error: if the write failed or kept losing races after retries
+        """
+        pending = _Pending(mutation)
+        with self._lock:
+            self._queue.append(pending)
+            lead = not self._leader_active
+            if lead:
+                self._leader_active = True
+        if lead:
+            self._lead(json_storage)
+        else:
+            pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+
+    def _lead(self, json_storage) -> None:
+        window = getattr(settings, 'S3_INDEX_WRITE_COALESCE_MS', 10) / 1000.0
+        if window > 0:
+            time.sleep(window)
+        while True:
+            with self._lock:
+                batch, self._queue = self._queue, []
+                if not batch:
+                    self._leader_active = False
+                    return
+            try:
+                self._commit(json_storage, batch)
+            except Exception as e:
+                for pending in batch:
+                    pending.error = e
+            finally:
+                for pending in batch:
+                    pending.done.set()
+
+    def _commit(self, json_storage, batch: List[_Pending]) -> None:
+        max_retries = getattr(settings, 'S3_INDEX_WRITE_MAX_RETRIES', 8)
+        for attempt in range(max_retries + 1):
+            data, etag = json_storage.read_json_versioned(self.s3_key)
+            created = data is None
+            for pending in batch:
+                data = pending.mutation(data)
+            if data is None:
+                return
+            try:
+                json_storage.write_json(self.s3_key, data, etag=etag, create_only=created)
+                self.commits += 1
+                if len(batch) > 1:
+                    logger.debug(f"Committed {len(batch)} coalesced mutations to {self.s3_key}")
+                return
+            except S3Error as e:
+                if e.error_code != 'PRECONDITION_FAILED':
+                    raise
+                self.conflicts += 1
+                if attempt == max_retries:
+                    break
+                # Jittered exponential backoff so competing processes spread out
+                time.sleep(random.uniform(0, 0.02 * (2 ** min(attempt, 6))))
+        raise S3Error(
+            f"Gave up writing {self.s3_key} after {max_retries + 1} conflicting attempts",
+            s3_key=self.s3_key,
+            operation='index_write',
+            error_code='INDEX_WRITE_CONFLICT'
+        )
+
+
+_writers: Dict[Tuple[Any, str], IndexWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_index_writer(json_storage, s3_key: str) -> IndexWriter:
+    """The process-wide writer for one document of one bucket."""
+    key = (getattr(json_storage, 'bucket_name', None), s3_key)
+    writer = _writers.get(key)
+    if writer is None:
+        with _writers_lock:
+            writer = _writers.setdefault(key, IndexWriter(s3_key))
+    return writer
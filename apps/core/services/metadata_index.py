@@ -0,0 +1,192 @@
+"""
+Query engine over an S3 model's index.json metadata.
+
+``MetadataIndex`` holds the index ``items`` column-wise and builds, on first
+use of a field, a hash index (value -> positions) for filtering and sorted
+position lists for ordering. Which fields exist is decided by each storage
+subclass's ``_extract_metadata``; nothing needs declaring up front. Indexes
+are built once per index version and shared by every ``list``/``count`` call
+in the process until the next write changes ``updated_at``.
+
+Filtering follows ``S3ModelStorage.list`` semantics: scalar values match by
+equality, list/tuple values mean "any of". Compound filters intersect the
+per-field position sets smallest first. Ordering uses the sorted lists, or a
+heap when only a small page of a small candidate set is needed, so a page
+never requires sorting all matches.
+"""
+
+import heapq
+import logging
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Candidate sets smaller than this fraction of the index are ordered with a
+# heap instead of walking the field's full sorted list
+HEAP_SELECT_RATIO = 0.1
+
+_UNHASHABLE = object()
+
+
+def _hash_key(value: Any) -> Any:
+    """Hashable form of a metadata value, or ``_UNHASHABLE``."""
+    if isinstance(value, list):
+        value = ('__list__', tuple(value))
+    try:
+        hash(value)
+    except TypeError:
+        return _UNHASHABLE
+    return value
+
+
+def _sort_value(value: Any) -> Any:
+    return '' if value is None else value
+
+
+class MetadataIndex:
+    """Column-wise, lazily indexed view of one index.json ``items`` list."""
+
+    def __init__(self, items: Sequence[Dict[str, Any]], version: Any = None):
+        self.items = list(items)
+        self.version = version
+        self._hash: Dict[str, Dict[Hashable, Set[int]]] = {}
+        # Positions whose value could not be hashed, checked by equality
+        self._unhashed: Dict[str, Set[int]] = {}
+        self._sorted: Dict[Tuple[str, bool], List[int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    # ------------------------------------------------------------------
+    # Per-field indexes
+    # ------------------------------------------------------------------
+
+    def _hash_index(self, field: str) -> Tuple[Dict[Hashable, Set[int]], Set[int]]:
+        index = self._hash.get(field)
+        if index is None:
+            with self._lock:
+                index = self._hash.get(field)
+                if index is None:
+                    index, unhashed = {}, set()
+                    for pos, item in enumerate(self.items):
+                        key = _hash_key(item.get(field))
+                        if key is _UNHASHABLE:
+                            unhashed.add(pos)
+                        else:
+                            index.setdefault(key, set()).add(pos)
+                    self._unhashed[field] = unhashed
+                    self._hash[field] = index
+        return index, self._unhashed[field]
+
+    def _sorted_positions(self, field: str, descending: bool) -> List[int]:
+        """Positions ordered by ``field``; ties keep index order in both directions."""
+        key = (field, descending)
+        order = self._sorted.get(key)
+        if order is None:
+            values = [_sort_value(item.get(field, '')) for item in self.items]
+            try:
+                order = sorted(range(len(values)), key=values.__getitem__, reverse=descending)
+            except TypeError:
+                # Mixed value types in one field: fall back to comparing as strings
+                order = sorted(range(len(values)), key=lambda p: str(values[p]), reverse=descending)
+            with self._lock:
+                self._sorted[key] = order
+        return order
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _field_matches(self, field: str, value: Any) -> Set[int]:
+        index, unhashed = self._hash_index(field)
+        wanted = value if isinstance(value, (list, tuple)) else [value]
+        matched: Set[int] = set()
+        for candidate in wanted:
+            key = _hash_key(candidate)
+            if key is not _UNHASHABLE:
+                matched |= index.get(key, set())
+        for pos in unhashed:
+            if self.items[pos].get(field) in wanted:
+                matched.add(pos)
+        return matched
+
+    def filter(self, filters: Optional[Dict[str, Any]]) -> Optional[Set[int]]:
+        """Positions matching every filter, or None for "all items"."""
+        if not filters:
+            return None
+        # Plan: evaluate every predicate from its hash index, then intersect
+        # smallest first so later intersections stay cheap.
+        matches = sorted((self._field_matches(f, v) for f, v in filters.items()), key=len)
+        result = set(matches[0])
+        for match in matches[1:]:
+            if not result:
+                break
+            result &= match
+        return result
+
+    def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        matched = self.filter(filters)
+        return len(self.items) if matched is None else len(matched)
+
+    def select(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: str = 'created_at',
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        One page of matching metadata entries in order.
+
+        Returns:
+            ``(entries, total)`` where ``total`` counts all matches
+        """
+        matched = self.filter(filters)
+        total = len(self.items) if matched is None else len(matched)
+        wanted = None if limit is None else offset + limit
+        if total == 0 or (wanted is not None and wanted <= 0):
+            return [], total
+
+        if matched is not None and wanted is not None and total <= HEAP_SELECT_RATIO * len(self.items):
+            values = {pos: _sort_value(self.items[pos].get(order_by, '')) for pos in matched}
+            try:
+                if descending:
+                    page = heapq.nlargest(wanted, matched, key=lambda p: (values[p], -p))
+                else:
+                    page = heapq.nsmallest(wanted, matched, key=lambda p: (values[p], p))
+            except TypeError:
+                page = [p for p in self._sorted_positions(order_by, descending) if p in matched][:wanted]
+        else:
+            page = []
+            for pos in self._sorted_positions(order_by, descending):
+                if matched is None or pos in matched:
+                    page.append(pos)
+                    if wanted is not None and len(page) >= wanted:
+                        break
+        return [self.items[pos] for pos in page[offset:]], total
+
+
+# Engines per model, reused while index.json's updated_at is unchanged
+_engines: Dict[str, MetadataIndex] = {}
+_engines_lock = threading.Lock()
+
+
+def engine_for(model_name: str, index_data: Dict[str, Any]) -> MetadataIndex:
+    """The shared ``MetadataIndex`` for a model's current index data."""
+    version = (index_data.get('updated_at'), index_data.get('total'))
+    with _engines_lock:
+        engine = _engines.get(model_name)
+    if engine is not None and engine.version == version:
+        return engine
+    engine = MetadataIndex(index_data.get('items', []), version=version)
+    with _engines_lock:
+        _engines[model_name] = engine
+    return engine
+
+
+def forget_engine(model_name: str) -> None:
+    with _engines_lock:
+        _engines.pop(model_name, None)
@@ -0,0 +1,251 @@
+"""Process-wide S3 client registry and transfer layer.
+
+boto3 clients are expensive to build (credential resolution, endpoint and
+service model loading) and each one owns its own urllib3 connection pool.
+Every S3 caller in the project goes through ``get_s3_client()`` so the whole
+process shares one thread-safe client - and one tuned connection pool - per
+credential/region/endpoint combination. ``S3TransferManager`` layers multipart
+uploads/downloads, range GETs and streaming bodies on top of that client.
+"""
+
+import logging
+import threading
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+_clients: Dict[Tuple[Any, ...], Any] = {}
+_clients_lock = threading.RLock()
+_transfer_managers: Dict[Tuple[Any, ...], 'S3TransferManager'] = {}
+
+
+def build_s3_config() -> Config:
+    """Client config: sized connection pool, adaptive retries and TCP keep-alive."""
+    return Config(
+        signature_version='s3v4',
+        max_pool_connections=getattr(settings, 'S3_MAX_POOL_CONNECTIONS', 50),
+        connect_timeout=getattr(settings, 'S3_CONNECT_TIMEOUT', 5),
+        read_timeout=getattr(settings, 'S3_READ_TIMEOUT', 60),
+        tcp_keepalive=True,
+        retries={
+            'mode': getattr(settings, 'S3_RETRY_MODE', 'adaptive'),
+            'max_attempts': getattr(settings, 'S3_MAX_ATTEMPTS', 5),
+        },
+    )
+
+
+# PutObject conditional-write parameters and their HTTP headers
+_PUT_CONDITIONS = {'IfMatch': 'If-Match', 'IfNoneMatch': 'If-None-Match'}
+
+
+def _stash_put_conditions(params, context, **kwargs):
+    # Runs before parameter validation, which rejects unmodeled parameters
+    for name, header in _PUT_CONDITIONS.items():
+        if name in params:
+            context.setdefault('put_conditions', {})[header] = params.pop(name)
+
+
+def _send_put_conditions(params, context, **kwargs):
+    params['headers'].update(context.get('put_conditions', {}))
+
+
+def enable_conditional_puts(client) -> None:
+    """
+    Accept ``IfMatch``/``IfNoneMatch`` on ``put_object`` for any botocore version.
+
+    S3 conditional writes postdate some botocore releases; for those the
+    parameters are sent as raw If-Match/If-None-Match headers. Idempotent.
+    """
+    members = client.meta.service_model.operation_model('PutObject').input_shape.members
+    if all(name in members for name in _PUT_CONDITIONS):
+        return
+    client.meta.events.register(
+        'before-parameter-build.s3.PutObject', _stash_put_conditions, unique_id='put-conditions-stash'
+    )
+    client.meta.events.register(
+        'before-call.s3.PutObject', _send_put_conditions, unique_id='put-conditions-send'
+    )
+
+
+def build_transfer_config() -> TransferConfig:
+    """Multipart thresholds/concurrency used by S3TransferManager."""
+    return TransferConfig(
+        multipart_threshold=getattr(settings, 'S3_MULTIPART_THRESHOLD_MB', 8) * MB,
+        multipart_chunksize=getattr(settings, 'S3_MULTIPART_CHUNKSIZE_MB', 8) * MB,
+        max_concurrency=getattr(settings, 'S3_TRANSFER_MAX_CONCURRENCY', 10),
+        use_threads=True,
+    )
+
+
+def _client_key(region_name: Optional[str] = None) -> Tuple[Any, ...]:
+    return (
+        getattr(settings, 'AWS_ACCESS_KEY_ID', '') or None,
+        getattr(settings, 'AWS_SECRET_ACCESS_KEY', '') or None,
+        region_name or getattr(settings, 'AWS_REGION', None),
+        getattr(settings, 'AWS_S3_ENDPOINT_URL', None) or None,
+    )
+
+
+def get_s3_client(region_name: Optional[str] = None):
+    """
+    Return the shared boto3 S3 client for the configured credentials.
+
+    boto3 clients are thread-safe, so one client (and its connection pool) is
+    reused by every thread in the process.
+
+    Args:
+        region_name: Optional region override (default: settings.AWS_REGION)
+
+    Returns:
+        boto3 S3 client
+    """
+    key = _client_key(region_name)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            access_key, secret_key, region, endpoint_url = key
+            session = boto3.session.Session(
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                region_name=region,
+            )
+            client = session.client('s3', endpoint_url=endpoint_url, config=build_s3_config())
+            _clients[key] = client
+            logger.debug(f"Created shared S3 client (region={region}, endpoint={endpoint_url})")
+        return client
+
+
+def get_transfer_manager(bucket_name: Optional[str] = None) -> 'S3TransferManager':
+    """Return the shared S3TransferManager for a bucket (default: settings.S3_BUCKET_NAME)."""
+    bucket = bucket_name or settings.S3_BUCKET_NAME
+    key = _client_key() + (bucket,)
+    manager = _transfer_managers.get(key)
+    if manager is None:
+        with _clients_lock:
+            manager = _transfer_managers.get(key)
+            if manager is None:
+                manager = S3TransferManager(bucket_name=bucket)
+                _transfer_managers[key] = manager
+    return manager
+
+
+def reset_s3_clients() -> None:
+    """Drop cached clients (after credential/endpoint changes, and in tests)."""
+    with _clients_lock:
+        _clients.clear()
+        _transfer_managers.clear()
+
+
+class S3TransferManager:
+    """
+    Object transfer API over the shared S3 client.
+
+    Small payloads use single PUT/GET calls; file objects go through boto3's
+    managed transfer, which switches to concurrent multipart above
+    ``S3_MULTIPART_THRESHOLD_MB``. Errors are the raw botocore exceptions -
+    callers such as S3Service translate them into S3Error.
+    """
+
+    def __init__(self, client=None, bucket_name: Optional[str] = None,
+                 transfer_config: Optional[TransferConfig] = None):
+        """
+        Initialize transfer manager.
+
+        Args:
+            client: Optional boto3 S3 client (default: shared client)
+            bucket_name: Bucket name (default: settings.S3_BUCKET_NAME)
+            transfer_config: Optional multipart TransferConfig
+        """
+        self.client = client or get_s3_client()
+        enable_conditional_puts(self.client)
+        self.bucket_name = bucket_name or settings.S3_BUCKET_NAME
+        self.transfer_config = transfer_config or build_transfer_config()
+
+    def put_bytes(self, s3_key: str, body: bytes, content_type: Optional[str] = None,
+                  **extra: Any) -> Dict[str, Any]:
+        """Single PUT of an in-memory payload. Returns the PutObject response."""
+        params: Dict[str, Any] = {'Bucket': self.bucket_name, 'Key': s3_key, 'Body': body, **extra}
+        if content_type:
+            params['ContentType'] = content_type
+        return self.client.put_object(**params)
+
+    def get_object(self, s3_key: str, **extra: Any) -> Dict[str, Any]:
+        """GetObject response with the unread streaming ``Body``."""
+        return self.client.get_object(Bucket=self.bucket_name, Key=s3_key, **extra)
+
+    def get_bytes(self, s3_key: str) -> bytes:
+        """Read a whole object into memory."""
+        response = self.get_object(s3_key)
+        try:
+            return response['Body'].read()
+        finally:
+            response['Body'].close()
+
+    def get_range(self, s3_key: str, start: int, end: Optional[int] = None) -> bytes:
+        """
+        Ranged GET of bytes ``start..end`` (inclusive, like the HTTP Range header).
+
+        With ``end=None`` reads to the end of the object; a negative ``start``
+        reads the last ``-start`` bytes.
+        """
+        if start < 0:
+            byte_range = f'bytes={start}'
+        elif end is None:
+            byte_range = f'bytes={start}-'
+        else:
+            byte_range = f'bytes={start}-{end}'
+        response = self.get_object(s3_key, Range=byte_range)
+        try:
+            return response['Body'].read()
+        finally:
+            response['Body'].close()
+
+    def iter_chunks(self, s3_key: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Stream an object's body in chunks without buffering it whole."""
+        response = self.get_object(s3_key)
+        body = response['Body']
+        try:
+            for chunk in body.iter_chunks(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
+        finally:
+            body.close()
+
+    def head(self, s3_key: str) -> Dict[str, Any]:
+        """HeadObject response (raises ClientError 404 when missing)."""
+        return self.client.head_object(Bucket=self.bucket_name, Key=s3_key)
+
+    def upload_fileobj(self, fileobj: IO[bytes], s3_key: str,
+                       content_type: Optional[str] = None) -> None:
+        """Managed (multipart above the threshold) upload from a binary file object."""
+        extra_args = {'ContentType': content_type} if content_type else None
+        self.client.upload_fileobj(
+            fileobj, self.bucket_name, s3_key,
+            ExtraArgs=extra_args, Config=self.transfer_config,
+        )
+
+    def upload_path(self, file_path: str, s3_key: str, content_type: Optional[str] = None) -> None:
+        """Managed (multipart above the threshold) upload of a local file."""
+        extra_args = {'ContentType': content_type} if content_type else None
+        self.client.upload_file(
+            file_path, self.bucket_name, s3_key,
+            ExtraArgs=extra_args, Config=self.transfer_config,
+        )
+
+    def download_fileobj(self, s3_key: str, fileobj: IO[bytes]) -> None:
+        """Managed (concurrent ranged parts above the threshold) download into a file object."""
+        self.client.download_fileobj(self.bucket_name, s3_key, fileobj, Config=self.transfer_config)
+
+    def download_path(self, s3_key: str, file_path: str) -> None:
+        """Managed download of an object to a local file."""
+        self.client.download_file(self.bucket_name, s3_key, file_path, Config=self.transfer_config)
@@ -3,13 +3,18 @@
 import json
 import uuid as uuid_lib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Callable
 from datetime import datetime
 from django.conf import settings
 from django.core.cache import cache
 
+from apps.core.services.index_writer import get_index_writer
+from apps.core.services.metadata_index import engine_for
 from apps.core.services.s3_service import S3Service
+from apps.core.services.search_index import SEARCH_INDEX_VERSION, InvertedIndex, cached_index, forget_index
 from apps.core.exceptions import S3Error
+from apps.documentation.repositories.s3_batch_operations import S3BatchOperations
 from apps.documentation.repositories.s3_json_storage import S3JSONStorage
 
 logger = logging.getLogger(__name__)
@@ -30,24 +35,38 @@ class S3ModelStorage:
       models/
         {model_name}/
           index.json          # {total: N, items: [{uuid, metadata}]}
+          search_index.json   # Inverted index (only when search_fields is set)
           {uuid}.json         # Full model data
     
     Features:
     - CRUD operations (create, read, update, delete)
     - Index management for fast listing
     - Pagination support
-    - Filtering/search support
+    - Filtering/search support (hash and sorted indexes over index.json, see metadata_index)
     - Batch operations
     - Caching for performance
+    
+    Subclasses that set ``search_fields`` (field -> weight) also maintain a
+    persisted inverted index, used by ``indexed_search``, ``related_ids`` and
+    ``search`` so queries do not load every document.
     """
     
+    # Full-text fields and their weights; empty disables the search index
+    search_fields: Dict[str, float] = {}
+    # List field indexed as exact tags
+    search_tag_field: Optional[str] = None
+    # Scalar fields kept in the search index for filtering
+    search_filter_fields: tuple = ()
+    # Search fields holding identifiers (keys, names): split into parts and substring-matched
+    search_identifier_fields: tuple = ()
+    
     def __init__(self, model_name: str, s3_service: Optional[S3Service] = None):
         """
         Initialize S3 model storage.
         
         Args:
             model_name: Name of the model (e.g., 'tasks', 'knowledge')
-            s3_service: Optional S3Service instance
+            s3_service: Optional S3Service instance (default: one on the shared S3 client)
         """
         self.model_name = model_name
         self.s3_service = s3_service or S3Service()
@@ -55,6 +74,7 @@ class S3ModelStorage:
         self.bucket_name = settings.S3_BUCKET_NAME
         self.models_prefix = f"models/{model_name}/"
         self.index_key = f"{self.models_prefix}index.json"
+        self.search_index_key = f"{self.models_prefix}search_index.json"
         self.cache_prefix = f"s3_model:{model_name}:"
         self.cache_ttl = 300  # 5 minutes default
     
@@ -80,32 +100,23 @@ class S3ModelStorage:
         
         index_data = self.s3_json_storage.read_json(self.index_key)
         if not index_data:
-            # Initialize empty index
+            # Empty until the first write creates it (a blind write here could
+            # clobber an index another worker is creating)
             index_data = {
                 'total': 0,
                 'items': [],
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': None
             }
-            self._write_index(index_data)
         
         cache.set(cache_key, index_data, self.cache_ttl)
         return index_data
     
-    def _write_index(self, index_data: Dict[str, Any]) -> None:
-        """
-        Write index.json to S3.
-        
-        Args:
-            index_data: Index dictionary to write
-        """
-        index_data['updated_at'] = datetime.utcnow().isoformat()
-        self.s3_json_storage.write_json(self.index_key, index_data)
-        
-        # Invalidate cache
-        cache_key = self._get_cache_key('index')
-        cache.delete(cache_key)
-    
-    def _update_index_item(self, item_uuid: str, metadata: Dict[str, Any], operation: str = 'update') -> None:
+    def _update_index_item(
+        self,
+        item_uuid: str,
+        metadata: Dict[str, Any],
+        operation: str = 'update'
+    ) -> Optional[Dict[str, Any]]:
         """
         Update an item in the index.
         
@@ -113,41 +124,71 @@ class S3ModelStorage:
             item_uuid: UUID of the item
             metadata: Metadata to store in index (should include fields for filtering)
             operation: 'create', 'update', or 'delete'
+            
+        Returns:
+            The index entry the change replaced, or None if there was none
         """
-        index_data = self._read_index()
-        items = index_data.get('items', [])
-        
         if operation == 'delete':
-            # Remove from index
-            items = [item for item in items if item.get('uuid') != item_uuid]
-            index_data['total'] = len(items)
+            replaced = self._apply_index_changes(deletes={item_uuid})
         else:
-            # Find existing item or create new
-            item_found = False
-            for i, item in enumerate(items):
-                if item.get('uuid') == item_uuid:
-                    items[i] = {**item, **metadata, 'uuid': item_uuid}
-                    item_found = True
-                    break
-            
-            if not item_found:
-                items.append({**metadata, 'uuid': item_uuid})
-                index_data['total'] = len(items)
-        
-        index_data['items'] = items
-        self._write_index(index_data)
+            replaced = self._apply_index_changes(upserts={item_uuid: metadata})
+        return replaced.get(item_uuid)
     
-    def create(self, data: Dict[str, Any], item_uuid: Optional[str] = None) -> Dict[str, Any]:
+    def _apply_index_changes(
+        self,
+        upserts: Optional[Dict[str, Dict[str, Any]]] = None,
+        deletes: Optional[set] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Create a new model instance.
+        Apply any number of upserts and deletes to index.json.
+        
+        The change goes through the model's shared IndexWriter, which merges
+        it with concurrent changes from this process into one conditional
+        write and re-applies it if another process wrote first.
         
         Args:
-            data: Model data dictionary
-            item_uuid: Optional UUID (generated if not provided)
+            upserts: UUID -> metadata; merged into existing entries, appended otherwise
+            deletes: UUIDs to remove
             
         Returns:
-            Created model data with UUID
+            UUID -> index entry as it was just before the committed write, for
+            every changed entry that already existed
         """
+        upserts = upserts or {}
+        deletes = deletes or set()
+        replaced: Dict[str, Dict[str, Any]] = {}
+        if not upserts and not deletes:
+            return replaced
+        
+        def mutate(index_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            # Re-run on every conflict retry, so only the committed attempt is reported
+            replaced.clear()
+            index_data = index_data or {'total': 0, 'items': []}
+            items = []
+            for item in index_data.get('items', []):
+                item_uuid = item.get('uuid')
+                if item_uuid in deletes or item_uuid in upserts:
+                    replaced[item_uuid] = item
+                if item_uuid in deletes:
+                    continue
+                if item_uuid in upserts:
+                    item = {**item, **upserts[item_uuid], 'uuid': item_uuid}
+                items.append(item)
+            existing = {item.get('uuid') for item in items}
+            for item_uuid, metadata in upserts.items():
+                if item_uuid not in existing and item_uuid not in deletes:
+                    items.append({**metadata, 'uuid': item_uuid})
+            index_data['items'] = items
+            index_data['total'] = len(items)
+            index_data['updated_at'] = datetime.utcnow().isoformat()
+            return index_data
+        
+        get_index_writer(self.s3_json_storage, self.index_key).submit(self.s3_json_storage, mutate)
+        cache.delete(self._get_cache_key('index'))
+        return replaced
+    
+    def _prepare_new_item(self, data: Dict[str, Any], item_uuid: Optional[str] = None) -> str:
+        """Assign the UUID and timestamps of a new item in place; returns the UUID."""
         # Generate UUID if not provided
         if not item_uuid:
             if 'id' in data:
@@ -167,6 +208,20 @@ class S3ModelStorage:
             data['created_at'] = now
         if 'updated_at' not in data:
             data['updated_at'] = now
+        return item_uuid
+    
+    def create(self, data: Dict[str, Any], item_uuid: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Create a new model instance.
+        
+        Args:
+            data: Model data dictionary
+            item_uuid: Optional UUID (generated if not provided)
+            
+        Returns:
+            Created model data with UUID
+        """
+        item_uuid = self._prepare_new_item(data, item_uuid)
         
         # Write to S3
         item_key = self._get_item_key(item_uuid)
@@ -175,6 +230,7 @@ class S3ModelStorage:
         # Update index with metadata (extract key fields for filtering)
         metadata = self._extract_metadata(data)
         self._update_index_item(item_uuid, metadata, 'create')
+        self._update_search_index(item_uuid, data)
         
         # Invalidate item cache
         cache_key = self._get_cache_key('item', item_uuid)
@@ -235,7 +291,9 @@ class S3ModelStorage:
         
         # Update index
         metadata = self._extract_metadata(updated_data)
-        self._update_index_item(item_uuid, metadata, 'update')
+        previous = self._update_index_item(item_uuid, metadata, 'update')
+        self._update_search_index(item_uuid, updated_data)
+        self._on_item_replaced(item_uuid, previous, updated_data)
         
         # Invalidate cache
         cache_key = self._get_cache_key('item', item_uuid)
@@ -264,7 +322,9 @@ class S3ModelStorage:
         self.s3_json_storage.delete_json(item_key)
         
         # Update index
-        self._update_index_item(item_uuid, {}, 'delete')
+        previous = self._update_index_item(item_uuid, {}, 'delete')
+        self._update_search_index(item_uuid, None)
+        self._on_item_replaced(item_uuid, previous, None)
         
         # Invalidate cache
         cache_key = self._get_cache_key('item', item_uuid)
@@ -294,56 +354,15 @@ class S3ModelStorage:
         Returns:
             Dictionary with 'items' list and 'total' count
         """
-        # Read index
-        index_data = self._read_index()
-        items_metadata = index_data.get('items', [])
-        
-        # Apply filters
-        if filters:
-            filtered_items = []
-            for item_meta in items_metadata:
-                match = True
-                for key, value in filters.items():
-                    item_value = item_meta.get(key)
-                    if isinstance(value, (list, tuple)):
-                        if item_value not in value:
-                            match = False
-                            break
-                    elif item_value != value:
-                        match = False
-                        break
-                if match:
-                    filtered_items.append(item_meta)
-            items_metadata = filtered_items
-        
-        # Sort
+        engine = engine_for(self.model_name, self._read_index())
         if order_by:
-            items_metadata.sort(
-                key=lambda x: x.get(order_by, ''),
-                reverse=reverse
-            )
+            page, total = engine.select(filters, order_by, descending=reverse, limit=limit or None, offset=offset)
         else:
             # Default: sort by created_at descending (newest first)
-            items_metadata.sort(
-                key=lambda x: x.get('created_at', ''),
-                reverse=not reverse
-            )
-        
-        # Paginate
-        total = len(items_metadata)
-        if limit:
-            items_metadata = items_metadata[offset:offset + limit]
-        else:
-            items_metadata = items_metadata[offset:]
+            page, total = engine.select(filters, 'created_at', descending=not reverse, limit=limit or None, offset=offset)
         
         # Load full data for returned items
-        items = []
-        for item_meta in items_metadata:
-            item_uuid = item_meta.get('uuid')
-            if item_uuid:
-                item_data = self.get(item_uuid)
-                if item_data:
-                    items.append(item_data)
+        items = self._load_items([item_meta['uuid'] for item_meta in page if item_meta.get('uuid')])
         
         return {
             'items': items,
@@ -356,37 +375,89 @@ class S3ModelStorage:
         """
         Create multiple model instances in batch.
         
+        Item objects are uploaded concurrently; index.json and the search
+        index are then updated once for the whole batch. Items whose upload
+        fails are logged and left out of the index and the result.
+        
         Args:
-            items: List of model data dictionaries
+            items: List of model data dictionaries (UUID taken from 'id'/'uuid' or generated)
             
         Returns:
             List of created model data
         """
-        created_items = []
+        if not items:
+            return []
+        prepared = {}
         for item_data in items:
-            created = self.create(item_data)
-            created_items.append(created)
+            item_uuid = self._prepare_new_item(item_data)
+            prepared[item_uuid] = item_data
+        
+        results = S3BatchOperations(storage=self.s3_json_storage).batch_write_json(
+            [(self._get_item_key(item_uuid), data) for item_uuid, data in prepared.items()]
+        )
+        created = {
+            item_uuid: data for item_uuid, data in prepared.items()
+            if results.get(self._get_item_key(item_uuid))
+        }
+        if len(created) < len(prepared):
+            logger.warning(
+                f"Batch create of {self.model_name}: {len(prepared) - len(created)} of {len(prepared)} uploads failed"
+            )
+        
+        self._apply_index_changes(
+            upserts={item_uuid: self._extract_metadata(data) for item_uuid, data in created.items()}
+        )
+        self._update_search_index_batch(upserts=created)
+        cache.delete_many([self._get_cache_key('item', item_uuid) for item_uuid in created])
         
-        logger.info(f"Batch created {len(created_items)} {self.model_name} items")
-        return created_items
+        logger.info(f"Batch created {len(created)} {self.model_name} items")
+        return list(created.values())
     
     def batch_delete(self, item_uuids: List[str]) -> int:
         """
         Delete multiple model instances in batch.
         
+        Objects are deleted concurrently; index.json and the search index are
+        then updated once. Only UUIDs listed in the index are deleted.
+        
         Args:
             item_uuids: List of UUIDs to delete
             
         Returns:
             Number of items deleted
         """
-        deleted_count = 0
-        for item_uuid in item_uuids:
-            if self.delete(item_uuid):
-                deleted_count += 1
+        indexed = {item.get('uuid') for item in self._read_index().get('items', [])}
+        targets = list(dict.fromkeys(u for u in item_uuids if u in indexed))
+        if not targets:
+            return 0
+        
+        results = S3BatchOperations(storage=self.s3_json_storage).batch_delete(
+            [self._get_item_key(item_uuid) for item_uuid in targets]
+        )
+        deleted = {item_uuid for item_uuid in targets if results.get(self._get_item_key(item_uuid))}
+        
+        self._apply_index_changes(deletes=deleted)
+        self._update_search_index_batch(deletes=deleted)
+        cache.delete_many([self._get_cache_key('item', item_uuid) for item_uuid in deleted])
+        
+        logger.info(f"Batch deleted {len(deleted)} {self.model_name} items")
+        return len(deleted)
+    
+    def _on_item_replaced(
+        self,
+        item_uuid: str,
+        previous: Optional[Dict[str, Any]],
+        current: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Hook called after update/delete has committed to index.json.
         
-        logger.info(f"Batch deleted {deleted_count} {self.model_name} items")
-        return deleted_count
+        Args:
+            item_uuid: UUID of the item
+            previous: Index entry the write replaced, read in the same
+                compare-and-swap as the write (None if it was not indexed)
+            current: Updated item data, or None for a delete
+        """
     
     def _extract_metadata(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -428,8 +499,7 @@ class S3ModelStorage:
         Returns:
             Count of matching items
         """
-        result = self.list(filters=filters, limit=1, offset=0)
-        return result.get('total', 0)
+        return engine_for(self.model_name, self._read_index()).count(filters)
     
     def exists(self, item_uuid: str) -> bool:
         """
@@ -462,6 +532,8 @@ class S3ModelStorage:
         Returns:
             Dictionary with 'items' list and 'total' count
         """
+        if not fields and self.search_fields:
+            return self.indexed_search(query, limit=limit, offset=offset)
         if not fields:
             fields = ['title', 'name', 'description', 'content']
         
@@ -495,3 +567,150 @@ class S3ModelStorage:
             'limit': limit,
             'offset': offset
         }
+    
+    def _new_search_index(self) -> InvertedIndex:
+        return InvertedIndex(
+            self.search_fields,
+            tag_field=self.search_tag_field,
+            filter_fields=self.search_filter_fields,
+            identifier_fields=self.search_identifier_fields,
+        )
+    
+    def _update_search_index(self, item_uuid: str, data: Optional[Dict[str, Any]]) -> None:
+        """
+        Apply one create/update (data) or delete (None) to search_index.json.
+        
+        Only the affected document's entry is rewritten. If the update fails
+        the object is removed so the next search rebuilds it instead of
+        serving stale results.
+        """
+        if data is None:
+            self._update_search_index_batch(deletes={item_uuid})
+        else:
+            self._update_search_index_batch(upserts={item_uuid: data})
+    
+    def _update_search_index_batch(
+        self,
+        upserts: Optional[Dict[str, Dict[str, Any]]] = None,
+        deletes: Optional[set] = None
+    ) -> None:
+        """Apply several document upserts and deletes to search_index.json in one write."""
+        if not self.search_fields or not (upserts or deletes):
+            return
+        index = self._new_search_index()
+        entries = {item_uuid: index.document_entry(data) for item_uuid, data in (upserts or {}).items()}
+        
+        def mutate(index_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            if index_data is None or index_data.get('version') != SEARCH_INDEX_VERSION:
+                # Built from scratch (including these items) on the next search
+                return None
+            docs = index_data.setdefault('docs', {})
+            for item_uuid in deletes or ():
+                docs.pop(item_uuid, None)
+            docs.update(entries)
+            index_data['total'] = len(docs)
+            index_data['updated_at'] = datetime.utcnow().isoformat()
+            return index_data
+        
+        try:
+            get_index_writer(self.s3_json_storage, self.search_index_key).submit(self.s3_json_storage, mutate)
+        except Exception as e:
+            logger.warning(f"Search index update failed for {self.model_name}: {e}")
+            try:
+                self.s3_json_storage.delete_json(self.search_index_key)
+            except Exception:
+                pass
+        forget_index(self.model_name)
+    
+    def rebuild_search_index(self) -> InvertedIndex:
+        """
+        Build search_index.json from every document listed in index.json.
+        
+        Runs once per model when the object is missing (first use, or after a
+        failed incremental update); afterwards it is maintained per write.
+        """
+        index = self._new_search_index()
+        for item_meta in self._read_index().get('items', []):
+            item_uuid = item_meta.get('uuid')
+            item_data = self.get(item_uuid) if item_uuid else None
+            if item_data:
+                index.add(item_uuid, item_data)
+        index_data = index.to_dict()
+        index_data['updated_at'] = datetime.utcnow().isoformat()
+        self.s3_json_storage.write_json(self.search_index_key, index_data)
+        forget_index(self.model_name)
+        logger.info(f"Rebuilt {self.model_name} search index: {len(index.docs)} items")
+        return index
+    
+    def _load_search_index(self) -> InvertedIndex:
+        index_data = self.s3_json_storage.read_json(self.search_index_key, readonly=True)
+        if index_data is None or index_data.get('version') != SEARCH_INDEX_VERSION:
+            return self.rebuild_search_index()
+        return cached_index(self.model_name, index_data, self._new_search_index)
+    
+    def _read_item(self, item_uuid: str) -> Optional[Dict[str, Any]]:
+        return self.s3_json_storage.read_json(self._get_item_key(item_uuid))
+    
+    def _load_items(self, item_uuids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Load several items, in order, skipping missing ones.
+        
+        Cached items come from one cache.get_many; the rest are fetched from
+        S3 concurrently (S3_MODEL_FETCH_WORKERS) and cached together.
+        """
+        if not item_uuids:
+            return []
+        cache_keys = {item_uuid: self._get_cache_key('item', item_uuid) for item_uuid in item_uuids}
+        cached = cache.get_many(list(cache_keys.values()))
+        loaded = {item_uuid: cached[key] for item_uuid, key in cache_keys.items() if cached.get(key)}
+        
+        missing = [item_uuid for item_uuid in cache_keys if item_uuid not in loaded]
+        if missing:
+            workers = min(len(missing), getattr(settings, 'S3_MODEL_FETCH_WORKERS', 8))
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(self._read_item, missing))
+            else:
+                results = [self._read_item(item_uuid) for item_uuid in missing]
+            fetched = {item_uuid: data for item_uuid, data in zip(missing, results) if data}
+            if fetched:
+                cache.set_many({cache_keys[u]: data for u, data in fetched.items()}, self.cache_ttl)
+            loaded.update(fetched)
+        
+        return [loaded[item_uuid] for item_uuid in item_uuids if item_uuid in loaded]
+    
+    def indexed_search(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Ranked search over the inverted index.
+        
+        Only the documents on the requested page are loaded from S3.
+        
+        Args:
+            query: Search query (all terms must match; prefixes of 3+ characters match too)
+            filters: Exact-match filters on ``search_filter_fields``
+            tags: Keep items carrying any of these tags
+            limit: Maximum results
+            offset: Offset for pagination
+            
+        Returns:
+            Dictionary with 'items' list (best match first) and 'total' count
+        """
+        ranked = self._load_search_index().search(query, filters=filters, tags=tags)
+        page = ranked[offset:offset + limit] if limit else ranked[offset:]
+        return {
+            'items': self._load_items([item_uuid for item_uuid, _ in page]),
+            'total': len(ranked),
+            'limit': limit,
+            'offset': offset
+        }
+    
+    def related_ids(self, item_uuid: str, same_fields: tuple = (), limit: int = 5) -> List[str]:
+        """UUIDs of the items most related to ``item_uuid`` (see InvertedIndex.related)."""
+        return self._load_search_index().related(item_uuid, same_fields=same_fields, limit=limit)
@@ -1,12 +1,12 @@
 """Core S3 service for AWS S3 operations."""
 
-import boto3
 import logging
-from typing import Optional, Dict, Any, List
+from typing import IO, Optional, Dict, Any, Iterator, List, Tuple
 from django.conf import settings
 from botocore.exceptions import ClientError, BotoCoreError
 from apps.core.exceptions import S3Error
 from apps.core.decorators.retry import retry_on_network_error
+from apps.core.services.s3_client import S3TransferManager, get_s3_client
 
 logger = logging.getLogger(__name__)
 
@@ -15,19 +15,22 @@ class S3Service:
     """Service for interacting with AWS S3."""
     
     def __init__(self):
-        """Initialize S3 client with connection pooling."""
-        self.session = boto3.Session(
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_REGION
-        )
-        self.s3_client = self.session.client('s3')
+        """Initialize S3 service on the shared, pooled S3 client."""
+        self.s3_client = get_s3_client()
         self.bucket_name = settings.S3_BUCKET_NAME
         self.data_prefix = settings.S3_DATA_PREFIX
         self.documentation_prefix = settings.S3_DOCUMENTATION_PREFIX
+        self.transfer = S3TransferManager(client=self.s3_client, bucket_name=self.bucket_name)
     
     @retry_on_network_error(max_retries=3, initial_delay=1.0, max_delay=10.0)
-    def upload_file(self, file_content: bytes, s3_key: str, content_type: str = 'text/plain') -> bool:
+    def upload_file(
+        self,
+        file_content: bytes,
+        s3_key: str,
+        content_type: str = 'text/plain',
+        if_match: Optional[str] = None,
+        if_none_match: Optional[str] = None
+    ) -> str:
         """
         Upload a file to S3 with retry logic for network errors.
         
@@ -35,23 +38,34 @@ class S3Service:
             file_content: File content as bytes
             s3_key: S3 object key (path)
             content_type: MIME type of the file
+            if_match: Only write if the current object has this ETag
+            if_none_match: ``'*'`` to only write if the key does not exist yet
             
         Returns:
-            True if successful
+            ETag S3 returned for the stored object ('' if none was reported)
             
         Raises:
-            S3Error: If upload fails
+            S3Error: If upload fails (PRECONDITION_FAILED when a condition
+                does not hold because another writer got there first)
         """
+        extra = {}
+        if if_match:
+            etag = if_match.strip('"')
+            extra['IfMatch'] = f'"{etag}"'
+        if if_none_match:
+            extra['IfNoneMatch'] = if_none_match
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=file_content,
-                ContentType=content_type
-            )
+            response = self.transfer.put_bytes(s3_key, file_content, content_type=content_type, **extra)
             logger.info(f"File uploaded to S3: {s3_key}")
-            return True
+            return (response.get('ETag') or '').strip('"')
         except (ClientError, BotoCoreError) as e:
+            if extra and isinstance(e, ClientError) and self._is_precondition_failure(e):
+                raise S3Error(
+                    f"Conditional write lost a race for {s3_key}",
+                    s3_key=s3_key,
+                    operation='upload',
+                    error_code='PRECONDITION_FAILED'
+                )
             logger.error(f"Error uploading file to S3: {str(e)}")
             raise S3Error(
                 f"Failed to upload file to S3: {str(e)}",
@@ -60,6 +74,13 @@ class S3Service:
                 error_code='S3_UPLOAD_FAILED'
             )
     
+    @staticmethod
+    def _is_precondition_failure(e: ClientError) -> bool:
+        # 412 when If-Match/If-None-Match fails, 409 when a concurrent conditional write wins
+        error_code = e.response.get('Error', {}).get('Code', '')
+        status = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+        return error_code in ('PreconditionFailed', 'ConditionalRequestConflict') or status in (409, 412)
+    
     def download_file(self, s3_key: str) -> bytes:
         """
         Download a file from S3.
@@ -74,28 +95,171 @@ class S3Service:
             S3Error: If download fails
         """
         try:
-            response = self.s3_client.get_object(
-                Bucket=self.bucket_name,
-                Key=s3_key
-            )
-            return response['Body'].read()
+            return self.transfer.get_bytes(s3_key)
+        except ClientError as e:
+            raise self._download_error(e, s3_key, 'download')
+    
+    def download_file_if_changed(
+        self,
+        s3_key: str,
+        etag: Optional[str] = None
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Conditional download using If-None-Match.
+
+        Args:
+            s3_key: S3 object key (path)
+            etag: ETag of the locally cached version, if any
+
+        Returns:
+            (content, etag). content is None when S3 answered 304 Not Modified,
+            in which case etag is the one passed in.
+
+        Raises:
+            S3Error: If download fails (FILE_NOT_FOUND when the key is missing)
+        """
+        extra = {'IfNoneMatch': f'"{etag}"'} if etag else {}
+        try:
+            response = self.transfer.get_object(s3_key, **extra)
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', '')
-            if error_code == 'NoSuchKey':
-                raise S3Error(
-                    f"File not found in S3: {s3_key}",
-                    s3_key=s3_key,
-                    operation='download',
-                    error_code='FILE_NOT_FOUND'
-                )
-            logger.error(f"Error downloading file from S3: {str(e)}")
+            status = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+            if etag and (error_code in ('304', 'NotModified') or status == 304):
+                return None, etag
+            raise self._download_error(e, s3_key, 'download')
+        body = response['Body']
+        try:
+            content = body.read()
+        finally:
+            body.close()
+        return content, (response.get('ETag') or '').strip('"') or None
+
+    def _download_error(self, e: ClientError, s3_key: str, operation: str) -> S3Error:
+        """Translate a GetObject ClientError into S3Error."""
+        error_code = e.response.get('Error', {}).get('Code', '')
+        if error_code in ('NoSuchKey', '404'):
+            return S3Error(
+                f"File not found in S3: {s3_key}",
+                s3_key=s3_key,
+                operation=operation,
+                error_code='FILE_NOT_FOUND'
+            )
+        logger.error(f"Error downloading file from S3: {str(e)}")
+        return S3Error(
+            f"Failed to download file from S3: {str(e)}",
+            s3_key=s3_key,
+            operation=operation,
+            error_code='S3_DOWNLOAD_FAILED'
+        )
+    
+    def download_range(self, s3_key: str, start: int, end: Optional[int] = None) -> bytes:
+        """
+        Download a byte range of a file (HTTP Range semantics, ``end`` inclusive).
+        
+        Args:
+            s3_key: S3 object key (path)
+            start: First byte offset (negative for a suffix range)
+            end: Last byte offset, or None to read to the end
+            
+        Returns:
+            The requested bytes
+            
+        Raises:
+            S3Error: If download fails
+        """
+        try:
+            return self.transfer.get_range(s3_key, start, end)
+        except ClientError as e:
+            raise self._download_error(e, s3_key, 'download_range')
+    
+    def stream_file(self, s3_key: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Stream a file from S3 in chunks without loading it into memory.
+        
+        The GetObject request is issued immediately so a missing key raises
+        here rather than on first iteration.
+        
+        Raises:
+            S3Error: If download fails
+        """
+        try:
+            response = self.transfer.get_object(s3_key)
+        except ClientError as e:
+            raise self._download_error(e, s3_key, 'stream')
+        
+        def chunks() -> Iterator[bytes]:
+            body = response['Body']
+            try:
+                for chunk in body.iter_chunks(chunk_size=chunk_size):
+                    if chunk:
+                        yield chunk
+            finally:
+                body.close()
+        
+        return chunks()
+    
+    @retry_on_network_error(max_retries=3, initial_delay=1.0, max_delay=10.0)
+    def upload_fileobj(self, fileobj: IO[bytes], s3_key: str, content_type: Optional[str] = None) -> bool:
+        """
+        Upload a binary file object, using multipart upload for large payloads.
+        
+        Raises:
+            S3Error: If upload fails
+        """
+        try:
+            self.transfer.upload_fileobj(fileobj, s3_key, content_type=content_type)
+            logger.info(f"File uploaded to S3: {s3_key}")
+            return True
+        except (ClientError, BotoCoreError) as e:
+            logger.error(f"Error uploading file to S3: {str(e)}")
             raise S3Error(
-                f"Failed to download file from S3: {str(e)}",
+                f"Failed to upload file to S3: {str(e)}",
                 s3_key=s3_key,
-                operation='download',
-                error_code='S3_DOWNLOAD_FAILED'
+                operation='upload',
+                error_code='S3_UPLOAD_FAILED'
             )
     
+    def download_fileobj(self, s3_key: str, fileobj: IO[bytes]) -> None:
+        """
+        Download a file into a binary file object using concurrent ranged parts.
+        
+        Raises:
+            S3Error: If download fails
+        """
+        try:
+            self.transfer.download_fileobj(s3_key, fileobj)
+        except ClientError as e:
+            raise self._download_error(e, s3_key, 'download')
+    
+    def iter_files(self, prefix: str, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate files in S3 with given prefix, one listing page at a time.
+        
+        Args:
+            prefix: The prefix to filter files by
+            page_size: Keys requested per ListObjectsV2 call
+            
+        Yields:
+            File dictionaries with 'key', 'size', 'last_modified' and 'etag'
+            
+        Raises:
+            ClientError/BotoCoreError: If a listing call fails
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        page_iterator = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            MaxKeys=page_size
+        )
+        for page in page_iterator:
+            for obj in page.get('Contents', ()):
+                yield {
+                    'key': obj['Key'],
+                    'size': obj['Size'],
+                    'last_modified': obj['LastModified'],
+                    'etag': (obj.get('ETag') or '').strip('"')
+                }
+    
     def list_files(self, prefix: str, max_keys: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         List files in S3 with given prefix.
@@ -105,27 +269,10 @@ class S3Service:
             max_keys: Maximum number of keys to return
             
         Returns:
-            List of file dictionaries with 'key' and 'size'
+            List of file dictionaries with 'key', 'size', 'last_modified' and 'etag'
         """
         try:
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                MaxKeys=max_keys or 1000
-            )
-            
-            files = []
-            for page in page_iterator:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        files.append({
-                            'key': obj['Key'],
-                            'size': obj['Size'],
-                            'last_modified': obj['LastModified']
-                        })
-            
-            return files
+            return list(self.iter_files(prefix, page_size=max_keys or 1000))
         except (ClientError, BotoCoreError) as e:
             logger.error(f"Error listing files from S3: {str(e)}")
             return []
@@ -178,10 +325,7 @@ class S3Service:
             Presigned URL string, or None if generation fails
         """
         try:
-            from botocore.client import Config
-            s3_client = self.session.client('s3', config=Config(signature_version='s3v4'))
-            
-            url = s3_client.generate_presigned_url(
+            url = self.s3_client.generate_presigned_url(
                 'get_object' if http_method == 'GET' else 'put_object',
                 Params={'Bucket': self.bucket_name, 'Key': s3_key},
                 ExpiresIn=expiration
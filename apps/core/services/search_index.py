@@ -0,0 +1,355 @@
+"""
+Inverted full-text index for S3-backed models.
+
+``S3ModelStorage`` subclasses that declare ``search_fields`` get a
+``search_index.json`` next to their ``index.json``. It stores, per document,
+the weighted term frequencies of its searchable fields, its tags and a few
+filter/order fields (plus the lowercased values of identifier fields such as
+keys, which are also split into their ``_``/``-``/``.``/camelCase parts and
+matched by substring); postings (term -> {doc: weight}) and the sorted
+vocabulary are derived from that in memory when the object is loaded. The
+index is updated per create/update/delete, so ranked search and related-item
+lookups touch only the index and the handful of documents finally returned.
+"""
+
+import bisect
+import logging
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_VERSION = 2
+
+# Query terms matching only as a prefix of an indexed term score at this factor
+PREFIX_MATCH_WEIGHT = 0.5
+# Prefix expansion is skipped for very short terms; they would match half the vocabulary
+MIN_PREFIX_LENGTH = 3
+# Documents matched only by a substring of an identifier field score at this factor
+SUBSTRING_MATCH_WEIGHT = 0.25
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_IDENTIFIER_PART_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+
+def tokenize(text: Any) -> List[str]:
+    """Lowercased word tokens of a string (or of each string in a list)."""
+    if isinstance(text, (list, tuple)):
+        tokens: List[str] = []
+        for value in text:
+            tokens.extend(tokenize(value))
+        return tokens
+    if not isinstance(text, str):
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+def tokenize_identifier(text: Any) -> List[str]:
+    """
+    Tokens of an identifier such as ``user_settings`` or ``apiKey.v2``: each
+    whole word plus its ``_`` and camelCase parts, lowercased.
+    """
+    if isinstance(text, (list, tuple)):
+        tokens: List[str] = []
+        for value in text:
+            tokens.extend(tokenize_identifier(value))
+        return tokens
+    if not isinstance(text, str):
+        return []
+    tokens = []
+    for word in _TOKEN_RE.findall(text):
+        tokens.append(word.lower())
+        parts = [p.lower() for p in _IDENTIFIER_PART_RE.findall(word)]
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+def _normalize_tag(tag: Any) -> Optional[str]:
+    if not isinstance(tag, str):
+        return None
+    tag = tag.strip().lower()
+    return tag or None
+
+
+class InvertedIndex:
+    """
+    In-memory form of a model's search index.
+
+    ``docs`` is the persisted part: ``{doc_id: {"t": {term: weight},
+    "tags": [...], "f": {field: value}, "o": order_key}}``. ``postings``,
+    ``tag_postings`` and ``vocabulary`` are rebuilt from it on load and kept
+    in step by ``add``/``remove``.
+    """
+
+    def __init__(
+        self,
+        field_weights: Dict[str, float],
+        tag_field: Optional[str] = None,
+        filter_fields: Sequence[str] = (),
+        order_field: str = "created_at",
+        identifier_fields: Sequence[str] = (),
+    ):
+        self.field_weights = field_weights
+        self.identifier_fields = tuple(identifier_fields)
+        self.tag_field = tag_field
+        self.filter_fields = tuple(filter_fields)
+        self.order_field = order_field
+        self.docs: Dict[str, Dict[str, Any]] = {}
+        self.postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self.tag_postings: Dict[str, set] = defaultdict(set)
+        self._vocabulary: Optional[List[str]] = None
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def document_entry(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """The persisted index record for one full document."""
+        terms: Dict[str, float] = defaultdict(float)
+        for field, weight in self.field_weights.items():
+            split = tokenize_identifier if field in self.identifier_fields else tokenize
+            for token in split(data.get(field)):
+                terms[token] += weight
+        tags = []
+        if self.tag_field:
+            tags = sorted({t for t in map(_normalize_tag, data.get(self.tag_field) or []) if t})
+        entry = {
+            "t": dict(terms),
+            "tags": tags,
+            "f": {field: data.get(field) for field in self.filter_fields},
+            "o": data.get(self.order_field) or "",
+        }
+        if self.identifier_fields:
+            entry["k"] = {
+                field: data[field].lower()
+                for field in self.identifier_fields
+                if isinstance(data.get(field), str)
+            }
+        return entry
+
+    def add(self, doc_id: str, data: Dict[str, Any]) -> None:
+        """Index (or re-index) a document."""
+        self.add_entry(doc_id, self.document_entry(data))
+
+    def add_entry(self, doc_id: str, entry: Dict[str, Any]) -> None:
+        self.remove(doc_id)
+        self.docs[doc_id] = entry
+        for term, weight in entry.get("t", {}).items():
+            if term not in self.postings:
+                self._vocabulary = None
+            self.postings[term][doc_id] = weight
+        for tag in entry.get("tags", []):
+            self.tag_postings[tag].add(doc_id)
+
+    def remove(self, doc_id: str) -> bool:
+        entry = self.docs.pop(doc_id, None)
+        if entry is None:
+            return False
+        for term in entry.get("t", {}):
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(doc_id, None)
+                if not posting:
+                    del self.postings[term]
+                    self._vocabulary = None
+        for tag in entry.get("tags", []):
+            docs = self.tag_postings.get(tag)
+            if docs is not None:
+                docs.discard(doc_id)
+                if not docs:
+                    del self.tag_postings[tag]
+        return True
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def vocabulary(self) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        return self._vocabulary
+
+    def _idf(self, term: str) -> float:
+        return math.log(1 + len(self.docs) / (1 + len(self.postings.get(term, ()))))
+
+    def _term_scores(self, term: str) -> Dict[str, float]:
+        """Score contribution of one query term per matching document."""
+        exact = self.postings.get(term, {})
+        idf = self._idf(term)
+        scores = {doc_id: weight * idf for doc_id, weight in exact.items()}
+        if len(term) >= MIN_PREFIX_LENGTH:
+            vocabulary = self.vocabulary
+            i = bisect.bisect_right(vocabulary, term)
+            while i < len(vocabulary) and vocabulary[i].startswith(term):
+                candidate = vocabulary[i]
+                idf = self._idf(candidate) * PREFIX_MATCH_WEIGHT
+                for doc_id, weight in self.postings[candidate].items():
+                    if doc_id not in exact:
+                        scores[doc_id] = max(scores.get(doc_id, 0.0), weight * idf)
+                i += 1
+        return scores
+
+    def _substring_scores(self, query: Any) -> Dict[str, float]:
+        """Documents whose identifier fields contain the whole query (e.g. ``ings`` in ``user_settings``)."""
+        needle = query.strip().lower() if isinstance(query, str) else ""
+        if not self.identifier_fields or len(needle) < MIN_PREFIX_LENGTH:
+            return {}
+        scores: Dict[str, float] = {}
+        for doc_id, entry in self.docs.items():
+            weight = max(
+                (self.field_weights.get(field, 1.0) for field, value in entry.get("k", {}).items() if needle in value),
+                default=0.0,
+            )
+            if weight:
+                scores[doc_id] = weight * SUBSTRING_MATCH_WEIGHT
+        return scores
+
+    def _matches_filters(self, doc_id: str, filters: Optional[Dict[str, Any]]) -> bool:
+        if not filters:
+            return True
+        fields = self.docs[doc_id].get("f", {})
+        for key, value in filters.items():
+            if isinstance(value, (list, tuple, set)):
+                if fields.get(key) not in value:
+                    return False
+            elif fields.get(key) != value:
+                return False
+        return True
+
+    def _tag_candidates(self, tags: Optional[Iterable[str]]) -> Optional[set]:
+        if not tags:
+            return None
+        matched: set = set()
+        for tag in filter(None, map(_normalize_tag, tags)):
+            matched |= self.tag_postings.get(tag, set())
+        return matched
+
+    def _by_recency(self, doc_ids: Iterable[str]) -> List[str]:
+        return sorted(doc_ids, key=lambda d: (self.docs[d].get("o", ""), d), reverse=True)
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank documents for a query.
+
+        Every query term must match (exactly, or as a prefix of an indexed
+        term); a query contained in an identifier field also matches, with a
+        lower score. ``tags`` keeps documents carrying any of them. Without a query
+        all matching documents are returned newest first with score 0.
+
+        Returns:
+            ``[(doc_id, score)]`` best first
+        """
+        candidates = self._tag_candidates(tags)
+        terms = list(dict.fromkeys(tokenize(query)))
+
+        if not terms:
+            pool = candidates if candidates is not None else self.docs.keys()
+            return [(d, 0.0) for d in self._by_recency(d for d in pool if self._matches_filters(d, filters))]
+
+        scores: Optional[Dict[str, float]] = None
+        # Rarest terms first keeps the running intersection small
+        for term in sorted(terms, key=lambda t: len(self.postings.get(t, ()))):
+            term_scores = self._term_scores(term)
+            if scores is None:
+                scores = dict(term_scores)
+            else:
+                scores = {d: s + term_scores[d] for d, s in scores.items() if d in term_scores}
+            if not scores:
+                break
+        for doc_id, score in self._substring_scores(query).items():
+            scores.setdefault(doc_id, score)
+
+        ranked = [
+            (doc_id, score) for doc_id, score in scores.items()
+            if (candidates is None or doc_id in candidates) and self._matches_filters(doc_id, filters)
+        ]
+        ranked.sort(key=lambda pair: (-pair[1], pair[0]))
+        return ranked
+
+    def related(
+        self,
+        doc_id: str,
+        same_fields: Sequence[str] = (),
+        limit: int = 5,
+        max_terms: int = 20,
+    ) -> List[str]:
+        """
+        Documents most related to ``doc_id`` among those sharing its
+        ``same_fields`` values (e.g. pattern type): shared tags rank first,
+        then overlap on the document's ``max_terms`` most distinctive terms,
+        then recency.
+        """
+        entry = self.docs.get(doc_id)
+        if entry is None:
+            return []
+        fields = entry.get("f", {})
+        filters = {f: fields.get(f) for f in same_fields if fields.get(f) not in (None, "")}
+
+        scores: Dict[str, float] = defaultdict(float)
+        for tag in entry.get("tags", []):
+            for other in self.tag_postings.get(tag, ()):
+                scores[other] += 1000.0
+        weighted_terms = sorted(
+            ((weight * self._idf(term), term) for term, weight in entry.get("t", {}).items()),
+            reverse=True,
+        )[:max_terms]
+        for weight, term in weighted_terms:
+            for other in self.postings.get(term, {}):
+                scores[other] += weight
+        scores.pop(doc_id, None)
+
+        ranked = [
+            other for other, _ in sorted(scores.items(), key=lambda pair: (-pair[1], pair[0]))
+            if self._matches_filters(other, filters)
+        ][:limit]
+        if len(ranked) < limit:
+            seen = set(ranked) | {doc_id}
+            rest = (d for d in self.docs if d not in seen and self._matches_filters(d, filters))
+            ranked.extend(self._by_recency(rest)[:limit - len(ranked)])
+        return ranked
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"version": SEARCH_INDEX_VERSION, "total": len(self.docs), "docs": self.docs}
+
+    def load(self, data: Dict[str, Any]) -> "InvertedIndex":
+        for doc_id, entry in (data.get("docs") or {}).items():
+            self.add_entry(doc_id, entry)
+        return self
+
+
+# Built indexes per model, reused while the persisted object is unchanged.
+# read_json(readonly=True) hands back the same parsed object for the same ETag,
+# so identity of that object is the validity token.
+_loaded: Dict[str, Tuple[Dict[str, Any], InvertedIndex]] = {}
+_loaded_lock = threading.Lock()
+
+
+def cached_index(model_name: str, raw: Dict[str, Any], factory: Callable[[], InvertedIndex]) -> InvertedIndex:
+    """Build (or reuse) the in-memory index for a persisted search index object."""
+    with _loaded_lock:
+        hit = _loaded.get(model_name)
+        if hit is not None and hit[0] is raw:
+            return hit[1]
+    index = factory().load(raw)
+    with _loaded_lock:
+        _loaded[model_name] = (raw, index)
+    return index
+
+
+def forget_index(model_name: str) -> None:
+    with _loaded_lock:
+        _loaded.pop(model_name, None)
@@ -0,0 +1,33 @@
+"""
+Shared test helpers for core services.
+
+Provides:
+- FakeJSONStorage, an in-memory stand-in for S3JSONStorage
+"""
+
+import copy
+
+
+class FakeJSONStorage:
+    """Dict-backed stand-in for S3JSONStorage that counts document reads."""
+
+    def __init__(self):
+        self.objects = {}
+        self.versions = {}
+        self.reads = []
+
+    def read_json(self, key, readonly=False):
+        self.reads.append(key)
+        return self.objects.get(key)
+
+    def read_json_versioned(self, key):
+        data = self.read_json(key)
+        return (copy.deepcopy(data), str(self.versions.get(key))) if data is not None else (None, None)
+
+    def write_json(self, key, data, etag=None, create_only=False):
+        self.objects[key] = data
+        self.versions[key] = self.versions.get(key, 0) + 1
+        return True
+
+    def delete_json(self, key):
+        return self.objects.pop(key, None) is not None
@@ -0,0 +1,131 @@
+"""Tests for write-combining, conditional S3 model index writes against moto."""
+import threading
+import uuid
+
+import boto3
+from django.test import TestCase, override_settings
+from moto import mock_aws
+
+from apps.core.exceptions import S3Error
+from apps.core.services.index_writer import get_index_writer
+from apps.core.services.s3_client import reset_s3_clients
+from apps.core.services.s3_model_storage import S3ModelStorage
+from apps.core.services.s3_service import S3Service
+
+BUCKET = 'test-bucket'
+
+
+class ConditionalS3Service(S3Service):
+    """
+    Enforces If-Match/If-None-Match on PUT, which moto 5.0 ignores.
+
+    ``before_conditional_put`` runs between reading the current ETag and
+    checking it, to stage a write from "another process".
+    """
+
+    _put_lock = threading.Lock()
+
+    def __init__(self):
+        super().__init__()
+        self.before_conditional_put = None
+
+    def upload_file(self, file_content, s3_key, content_type='text/plain', if_match=None, if_none_match=None):
+        if not (if_match or if_none_match):
+            return super().upload_file(file_content, s3_key, content_type)
+        with self._put_lock:
+            hook, self.before_conditional_put = self.before_conditional_put, None
+            if hook:
+                hook()
+            try:
+                current = self.transfer.head(s3_key)['ETag'].strip('"')
+            except Exception:
+                current = None
+            if (if_match and current != if_match.strip('"')) or (if_none_match and current):
+                raise S3Error('precondition failed', s3_key=s3_key, error_code='PRECONDITION_FAILED')
+            return super().upload_file(file_content, s3_key, content_type, if_match=if_match,
+                                       if_none_match=if_none_match)
+
+
+@override_settings(
+    AWS_ACCESS_KEY_ID='testing',
+    AWS_SECRET_ACCESS_KEY='testing',
+    AWS_REGION='us-east-1',
+    AWS_S3_ENDPOINT_URL='',
+    S3_BUCKET_NAME=BUCKET,
+)
+class IndexWriterTest(TestCase):
+
+    def setUp(self):
+        self.mock = mock_aws()
+        self.mock.start()
+        reset_s3_clients()
+        boto3.client('s3', region_name='us-east-1').create_bucket(Bucket=BUCKET)
+        self.service = ConditionalS3Service()
+        self.storage = S3ModelStorage(f'things-{uuid.uuid4().hex[:8]}', s3_service=self.service)
+
+    def tearDown(self):
+        reset_s3_clients()
+        self.mock.stop()
+
+    def _indexed(self):
+        data = self.storage.s3_json_storage.read_json(self.storage.index_key)
+        return {item['uuid'] for item in data['items']}
+
+    def test_put_conditions_reach_s3_as_headers(self):
+        sent = []
+        client = self.service.transfer.client
+        client.meta.events.register_last(
+            'before-call.s3.PutObject', lambda params, **kwargs: sent.append(dict(params['headers']))
+        )
+        S3Service.upload_file(self.service, b'{}', 'a.json', if_none_match='*')
+        S3Service.upload_file(self.service, b'{}', 'a.json', if_match='abc')
+        self.assertEqual(sent[0].get('If-None-Match'), '*')
+        self.assertEqual(sent[1].get('If-Match'), '"abc"')
+
+    @override_settings(S3_INDEX_WRITE_COALESCE_MS=50)
+    def test_concurrent_creates_are_coalesced_without_lost_updates(self):
+        barrier = threading.Barrier(8)
+
+        def worker(n):
+            barrier.wait()
+            for i in range(3):
+                self.storage.create({'name': f'{n}-{i}'}, item_uuid=f'{n}-{i}')
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self._indexed()), 24)
+        self.assertLess(get_index_writer(self.storage.s3_json_storage, self.storage.index_key).commits, 24)
+
+    def test_conflicting_write_from_another_process_is_retried(self):
+        self.storage.create({'name': 'first'}, item_uuid='first')
+        other = S3ModelStorage(self.storage.model_name, s3_service=S3Service())
+
+        def foreign_write():
+            index, _ = other.s3_json_storage.read_json_versioned(other.index_key)
+            index['items'].append({'uuid': 'foreign'})
+            other.s3_json_storage.write_json(other.index_key, index)
+
+        self.service.before_conditional_put = foreign_write
+        self.storage.create({'name': 'second'}, item_uuid='second')
+
+        self.assertEqual(self._indexed(), {'first', 'foreign', 'second'})
+        self.assertEqual(get_index_writer(self.storage.s3_json_storage, self.storage.index_key).conflicts, 1)
+
+    @override_settings(S3_INDEX_WRITE_MAX_RETRIES=1)
+    def test_gives_up_after_max_retries(self):
+        self.storage.create({'name': 'first'}, item_uuid='first')
+        real_upload = self.service.upload_file
+
+        def always_conflict(*args, **kwargs):
+            if kwargs.get('if_match'):
+                raise S3Error('precondition failed', error_code='PRECONDITION_FAILED')
+            return real_upload(*args, **kwargs)
+
+        self.service.upload_file = always_conflict
+        with self.assertRaises(S3Error) as raised:
+            self.storage.create({'name': 'second'}, item_uuid='second')
+        self.assertEqual(raised.exception.error_code, 'INDEX_WRITE_CONFLICT')
@@ -0,0 +1,69 @@
+"""Tests for the pluggable JSON codec."""
+import decimal
+import json
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy
+
+from apps.core.utils import json_codec
+
+
+class JsonCodecTest(SimpleTestCase):
+    """Each available backend must behave the same for callers."""
+
+    def setUp(self):
+        self.previous = json_codec.backend_name()
+
+    def tearDown(self):
+        json_codec.use_backend(self.previous)
+
+    def test_round_trip_from_bytes(self):
+        document = {"name": "Zürich", "items": [1, 2.5, None, True], "nested": {"a": "b"}}
+        for backend in json_codec.BACKENDS:
+            with self.subTest(backend=backend):
+                json_codec.use_backend(backend)
+                encoded = json_codec.dumps(document)
+                self.assertIsInstance(encoded, bytes)
+                self.assertIn("Zürich".encode("utf-8"), encoded)
+                self.assertNotIn(b": ", encoded)
+                self.assertEqual(json_codec.loads(encoded), document)
+                self.assertEqual(json_codec.loads(memoryview(encoded)), document)
+
+    def test_indent_and_fallback_types(self):
+        for backend in json_codec.BACKENDS:
+            with self.subTest(backend=backend):
+                json_codec.use_backend(backend)
+                self.assertIn(b'\n  "a"', json_codec.dumps({"a": 1}, indent=True))
+                encoded = json_codec.dumps({"d": decimal.Decimal("1.5"), "l": gettext_lazy("Pages"), 1: 2**70})
+                self.assertEqual(json.loads(encoded), {"d": "1.5", "l": "Pages", "1": 2**70})
+
+    def test_decode_errors_are_json_decode_errors(self):
+        for backend in json_codec.BACKENDS:
+            with self.subTest(backend=backend):
+                json_codec.use_backend(backend)
+                with self.assertRaises(json.JSONDecodeError):
+                    json_codec.loads(b"{not json")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            json_codec.use_backend("simdjson")
+
+    def test_dump_file_respects_pretty_setting(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "index.json"
+            json_codec.dump_file(path, {"a": [1]})
+            self.assertEqual(path.read_bytes(), b'{"a":[1]}')
+            with override_settings(JSON_PRETTY_FILES=True):
+                json_codec.dump_file(path, {"a": [1]})
+            self.assertIn(b"\n", path.read_bytes())
+            self.assertEqual(json_codec.load_file(path), {"a": [1]})
+
+    def test_codec_json_response(self):
+        response = json_codec.CodecJsonResponse({"ok": True}, status=201)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(response.content), {"ok": True})
+        with self.assertRaises(TypeError):
+            json_codec.CodecJsonResponse([1, 2])
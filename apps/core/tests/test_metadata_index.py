@@ -0,0 +1,86 @@
+"""Tests for the metadata index engine behind S3ModelStorage.list."""
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from apps.core.services import metadata_index
+from apps.core.services.metadata_index import MetadataIndex
+from apps.core.tests.helpers import FakeJSONStorage
+from apps.tasks.services.task_storage_service import TaskStorageService
+
+
+def _items():
+    return [
+        {'uuid': 'a', 'status': 'open', 'priority': 'high', 'created_at': '2024-01-02', 'tags': ['x']},
+        {'uuid': 'b', 'status': 'done', 'priority': 'high', 'created_at': '2024-01-03'},
+        {'uuid': 'c', 'status': 'open', 'priority': 'low', 'created_at': '2024-01-01', 'due': None},
+        {'uuid': 'd', 'status': 'open', 'priority': 'high', 'created_at': '2024-01-03', 'meta': {'k': 1}},
+    ]
+
+
+def _reference(items, filters, order_by, descending):
+    """The original linear filter + full sort."""
+    matched = [
+        i for i in items
+        if all((i.get(k) in v) if isinstance(v, (list, tuple)) else i.get(k) == v for k, v in filters.items())
+    ]
+    return sorted(matched, key=lambda i: '' if i.get(order_by) is None else i[order_by], reverse=descending)
+
+
+class MetadataIndexTest(SimpleTestCase):
+
+    def test_matches_linear_filter_and_sort(self):
+        engine = MetadataIndex(_items())
+        cases = [
+            {},
+            {'status': 'open'},
+            {'status': 'open', 'priority': 'high'},
+            {'status': ['done', 'open'], 'priority': 'low'},
+            {'tags': [['x']]},
+            {'meta': [{'k': 1}]},
+            {'due': None, 'status': 'open'},
+            {'status': 'missing'},
+        ]
+        for filters in cases:
+            for descending in (True, False):
+                for limit, offset in ((None, 0), (1, 0), (2, 1)):
+                    with self.subTest(filters=filters, descending=descending, limit=limit, offset=offset):
+                        expected = _reference(_items(), filters, 'created_at', descending)
+                        page, total = engine.select(filters, 'created_at', descending, limit, offset)
+                        self.assertEqual(total, len(expected))
+                        end = None if limit is None else offset + limit
+                        self.assertEqual([i['uuid'] for i in page], [i['uuid'] for i in expected[offset:end]])
+
+    def test_heap_selection_matches_sorted_walk(self):
+        items = [{'uuid': str(n), 'group': n % 20, 'rank': n % 7} for n in range(200)]
+        engine = MetadataIndex(items)
+        for descending in (True, False):
+            page, total = engine.select({'group': 3}, 'rank', descending, limit=4)
+            expected = _reference(items, {'group': 3}, 'rank', descending)
+            self.assertEqual(total, 10)
+            self.assertEqual([i['uuid'] for i in page], [i['uuid'] for i in expected[:4]])
+
+
+class StorageListTest(SimpleTestCase):
+
+    def setUp(self):
+        metadata_index._engines.clear()
+        self.storage = TaskStorageService()
+        self.storage.model_name = self.storage.cache_prefix = f'tasks-test-{id(self)}:'
+        self.json = self.storage.s3_json_storage = FakeJSONStorage()
+        for n in range(6):
+            self.storage.create({'title': f'Task {n}', 'status': 'open' if n % 2 else 'done',
+                                 'created_at': f'2024-01-0{n + 1}'}, item_uuid=f't{n}')
+
+    def test_list_loads_only_the_page_and_reuses_engine(self):
+        with self.settings(S3_MODEL_FETCH_WORKERS=1), patch.object(self.storage, 'get') as mock_get:
+            result = self.storage.list_tasks(status='open', limit=2)
+        mock_get.assert_not_called()
+        self.assertEqual([t['uuid'] for t in result], ['t5', 't3'])
+        engine = metadata_index._engines[self.storage.model_name]
+        self.assertEqual(self.storage.count({'status': 'done'}), 3)
+        self.assertIs(metadata_index._engines[self.storage.model_name], engine)
+
+        self.storage.delete('t5')
+        self.assertEqual([t['uuid'] for t in self.storage.list_tasks(status='open')], ['t3', 't1'])
+        self.assertIsNot(metadata_index._engines[self.storage.model_name], engine)
@@ -0,0 +1,103 @@
+"""Tests for the shared S3 client registry and transfer layer."""
+import io
+
+import boto3
+from django.test import TestCase, override_settings
+from moto import mock_aws
+
+from apps.core.exceptions import S3Error
+from apps.core.services.s3_client import (
+    S3TransferManager,
+    get_s3_client,
+    get_transfer_manager,
+    reset_s3_clients,
+)
+from apps.core.services.s3_service import S3Service
+
+BUCKET = 'test-bucket'
+
+
+@override_settings(
+    AWS_ACCESS_KEY_ID='testing',
+    AWS_SECRET_ACCESS_KEY='testing',
+    AWS_REGION='us-east-1',
+    AWS_S3_ENDPOINT_URL='',
+    S3_BUCKET_NAME=BUCKET,
+    S3_MULTIPART_THRESHOLD_MB=5,
+    S3_MULTIPART_CHUNKSIZE_MB=5,
+)
+class S3ClientRegistryTest(TestCase):
+    """Test shared client reuse and the transfer manager against moto."""
+
+    def setUp(self):
+        self.mock = mock_aws()
+        self.mock.start()
+        reset_s3_clients()
+        boto3.client('s3', region_name='us-east-1').create_bucket(Bucket=BUCKET)
+
+    def tearDown(self):
+        reset_s3_clients()
+        self.mock.stop()
+
+    def test_client_is_shared_across_services(self):
+        """Every S3Service reuses the same pooled client."""
+        first, second = S3Service(), S3Service()
+        self.assertIs(first.s3_client, second.s3_client)
+        self.assertIs(first.s3_client, get_s3_client())
+        self.assertIs(get_transfer_manager(), get_transfer_manager(BUCKET))
+
+    def test_client_config(self):
+        """Client is tuned with pool size, adaptive retries and keep-alive."""
+        with self.settings(S3_MAX_POOL_CONNECTIONS=64):
+            reset_s3_clients()
+            config = get_s3_client().meta.config
+        self.assertEqual(config.max_pool_connections, 64)
+        self.assertEqual(config.retries['mode'], 'adaptive')
+        self.assertTrue(config.tcp_keepalive)
+
+    def test_region_override_gets_separate_client(self):
+        """Different regions do not share a client."""
+        self.assertIsNot(get_s3_client(), get_s3_client(region_name='eu-west-1'))
+        self.assertIs(get_s3_client('eu-west-1'), get_s3_client('eu-west-1'))
+
+    def test_range_and_stream(self):
+        """Range GETs and chunked streaming return the right bytes."""
+        manager = S3TransferManager()
+        manager.put_bytes('a.bin', b'0123456789', content_type='application/octet-stream')
+
+        self.assertEqual(manager.get_range('a.bin', 2, 4), b'234')
+        self.assertEqual(manager.get_range('a.bin', 7), b'789')
+        self.assertEqual(manager.get_range('a.bin', -3), b'789')
+        self.assertEqual(b''.join(manager.iter_chunks('a.bin', chunk_size=3)), b'0123456789')
+
+    def test_multipart_round_trip(self):
+        """Payloads above the threshold go through multipart upload."""
+        payload = b'x' * (11 * 1024 * 1024)
+        service = S3Service()
+        service.upload_fileobj(io.BytesIO(payload), 'big.bin')
+
+        head = service.transfer.head('big.bin')
+        self.assertIn('-', head['ETag'])  # multipart ETags carry a part count
+        out = io.BytesIO()
+        service.download_fileobj('big.bin', out)
+        self.assertEqual(out.getvalue(), payload)
+
+    def test_service_missing_key_errors(self):
+        """Missing keys surface as FILE_NOT_FOUND S3Errors."""
+        service = S3Service()
+        for call in (
+            lambda: service.download_file('missing.json'),
+            lambda: service.download_range('missing.json', 0, 10),
+            lambda: service.stream_file('missing.json'),
+        ):
+            with self.assertRaises(S3Error) as ctx:
+                call()
+            self.assertEqual(ctx.exception.error_code, 'FILE_NOT_FOUND')
+
+    def test_service_upload_download(self):
+        """S3Service upload/download/list go through the shared client."""
+        service = S3Service()
+        service.upload_file(b'{"a": 1}', 'data/a.json', content_type='application/json')
+        self.assertEqual(service.download_file('data/a.json'), b'{"a": 1}')
+        self.assertEqual(b''.join(service.stream_file('data/a.json')), b'{"a": 1}')
+        self.assertEqual([f['key'] for f in service.list_files('data/')], ['data/a.json'])
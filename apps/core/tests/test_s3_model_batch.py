@@ -0,0 +1,51 @@
+"""Tests for S3ModelStorage batch create/delete."""
+from django.test import SimpleTestCase
+
+from apps.core.tests.helpers import FakeJSONStorage
+from apps.knowledge.services.knowledge_storage_service import KnowledgeStorageService
+
+
+class CountingJSONStorage(FakeJSONStorage):
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write_json(self, key, data, **conditions):
+        self.writes.append(key)
+        return super().write_json(key, data, **conditions)
+
+
+class BatchStorageTest(SimpleTestCase):
+
+    def setUp(self):
+        self.storage = KnowledgeStorageService()
+        self.storage.model_name = self.storage.cache_prefix = f'knowledge-batch-{id(self)}:'
+        self.json = self.storage.s3_json_storage = CountingJSONStorage()
+        self.storage.create_knowledge('pattern', 'Existing', 'seed', tags=['seed'])
+        # Materialize search_index.json so batches must maintain it
+        self.storage.search_knowledge(query='seed')
+        self.json.writes.clear()
+
+    def _index_writes(self):
+        return [k for k in self.json.writes if k in (self.storage.index_key, self.storage.search_index_key)]
+
+    def test_batch_create_writes_indexes_once(self):
+        created = self.storage.batch_create([
+            {'title': f'Django tip {n}', 'content': 'cache', 'pattern_type': 'pattern', 'tags': ['django']}
+            for n in range(25)
+        ])
+        self.assertEqual(len(created), 25)
+        self.assertEqual(sorted(self._index_writes()), sorted([self.storage.index_key, self.storage.search_index_key]))
+        self.assertEqual(self.storage.count(), 26)
+        self.assertEqual(len(self.storage.search_knowledge(query='django', limit=100)), 25)
+
+    def test_batch_delete_removes_only_indexed_items(self):
+        created = self.storage.batch_create([{'title': f'Item {n}', 'content': 'x'} for n in range(5)])
+        self.json.writes.clear()
+        uuids = [item['uuid'] for item in created[:3]]
+        self.assertEqual(self.storage.batch_delete(uuids + ['missing', uuids[0]]), 3)
+        self.assertEqual(len(self._index_writes()), 2)
+        self.assertEqual(self.storage.count(), 3)
+        self.assertFalse(any(self.storage._get_item_key(u) in self.json.objects for u in uuids))
+        self.assertEqual(set(self.json.objects[self.storage.search_index_key]['docs']) & set(uuids), set())
@@ -0,0 +1,114 @@
+"""Tests for the inverted search index used by S3 model storage."""
+
+from django.test import SimpleTestCase
+
+from apps.core.services.search_index import InvertedIndex
+from apps.core.tests.helpers import FakeJSONStorage
+from apps.json_store.services.json_store_storage_service import JSONStoreStorageService
+from apps.knowledge.services.knowledge_storage_service import KnowledgeStorageService
+
+
+def _index():
+    return InvertedIndex({'title': 3.0, 'content': 1.0}, tag_field='tags', filter_fields=('pattern_type',))
+
+
+class InvertedIndexTest(SimpleTestCase):
+
+    def setUp(self):
+        self.index = _index()
+        self.index.add('a', {'title': 'Django caching', 'content': 'cache views', 'tags': ['Django'],
+                             'pattern_type': 'pattern', 'created_at': '2024-01-01'})
+        self.index.add('b', {'title': 'React hooks', 'content': 'django rest backend', 'tags': ['react'],
+                             'pattern_type': 'pattern', 'created_at': '2024-01-02'})
+        self.index.add('c', {'title': 'Deploy', 'content': 'docker', 'tags': ['django'],
+                             'pattern_type': 'runbook', 'created_at': '2024-01-03'})
+
+    def test_ranked_search_with_filters_and_prefixes(self):
+        self.assertEqual([d for d, _ in self.index.search('django')], ['a', 'b'])
+        self.assertEqual([d for d, _ in self.index.search('cach')], ['a'])
+        self.assertEqual(self.index.search('django docker'), [])
+        self.assertEqual([d for d, _ in self.index.search('django', filters={'pattern_type': 'runbook'})], [])
+        self.assertEqual([d for d, _ in self.index.search(tags=['DJANGO'])], ['c', 'a'])
+        self.assertEqual([d for d, _ in self.index.search()], ['c', 'b', 'a'])
+
+    def test_reindex_and_remove_update_postings(self):
+        self.index.add('a', {'title': 'Celery', 'content': '', 'tags': []})
+        self.assertNotIn('a', self.index.postings.get('django', {}))
+        self.assertEqual(self.index.tag_postings['django'], {'c'})
+        self.index.remove('b')
+        self.assertNotIn('hooks', self.index.postings)
+        self.assertEqual(_index().load(self.index.to_dict()).docs, self.index.docs)
+
+    def test_related_prefers_shared_tags_within_filters(self):
+        self.index.add('d', {'title': 'Django signals', 'tags': ['django'], 'pattern_type': 'pattern'})
+        self.assertEqual(self.index.related('a', same_fields=('pattern_type',), limit=5), ['d', 'b'])
+        self.assertEqual(self.index.related('a', limit=2), ['d', 'c'])
+        self.assertEqual(self.index.related('missing'), [])
+
+    def test_identifier_fields_match_parts_and_substrings(self):
+        index = InvertedIndex({'key': 3.0, 'description': 1.0}, identifier_fields=('key',))
+        index.add('s', {'key': 'user_settings', 'description': ''})
+        index.add('k', {'key': 'apiKey.v2', 'description': 'settings for keys'})
+        self.assertEqual([d for d, _ in index.search('user_settings')], ['s'])
+        self.assertEqual([d for d, _ in index.search('settings')], ['s', 'k'])
+        self.assertEqual([d for d, _ in index.search('ings')], ['s'])
+        self.assertEqual([d for d, _ in index.search('key')], ['k'])
+        self.assertEqual([d for d, _ in index.search('apikey')], ['k'])
+        self.assertEqual(index.search('zzz'), [])
+
+
+class KnowledgeIndexedSearchTest(SimpleTestCase):
+    """Search and related lookups read the index plus only the returned documents."""
+
+    def setUp(self):
+        self.storage = KnowledgeStorageService()
+        self.storage.model_name = self.storage.cache_prefix = f'knowledge-test-{id(self)}:'
+        self.json = self.storage.s3_json_storage = FakeJSONStorage()
+        self.first = self.storage.create_knowledge('pattern', 'Django caching', 'cache views', tags=['django'])
+        self.second = self.storage.create_knowledge('pattern', 'React hooks', 'state', tags=['react'])
+
+    def test_missing_index_is_rebuilt_then_maintained(self):
+        self.assertNotIn(self.storage.search_index_key, self.json.objects)
+        results = self.storage.search_knowledge(query='django')
+        self.assertEqual([r['title'] for r in results], ['Django caching'])
+        self.assertIn(self.storage.search_index_key, self.json.objects)
+
+        third = self.storage.create_knowledge('pattern', 'Django signals', 'hooks', tags=['django'])
+        self.storage.update_knowledge(self.second['knowledge_id'], title='Vue hooks')
+        self.storage.delete_knowledge(self.first['knowledge_id'])
+        docs = self.json.objects[self.storage.search_index_key]['docs']
+        self.assertEqual(set(docs), {self.second['knowledge_id'], third['knowledge_id']})
+
+        self.json.reads.clear()
+        results = self.storage.search_knowledge(query='hooks', limit=1)
+        self.assertEqual(len(results), 1)
+        item_reads = [k for k in self.json.reads if k != self.storage.search_index_key]
+        self.assertEqual(len(item_reads), 1)
+        self.assertEqual([r['title'] for r in self.storage.search_knowledge(query='vue')], ['Vue hooks'])
+
+    def test_related_knowledge(self):
+        third = self.storage.create_knowledge('pattern', 'Django signals', 'events', tags=['django'])
+        related = self.storage.get_related_knowledge(self.first['knowledge_id'], limit=1)
+        self.assertEqual([r['knowledge_id'] for r in related], [third['knowledge_id']])
+
+
+class JSONStoreIndexedSearchTest(SimpleTestCase):
+    """Store keys are found by their parts and by substrings, as with the old scan."""
+
+    def setUp(self):
+        self.storage = JSONStoreStorageService()
+        self.storage.model_name = self.storage.cache_prefix = f'json-store-test-{id(self)}:'
+        self.storage.s3_json_storage = FakeJSONStorage()
+        self.storage.create_store('user_settings', {}, description='Per-user preferences')
+        self.storage.create_store('featureFlags', {}, store_type='config')
+
+    def _keys(self, query, **kwargs):
+        return [s['key'] for s in self.storage.search_stores(query, **kwargs)]
+
+    def test_key_parts_and_substrings(self):
+        self.assertEqual(self._keys('settings'), ['user_settings'])
+        self.assertEqual(self._keys('ings'), ['user_settings'])
+        self.assertEqual(self._keys('flags'), ['featureFlags'])
+        self.assertEqual(self._keys('ureFla'), ['featureFlags'])
+        self.assertEqual(self._keys('preferences'), ['user_settings'])
+        self.assertEqual(self._keys('flags', store_type='custom'), [])
@@ -0,0 +1,156 @@
+"""
+Pluggable JSON codec used by storage backends, index generation and API responses.
+
+Uses orjson when it is installed and falls back to the stdlib ``json`` module
+otherwise. Both backends:
+
+- decode directly from ``bytes`` (no intermediate ``str``),
+- encode to UTF-8 ``bytes`` (non-ASCII kept as-is, like ``ensure_ascii=False``),
+- raise ``json.JSONDecodeError`` (a ``ValueError``) on malformed input.
+
+Machine-written files are compact unless ``JSON_PRETTY_FILES`` is enabled;
+see ``dump_file``.
+"""
+
+import decimal
+import json
+import logging
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.http.response import HttpResponse
+from django.utils.functional import Promise
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+JSONDecodeError = json.JSONDecodeError
+BACKENDS = ('orjson', 'stdlib') if orjson is not None else ('stdlib',)
+
+# Resolved from settings.JSON_CODEC_BACKEND on first use
+_backend: Optional[str] = None
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types neither backend encodes natively (Decimal, lazy strings, ...)."""
+    if isinstance(obj, (decimal.Decimal, Promise)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    try:
+        return _django_encoder.default(obj)
+    except TypeError:
+        return str(obj)
+
+
+class _StdlibEncoder(DjangoJSONEncoder):
+    def default(self, obj: Any) -> Any:
+        return _default(obj)
+
+
+def _resolve_backend() -> str:
+    global _backend
+    configured = str(getattr(settings, 'JSON_CODEC_BACKEND', 'auto')).lower()
+    if configured not in ('auto',) + BACKENDS:
+        logger.warning(f"JSON_CODEC_BACKEND={configured} is not available, using {BACKENDS[0]}")
+    _backend = configured if configured in BACKENDS else BACKENDS[0]
+    return _backend
+
+
+def backend_name() -> str:
+    """Name of the active backend ('orjson' or 'stdlib')."""
+    return _backend or _resolve_backend()
+
+
+def use_backend(name: str) -> str:
+    """
+    Switch the active backend (benchmarks, tests). Returns the previous one.
+
+    Raises:
+        ValueError: If the backend is not available
+    """
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"JSON backend '{name}' is not available (have: {', '.join(BACKENDS)})")
+    previous, _backend = backend_name(), name
+    return previous
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode JSON from bytes or str."""
+    if (_backend or _resolve_backend()) == 'orjson':
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+    return json.dumps(
+        obj,
+        cls=_StdlibEncoder,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (',', ':'),
+        sort_keys=sort_keys,
+    ).encode('utf-8')
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode to UTF-8 JSON bytes (compact unless indent=True)."""
+    if (_backend or _resolve_backend()) == 'orjson':
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=_default, option=option)
+        except TypeError:
+            # Values orjson rejects (e.g. integers beyond 64 bits) still encode via stdlib
+            pass
+    return _stdlib_dumps(obj, indent, sort_keys)
+
+
+def dumps_str(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+    return dumps(obj, indent=indent, sort_keys=sort_keys).decode('utf-8')
+
+
+def pretty_files() -> bool:
+    """Whether machine-written JSON files are indented (JSON_PRETTY_FILES)."""
+    return bool(getattr(settings, 'JSON_PRETTY_FILES', False))
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """Read and decode a JSON file straight from its bytes."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_file(path: Union[str, Path], obj: Any, indent: Optional[bool] = None) -> None:
+    """Encode and write a JSON file (indent defaults to JSON_PRETTY_FILES)."""
+    data = dumps(obj, indent=pretty_files() if indent is None else indent)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+class CodecJsonResponse(JsonResponse):
+    """JsonResponse whose body is encoded with the active codec backend."""
+
+    def __init__(self, data: Any, safe: bool = True, **kwargs: Any):
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                "In order to allow non-dict objects to be serialized set the "
+                "safe parameter to False."
+            )
+        kwargs.setdefault('content_type', 'application/json')
+        HttpResponse.__init__(self, content=dumps(data), **kwargs)
@@ -11,11 +11,9 @@ from django.views.decorators.http import require_http_methods
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.csrf import csrf_exempt
 
-from apps.documentation.services import (
-    get_pages_service,
-    get_endpoints_service,
-    get_relationships_service
-)
+from apps.documentation.services.media_jobs import BulkDeleteJob
+from apps.operations.api.views import job_links
+from apps.operations.services import OperationsService
 
 logger = logging.getLogger(__name__)
 
@@ -33,12 +31,19 @@ def dashboard_bulk_delete_api(request):
         "ids": ["id1", "id2", ...]
     }
     
-    Returns:
+    The deletes run as a background operation; follow it at progress_url
+    (JSON) or events_url (SSE).
+    
+    Returns (202):
     {
         "success": true,
-        "deleted_count": 2,
-        "failed_count": 0,
-        "errors": []
+        "operation_id": "...",
+        "status": "queued",
+        "total_requested": 2,
+        "progress_url": "...",
+        "events_url": "...",
+        "cancel_url": "...",
+        "resume_url": "..."
     }
     """
     try:
@@ -58,90 +63,33 @@ def dashboard_bulk_delete_api(request):
                 'error': 'ids must be a non-empty array'
             }, status=400)
         
-        deleted_count = 0
-        failed_count = 0
-        errors = []
-        
-        if resource_type == 'pages':
-            service = get_pages_service()
-            for page_id in ids:
-                try:
-                    success = service.delete_page(page_id)
-                    if success:
-                        deleted_count += 1
-                    else:
-                        failed_count += 1
-                        errors.append({
-                            'id': page_id,
-                            'error': 'Failed to delete page'
-                        })
-                except Exception as e:
-                    failed_count += 1
-                    errors.append({
-                        'id': page_id,
-                        'error': str(e)
-                    })
-        
-        elif resource_type == 'endpoints':
-            service = get_endpoints_service()
-            for endpoint_id in ids:
-                try:
-                    success = service.delete_endpoint(endpoint_id)
-                    if success:
-                        deleted_count += 1
-                    else:
-                        failed_count += 1
-                        errors.append({
-                            'id': endpoint_id,
-                            'error': 'Failed to delete endpoint'
-                        })
-                except Exception as e:
-                    failed_count += 1
-                    errors.append({
-                        'id': endpoint_id,
-                        'error': str(e)
-                    })
-        
-        elif resource_type == 'relationships':
-            service = get_relationships_service()
-            for relationship_id in ids:
-                try:
-                    success = service.delete_relationship(relationship_id)
-                    if success:
-                        deleted_count += 1
-                    else:
-                        failed_count += 1
-                        errors.append({
-                            'id': relationship_id,
-                            'error': 'Failed to delete relationship'
-                        })
-                except Exception as e:
-                    failed_count += 1
-                    errors.append({
-                        'id': relationship_id,
-                        'error': str(e)
-                    })
-        
-        elif resource_type == 'postman':
+        if resource_type == 'postman':
             # Postman delete would need to be implemented in PostmanService
             return JsonResponse({
                 'success': False,
                 'error': 'Bulk delete for Postman configurations not yet implemented'
             }, status=501)
         
-        else:
+        if resource_type not in ('pages', 'endpoints', 'relationships'):
             return JsonResponse({
                 'success': False,
                 'error': f'Invalid resource_type: {resource_type}'
             }, status=400)
         
+        operation = OperationsService().start_job(
+            BulkDeleteJob(),
+            f'Bulk delete {len(ids)} {resource_type}',
+            params={'resource_type': resource_type, 'ids': ids},
+            started_by=request.user
+        )
+        operation_id = operation['operation_id']
         return JsonResponse({
             'success': True,
-            'deleted_count': deleted_count,
-            'failed_count': failed_count,
-            'errors': errors,
-            'total_requested': len(ids)
-        })
+            'operation_id': operation_id,
+            'status': operation.get('status'),
+            'total_requested': len(ids),
+            **job_links(operation_id)
+        }, status=202)
         
     except json.JSONDecodeError:
         return JsonResponse({
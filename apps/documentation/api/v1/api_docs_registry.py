@@ -53,6 +53,14 @@ GROUPS: List[Dict[str, Any]] = [
             _endpoint("docs/endpoint-stats/", "docs_endpoint_stats", "Endpoint stats", "Get per-endpoint request counts and last-called timestamps (JSON)."),
         ],
     },
+    {
+        "id": "export",
+        "name": "Export",
+        "description": "Streaming full-corpus reads",
+        "endpoints": [
+            _endpoint("export/{resource_type}/", "export_resource", "Export resource", "Stream all pages, endpoints, relationships or postman records as NDJSON (format=json for a JSON document).", query_params=[{"name": "format"}, {"name": "expand"}], path_params=[{"name": "resource_type"}]),
+        ],
+    },
     {
         "id": "pages",
         "name": "Pages",
@@ -24,8 +24,11 @@ from apps.documentation.utils.api_responses import (
     error_response,
     not_found_response,
     server_error_response,
-    paginated_response
+    paginated_response,
+    cursor_paginated_response,
 )
+from apps.documentation.utils.conditional_get import conditional_documentation_get
+from apps.documentation.utils.cursor_pagination import InvalidCursor, cursor_page, wants_cursor
 from apps.documentation.utils.list_projectors import (
     should_expand_full,
     to_page_list_item,
@@ -37,17 +40,38 @@ from apps.documentation.utils.list_projectors import (
 logger = logging.getLogger(__name__)
 
 
+def _cursor_list_response(request: HttpRequest, resource_type: str, filters: dict, loader, projector) -> JsonResponse:
+    """Serve a list request in cursor mode (?cursor=, empty for the first page)."""
+    try:
+        page = cursor_page(resource_type, request.GET, filters, loader,
+                           project=projector, full=should_expand_full(request.GET))
+    except (InvalidCursor, ValueError) as e:
+        return error_response(message=str(e)).to_json_response()
+    return cursor_paginated_response(
+        data=page['items'],
+        total=page['total'],
+        page_size=page['limit'],
+        next_cursor=page['next_cursor'],
+        has_more=page['has_more'],
+    ).to_json_response()
+
+
+def _page_number(offset: int, limit: int) -> int:
+    return offset // limit + 1 if limit > 0 else 1
+
+
 # =============================================================================
 # Pages API
 # =============================================================================
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("pages",))
 def pages_list(request: HttpRequest) -> JsonResponse:
     """
     GET /api/v1/pages/
 
     List pages with optional filtering and pagination.
-    Query params: page_type, status, limit, offset
+    Query params: page_type, status, limit, offset | cursor
     """
     try:
         service = get_pages_service()
@@ -55,6 +79,12 @@ def pages_list(request: HttpRequest) -> JsonResponse:
         # Extract query parameters
         page_type = request.GET.get('page_type')
         status = request.GET.get('status')
+        if wants_cursor(request.GET):
+            return _cursor_list_response(
+                request, 'pages', {'page_type': page_type, 'status': status},
+                lambda: service.list_pages(page_type=page_type, status=status, limit=None, offset=0).get('pages', []),
+                to_page_list_item,
+            )
         limit = int(request.GET.get('limit', 50))
         offset = int(request.GET.get('offset', 0))
 
@@ -74,7 +104,7 @@ def pages_list(request: HttpRequest) -> JsonResponse:
         return paginated_response(
             data=items,
             total=total,
-            page=1,
+            page=_page_number(offset, limit),
             page_size=limit,
             message=""
         ).to_json_response()
@@ -86,6 +116,7 @@ def pages_list(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("pages",), "detail")
 def pages_detail(request: HttpRequest, page_id: str) -> JsonResponse:
     """
     GET /api/v1/pages/{page_id}/
@@ -119,12 +150,13 @@ def pages_detail(request: HttpRequest, page_id: str) -> JsonResponse:
 # =============================================================================
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("endpoints",))
 def endpoints_list(request: HttpRequest) -> JsonResponse:
     """
     GET /api/v1/endpoints/
 
     List endpoints with optional filtering and pagination.
-    Query params: api_version, method, limit, offset
+    Query params: api_version, method, limit, offset | cursor
     """
     try:
         service = get_endpoints_service()
@@ -132,6 +164,14 @@ def endpoints_list(request: HttpRequest) -> JsonResponse:
         # Extract query parameters
         api_version = request.GET.get('api_version')
         method = request.GET.get('method')
+        if wants_cursor(request.GET):
+            return _cursor_list_response(
+                request, 'endpoints', {'api_version': api_version, 'method': method},
+                lambda: service.list_endpoints(
+                    api_version=api_version, method=method, limit=None, offset=0
+                ).get('endpoints', []),
+                to_endpoint_list_item,
+            )
         limit = int(request.GET.get('limit', 50))
         offset = int(request.GET.get('offset', 0))
 
@@ -150,7 +190,7 @@ def endpoints_list(request: HttpRequest) -> JsonResponse:
         return paginated_response(
             data=items,
             total=total,
-            page=1,
+            page=_page_number(offset, limit),
             page_size=limit,
             message=""
         ).to_json_response()
@@ -162,6 +202,7 @@ def endpoints_list(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("endpoints",), "detail")
 def endpoints_detail(request: HttpRequest, endpoint_id: str) -> JsonResponse:
     """
     GET /api/v1/endpoints/{endpoint_id}/
@@ -195,12 +236,13 @@ def endpoints_detail(request: HttpRequest, endpoint_id: str) -> JsonResponse:
 # =============================================================================
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("relationships",))
 def relationships_list(request: HttpRequest) -> JsonResponse:
     """
     GET /api/v1/relationships/
 
     List relationships with optional filtering and pagination.
-    Query params: page_id, endpoint_id, limit, offset
+    Query params: page_id, endpoint_id, limit, offset | cursor
     """
     try:
         service = get_relationships_service()
@@ -208,6 +250,14 @@ def relationships_list(request: HttpRequest) -> JsonResponse:
         # Extract query parameters
         page_id = request.GET.get('page_id')
         endpoint_id = request.GET.get('endpoint_id')
+        if wants_cursor(request.GET):
+            return _cursor_list_response(
+                request, 'relationships', {'page_id': page_id, 'endpoint_id': endpoint_id},
+                lambda: service.list_relationships(
+                    page_id=page_id, endpoint_id=endpoint_id, limit=None, offset=0
+                ).get('relationships', []),
+                to_relationship_list_item,
+            )
         limit = int(request.GET.get('limit', 50))
         offset = int(request.GET.get('offset', 0))
 
@@ -226,7 +276,7 @@ def relationships_list(request: HttpRequest) -> JsonResponse:
         return paginated_response(
             data=items,
             total=total,
-            page=1,
+            page=_page_number(offset, limit),
             page_size=limit,
             message=""
         ).to_json_response()
@@ -238,6 +288,7 @@ def relationships_list(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("relationships",), "detail")
 def relationships_detail(request, relationship_id):
     """
     GET /api/v1/relationships/{relationship_id}/
@@ -264,6 +315,7 @@ def relationships_detail(request, relationship_id):
 # =============================================================================
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("postman",))
 def postman_list(request: HttpRequest) -> JsonResponse:
     """
     GET /api/v1/postman/
@@ -304,6 +356,7 @@ def postman_list(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("postman",), "detail")
 def postman_detail(request: HttpRequest, postman_id: str) -> JsonResponse:
     """
     GET /api/v1/postman/{postman_id}/
@@ -330,6 +383,7 @@ def postman_detail(request: HttpRequest, postman_id: str) -> JsonResponse:
 # =============================================================================
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("pages",))
 def dashboard_pages(request: HttpRequest) -> JsonResponse:
     """
     GET /api/v1/dashboard/pages/
@@ -385,6 +439,7 @@ def dashboard_pages(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("endpoints",))
 def dashboard_endpoints(request: HttpRequest) -> JsonResponse:
     """
     GET /api/v1/dashboard/endpoints/
@@ -450,6 +505,7 @@ def dashboard_endpoints(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("relationships",))
 def dashboard_relationships(request: HttpRequest) -> JsonResponse:
     """
     GET /api/v1/dashboard/relationships/
@@ -509,6 +565,7 @@ def dashboard_relationships(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("postman",))
 def dashboard_postman(request: HttpRequest) -> JsonResponse:
     """
     GET /api/v1/dashboard/postman/
@@ -14,36 +14,54 @@ from django.http import HttpRequest, JsonResponse
 from apps.documentation.services import get_endpoints_service
 from apps.documentation.utils.format_examples import endpoint_examples, analysis_examples
 from apps.documentation.utils.cache_decorator import cache_documentation_get
+from apps.documentation.utils.conditional_get import conditional_documentation_get
+from apps.documentation.utils.cursor_pagination import InvalidCursor, cursor_page, wants_cursor
 from django.conf import settings
 from apps.documentation.utils.list_projectors import should_expand_full, to_endpoint_list_item
 
 logger = logging.getLogger(__name__)
 DATA_PREFIX = getattr(settings, "S3_DATA_PREFIX", "data/")
+# Resource types whose changes invalidate this module's ETags
+ENDPOINTS_RESOURCES = ("endpoints", "relationships")
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(ENDPOINTS_RESOURCES)
 @cache_documentation_get(timeout=300)
 def endpoints_list(request: HttpRequest) -> JsonResponse:
-    """GET /api/v1/endpoints/"""
+    """GET /api/v1/endpoints/ (?cursor= for keyset pages)"""
     try:
         service = get_endpoints_service()
+        filters = {
+            "api_version": request.GET.get("api_version"),
+            "method": request.GET.get("method"),
+            "endpoint_state": request.GET.get("endpoint_state"),
+        }
+        if wants_cursor(request.GET):
+            page = cursor_page("endpoints", request.GET, filters, lambda: service.list_endpoints(
+                limit=None, offset=0, **filters).get("endpoints", []),
+                project=to_endpoint_list_item, full=should_expand_full(request.GET))
+            endpoints = page["items"]
+            return JsonResponse({"endpoints": endpoints, "total": page["total"],
+                                 "next_cursor": page["next_cursor"], "has_more": page["has_more"]})
         result = service.list_endpoints(
-            api_version=request.GET.get("api_version"),
-            method=request.GET.get("method"),
-            endpoint_state=request.GET.get("endpoint_state"),
             limit=int(request.GET.get("limit") or 0) or None,
             offset=int(request.GET.get("offset", 0)),
+            **filters,
         )
         endpoints = result.get("endpoints", [])
         if not should_expand_full(request.GET):
             endpoints = [to_endpoint_list_item(ep) for ep in endpoints]
         return JsonResponse({"endpoints": endpoints, "total": result.get("total", 0)})
+    except (InvalidCursor, ValueError) as e:
+        return JsonResponse({"detail": str(e)}, status=400)
     except Exception as e:
         logger.exception("endpoints list failed")
         return JsonResponse({"detail": str(e)}, status=500)
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get((), "static")
 @cache_documentation_get(timeout=3600)
 def endpoints_format(request: HttpRequest) -> JsonResponse:
     """GET /api/v1/endpoints/format/"""
@@ -69,6 +87,7 @@ def endpoints_api_versions(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(ENDPOINTS_RESOURCES, "stats")
 @cache_documentation_get(timeout=300)
 def endpoints_methods(request: HttpRequest) -> JsonResponse:
     """GET /api/v1/endpoints/methods/"""
@@ -92,18 +111,21 @@ def _by_api_version_list(api_version: str) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(ENDPOINTS_RESOURCES)
 @cache_documentation_get(timeout=300)
 def endpoints_by_api_version_v1(request: HttpRequest) -> JsonResponse:
     return _by_api_version_list("v1")
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(ENDPOINTS_RESOURCES)
 @cache_documentation_get(timeout=300)
 def endpoints_by_api_version_v4(request: HttpRequest) -> JsonResponse:
     return _by_api_version_list("v4")
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(ENDPOINTS_RESOURCES)
 @cache_documentation_get(timeout=300)
 def endpoints_by_api_version_graphql(request: HttpRequest) -> JsonResponse:
     return _by_api_version_list("graphql")
@@ -161,24 +183,28 @@ def _by_method_list(method: str) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(ENDPOINTS_RESOURCES)
 @cache_documentation_get(timeout=300)
 def endpoints_by_method_get(request: HttpRequest) -> JsonResponse:
     return _by_method_list("GET")
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(ENDPOINTS_RESOURCES)
 @cache_documentation_get(timeout=300)
 def endpoints_by_method_post(request: HttpRequest) -> JsonResponse:
     return _by_method_list("POST")
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(ENDPOINTS_RESOURCES)
 @cache_documentation_get(timeout=300)
 def endpoints_by_method_query(request: HttpRequest) -> JsonResponse:
     return _by_method_list("QUERY")
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(ENDPOINTS_RESOURCES)
 @cache_documentation_get(timeout=300)
 def endpoints_by_method_mutation(request: HttpRequest) -> JsonResponse:
     return _by_method_list("MUTATION")
@@ -214,6 +240,7 @@ def endpoints_by_method_stats(request: HttpRequest, method: str) -> JsonResponse
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(ENDPOINTS_RESOURCES)
 @cache_documentation_get(timeout=300)
 def endpoints_by_state_list(request: HttpRequest, state: str) -> JsonResponse:
     """GET /api/v1/endpoints/by-state/{state}/"""
@@ -288,6 +315,7 @@ def endpoints_by_lambda_count(request: HttpRequest, service_name: str) -> JsonRe
 # ----- Detail and sub-resources (after all static/param lists) -----
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(ENDPOINTS_RESOURCES, "detail")
 @cache_documentation_get(timeout=600)
 def endpoints_detail(request: HttpRequest, endpoint_id: str) -> JsonResponse:
     """GET /api/v1/endpoints/{endpoint_id}/"""
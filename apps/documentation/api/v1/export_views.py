@@ -0,0 +1,63 @@
+"""
+Export API v1 - streaming full-corpus reads (pages, endpoints, relationships, postman).
+
+GET /api/v1/export/{resource_type}/ streams every record of a resource type as
+NDJSON (default) or, with ?format=json, as a chunked {"<type>": [...], "total": N}
+document. Records are full documents unless ?expand=summary is given.
+"""
+
+from __future__ import annotations
+
+import logging
+from django.http import HttpRequest, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_http_methods
+
+from apps.documentation.services.export_service import (
+    DocumentationExportService,
+    EXPORT_SOURCES,
+    iter_json_array,
+    iter_ndjson,
+)
+from apps.documentation.utils.list_projectors import (
+    to_endpoint_list_item,
+    to_page_list_item,
+    to_postman_list_item,
+    to_relationship_list_item,
+)
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PROJECTORS = {
+    "pages": to_page_list_item,
+    "endpoints": to_endpoint_list_item,
+    "relationships": to_relationship_list_item,
+    "postman": to_postman_list_item,
+}
+
+
+@require_http_methods(["GET"])
+def export_resource(request: HttpRequest, resource_type: str):
+    """GET /api/v1/export/{resource_type}/ - Stream all records (NDJSON or JSON array)."""
+    if resource_type not in EXPORT_SOURCES:
+        return JsonResponse(
+            {"detail": f"Unknown resource type '{resource_type}'", "allowed": list(EXPORT_SOURCES)},
+            status=404,
+        )
+    output_format = (request.GET.get("format") or "ndjson").lower()
+    if output_format not in ("ndjson", "json"):
+        return JsonResponse({"detail": "format must be 'ndjson' or 'json'"}, status=400)
+
+    project = SUMMARY_PROJECTORS[resource_type] if request.GET.get("expand") == "summary" else None
+    records = DocumentationExportService().iter_records(resource_type, project=project)
+
+    if output_format == "json":
+        response = StreamingHttpResponse(
+            iter_json_array(records, resource_type), content_type="application/json"
+        )
+    else:
+        response = StreamingHttpResponse(iter_ndjson(records), content_type="application/x-ndjson")
+    response["Cache-Control"] = "no-store"
+    # Tell reverse proxies (nginx) not to buffer the stream
+    response["X-Accel-Buffering"] = "no"
+    logger.info(f"Streaming {resource_type} export as {output_format}")
+    return response
@@ -10,11 +10,13 @@ from django.http import HttpRequest, JsonResponse
 
 from apps.documentation.services import get_shared_s3_index_manager
 from apps.documentation.utils.cache_decorator import cache_documentation_get
+from apps.documentation.utils.conditional_get import conditional_documentation_get
 
 logger = logging.getLogger(__name__)
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("pages",))
 @cache_documentation_get(timeout=300)
 def index_pages(request: HttpRequest) -> JsonResponse:
     try:
@@ -27,6 +29,7 @@ def index_pages(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("endpoints",))
 @cache_documentation_get(timeout=300)
 def index_endpoints(request: HttpRequest) -> JsonResponse:
     try:
@@ -39,6 +42,7 @@ def index_endpoints(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("relationships",))
 @cache_documentation_get(timeout=300)
 def index_relationships(request: HttpRequest) -> JsonResponse:
     try:
@@ -51,6 +55,7 @@ def index_relationships(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(("postman",))
 @cache_documentation_get(timeout=300)
 def index_postman(request: HttpRequest) -> JsonResponse:
     try:
@@ -15,6 +15,8 @@ from apps.documentation.services import get_pages_service
 from apps.documentation.utils.format_examples import page_examples, analysis_examples
 from apps.documentation.utils.exceptions import DocumentationNotFoundError
 from apps.documentation.utils.cache_decorator import cache_documentation_get
+from apps.documentation.utils.conditional_get import conditional_documentation_get
+from apps.documentation.utils.cursor_pagination import InvalidCursor, cursor_page, wants_cursor
 from django.conf import settings
 from apps.documentation.utils.list_projectors import should_expand_full, to_page_list_item
 
@@ -22,18 +24,30 @@ logger = logging.getLogger(__name__)
 
 VALID_USER_TYPES = frozenset(["super_admin", "admin", "pro_user", "free_user", "guest"])
 DATA_PREFIX = getattr(settings, "S3_DATA_PREFIX", "data/")
+# Resource types whose changes invalidate this module's ETags
+PAGES_RESOURCES = ("pages", "relationships")
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(PAGES_RESOURCES)
 @cache_documentation_get(timeout=300)
 def pages_list(request: HttpRequest) -> JsonResponse:
-    """GET /api/v1/pages/ - List all pages (Lambda shape)."""
+    """GET /api/v1/pages/ - List all pages (Lambda shape; ?cursor= for keyset pages)."""
     try:
         service = get_pages_service()
         page_type = request.GET.get("page_type")
         include_drafts = request.GET.get("include_drafts", "true").lower() == "true"
         include_deleted = request.GET.get("include_deleted", "false").lower() == "true"
         status_filter = request.GET.get("status")
+        if wants_cursor(request.GET):
+            filters = {"page_type": page_type, "include_drafts": include_drafts,
+                       "include_deleted": include_deleted, "status": status_filter}
+            page = cursor_page("pages", request.GET, filters, lambda: service.list_pages(
+                limit=None, offset=0, **filters).get("pages", []),
+                project=to_page_list_item, full=should_expand_full(request.GET))
+            pages = page["items"]
+            return JsonResponse({"pages": pages, "total": page["total"],
+                                 "next_cursor": page["next_cursor"], "has_more": page["has_more"]})
         limit = request.GET.get("limit")
         offset = int(request.GET.get("offset", 0))
         if limit is not None:
@@ -50,12 +64,15 @@ def pages_list(request: HttpRequest) -> JsonResponse:
         if not should_expand_full(request.GET):
             pages = [to_page_list_item(p) for p in pages]
         return JsonResponse({"pages": pages, "total": result.get("total", 0)})
+    except (InvalidCursor, ValueError) as e:
+        return JsonResponse({"detail": str(e)}, status=400)
     except Exception as e:
         logger.exception("pages list failed")
         return JsonResponse({"detail": str(e)}, status=500)
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get((), "static")
 @cache_documentation_get(timeout=3600)
 def pages_format(request: HttpRequest) -> JsonResponse:
     """GET /api/v1/pages/format/ - JSON examples for pages."""
@@ -69,6 +86,7 @@ def pages_format(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(PAGES_RESOURCES, "stats")
 @cache_documentation_get(timeout=300)
 def pages_statistics(request: HttpRequest) -> JsonResponse:
     """GET /api/v1/pages/statistics/ - Pages index statistics."""
@@ -91,6 +109,7 @@ def pages_statistics(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(PAGES_RESOURCES, "stats")
 @cache_documentation_get(timeout=300)
 def pages_types(request: HttpRequest) -> JsonResponse:
     """GET /api/v1/pages/types/ - List page types with counts."""
@@ -110,6 +129,7 @@ def pages_types(request: HttpRequest) -> JsonResponse:
 # ----- by-type (static before parameterized) -----
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(PAGES_RESOURCES)
 @cache_documentation_get(timeout=300)
 def pages_by_type_docs(request: HttpRequest) -> JsonResponse:
     """GET /api/v1/pages/by-type/docs/"""
@@ -123,6 +143,7 @@ def pages_by_type_docs(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(PAGES_RESOURCES)
 @cache_documentation_get(timeout=300)
 def pages_by_type_marketing(request: HttpRequest) -> JsonResponse:
     """GET /api/v1/pages/by-type/marketing/"""
@@ -136,6 +157,7 @@ def pages_by_type_marketing(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(PAGES_RESOURCES)
 @cache_documentation_get(timeout=300)
 def pages_by_type_dashboard(request: HttpRequest) -> JsonResponse:
     """GET /api/v1/pages/by-type/dashboard/"""
@@ -196,6 +218,7 @@ def pages_by_type_draft(request: HttpRequest, page_type: str) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(PAGES_RESOURCES, "stats")
 @cache_documentation_get(timeout=300)
 def pages_by_type_stats(request: HttpRequest, page_type: str) -> JsonResponse:
     """GET /api/v1/pages/by-type/{page_type}/stats/"""
@@ -223,6 +246,7 @@ def pages_by_type_stats(request: HttpRequest, page_type: str) -> JsonResponse:
 # ----- by-state -----
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(PAGES_RESOURCES)
 @cache_documentation_get(timeout=300)
 def pages_by_state_list(request: HttpRequest, state: str) -> JsonResponse:
     """GET /api/v1/pages/by-state/{state}/"""
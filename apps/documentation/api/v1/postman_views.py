@@ -11,14 +11,18 @@ from django.http import HttpRequest, JsonResponse
 from apps.documentation.services import get_postman_service
 from apps.documentation.utils.format_examples import postman_examples, analysis_examples
 from apps.documentation.utils.cache_decorator import cache_documentation_get
+from apps.documentation.utils.conditional_get import conditional_documentation_get
 from django.conf import settings
 from apps.documentation.utils.list_projectors import should_expand_full, to_postman_list_item
 
 logger = logging.getLogger(__name__)
 DATA_PREFIX = getattr(settings, "S3_DATA_PREFIX", "data/")
+# Resource types whose changes invalidate this module's ETags
+POSTMAN_RESOURCES = ("postman",)
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(POSTMAN_RESOURCES)
 @cache_documentation_get(timeout=300)
 def postman_list(request: HttpRequest) -> JsonResponse:
     try:
@@ -45,6 +49,7 @@ def postman_statistics(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get((), "static")
 @cache_documentation_get(timeout=3600)
 def postman_format(request: HttpRequest) -> JsonResponse:
     examples = postman_examples(DATA_PREFIX)
@@ -79,6 +84,7 @@ def postman_by_state_count(request: HttpRequest, state: str) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(POSTMAN_RESOURCES, "detail")
 @cache_documentation_get(timeout=600)
 def postman_detail(request: HttpRequest, config_id: str) -> JsonResponse:
     try:
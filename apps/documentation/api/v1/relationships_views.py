@@ -11,16 +11,31 @@ from django.http import HttpRequest, JsonResponse
 from apps.documentation.services import get_relationships_service
 from apps.documentation.utils.format_examples import relationship_examples, analysis_examples
 from apps.documentation.utils.cache_decorator import cache_documentation_get
+from apps.documentation.utils.conditional_get import conditional_documentation_get
+from apps.documentation.utils.cursor_pagination import InvalidCursor, cursor_page, wants_cursor
 from django.conf import settings
 from apps.documentation.utils.list_projectors import should_expand_full, to_relationship_list_item
 
 logger = logging.getLogger(__name__)
 DATA_PREFIX = getattr(settings, "S3_DATA_PREFIX", "data/")
+# Resource types whose changes invalidate this module's ETags
+RELATIONSHIPS_RESOURCES = ("relationships", "pages", "endpoints")
 
 
 def _rel_list(request: HttpRequest, usage_type=None, usage_context=None, page_id=None, endpoint_id=None):
     s = get_relationships_service()
-    r = s.list_relationships(usage_type=usage_type, usage_context=usage_context, page_id=page_id, endpoint_id=endpoint_id, limit=None, offset=0)
+    filters = {"usage_type": usage_type, "usage_context": usage_context, "page_id": page_id, "endpoint_id": endpoint_id}
+    if wants_cursor(request.GET):
+        try:
+            page = cursor_page("relationships", request.GET, filters, lambda: s.list_relationships(
+                limit=None, offset=0, **filters).get("relationships", []),
+                project=to_relationship_list_item, full=should_expand_full(request.GET))
+        except (InvalidCursor, ValueError) as e:
+            return JsonResponse({"detail": str(e)}, status=400)
+        relationships = page["items"]
+        return JsonResponse({"relationships": relationships, "total": page["total"],
+                             "next_cursor": page["next_cursor"], "has_more": page["has_more"]})
+    r = s.list_relationships(limit=None, offset=0, **filters)
     relationships = r.get("relationships", [])
     if not should_expand_full(request.GET):
         relationships = [to_relationship_list_item(rel) for rel in relationships]
@@ -28,6 +43,7 @@ def _rel_list(request: HttpRequest, usage_type=None, usage_context=None, page_id
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(RELATIONSHIPS_RESOURCES)
 @cache_documentation_get(timeout=300)
 def relationships_list(request: HttpRequest) -> JsonResponse:
     try:
@@ -38,6 +54,7 @@ def relationships_list(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get((), "static")
 @cache_documentation_get(timeout=3600)
 def relationships_format(request: HttpRequest) -> JsonResponse:
     examples = relationship_examples(DATA_PREFIX)
@@ -50,6 +67,7 @@ def relationships_format(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(RELATIONSHIPS_RESOURCES)
 @cache_documentation_get(timeout=300)
 def relationships_graph(request: HttpRequest) -> JsonResponse:
     try:
@@ -62,6 +80,7 @@ def relationships_graph(request: HttpRequest) -> JsonResponse:
 
 
 @require_http_methods(["GET"])
+@conditional_documentation_get(RELATIONSHIPS_RESOURCES, "stats")
 @cache_documentation_get(timeout=300)
 def relationships_statistics(request: HttpRequest) -> JsonResponse:
     try:
@@ -361,6 +380,7 @@ def relationships_performance_errors(request: HttpRequest) -> JsonResponse:
 
 # detail and sub-resources
 @require_http_methods(["GET"])
+@conditional_documentation_get(RELATIONSHIPS_RESOURCES, "detail")
 @cache_documentation_get(timeout=600)
 def relationships_detail(request: HttpRequest, relationship_id: str) -> JsonResponse:
     try:
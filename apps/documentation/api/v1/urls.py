@@ -8,7 +8,7 @@ URL configuration for REST API v1 - documentation GETs and dashboard.
 
 from django.urls import path, include
 
-from . import health, core, docs_meta
+from . import health, core, docs_meta, export_views
 
 urlpatterns = [
     # ==========================================================================
@@ -25,6 +25,11 @@ urlpatterns = [
     # ==========================================================================
     path('docs/endpoint-stats/', docs_meta.endpoint_stats, name='docs_endpoint_stats'),
 
+    # ==========================================================================
+    # Export - streaming full-corpus reads (NDJSON / chunked JSON)
+    # ==========================================================================
+    path('export/<str:resource_type>/', export_views.export_resource, name='export_resource'),
+
     # ==========================================================================
     # Pages API - 20 GET routes (Lambda parity)
     # ==========================================================================
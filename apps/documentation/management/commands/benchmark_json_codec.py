@@ -0,0 +1,85 @@
+"""
+Management command to benchmark JSON parse/dump throughput on the media/ corpus.
+
+Loads every *.json file under media/ (or --path) into memory once, then times
+decoding from bytes and compact encoding for each available backend of
+apps.core.utils.json_codec (orjson, stdlib). Results are reported as MB/s of
+JSON text so backends are directly comparable.
+
+Usage:
+    python manage.py benchmark_json_codec
+    python manage.py benchmark_json_codec --rounds 5 --path media/pages
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.utils import json_codec
+from apps.documentation.utils.paths import get_media_root
+
+
+class Command(BaseCommand):
+    help = "Benchmark JSON decode/encode throughput of the available codec backends on media/."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--path", type=str, default="", help="Directory to scan (default: media/)")
+        parser.add_argument("--rounds", type=int, default=3, help="Timed passes per measurement (best is reported)")
+        parser.add_argument("--indent", action="store_true", help="Also time indented (pretty) encoding")
+
+    def handle(self, *args, **options) -> None:
+        root = Path(options["path"]) if options["path"] else get_media_root()
+        rounds = max(1, options["rounds"])
+        blobs = self._load_corpus(root)
+        if not blobs:
+            raise CommandError(f"No JSON files found under {root}")
+
+        total_bytes = sum(len(b) for b in blobs)
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"JSON codec benchmark: {len(blobs)} files, {total_bytes / 1e6:.2f} MB from {root}"
+        ))
+
+        previous = json_codec.backend_name()
+        try:
+            for backend in json_codec.BACKENDS:
+                json_codec.use_backend(backend)
+                documents = [json_codec.loads(b) for b in blobs]
+                loads_s = self._best(rounds, lambda: [json_codec.loads(b) for b in blobs])
+                dumps_s = self._best(rounds, lambda: [json_codec.dumps(d) for d in documents])
+                line = (
+                    f"{backend:8s} loads {total_bytes / 1e6 / loads_s:8.1f} MB/s ({loads_s * 1000:7.1f} ms)  "
+                    f"dumps {total_bytes / 1e6 / dumps_s:8.1f} MB/s ({dumps_s * 1000:7.1f} ms)"
+                )
+                if options["indent"]:
+                    pretty_s = self._best(rounds, lambda: [json_codec.dumps(d, indent=True) for d in documents])
+                    line += f"  dumps(indent) {total_bytes / 1e6 / pretty_s:8.1f} MB/s"
+                self.stdout.write(line)
+        finally:
+            json_codec.use_backend(previous)
+
+        if len(json_codec.BACKENDS) == 1:
+            self.stdout.write(self.style.WARNING("orjson is not installed; only the stdlib backend was measured."))
+        self.stdout.write(self.style.SUCCESS(f"Active backend: {previous}"))
+
+    def _load_corpus(self, root: Path) -> List[bytes]:
+        blobs = []
+        for path in sorted(root.rglob("*.json")):
+            try:
+                data = path.read_bytes()
+                json_codec.loads(data)
+            except (OSError, ValueError) as e:
+                self.stdout.write(self.style.NOTICE(f"Skipping {path}: {e}"))
+                continue
+            blobs.append(data)
+        return blobs
+
+    @staticmethod
+    def _best(rounds: int, fn: Callable[[], object]) -> float:
+        best = float("inf")
+        for _ in range(rounds):
+            started = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - started)
+        return max(best, 1e-9)
@@ -7,6 +7,9 @@ from django.conf import settings
 
 from apps.documentation.services.pages_service import PagesService
 
+# New pages per bulk create (one index write each)
+IMPORT_BATCH_SIZE = 100
+
 class Command(BaseCommand):
     help = 'Import documentation pages from markdown files'
 
@@ -31,6 +34,8 @@ class Command(BaseCommand):
         self.stdout.write(f"Found {len(files)} markdown files in {pages_dir}")
         
         success_count = 0
+        existing_ids = {p.get('page_id') for p in service.list_pages(limit=None).get('pages', [])}
+        new_pages = []
         
         for file_path in files:
             filename = file_path.name
@@ -78,17 +83,29 @@ class Command(BaseCommand):
                 }
             }
             
+            if page_id not in existing_ids:
+                # Created in bulk below
+                new_pages.append(page_data)
+                continue
+            
             try:
-                # Check if exists (update) or create
-                existing = service.get_page(page_id)
-                if existing:
-                    service.update_page(page_id, page_data)
-                    self.stdout.write(self.style.SUCCESS(f'Updated: {page_id}'))
-                else:
-                    service.create_page(page_data)
-                    self.stdout.write(self.style.SUCCESS(f'Created: {page_id}'))
+                service.update_page(page_id, page_data)
+                self.stdout.write(self.style.SUCCESS(f'Updated: {page_id}'))
                 success_count += 1
             except Exception as e:
                 self.stdout.write(self.style.ERROR(f'Error saving {page_id}: {e}'))
+        
+        for start in range(0, len(new_pages), IMPORT_BATCH_SIZE):
+            batch = new_pages[start:start + IMPORT_BATCH_SIZE]
+            try:
+                result = service.create_pages(batch)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'Error creating {len(batch)} pages: {e}'))
+                continue
+            for page in result['created']:
+                self.stdout.write(self.style.SUCCESS(f"Created: {page.get('page_id')}"))
+            for page_id in result['failed']:
+                self.stdout.write(self.style.ERROR(f'Error saving {page_id}'))
+            success_count += len(result['created'])
 
         self.stdout.write(self.style.SUCCESS(f'Successfully imported {success_count} pages.'))
@@ -0,0 +1,97 @@
+"""
+Import documentation relationships from a JSON file.
+
+The file may hold a list of relationship records or an index-style object
+with a ``relationships`` list (the default is the local
+``media/relationship/index.json``). By-page / by-endpoint aggregates are
+flattened into their nested relationship records.
+
+Existing relationships are updated one by one; new ones are created in bulk
+through ``RelationshipsService.create_relationships``, so each batch costs
+one index write instead of one per relationship.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+
+from django.core.management.base import BaseCommand
+
+from apps.documentation.services.relationships_service import RelationshipsService
+from apps.documentation.utils.paths import get_relationships_dir
+
+# New relationships per bulk create (one index write each)
+IMPORT_BATCH_SIZE = 200
+
+
+def _flatten(entries: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        if entry.get('relationship_id'):
+            yield entry
+            continue
+        for key in ('pages', 'endpoints'):
+            yield from _flatten(entry.get(key) or [])
+
+
+class Command(BaseCommand):
+    help = 'Import documentation relationships from a JSON file'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--file',
+            help='JSON file with relationships (default: local relationships index.json)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help=f'New relationships per bulk create (default: {IMPORT_BATCH_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        source = Path(options.get('file') or get_relationships_dir() / 'index.json')
+        try:
+            data = json.loads(source.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            self.stdout.write(self.style.ERROR(f'Error reading {source}: {e}'))
+            return
+
+        entries = data.get('relationships', []) if isinstance(data, dict) else data
+        records = {rel['relationship_id']: rel for rel in _flatten(entries or [])}
+        self.stdout.write(f"Found {len(records)} relationships in {source}")
+
+        service = RelationshipsService()
+        existing_ids = {
+            rel.get('relationship_id')
+            for rel in service.list_relationships(limit=None).get('relationships', [])
+        }
+
+        success_count = 0
+        new_relationships = []
+        for relationship_id, relationship_data in records.items():
+            if relationship_id not in existing_ids:
+                new_relationships.append(relationship_data)
+                continue
+            try:
+                service.update_relationship(relationship_id, relationship_data)
+                self.stdout.write(self.style.SUCCESS(f'Updated: {relationship_id}'))
+                success_count += 1
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'Error saving {relationship_id}: {e}'))
+
+        batch_size = max(1, options.get('batch_size') or IMPORT_BATCH_SIZE)
+        for start in range(0, len(new_relationships), batch_size):
+            batch = new_relationships[start:start + batch_size]
+            try:
+                result = service.create_relationships(batch)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'Error creating {len(batch)} relationships: {e}'))
+                continue
+            for relationship_id in result['failed']:
+                self.stdout.write(self.style.ERROR(f'Error saving {relationship_id}'))
+            self.stdout.write(self.style.SUCCESS(f"Created {len(result['created'])} relationships"))
+            success_count += len(result['created'])
+
+        self.stdout.write(self.style.SUCCESS(f'Successfully imported {success_count} relationships.'))
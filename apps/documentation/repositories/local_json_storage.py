@@ -1,6 +1,5 @@
 """Local JSON file storage client for reading from media/ directory."""
 
-import json
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
@@ -9,6 +8,8 @@ from typing import Any, Dict, List, Optional
 from django.conf import settings
 from django.core.cache import cache
 
+from apps.core.utils import json_codec
+
 logger = logging.getLogger(__name__)
 INDEX_CACHE_TTL = 300  # 5 minutes
 
@@ -60,9 +61,8 @@ class LocalJSONStorage:
             return None
         
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            return json_codec.load_file(full_path)
+        except json_codec.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from {full_path}: {e}")
             return None
         except Exception as e:
@@ -407,8 +407,7 @@ class LocalJSONStorage:
             full_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(full_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            json_codec.dump_file(full_path, data)
             logger.info(f"Wrote JSON to local file: {full_path}")
             return True
         except Exception as e:
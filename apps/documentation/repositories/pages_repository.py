@@ -7,6 +7,7 @@ from contextlib import contextmanager
 
 from django.conf import settings
 from apps.documentation.repositories.base import BaseRepository
+from apps.documentation.repositories.s3_batch_operations import S3BatchOperations
 from apps.documentation.repositories.s3_json_storage import S3JSONStorage
 from apps.documentation.utils.s3_index_manager import S3IndexManager
 from apps.core.exceptions import RepositoryError, S3Error
@@ -273,19 +274,12 @@ class PagesRepository(BaseRepository):
         total = sum(st["count"] for st in statistics)
         return {"statistics": statistics, "total": total}
 
-    def create(self, page_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare_page(self, page_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Create a new documentation page with full Lambda API model support.
+        Validate a new page and fill in its required and computed fields.
         
-        Args:
-            page_data: Page data dictionary
-            
-        Returns:
-            Created page data dictionary
-            
         Raises:
             ValueError: If page_id is missing or data is invalid
-            RepositoryError: If creation fails
         """
         from apps.documentation.schemas.lambda_models import validate_page_data
         
@@ -300,41 +294,59 @@ class PagesRepository(BaseRepository):
             self.logger.error(f"Validation error for page {page_id}: {e}", exc_info=True)
             raise ValueError(f"Invalid page data: {e}") from e
         
-        try:
-            page_key = self._get_page_key(page_id)
-            
-            # Ensure required fields
-            if "_id" not in page_data:
-                page_data["_id"] = f"{page_id}-001"
-            if "created_at" not in page_data:
-                page_data["created_at"] = datetime.now(timezone.utc).isoformat()
-            
-            # Validate and fix route
-            metadata = page_data.get("metadata", {})
-            if not isinstance(metadata, dict):
-                metadata = {}
-            route = metadata.get("route") or page_data.get("route") or "/"
-            route = self._validate_and_fix_route(route, page_id)
-            metadata["route"] = route
-            page_data["metadata"] = metadata
-            page_data["route"] = route
-            
-            # Auto-calculate computed fields
-            uses_endpoints = metadata.get("uses_endpoints", [])
-            metadata["endpoint_count"] = len(uses_endpoints)
+        # Ensure required fields
+        if "_id" not in page_data:
+            page_data["_id"] = f"{page_id}-001"
+        if "created_at" not in page_data:
+            page_data["created_at"] = datetime.now(timezone.utc).isoformat()
+        
+        # Validate and fix route
+        metadata = page_data.get("metadata", {})
+        if not isinstance(metadata, dict):
+            metadata = {}
+        route = metadata.get("route") or page_data.get("route") or "/"
+        route = self._validate_and_fix_route(route, page_id)
+        metadata["route"] = route
+        page_data["route"] = route
+        
+        # Auto-calculate computed fields
+        uses_endpoints = metadata.get("uses_endpoints", [])
+        metadata["endpoint_count"] = len(uses_endpoints)
+        
+        # Derive api_versions
+        api_versions_set = set()
+        for endpoint in uses_endpoints:
+            if isinstance(endpoint, dict) and "api_version" in endpoint:
+                api_versions_set.add(endpoint["api_version"])
+        metadata["api_versions"] = sorted(list(api_versions_set))
+        
+        # Ensure s3_key in metadata
+        if "s3_key" not in metadata:
+            metadata["s3_key"] = f"data/pages/{page_id}.json"
+        page_data["metadata"] = metadata
+        return page_data
+
+    def create(self, page_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new documentation page with full Lambda API model support.
+        
+        Args:
+            page_data: Page data dictionary
             
-            # Derive api_versions
-            api_versions_set = set()
-            for endpoint in uses_endpoints:
-                if isinstance(endpoint, dict) and "api_version" in endpoint:
-                    api_versions_set.add(endpoint["api_version"])
-            metadata["api_versions"] = sorted(list(api_versions_set))
-            page_data["metadata"] = metadata
+        Returns:
+            Created page data dictionary
             
-            # Ensure s3_key in metadata
-            if "s3_key" not in metadata:
-                metadata["s3_key"] = f"data/pages/{page_id}.json"
-            page_data["metadata"] = metadata
+        Raises:
+            ValueError: If page_id is missing or data is invalid
+            RepositoryError: If creation fails
+        """
+        page_id = page_data.get("page_id")
+        if not page_id:
+            raise ValueError("page_id is required")
+        page_data = self._prepare_page(page_data)
+        
+        try:
+            page_key = self._get_page_key(page_id)
             
             # Write to S3
             self.storage.write_json(page_key, page_data)
@@ -553,37 +565,64 @@ class PagesRepository(BaseRepository):
                 self.logger.warning(f"Transaction operation: {op['type']} on {op.get('page_id', 'unknown')}")
             raise
     
-    def batch_create(self, pages_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def batch_create(self, pages_data: List[Dict[str, Any]], raise_on_error: bool = True) -> List[Dict[str, Any]]:
         """
         Create multiple pages in batch.
         
+        Page files are uploaded concurrently and index.json is updated (and
+        its caches invalidated) once for the whole batch. Pages that were
+        written stay created when others fail.
+        
         Args:
             pages_data: List of page data dictionaries
+            raise_on_error: Raise when any page fails; otherwise only log it and
+                return the pages that were created
             
         Returns:
             List of created page data dictionaries
             
         Raises:
-            RepositoryError: If batch creation fails
+            RepositoryError: If batch creation fails and raise_on_error is set
         """
         if not pages_data:
             return []
         
-        results: List[Dict[str, Any]] = []
+        prepared: List[Dict[str, Any]] = []
         errors: List[Tuple[str, Exception]] = []
         
         for page_data in pages_data:
             try:
-                result = self.create(page_data)
-                results.append(result)
+                prepared.append(self._prepare_page(page_data))
             except Exception as e:
                 page_id = page_data.get("page_id", "unknown")
                 errors.append((page_id, e))
                 self.logger.error(f"Failed to create page {page_id} in batch: {e}")
         
+        written = S3BatchOperations(storage=self.storage).batch_write_json(
+            [(self._get_page_key(data["page_id"]), data) for data in prepared]
+        )
+        results: List[Dict[str, Any]] = []
+        for data in prepared:
+            page_id = data["page_id"]
+            if written.get(self._get_page_key(page_id)):
+                results.append(data)
+            else:
+                errors.append((page_id, S3Error(f"Failed to write page {page_id}")))
+                self.logger.error(f"Failed to create page {page_id} in batch: write failed")
+        
+        if results:
+            indexed = self.index_manager.add_items_to_index(
+                'pages',
+                [(data["page_id"], data) for data in results]
+            )
+            if not indexed:
+                self.logger.warning(f"Failed to update index for {len(results)} batch-created pages")
+        
         if errors:
             error_msg = f"Batch create failed for {len(errors)}/{len(pages_data)} pages"
             self.logger.error(error_msg)
+            if not raise_on_error:
+                return results
             raise RepositoryError(
                 message=error_msg,
                 operation="batch_create",
@@ -7,6 +7,7 @@ from contextlib import contextmanager
 
 from django.conf import settings
 from apps.documentation.repositories.base import BaseRepository
+from apps.documentation.repositories.s3_batch_operations import S3BatchOperations
 from apps.documentation.repositories.s3_json_storage import S3JSONStorage
 from apps.documentation.schemas.lambda_models import validate_relationship_data
 from apps.documentation.utils.s3_index_manager import S3IndexManager
@@ -228,6 +229,18 @@ class RelationshipsRepository(BaseRepository):
             self.logger.error(f"Error scanning relationship files: {e}", exc_info=True)
             return []
 
+    def _prepare_relationship(self, relationship_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate and normalize relationship data against the canonical schema.
+        
+        Raises:
+            ValueError: If relationship_id is missing
+        """
+        relationship_data = validate_relationship_data(relationship_data)
+        if not relationship_data.get("relationship_id"):
+            raise ValueError("relationship_id is required")
+        return relationship_data
+
     def create(self, relationship_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new relationship.
@@ -242,12 +255,8 @@ class RelationshipsRepository(BaseRepository):
             ValueError: If relationship_id is missing
             RepositoryError: If creation fails
         """
-        # Validate and normalize against canonical schema
-        relationship_data = validate_relationship_data(relationship_data)
-
-        relationship_id = relationship_data.get("relationship_id")
-        if not relationship_id:
-            raise ValueError("relationship_id is required")
+        relationship_data = self._prepare_relationship(relationship_data)
+        relationship_id = relationship_data["relationship_id"]
 
         try:
             relationship_key = self._get_relationship_key(relationship_id)
@@ -428,37 +437,64 @@ class RelationshipsRepository(BaseRepository):
                 self.logger.warning(f"Transaction operation: {op['type']} on {op.get('relationship_id', 'unknown')}")
             raise
     
-    def batch_create(self, relationships_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def batch_create(self, relationships_data: List[Dict[str, Any]], raise_on_error: bool = True) -> List[Dict[str, Any]]:
         """
         Create multiple relationships in batch.
         
+        Relationship files are uploaded concurrently and index.json is
+        updated (and its caches invalidated) once for the whole batch.
+        Relationships that were written stay created when others fail.
+        
         Args:
             relationships_data: List of relationship data dictionaries
+            raise_on_error: Raise when any relationship fails; otherwise only log
+                it and return the relationships that were created
             
         Returns:
             List of created relationship data dictionaries
             
         Raises:
-            RepositoryError: If batch creation fails
+            RepositoryError: If batch creation fails and raise_on_error is set
         """
         if not relationships_data:
             return []
         
-        results: List[Dict[str, Any]] = []
+        prepared: List[Dict[str, Any]] = []
         errors: List[Tuple[str, Exception]] = []
         
         for relationship_data in relationships_data:
             try:
-                result = self.create(relationship_data)
-                results.append(result)
+                prepared.append(self._prepare_relationship(relationship_data))
             except Exception as e:
                 relationship_id = relationship_data.get("relationship_id", "unknown")
                 errors.append((relationship_id, e))
                 self.logger.error(f"Failed to create relationship {relationship_id} in batch: {e}")
         
+        written = S3BatchOperations(storage=self.storage).batch_write_json(
+            [(self._get_relationship_key(data["relationship_id"]), data) for data in prepared]
+        )
+        results: List[Dict[str, Any]] = []
+        for data in prepared:
+            relationship_id = data["relationship_id"]
+            if written.get(self._get_relationship_key(relationship_id)):
+                results.append(data)
+            else:
+                errors.append((relationship_id, S3Error(f"Failed to write relationship {relationship_id}")))
+                self.logger.error(f"Failed to create relationship {relationship_id} in batch: write failed")
+        
+        if results:
+            indexed = self.index_manager.add_items_to_index(
+                'relationships',
+                [(data["relationship_id"], data) for data in results]
+            )
+            if not indexed:
+                self.logger.warning(f"Failed to update index for {len(results)} batch-created relationships")
+        
         if errors:
             error_msg = f"Batch create failed for {len(errors)}/{len(relationships_data)} relationships"
             self.logger.error(error_msg)
+            if not raise_on_error:
+                return results
             raise RepositoryError(
                 message=error_msg,
                 operation="batch_create",
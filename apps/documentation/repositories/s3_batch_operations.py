@@ -5,6 +5,7 @@ S3 Batch Operations for optimized bulk operations.
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from django.conf import settings
 from apps.documentation.repositories.s3_json_storage import S3JSONStorage
 
 logger = logging.getLogger(__name__)
@@ -17,7 +18,10 @@ class S3BatchOperations:
     Provides:
     - Parallel batch reads
     - Parallel batch writes
-    - Connection reuse through shared S3Service
+    - Connection reuse through the shared, pooled S3 client
+    
+    Worker count is capped at S3_MAX_POOL_CONNECTIONS so parallel requests
+    never wait on (or discard) connections from the shared pool.
     """
     
     def __init__(self, storage: Optional[S3JSONStorage] = None, max_workers: int = 10):
@@ -26,14 +30,15 @@ class S3BatchOperations:
         
         Args:
             storage: S3JSONStorage instance
-            max_workers: Maximum number of parallel workers
+            max_workers: Maximum number of parallel workers (capped at the S3 pool size)
         """
         if storage is None:
             from apps.documentation.services import get_shared_s3_storage
             self.storage = get_shared_s3_storage()
         else:
             self.storage = storage
-        self.max_workers = max_workers
+        pool_size = getattr(settings, 'S3_MAX_POOL_CONNECTIONS', 50)
+        self.max_workers = max(1, min(max_workers, pool_size))
     
     def batch_read_json(
         self,
@@ -1,11 +1,13 @@
 """Synchronous S3 JSON storage client for Django."""
 
-import json
+import hashlib
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from apps.core.services.s3_service import S3Service
+from apps.core.utils import json_codec
 from apps.core.exceptions import S3Error
+from apps.documentation.repositories.s3_object_cache import S3ObjectCache, get_s3_object_cache
 from apps.documentation.utils.exceptions import RepositoryError
 from django.conf import settings
 
@@ -15,23 +17,41 @@ logger = logging.getLogger(__name__)
 class S3JSONStorage:
     """Synchronous client for S3 JSON file operations."""
 
-    def __init__(self, s3_service: Optional[S3Service] = None):
+    def __init__(
+        self,
+        s3_service: Optional[S3Service] = None,
+        object_cache: Optional[S3ObjectCache] = None,
+    ):
         """Initialize S3 JSON storage client.
         
         Args:
-            s3_service: Optional S3Service instance. If not provided, creates new one.
+            s3_service: Optional S3Service instance. If not provided, creates one on
+                the shared, pooled S3 client.
+            object_cache: Optional ETag-validated object cache. Defaults to the
+                process-wide cache (None when S3_OBJECT_CACHE_ENABLED is off).
         """
         self.s3_service = s3_service or S3Service()
+        self.object_cache = object_cache if object_cache is not None else get_s3_object_cache()
         self.bucket_name = settings.S3_BUCKET_NAME
         self.max_retries = 3
         self.retry_delay = 0.1  # Initial delay in seconds
 
-    def read_json(self, s3_key: str) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _is_not_found(e: S3Error) -> bool:
+        return 'NoSuchKey' in str(e) or '404' in str(e) or 'not found' in str(e).lower() or 'FILE_NOT_FOUND' in str(e)
+
+    def read_json(self, s3_key: str, readonly: bool = False) -> Optional[Dict[str, Any]]:
         """
         Read and parse JSON file from S3.
 
+        With the object cache enabled, a cached copy is revalidated with
+        If-None-Match, so an unchanged object costs a 304 instead of a full
+        download.
+
         Args:
             s3_key: The S3 key (path) of the JSON file
+            readonly: Return the parsed object memoized for the current ETag
+                instead of a fresh parse. Callers must not mutate the result.
 
         Returns:
             Parsed JSON data as dictionary, or None if file doesn't exist
@@ -39,35 +59,95 @@ class S3JSONStorage:
         Raises:
             S3Error: If S3 operation fails (other than file not found)
         """
+        if self.object_cache is None:
+            return self._read_json_uncached(s3_key)
+
+        cached = self.object_cache.get(s3_key)
+        try:
+            content, etag = self.s3_service.download_file_if_changed(s3_key, cached.etag if cached else None)
+        except S3Error as e:
+            if self._is_not_found(e):
+                logger.debug(f"JSON file not found: {s3_key}")
+                if cached:
+                    self.object_cache.evict(s3_key)
+                return None
+            raise
+
+        if content is None and cached:
+            entry = cached
+        elif etag:
+            entry = self.object_cache.put(s3_key, etag, content)
+        else:
+            return self._parse_json(s3_key, content)
+
+        if not readonly:
+            return self._parse_json(s3_key, entry.body)
+        try:
+            return self.object_cache.parsed(entry)
+        except (json_codec.JSONDecodeError, UnicodeDecodeError) as e:
+            self.object_cache.evict(s3_key)
+            raise self._parse_error(s3_key, e)
+
+    def read_json_versioned(self, s3_key: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Read a fresh, mutable copy of a JSON file together with its ETag.
+
+        Used for read-modify-write cycles: pass the ETag back to
+        ``write_json(..., etag=...)`` so the write fails if someone else
+        wrote in between.
+
+        Returns:
+            ``(data, etag)``, or ``(None, None)`` if the file doesn't exist
+        """
+        cached = self.object_cache.get(s3_key) if self.object_cache is not None else None
+        try:
+            content, etag = self.s3_service.download_file_if_changed(s3_key, cached.etag if cached else None)
+        except S3Error as e:
+            if self._is_not_found(e):
+                if cached:
+                    self.object_cache.evict(s3_key)
+                return None, None
+            raise
+        if content is None and cached:
+            content = cached.body
+        elif etag and self.object_cache is not None:
+            self.object_cache.put(s3_key, etag, content)
+        return self._parse_json(s3_key, content), etag
+
+    def _read_json_uncached(self, s3_key: str) -> Optional[Dict[str, Any]]:
         try:
             file_content = self.s3_service.download_file(s3_key)
             if not isinstance(file_content, (bytes, bytearray, str)):
                 logger.warning(f"Unexpected file_content type for {s3_key}: {type(file_content)}")
                 return None
-            if isinstance(file_content, bytes):
-                content_str = file_content.decode('utf-8')
-            else:
-                content_str = file_content
-            return json.loads(content_str)
         except S3Error as e:
-            if 'NoSuchKey' in str(e) or '404' in str(e) or 'not found' in str(e).lower() or 'FILE_NOT_FOUND' in str(e):
+            if self._is_not_found(e):
                 logger.debug(f"JSON file not found: {s3_key}")
                 return None
             raise
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-            logger.error(f"Failed to parse JSON from {s3_key}: {e}")
-            raise RepositoryError(
-                f"Failed to parse JSON from S3: {str(e)}",
-                entity_id=s3_key,
-                operation='read_json',
-                error_code='JSON_PARSE_ERROR'
-            )
+        return self._parse_json(s3_key, file_content)
+
+    def _parse_json(self, s3_key: str, content: Any) -> Optional[Dict[str, Any]]:
+        try:
+            return json_codec.loads(content)
+        except (json_codec.JSONDecodeError, UnicodeDecodeError) as e:
+            raise self._parse_error(s3_key, e)
+
+    def _parse_error(self, s3_key: str, e: Exception) -> RepositoryError:
+        logger.error(f"Failed to parse JSON from {s3_key}: {e}")
+        return RepositoryError(
+            f"Failed to parse JSON from S3: {str(e)}",
+            entity_id=s3_key,
+            operation='read_json',
+            error_code='JSON_PARSE_ERROR'
+        )
 
     def write_json(
         self,
         s3_key: str,
         data: Dict[str, Any],
         etag: Optional[str] = None,
+        create_only: bool = False,
     ) -> str:
         """
         Write JSON data to S3.
@@ -75,22 +155,35 @@ class S3JSONStorage:
         Args:
             s3_key: The S3 key (path) where to write the JSON
             data: The data dictionary to write as JSON
-            etag: Optional ETag for conditional write (not fully implemented in sync version)
+            etag: Only write if the stored object still has this ETag
+                (compare-and-swap against a ``read_json_versioned`` result)
+            create_only: Only write if the key does not exist yet
 
         Returns:
             The S3 key where the file was written
             
         Raises:
-            S3Error: If S3 upload fails
+            S3Error: If S3 upload fails (PRECONDITION_FAILED when ``etag`` or
+                ``create_only`` does not hold)
             RepositoryError: If JSON serialization fails
         """
         try:
-            json_content = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            json_content = json_codec.dumps(data, indent=json_codec.pretty_files())
+            conditions = {}
+            if etag:
+                conditions['if_match'] = etag
+            if create_only:
+                conditions['if_none_match'] = '*'
             self.s3_service.upload_file(
                 file_content=json_content,
                 s3_key=s3_key,
-                content_type='application/json'
+                content_type='application/json',
+                **conditions
             )
+            if self.object_cache is not None:
+                # Single-part PUT ETags are the content MD5; if the bucket reports
+                # something else the next read simply gets a full 200 response.
+                self.object_cache.put(s3_key, hashlib.md5(json_content).hexdigest(), json_content)
             logger.info(f"Wrote JSON to S3: {s3_key}")
             return s3_key
         except (TypeError, ValueError) as e:
@@ -117,10 +210,12 @@ class S3JSONStorage:
         Raises:
             S3Error: If S3 delete fails
         """
+        if self.object_cache is not None:
+            self.object_cache.evict(s3_key)
         try:
             return self.s3_service.delete_file(s3_key)
         except S3Error as e:
-            if 'NoSuchKey' in str(e) or '404' in str(e) or 'not found' in str(e).lower() or 'FILE_NOT_FOUND' in str(e):
+            if self._is_not_found(e):
                 logger.debug(f"JSON file not found (already deleted): {s3_key}")
                 return True
             raise
@@ -0,0 +1,250 @@
+"""ETag-validated object cache for S3JSONStorage reads.
+
+Each cached object keeps the ETag S3 reported, its raw bytes and (lazily) its
+parsed JSON. Reads revalidate with ``If-None-Match`` so an unchanged object
+costs a 304 round-trip instead of a full download, and the parsed form is
+memoized per ETag. Raw bytes are also written to disk so the cache survives
+process restarts (large index.json files are the main beneficiaries). The
+disk copy is bounded by a byte budget; least recently used entries (by file
+mtime, refreshed on every disk hit) are removed first.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from django.conf import settings
+
+from apps.core.utils import json_codec
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+# Pruning stops once the disk cache is back under this share of its budget,
+# so a full cache is not rescanned on every write
+DISK_PRUNE_TARGET = 0.8
+
+
+@dataclass
+class CachedObject:
+    """One cached S3 object version."""
+
+    etag: str
+    body: bytes
+    parsed: Any = field(default=_MISSING, repr=False)
+
+
+class S3ObjectCache:
+    """
+    Two-level (memory LRU + disk) cache of S3 objects keyed by S3 key.
+
+    Disk entries are ``<sha1(key)>.obj`` files holding a one-line JSON header
+    ({key, etag}) followed by the raw object bytes. With ``cache_dir=None`` the
+    cache is memory-only. The directory may be shared by several processes;
+    each one prunes it from a fresh listing when its estimate exceeds
+    ``max_disk_bytes``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_memory_entries: int = 256,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize object cache.
+
+        Args:
+            cache_dir: Directory for on-disk entries (None for memory-only)
+            max_memory_entries: Objects kept in the in-memory LRU
+            max_disk_bytes: Size budget of the on-disk entries
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: 'OrderedDict[str, CachedObject]' = OrderedDict()
+        self._lock = threading.Lock()
+        # Estimated bytes on disk; None until the first write scans the directory
+        self._disk_bytes: Optional[int] = None
+        self._disk_lock = threading.Lock()
+
+    def _disk_path(self, s3_key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{hashlib.sha1(s3_key.encode('utf-8')).hexdigest()}.obj"
+
+    def _remember(self, s3_key: str, entry: CachedObject) -> None:
+        with self._lock:
+            self._memory[s3_key] = entry
+            self._memory.move_to_end(s3_key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, s3_key: str) -> Optional[CachedObject]:
+        """Return the cached version of an object, loading it from disk if needed."""
+        with self._lock:
+            entry = self._memory.get(s3_key)
+            if entry is not None:
+                self._memory.move_to_end(s3_key)
+                return entry
+
+        path = self._disk_path(s3_key)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                header = json_codec.loads(f.readline())
+                body = f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable S3 cache entry for {s3_key}: {e}")
+            return None
+        if header.get('key') != s3_key or not header.get('etag'):
+            return None
+        try:
+            # Mark as recently used for pruning
+            os.utime(path)
+        except OSError:
+            pass
+        entry = CachedObject(etag=header['etag'], body=body)
+        self._remember(s3_key, entry)
+        return entry
+
+    def put(self, s3_key: str, etag: str, body: bytes) -> CachedObject:
+        """Store a new object version (memory and disk)."""
+        entry = CachedObject(etag=etag, body=bytes(body))
+        self._remember(s3_key, entry)
+
+        path = self._disk_path(s3_key)
+        header = json_codec.dumps({'key': s3_key, 'etag': etag}) + b'\n'
+        size = len(header) + len(entry.body)
+        if path is not None and size <= self.max_disk_bytes * DISK_PRUNE_TARGET:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                with open(tmp, 'wb') as f:
+                    f.write(header)
+                    f.write(entry.body)
+                os.replace(tmp, path)
+                self._account_disk(size)
+            except OSError as e:
+                logger.warning(f"Failed to write S3 cache entry for {s3_key}: {e}")
+        return entry
+
+    def _account_disk(self, added: int) -> None:
+        """Add a write to the disk estimate and prune once it exceeds the budget."""
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+            else:
+                self._disk_bytes += added
+            if self._disk_bytes > self.max_disk_bytes:
+                self._disk_bytes = self._prune_disk()
+
+    def _scan_disk(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every on-disk entry."""
+        entries = []
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return entries
+        with os.scandir(self.cache_dir) as it:
+            for item in it:
+                if not item.name.endswith('.obj'):
+                    continue
+                try:
+                    st = item.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, item.path))
+        return entries
+
+    def _prune_disk(self) -> int:
+        """
+        Remove least recently used entries until the directory is below
+        DISK_PRUNE_TARGET of the budget. Returns the bytes left.
+        """
+        entries = sorted(self._scan_disk())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_disk_bytes * DISK_PRUNE_TARGET
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to prune S3 cache entry {path}: {e}")
+                continue
+            total -= size
+            removed += 1
+        # Stale temp files from crashed writers
+        cutoff = time.time() - 3600
+        for path in self.cache_dir.glob('*.tmp'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+        logger.info(f"Pruned {removed} S3 cache entries; {total} bytes left on disk")
+        return total
+
+    def parsed(self, entry: CachedObject) -> Any:
+        """Parsed JSON for a cached version, decoded once per ETag."""
+        if entry.parsed is _MISSING:
+            entry.parsed = json_codec.loads(entry.body)
+        return entry.parsed
+
+    def evict(self, s3_key: str) -> None:
+        """Forget an object (after delete, or when its cached bytes are unusable)."""
+        with self._lock:
+            self._memory.pop(s3_key, None)
+        path = self._disk_path(s3_key)
+        if path is not None:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove S3 cache entry for {s3_key}: {e}")
+
+    def clear(self) -> None:
+        """Drop every cached object."""
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir is not None and self.cache_dir.is_dir():
+            for path in self.cache_dir.glob('*.obj'):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        with self._disk_lock:
+            self._disk_bytes = 0 if self.cache_dir is not None else None
+
+
+_shared_object_cache: Optional[S3ObjectCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_s3_object_cache() -> Optional[S3ObjectCache]:
+    """Process-wide object cache, or None when S3_OBJECT_CACHE_ENABLED is off."""
+    global _shared_object_cache
+    if not getattr(settings, 'S3_OBJECT_CACHE_ENABLED', True):
+        return None
+    if _shared_object_cache is None:
+        with _shared_lock:
+            if _shared_object_cache is None:
+                cache_dir = getattr(settings, 'S3_OBJECT_CACHE_DIR', None)
+                _shared_object_cache = S3ObjectCache(
+                    cache_dir=Path(cache_dir) if cache_dir else None,
+                    max_memory_entries=getattr(settings, 'S3_OBJECT_CACHE_MEMORY_ENTRIES', 256),
+                    max_disk_bytes=getattr(settings, 'S3_OBJECT_CACHE_DISK_MB', 256) * 1024 * 1024,
+                )
+    return _shared_object_cache
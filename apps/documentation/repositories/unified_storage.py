@@ -11,6 +11,7 @@ from django.core.cache import cache
 from apps.documentation.repositories.local_json_storage import LocalJSONStorage
 from apps.documentation.repositories.s3_json_storage import S3JSONStorage
 from apps.core.exceptions import RepositoryError, S3Error
+from apps.documentation.utils.resource_statistics import dimension_counts, read_aggregate
 
 # Optional imports for fallback services
 try:
@@ -486,6 +487,10 @@ class UnifiedStorage:
         Uses same strategy as list_pages: Local → S3 for consistency.
         This ensures count matches list_pages results.
         """
+        aggregate = read_aggregate("pages")
+        if aggregate is not None:
+            return dimension_counts(aggregate, "by_type").get(page_type, 0)
+
         # Try local files first (same strategy as list_pages)
         if self.use_local_json_files:
             try:
@@ -508,6 +513,19 @@ class UnifiedStorage:
 
     def get_type_statistics(self) -> Dict[str, Any]:
         """Get statistics for all page types."""
+        aggregate = read_aggregate("pages")
+        if aggregate is not None:
+            count_by_type = {t: {"published": 0, "draft": 0, "deleted": 0, "total": 0}
+                             for t in ("docs", "marketing", "dashboard")}
+            for key, count in dimension_counts(aggregate, "by_type_status").items():
+                pt, _, st = key.partition(":")
+                entry = count_by_type.setdefault(pt, {"published": 0, "draft": 0, "deleted": 0, "total": 0})
+                entry["total"] += count
+                if st in ("published", "draft", "deleted"):
+                    entry[st] += count
+            statistics = [{"type": t, "count": v["total"], "published": v["published"], "draft": v["draft"], "deleted": v["deleted"]}
+                          for t, v in count_by_type.items()]
+            return {"statistics": statistics, "total": aggregate.get("total", 0)}
         try:
             from apps.documentation.repositories.pages_repository import PagesRepository
             repo = PagesRepository(storage=self.s3_storage)
@@ -776,6 +794,9 @@ class UnifiedStorage:
 
     def count_endpoints_by_api_version(self, api_version: str) -> int:
         """Count endpoints by API version."""
+        aggregate = read_aggregate("endpoints")
+        if aggregate is not None:
+            return dimension_counts(aggregate, "by_api_version").get(api_version, 0)
         try:
             from apps.documentation.repositories.endpoints_repository import EndpointsRepository
             repo = EndpointsRepository(storage=self.s3_storage)
@@ -786,6 +807,9 @@ class UnifiedStorage:
 
     def count_endpoints_by_method(self, method: str) -> int:
         """Count endpoints by method."""
+        aggregate = read_aggregate("endpoints")
+        if aggregate is not None:
+            return dimension_counts(aggregate, "by_method").get((method or "GET").upper(), 0)
         try:
             from apps.documentation.repositories.endpoints_repository import EndpointsRepository
             repo = EndpointsRepository(storage=self.s3_storage)
@@ -796,6 +820,10 @@ class UnifiedStorage:
 
     def get_api_version_statistics(self) -> Dict[str, Any]:
         """Get statistics for all API versions."""
+        aggregate = read_aggregate("endpoints")
+        if aggregate is not None:
+            statistics = [{"api_version": v, "count": c} for v, c in dimension_counts(aggregate, "by_api_version").items()]
+            return {"versions": statistics, "total": aggregate.get("total", 0)}
         try:
             from apps.documentation.repositories.endpoints_repository import EndpointsRepository
             repo = EndpointsRepository(storage=self.s3_storage)
@@ -806,6 +834,10 @@ class UnifiedStorage:
 
     def get_method_statistics(self) -> Dict[str, Any]:
         """Get statistics for all methods."""
+        aggregate = read_aggregate("endpoints")
+        if aggregate is not None:
+            statistics = [{"method": m, "count": c} for m, c in dimension_counts(aggregate, "by_method").items()]
+            return {"methods": statistics, "total": aggregate.get("total", 0)}
         try:
             from apps.documentation.repositories.endpoints_repository import EndpointsRepository
             repo = EndpointsRepository(storage=self.s3_storage)
@@ -889,17 +921,24 @@ class UnifiedStorage:
 
     def get_relationship_statistics(self) -> Dict[str, Any]:
         """Get relationship statistics (counts by usage_type, etc.)."""
-        result = self.list_relationships(limit=None, offset=0)
-        rels = result.get("relationships", [])
-        by_usage_type = {}
-        by_usage_context = {}
-        for r in rels:
-            ut = r.get("usage_type") or "primary"
-            by_usage_type[ut] = by_usage_type.get(ut, 0) + 1
-            uc = r.get("usage_context") or "data_fetching"
-            by_usage_context[uc] = by_usage_context.get(uc, 0) + 1
+        aggregate = read_aggregate("relationships")
+        if aggregate is not None:
+            total = aggregate.get("total", 0)
+            by_usage_type = dimension_counts(aggregate, "by_usage_type")
+            by_usage_context = dimension_counts(aggregate, "by_usage_context")
+        else:
+            result = self.list_relationships(limit=None, offset=0)
+            rels = result.get("relationships", [])
+            total = len(rels)
+            by_usage_type = {}
+            by_usage_context = {}
+            for r in rels:
+                ut = r.get("usage_type") or "primary"
+                by_usage_type[ut] = by_usage_type.get(ut, 0) + 1
+                uc = r.get("usage_context") or "data_fetching"
+                by_usage_context[uc] = by_usage_context.get(uc, 0) + 1
         return {
-            "total": len(rels),
+            "total": total,
             "by_usage_type": by_usage_type,
             "by_usage_context": by_usage_context,
             "statistics": [
@@ -909,8 +948,8 @@ class UnifiedStorage:
 
     def get_relationship_graph(self) -> Dict[str, Any]:
         """Get graph representation (nodes and edges) for relationships."""
-        result = self.list_relationships(limit=None, offset=0)
-        rels = result.get("relationships", [])
+        from apps.documentation.utils.relationship_graph import relationship_records
+        rels = relationship_records()
         nodes = []
         edges = []
         seen_pages = set()
@@ -1050,6 +1089,13 @@ class UnifiedStorage:
             # Clear all cache
             clear_cache()
         """
+        # Change the API v1 ETag generation even where pattern deletion is unavailable
+        from apps.documentation.utils.conditional_get import bump_generation
+        if resource_type:
+            bump_generation(resource_type)
+        else:
+            bump_generation()
+
         try:
             # Try to use RedisCacheManager for pattern deletion
             from apps.core.utils.redis_cache import RedisCacheManager
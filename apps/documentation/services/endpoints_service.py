@@ -7,6 +7,7 @@ from apps.documentation.repositories.unified_storage import UnifiedStorage
 from apps.documentation.repositories.endpoints_repository import EndpointsRepository
 from apps.documentation.utils.retry import retry_on_network_error
 from apps.documentation.utils.exceptions import DocumentationError
+from apps.documentation.utils.resource_statistics import dimension_counts, read_aggregate
 
 logger = logging.getLogger(__name__)
 
@@ -312,7 +313,10 @@ class EndpointsService(DocumentationServiceBase):
             return self.get_endpoints_by_api_version(api_version, method=method)
     
     def count_endpoints_by_api_version(self, api_version: str) -> int:
-        """Count endpoints by API version (use S3 direct like PagesService)."""
+        """Count endpoints by API version (precomputed aggregate, else S3 direct like PagesService)."""
+        aggregate = read_aggregate('endpoints')
+        if aggregate is not None:
+            return dimension_counts(aggregate, 'by_api_version').get(api_version, 0)
         try:
             endpoints = self.repository.list_all(api_version=api_version)
             return len(endpoints)
@@ -323,7 +327,10 @@ class EndpointsService(DocumentationServiceBase):
             return result.get('total', 0)
 
     def count_endpoints_by_method(self, method: str) -> int:
-        """Count endpoints by method (use S3 direct like PagesService)."""
+        """Count endpoints by method (precomputed aggregate, else S3 direct like PagesService)."""
+        aggregate = read_aggregate('endpoints')
+        if aggregate is not None:
+            return dimension_counts(aggregate, 'by_method').get((method or 'GET').upper(), 0)
         try:
             endpoints = self.repository.list_all(method=method)
             return len(endpoints)
@@ -334,17 +341,21 @@ class EndpointsService(DocumentationServiceBase):
             return result.get('total', 0)
     
     def get_api_version_statistics(self) -> Dict[str, Any]:
-        """Get API version statistics (use S3 direct like PagesService)."""
+        """Get API version statistics (precomputed aggregate, else S3 direct like PagesService)."""
         try:
-            # Get all endpoints and calculate statistics
-            all_endpoints = self.repository.list_all()
-            version_counts = {}
-
-            for endpoint in all_endpoints:
-                api_version = endpoint.get('api_version', 'unknown')
-                if api_version not in version_counts:
-                    version_counts[api_version] = 0
-                version_counts[api_version] += 1
+            aggregate = read_aggregate('endpoints')
+            if aggregate is not None:
+                version_counts = dimension_counts(aggregate, 'by_api_version')
+            else:
+                # Get all endpoints and calculate statistics
+                all_endpoints = self.repository.list_all()
+                version_counts = {}
+
+                for endpoint in all_endpoints:
+                    api_version = endpoint.get('api_version', 'unknown')
+                    if api_version not in version_counts:
+                        version_counts[api_version] = 0
+                    version_counts[api_version] += 1
 
             versions = [
                 {'api_version': version, 'count': count}
@@ -361,17 +372,21 @@ class EndpointsService(DocumentationServiceBase):
             return {'versions': [], 'total': 0}
 
     def get_method_statistics(self) -> Dict[str, Any]:
-        """Get method statistics (use S3 direct like PagesService)."""
+        """Get method statistics (precomputed aggregate, else S3 direct like PagesService)."""
         try:
-            # Get all endpoints and calculate statistics
-            all_endpoints = self.repository.list_all()
-            method_counts = {}
-
-            for endpoint in all_endpoints:
-                method = endpoint.get('method', 'unknown')
-                if method not in method_counts:
-                    method_counts[method] = 0
-                method_counts[method] += 1
+            aggregate = read_aggregate('endpoints')
+            if aggregate is not None:
+                method_counts = dimension_counts(aggregate, 'by_method')
+            else:
+                # Get all endpoints and calculate statistics
+                all_endpoints = self.repository.list_all()
+                method_counts = {}
+
+                for endpoint in all_endpoints:
+                    method = endpoint.get('method', 'unknown')
+                    if method not in method_counts:
+                        method_counts[method] = 0
+                    method_counts[method] += 1
 
             methods = [
                 {'method': method, 'count': count}
@@ -0,0 +1,211 @@
+"""Streaming export of full documentation resource sets.
+
+Records are read lazily - one local file or one S3 object at a time, with a
+small bounded prefetch window for S3 - and encoded as they are produced, so
+exporting the whole corpus uses constant memory and the first bytes go out
+as soon as the first record is read.
+"""
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from django.conf import settings
+
+from apps.core.utils import json_codec
+
+from apps.documentation.services.media_file_manager import INDEX_EXCLUDE
+from apps.documentation.utils.paths import (
+    get_endpoints_dir,
+    get_pages_dir,
+    get_postman_dir,
+    get_relationships_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+# Sub-paths (relative to media/ and to the S3 data prefix) holding each resource type.
+# Relationships export the canonical per-relationship records
+# (data/relationships/{id}.json), not the by-page/by-endpoint aggregates.
+EXPORT_SOURCES: Dict[str, List[str]] = {
+    "pages": ["pages"],
+    "endpoints": ["endpoints"],
+    "relationships": ["relationships"],
+    "postman": ["postman/configurations"],
+}
+
+# Encoded records are buffered up to this size before a chunk is yielded
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+class DocumentationExportService:
+    """Lazily iterate and encode every record of a documentation resource type."""
+
+    def __init__(self, unified_storage=None, s3_prefetch: int = 8):
+        """
+        Initialize export service.
+
+        Args:
+            unified_storage: Optional UnifiedStorage (default: shared instance)
+            s3_prefetch: S3 objects fetched ahead of the consumer
+        """
+        if unified_storage is None:
+            from apps.documentation.services import get_shared_unified_storage
+            unified_storage = get_shared_unified_storage()
+        self.unified_storage = unified_storage
+        self.s3_prefetch = max(1, s3_prefetch)
+
+    @staticmethod
+    def resource_types() -> List[str]:
+        return list(EXPORT_SOURCES)
+
+    def _local_dirs(self, resource_type: str) -> List[Path]:
+        if resource_type == "pages":
+            return [get_pages_dir()]
+        if resource_type == "endpoints":
+            return [get_endpoints_dir()]
+        if resource_type == "relationships":
+            return [get_relationships_dir()]
+        if resource_type == "postman":
+            return [get_postman_dir() / "configurations"]
+        return []
+
+    def iter_local(self, resource_type: str) -> Iterator[Dict[str, Any]]:
+        """Yield records from media/ one file at a time (sorted by name)."""
+        if resource_type == "relationships":
+            yield from self._iter_local_relationships()
+            return
+        for directory in self._local_dirs(resource_type):
+            if not directory.is_dir():
+                continue
+            names = sorted(
+                entry.name for entry in os.scandir(directory)
+                if entry.is_file() and entry.name.endswith(".json") and entry.name not in INDEX_EXCLUDE
+            )
+            for name in names:
+                try:
+                    record = json_codec.load_file(directory / name)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Skipping unreadable export file {directory / name}: {e}")
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+    def _iter_local_relationships(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the records of media/relationships/index.json.
+
+        Local media keeps relationships as by-page/by-endpoint aggregates;
+        the index flattens them into one record per relationship, which is
+        what list_relationships serves in local mode.
+        """
+        index_file = get_relationships_dir() / "index.json"
+        try:
+            index_data = json_codec.load_file(index_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable relationships index {index_file}: {e}")
+            return
+        for record in (index_data or {}).get("relationships", []):
+            if isinstance(record, dict):
+                yield record
+
+    def iter_s3(self, resource_type: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield records from S3, listing lazily and prefetching a few objects ahead.
+
+        Objects are read past the S3ObjectCache: a full export touches every
+        record once and would otherwise evict the hot working set.
+        """
+        s3_storage = self.unified_storage.s3_storage
+        data_prefix = settings.S3_DATA_PREFIX.rstrip("/")
+
+        def keys() -> Iterator[str]:
+            for sub in EXPORT_SOURCES[resource_type]:
+                prefix = f"{data_prefix}/{sub}/"
+                for file_info in s3_storage.s3_service.iter_files(prefix):
+                    key = file_info["key"]
+                    name = key[len(prefix):]
+                    # Direct children only, like the local directory scan
+                    if "/" not in name and name.endswith(".json") and name not in INDEX_EXCLUDE:
+                        yield key
+
+        with ThreadPoolExecutor(max_workers=self.s3_prefetch) as executor:
+            window: deque = deque()
+            for key in keys():
+                window.append((key, executor.submit(s3_storage._read_json_uncached, key)))
+                if len(window) >= self.s3_prefetch:
+                    yield from self._drain_one(window)
+            while window:
+                yield from self._drain_one(window)
+
+    @staticmethod
+    def _drain_one(window: deque) -> Iterator[Dict[str, Any]]:
+        key, future = window.popleft()
+        try:
+            record = future.result()
+        except Exception as e:
+            logger.warning(f"Skipping unreadable export object {key}: {e}")
+            return
+        if isinstance(record, dict):
+            yield record
+
+    def iter_records(
+        self,
+        resource_type: str,
+        project: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every record of a resource type from the primary store.
+
+        Local media files are used when USE_LOCAL_JSON_FILES is on and the
+        resource has a local directory; otherwise records stream from S3.
+
+        Raises:
+            ValueError: If resource_type is not exportable
+        """
+        if resource_type not in EXPORT_SOURCES:
+            raise ValueError(f"Unknown export resource type: {resource_type}")
+        use_local = self.unified_storage.use_local_json_files and any(
+            d.is_dir() for d in self._local_dirs(resource_type)
+        )
+        records = self.iter_local(resource_type) if use_local else self.iter_s3(resource_type)
+        for record in records:
+            yield project(record) if project else record
+
+
+def _chunked(pieces: Iterable[bytes], chunk_bytes: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+    buffer: List[bytes] = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_bytes:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return json_codec.dumps(record)
+
+
+def iter_ndjson(records: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode records as newline-delimited JSON chunks."""
+    return _chunked(_encode(record) + b"\n" for record in records)
+
+
+def iter_json_array(records: Iterable[Dict[str, Any]], key: str) -> Iterator[bytes]:
+    """Encode records as ``{"<key>": [...], "total": N}`` without materializing the list."""
+    def pieces() -> Iterator[bytes]:
+        yield b'{"' + key.encode("utf-8") + b'":['
+        total = 0
+        for record in records:
+            yield (b"," if total else b"") + _encode(record)
+            total += 1
+        yield b'],"total":' + str(total).encode("ascii") + b"}"
+
+    return _chunked(pieces())
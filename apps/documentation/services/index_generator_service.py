@@ -1,6 +1,5 @@
 """Index Generator – rebuild local media/ index.json for pages, endpoints, postman, relationships."""
 
-import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
@@ -8,6 +7,15 @@ from typing import Any, Dict, List, Optional, Set
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from django.core.cache import cache
 
+from apps.core.utils import json_codec
+from apps.documentation.utils.resource_statistics import (
+    AGGREGATE_KEY,
+    ITEM_STATS_KEY,
+    aggregate_from_entries,
+    build_aggregate,
+    item_stat_keys,
+)
+
 from apps.documentation.utils.paths import (
     get_endpoints_dir,
     get_media_root,
@@ -47,8 +55,7 @@ class IndexGeneratorService:
             Extracted index data or None if processing failed
         """
         try:
-            with open(file_info["path"], "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_codec.load_file(file_info["path"])
             
             # Ensure data is a dictionary
             if not isinstance(data, dict):
@@ -125,7 +132,8 @@ class IndexGeneratorService:
                                 "page_id": pid,
                                 "page_type": ptype,
                                 "route": route,
-                                "file_name": result["file_name"]
+                                "file_name": result["file_name"],
+                                ITEM_STATS_KEY: item_stat_keys("pages", result["data"]),
                             })
                             if ptype in indexes["by_type"] and pid not in indexes["by_type"][ptype]:
                                 indexes["by_type"][ptype].append(pid)
@@ -146,7 +154,8 @@ class IndexGeneratorService:
                             "page_id": pid,
                             "page_type": ptype,
                             "route": route,
-                            "file_name": result["file_name"]
+                            "file_name": result["file_name"],
+                            ITEM_STATS_KEY: item_stat_keys("pages", result["data"]),
                         })
                         if ptype in indexes["by_type"] and pid not in indexes["by_type"][ptype]:
                             indexes["by_type"][ptype].append(pid)
@@ -165,9 +174,9 @@ class IndexGeneratorService:
                 "pages": pages,
                 "indexes": indexes,
                 "statistics": stats,
+                AGGREGATE_KEY: aggregate_from_entries("pages", pages),
             }
-            with open(index_file, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
+            json_codec.dump_file(index_file, payload)
             logger.info("Generated pages index with %d pages", len(pages))
             return {"success": True, "index_path": str(index_file.relative_to(self.media_root)), "total": len(pages)}
         except Exception as e:
@@ -210,7 +219,8 @@ class IndexGeneratorService:
                                 "method": method,
                                 "api_version": api_version,
                                 "path": path,
-                                "file_name": result["file_name"]
+                                "file_name": result["file_name"],
+                                ITEM_STATS_KEY: item_stat_keys("endpoints", result["data"]),
                             })
                             indexes["by_method"].setdefault(method, []).append(eid)
                             indexes["by_api_version"].setdefault(api_version, []).append(eid)
@@ -233,7 +243,8 @@ class IndexGeneratorService:
                             "method": method,
                             "api_version": api_version,
                             "path": path,
-                            "file_name": result["file_name"]
+                            "file_name": result["file_name"],
+                            ITEM_STATS_KEY: item_stat_keys("endpoints", result["data"]),
                         })
                         indexes["by_method"].setdefault(method, []).append(eid)
                         indexes["by_api_version"].setdefault(api_version, []).append(eid)
@@ -252,9 +263,9 @@ class IndexGeneratorService:
                 "endpoints": endpoints,
                 "indexes": indexes,
                 "statistics": stats,
+                AGGREGATE_KEY: aggregate_from_entries("endpoints", endpoints),
             }
-            with open(index_file, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
+            json_codec.dump_file(index_file, payload)
             logger.info("Generated endpoints index with %d endpoints", len(endpoints))
             return {"success": True, "index_path": str(index_file.relative_to(self.media_root)), "total": len(endpoints)}
         except Exception as e:
@@ -277,8 +288,7 @@ class IndexGeneratorService:
                 files = list_directory_files(d, extensions=[".json"], exclude_files=INDEX_EXCLUSIONS)
                 for fi in files:
                     try:
-                        with open(fi["path"], "r", encoding="utf-8") as f:
-                            data = json.load(f)
+                        data = json_codec.load_file(fi["path"])
                         if sub == "collection":
                             name = (data.get("info") or {}).get("name") or Path(fi["path"]).stem
                             collections.append({"collection_id": name, "file_name": fi["name"], "type": "collection"})
@@ -305,12 +315,12 @@ class IndexGeneratorService:
                 "configurations": configurations,
                 "indexes": indexes,
                 "statistics": stats,
+                AGGREGATE_KEY: build_aggregate("postman", configurations),
             }
             index_file = postman_dir / "index.json"
             if index_file.exists():
                 index_file.unlink()
-            with open(index_file, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
+            json_codec.dump_file(index_file, payload)
             logger.info("Generated postman index: %d collections, %d envs, %d configs", len(collections), len(environments), len(configurations))
             return {"success": True, "index_path": str(index_file.relative_to(self.media_root)), "total": len(configurations), "collections": len(collections), "environments": len(environments)}
         except Exception as e:
@@ -331,8 +341,7 @@ class IndexGeneratorService:
                 files = list_directory_files(d, extensions=[".json"], exclude_files=INDEX_EXCLUSIONS)
                 for fi in files:
                     try:
-                        with open(fi["path"], "r", encoding="utf-8") as f:
-                            data = json.load(f)
+                        data = json_codec.load_file(fi["path"])
                         if isinstance(data, list):
                             relationships.extend(data)
                         else:
@@ -356,12 +365,12 @@ class IndexGeneratorService:
                 "relationships": relationships,
                 "indexes": indexes,
                 "statistics": stats,
+                AGGREGATE_KEY: build_aggregate("relationships", relationships),
             }
             index_file = rel_dir / "index.json"
             if index_file.exists():
                 index_file.unlink()
-            with open(index_file, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
+            json_codec.dump_file(index_file, payload)
             logger.info("Generated relationships index with %d entries", len(relationships))
             return {"success": True, "index_path": str(index_file.relative_to(self.media_root)), "total": len(relationships)}
         except Exception as e:
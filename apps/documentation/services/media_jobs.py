@@ -0,0 +1,139 @@
+"""
+Background jobs for long-running media operations.
+
+Run through ``OperationsService.start_job``; see
+``apps.operations.services.job_runner`` for progress, cancellation and
+resumption.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from apps.operations.services.job_runner import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAMES = ("pages", "endpoints", "postman", "relationships")
+SYNC_RESOURCE_TYPES = ("pages", "endpoints", "relationships", "postman")
+# Counters of MediaSyncService._sync_resource_type summed into job totals
+SYNC_COUNTERS = ("total_files", "synced", "created", "updated", "unchanged", "deleted", "errors")
+# Files uploaded (or remote keys deleted) per BulkSyncJob item
+SYNC_BATCH_SIZE = 50
+
+
+class RegenerateIndexesJob(BackgroundJob):
+    """Regenerate media indexes, one index per item. Params: {names?}."""
+
+    operation_type = "regenerate_indexes"
+
+    def plan(self, params: Dict[str, Any]) -> List[Any]:
+        return list(params.get("names") or INDEX_NAMES)
+
+    def process(self, params: Dict[str, Any], item: Any) -> Optional[Dict[str, Any]]:
+        from apps.documentation.services.index_generator_service import IndexGeneratorService
+
+        generate = getattr(IndexGeneratorService(), f"generate_{item}_index", None)
+        if not generate:
+            return {"error": f"Unknown index: {item}"}
+        out = generate() or {}
+        if not out.get("success", True):
+            return {"error": out.get("error", "Index regeneration failed")}
+        return {"regenerated": 1}
+
+
+class BulkSyncJob(BackgroundJob):
+    """
+    Sync media to S3.
+
+    Params: {resource_type, direction, file_paths?, delete_orphans?}. Given
+    file paths (to_lambda) each file is an item. Otherwise planning diffs
+    each resource type against S3 once, and the items are one scan summary
+    per resource type plus batches of SYNC_BATCH_SIZE uploads or deletes,
+    so slicing, cancellation and progress work within a resource type.
+    """
+
+    operation_type = "bulk_sync"
+
+    def plan(self, params: Dict[str, Any]) -> List[Any]:
+        from apps.documentation.services.media_sync_service import MediaSyncService
+
+        file_paths = params.get("file_paths") or []
+        if params.get("direction", "to_lambda") == "to_lambda" and file_paths:
+            return [{"file_path": fp} for fp in file_paths]
+        resource_type = params.get("resource_type", "all")
+        types = SYNC_RESOURCE_TYPES if resource_type == "all" else (resource_type,)
+
+        sync_svc = MediaSyncService()
+        items: List[Any] = []
+        for rt in types:
+            result, to_upload, orphans = sync_svc.plan_resource_type(
+                rt, delete_orphans=bool(params.get("delete_orphans", False))
+            )
+            items.append({
+                "resource_type": rt,
+                "scan": {key: result[key] for key in ("total_files", "unchanged", "errors")},
+                "scan_errors": result["error_details"][:3],
+            })
+            for i in range(0, len(to_upload), SYNC_BATCH_SIZE):
+                items.append({"resource_type": rt, "uploads": [list(u) for u in to_upload[i:i + SYNC_BATCH_SIZE]]})
+            for i in range(0, len(orphans), SYNC_BATCH_SIZE):
+                items.append({"resource_type": rt, "deletes": orphans[i:i + SYNC_BATCH_SIZE]})
+        # Unchanged files whose size/mtime moved were re-recorded while diffing
+        sync_svc.manifest.save()
+        return items
+
+    def process(self, params: Dict[str, Any], item: Any) -> Optional[Dict[str, Any]]:
+        from apps.documentation.services.media_sync_service import MediaSyncService
+
+        sync_svc = MediaSyncService()
+        if "file_path" in item:
+            result = sync_svc.sync_file_to_s3(item["file_path"])
+            if not result.get("success"):
+                return {"error": result.get("error") or "Sync failed"}
+            return {"synced": 1}
+
+        if "scan" in item:
+            counters = dict(item["scan"])
+            result = {"errors": counters["errors"], "error_details": item.get("scan_errors") or []}
+        else:
+            result = MediaSyncService._empty_result(item["resource_type"])
+            sync_svc.upload_files(item.get("uploads") or [], result)
+            sync_svc.delete_remote(item.get("deletes") or [], result)
+            sync_svc.manifest.save()
+            counters = {key: result.get(key, 0) for key in SYNC_COUNTERS}
+        if result.get("errors"):
+            details = "; ".join(
+                f"{d.get('file') or item['resource_type']}: {d.get('error')}"
+                for d in (result.get("error_details") or [])[:3]
+            )
+            counters["error"] = f"{result['errors']} errors ({details})"
+        return counters
+
+
+class BulkDeleteJob(BackgroundJob):
+    """Delete dashboard resources, one ID per item. Params: {resource_type, ids}."""
+
+    operation_type = "bulk_delete"
+
+    def plan(self, params: Dict[str, Any]) -> List[Any]:
+        return list(params.get("ids") or [])
+
+    def process(self, params: Dict[str, Any], item: Any) -> Optional[Dict[str, Any]]:
+        from apps.documentation.services import (
+            get_endpoints_service,
+            get_pages_service,
+            get_relationships_service,
+        )
+
+        resource_type = params.get("resource_type")
+        if resource_type == "pages":
+            deleted = get_pages_service().delete_page(item)
+        elif resource_type == "endpoints":
+            deleted = get_endpoints_service().delete_endpoint(item)
+        elif resource_type == "relationships":
+            deleted = get_relationships_service().delete_relationship(item)
+        else:
+            return {"error": f"Invalid resource_type: {resource_type}"}
+        if not deleted:
+            return {"error": f"Failed to delete {resource_type[:-1]}"}
+        return {"deleted": 1}
@@ -1,22 +1,160 @@
-"""Media Sync – upload media JSON to S3 (and optionally sync from S3/Lambda)."""
+"""Media Sync – upload media JSON to S3 (and optionally sync from S3/Lambda).
 
+Syncs are diff-based: each resource type makes one paginated S3 listing, local
+files are compared against the listed ETags (with a local manifest of content
+hashes so unchanged files are not even re-read), and only changed files are
+uploaded, concurrently, through one shared S3 client.
+"""
+
+import hashlib
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
 
-from apps.documentation.services.media_file_manager import MediaFileManagerService
-from apps.documentation.utils.paths import get_media_root
+from apps.documentation.services.media_file_manager import INDEX_EXCLUDE, MediaFileManagerService
+from apps.documentation.utils.paths import get_media_root, get_media_sync_manifest_path
 
 logger = logging.getLogger(__name__)
 
+MANIFEST_VERSION = 1
+
+
+class SyncManifest:
+    """
+    Local record of what was last uploaded for each S3 key.
+
+    Entries: {s3_key: {md5, size, mtime_ns, etag}}. ``md5``/``size``/``mtime_ns``
+    let unchanged files skip hashing; ``etag`` is the ETag S3 reported for the
+    upload, which keeps comparisons valid when ETag is not the content MD5
+    (e.g. SSE-KMS buckets).
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path) if path else get_media_sync_manifest_path()
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                data = json.loads(f.read())
+            if data.get("version") == MANIFEST_VERSION:
+                self.entries = data.get("entries") or {}
+        except FileNotFoundError:
+            self.entries = {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable media sync manifest %s: %s", self.path, e)
+            self.entries = {}
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps(
+                {"version": MANIFEST_VERSION, "entries": self.entries},
+                separators=(",", ":"),
+            ).encode("utf-8")
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("Failed to write media sync manifest %s: %s", self.path, e)
+
+    def get(self, s3_key: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(s3_key)
+
+    def record(self, s3_key: str, md5: str, size: int, mtime_ns: int, etag: Optional[str]) -> None:
+        with self._lock:
+            self.entries[s3_key] = {"md5": md5, "size": size, "mtime_ns": mtime_ns, "etag": etag or md5}
+            self._dirty = True
+
+    def forget(self, s3_key: str) -> None:
+        with self._lock:
+            if self.entries.pop(s3_key, None) is not None:
+                self._dirty = True
+
 
 class MediaSyncService:
     """Sync local media/ JSON to S3. Sync-from-Lambda optional when API supports it."""
 
-    def __init__(self) -> None:
+    def __init__(self, s3_service=None, max_workers: Optional[int] = None,
+                 manifest: Optional[SyncManifest] = None) -> None:
         self.file_manager = MediaFileManagerService()
         self.media_root = get_media_root()
+        self._s3_service = s3_service
+        self.max_workers = max_workers or getattr(settings, "MEDIA_SYNC_MAX_WORKERS", 8)
+        self._manifest = manifest
+
+    @property
+    def s3_service(self):
+        """Shared S3Service (one client and connection pool for all uploads)."""
+        if self._s3_service is None:
+            from apps.core.services.s3_service import S3Service
+            self._s3_service = S3Service()
+        return self._s3_service
+
+    @property
+    def manifest(self) -> SyncManifest:
+        if self._manifest is None:
+            self._manifest = SyncManifest()
+        return self._manifest
+
+    # ------------------------------------------------------------------
+    # Local state
+    # ------------------------------------------------------------------
+
+    def _local_state(self, file_path: str, s3_key: str) -> Tuple[str, int, int]:
+        """Return (md5, size, mtime_ns), reusing the manifest hash when size/mtime match."""
+        st = os.stat(file_path)
+        entry = self.manifest.get(s3_key)
+        if entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+            return entry["md5"], st.st_size, st.st_mtime_ns
+        h = hashlib.md5()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                h.update(chunk)
+        return h.hexdigest(), st.st_size, st.st_mtime_ns
+
+    def _is_unchanged(self, s3_key: str, md5: str, remote_etag: Optional[str]) -> bool:
+        if remote_etag is None:
+            return False
+        if remote_etag == md5:
+            return True
+        entry = self.manifest.get(s3_key)
+        return bool(entry and entry.get("md5") == md5 and entry.get("etag") == remote_etag)
+
+    def _list_remote(self, resource_type: str) -> Dict[str, str]:
+        """One paginated listing of the resource prefix -> {s3_key: etag}."""
+        prefix = f"{self.file_manager.data_prefix}/{resource_type}/"
+        return {f["key"]: f.get("etag", "") for f in self.s3_service.list_files(prefix=prefix)}
+
+    # ------------------------------------------------------------------
+    # Upload
+    # ------------------------------------------------------------------
+
+    def _upload(self, file_path: str, s3_key: str, size: int, mtime_ns: int) -> Dict[str, Any]:
+        """Upload raw file bytes (validated as JSON) and record them in the manifest."""
+        with open(file_path, "rb") as f:
+            content = f.read()
+        json.loads(content)  # Refuse to publish a corrupt document
+        md5 = hashlib.md5(content).hexdigest()
+        # Record the ETag S3 reports (not the MD5, e.g. under SSE-KMS) so the
+        # next listing recognises the object as unchanged
+        etag = self.s3_service.upload_file(content, s3_key, content_type="application/json")
+        self.manifest.record(s3_key, md5, size, mtime_ns, etag=etag or md5)
+        return {"s3_key": s3_key, "md5": md5}
 
     def sync_file_to_s3(self, file_path: str) -> Dict[str, Any]:
         """
@@ -33,73 +171,164 @@ class MediaSyncService:
             return {"success": False, "s3_key": None, "error": str(e)}
 
         try:
-            with open(p, "rb") as f:
-                content = f.read()
-        except OSError as e:
-            return {"success": False, "s3_key": s3_key, "error": str(e)}
-
-        try:
-            from apps.core.services.s3_service import S3Service
-            svc = S3Service()
-            svc.upload_file(content, s3_key, content_type="application/json")
+            st = p.stat()
+            self._upload(str(p), s3_key, st.st_size, st.st_mtime_ns)
+            self.manifest.save()
             return {"success": True, "s3_key": s3_key, "error": None}
         except Exception as e:
             logger.warning("sync_file_to_s3 failed path=%s key=%s: %s", file_path, s3_key, e)
             return {"success": False, "s3_key": s3_key, "error": str(e)}
 
-    def _sync_resource_type(self, resource_type: str, dry_run: bool) -> Dict[str, Any]:
-        """Scan resource type, upload each JSON to S3. Returns {resource_type, total_files, synced, errors, ...}."""
-        result: Dict[str, Any] = {
+    @staticmethod
+    def _empty_result(resource_type: str) -> Dict[str, Any]:
+        return {
             "resource_type": resource_type,
             "total_files": 0,
             "synced": 0,
             "created": 0,
             "updated": 0,
+            "unchanged": 0,
+            "deleted": 0,
             "errors": 0,
             "error_details": [],
         }
+
+    def plan_resource_type(
+        self,
+        resource_type: str,
+        delete_orphans: bool = False,
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, str, int, int, bool]], List[str]]:
+        """
+        Diff one resource type against S3 without writing to it.
+
+        Returns (result, to_upload, orphans): the result counts total_files,
+        unchanged and errors; to_upload holds (file_path, s3_key, size,
+        mtime_ns, is_new) per changed file; orphans are remote keys with no
+        local file (only when delete_orphans).
+        """
+        result = self._empty_result(resource_type)
         files = self.file_manager.scan_media_directory(resource_type)
         result["total_files"] = len(files)
-        if dry_run:
-            result["synced"] = len(files)
-            return result
 
+        try:
+            remote = self._list_remote(resource_type)
+        except Exception as e:
+            logger.warning("S3 listing failed for %s: %s", resource_type, e)
+            result["errors"] += 1
+            result["error_details"].append({"file": None, "error": f"S3 listing failed: {e}"})
+            return result, [], []
+
+        to_upload: List[Tuple[str, str, int, int, bool]] = []
+        local_keys = set()
         for fi in files:
             fp = fi.get("file_path")
-            if not fp:
+            s3_key = fi.get("s3_key")
+            if not fp or not s3_key:
                 continue
+            local_keys.add(s3_key)
             try:
-                with open(fp, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                # Normalize minimal fields if needed; we upload as-is
-                out = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
-                resource_type = fi.get("resource_type", "project")
-                s3_key = self.file_manager.calculate_s3_key(Path(fp), resource_type)
-                from apps.core.services.s3_service import S3Service
-                svc = S3Service()
-                svc.upload_file(out, s3_key, content_type="application/json")
-                result["synced"] += 1
-                result["updated"] += 1
-            except Exception as e:
+                md5, size, mtime_ns = self._local_state(fp, s3_key)
+            except OSError as e:
                 result["errors"] += 1
                 result["error_details"].append({"file": fp, "error": str(e)})
+                continue
+            remote_etag = remote.get(s3_key)
+            if self._is_unchanged(s3_key, md5, remote_etag):
+                result["unchanged"] += 1
+                entry = self.manifest.get(s3_key)
+                if not entry or entry.get("mtime_ns") != mtime_ns or entry.get("md5") != md5:
+                    self.manifest.record(s3_key, md5, size, mtime_ns, etag=remote_etag)
+                continue
+            to_upload.append((fp, s3_key, size, mtime_ns, remote_etag is None))
+
+        orphans = []
+        if delete_orphans:
+            orphans = [
+                key for key in remote
+                if key not in local_keys
+                and key.endswith(".json")
+                and key.rsplit("/", 1)[-1] not in INDEX_EXCLUDE
+            ]
+        return result, to_upload, orphans
+
+    def upload_files(self, to_upload: Iterable[Sequence[Any]], result: Dict[str, Any]) -> None:
+        """Upload planned files concurrently, counting outcomes into result."""
+        to_upload = list(to_upload)
+        if not to_upload:
+            return
+        workers = max(1, min(self.max_workers, len(to_upload)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._upload, fp, s3_key, size, mtime_ns): (fp, is_new)
+                for fp, s3_key, size, mtime_ns, is_new in to_upload
+            }
+            for future in as_completed(futures):
+                fp, is_new = futures[future]
+                try:
+                    future.result()
+                    result["synced"] += 1
+                    result["created" if is_new else "updated"] += 1
+                except Exception as e:
+                    result["errors"] += 1
+                    result["error_details"].append({"file": fp, "error": str(e)})
+
+    def delete_remote(self, keys: Iterable[str], result: Dict[str, Any]) -> None:
+        """Delete orphaned remote keys, counting outcomes into result."""
+        for key in keys:
+            try:
+                self.s3_service.delete_file(key)
+                self.manifest.forget(key)
+                result["deleted"] += 1
+            except Exception as e:
+                result["errors"] += 1
+                result["error_details"].append({"file": key, "error": f"Delete failed: {e}"})
+
+    def _sync_resource_type(
+        self,
+        resource_type: str,
+        dry_run: bool,
+        delete_orphans: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Diff one resource type against S3 and upload changed files.
+
+        Returns {resource_type, total_files, synced, created, updated, unchanged,
+        deleted, errors, error_details}. With dry_run, nothing is written and
+        synced/created/updated/deleted describe what would happen.
+        """
+        result, to_upload, orphans = self.plan_resource_type(resource_type, delete_orphans)
+
+        if dry_run:
+            result["created"] = sum(1 for item in to_upload if item[4])
+            result["updated"] = len(to_upload) - result["created"]
+            result["synced"] = len(to_upload)
+            result["deleted"] = len(orphans)
+            return result
+
+        self.upload_files(to_upload, result)
+        self.delete_remote(orphans, result)
 
+        self.manifest.save()
+        logger.info(
+            "Synced %s: %s uploaded, %s unchanged, %s deleted, %s errors",
+            resource_type, result["synced"], result["unchanged"], result["deleted"], result["errors"],
+        )
         return result
 
-    def sync_pages_to_s3(self, dry_run: bool = False) -> Dict[str, Any]:
-        return self._sync_resource_type("pages", dry_run)
+    def sync_pages_to_s3(self, dry_run: bool = False, delete_orphans: bool = False) -> Dict[str, Any]:
+        return self._sync_resource_type("pages", dry_run, delete_orphans)
 
-    def sync_endpoints_to_s3(self, dry_run: bool = False) -> Dict[str, Any]:
-        return self._sync_resource_type("endpoints", dry_run)
+    def sync_endpoints_to_s3(self, dry_run: bool = False, delete_orphans: bool = False) -> Dict[str, Any]:
+        return self._sync_resource_type("endpoints", dry_run, delete_orphans)
 
-    def sync_relationships_to_s3(self, dry_run: bool = False) -> Dict[str, Any]:
-        return self._sync_resource_type("relationships", dry_run)
+    def sync_relationships_to_s3(self, dry_run: bool = False, delete_orphans: bool = False) -> Dict[str, Any]:
+        return self._sync_resource_type("relationships", dry_run, delete_orphans)
 
-    def sync_postman_to_s3(self, dry_run: bool = False) -> Dict[str, Any]:
-        return self._sync_resource_type("postman", dry_run)
+    def sync_postman_to_s3(self, dry_run: bool = False, delete_orphans: bool = False) -> Dict[str, Any]:
+        return self._sync_resource_type("postman", dry_run, delete_orphans)
 
-    def sync_all_to_s3(self, dry_run: bool = False) -> Dict[str, Any]:
+    def sync_all_to_s3(self, dry_run: bool = False, delete_orphans: bool = False) -> Dict[str, Any]:
         out: Dict[str, Any] = {}
         for rt in ("pages", "endpoints", "relationships", "postman"):
-            out[rt] = self._sync_resource_type(rt, dry_run)
+            out[rt] = self._sync_resource_type(rt, dry_run, delete_orphans)
         return out
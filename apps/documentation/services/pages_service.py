@@ -8,6 +8,7 @@ from apps.documentation.repositories.unified_storage import UnifiedStorage
 from apps.documentation.repositories.pages_repository import PagesRepository
 from apps.documentation.utils.retry import retry_on_network_error
 from apps.documentation.utils.exceptions import DocumentationError
+from apps.documentation.utils.resource_statistics import dimension_counts, read_aggregate
 
 logger = logging.getLogger(__name__)
 
@@ -274,32 +275,38 @@ class PagesService(DocumentationServiceBase):
             - indexes: Index structure
         """
         try:
-            # Get type statistics
-            type_stats = self.get_type_statistics()
-            
-            # Get all pages for state breakdown
-            all_pages_result = self.list_pages(limit=None, offset=0, use_cache=True)
-            all_pages = all_pages_result.get("pages", [])
-            
-            # Calculate state breakdown
-            by_state = {}
-            by_type = {}
-            total_with_endpoints = 0
-            
-            for page in all_pages:
-                # Count by state
-                metadata = page.get("metadata", {})
-                state = metadata.get("page_state") or metadata.get("status", "published")
-                by_state[state] = by_state.get(state, 0) + 1
+            # Precomputed aggregate (maintained with the index) avoids listing every page
+            aggregate = read_aggregate("pages")
+            if aggregate is not None:
+                total = aggregate.get("total", 0)
+                by_state = dimension_counts(aggregate, "by_state")
+                by_type = dimension_counts(aggregate, "by_type")
+                total_with_endpoints = dimension_counts(aggregate, "with_endpoints").get("yes", 0)
+            else:
+                # Get all pages for state breakdown
+                all_pages_result = self.list_pages(limit=None, offset=0, use_cache=True)
+                all_pages = all_pages_result.get("pages", [])
+                total = len(all_pages)
                 
-                # Count by type
-                page_type = page.get("page_type", "docs")
-                by_type[page_type] = by_type.get(page_type, 0) + 1
+                # Calculate state breakdown
+                by_state = {}
+                by_type = {}
+                total_with_endpoints = 0
                 
-                # Count pages with endpoints
-                uses_endpoints = metadata.get("uses_endpoints", [])
-                if uses_endpoints and len(uses_endpoints) > 0:
-                    total_with_endpoints += 1
+                for page in all_pages:
+                    # Count by state
+                    metadata = page.get("metadata", {})
+                    state = metadata.get("page_state") or metadata.get("status", "published")
+                    by_state[state] = by_state.get(state, 0) + 1
+                    
+                    # Count by type
+                    page_type = page.get("page_type", "docs")
+                    by_type[page_type] = by_type.get(page_type, 0) + 1
+                    
+                    # Count pages with endpoints
+                    uses_endpoints = metadata.get("uses_endpoints", [])
+                    if uses_endpoints and len(uses_endpoints) > 0:
+                        total_with_endpoints += 1
             
             # Get index data for version and last_updated
             try:
@@ -316,7 +323,7 @@ class PagesService(DocumentationServiceBase):
                 indexes = {}
             
             return {
-                "total": len(all_pages),
+                "total": total,
                 "version": version,
                 "last_updated": last_updated,
                 "statistics": {
@@ -395,6 +402,63 @@ class PagesService(DocumentationServiceBase):
                 f"Failed to create page: {error_response.get('error', str(e))}"
             ) from e
     
+    def create_pages(self, pages_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many pages with one index write (bulk import).
+        
+        Each page gets the same validation and transformation as create_page.
+        Files are uploaded concurrently by PagesRepository.batch_create and the
+        caches (and ETag generation) are invalidated once for the whole batch.
+        
+        Args:
+            pages_data: Page data dictionaries in Django format
+            
+        Returns:
+            Dictionary with 'created' (page dicts) and 'failed' (page ids that
+            were invalid or could not be written)
+            
+        Raises:
+            DocumentationError: If the batch cannot be written at all
+        """
+        from apps.documentation.utils.data_transformers import DataTransformer
+        
+        required_fields = ['page_id', 'title']
+        lambda_pages: List[Dict[str, Any]] = []
+        failed: List[str] = []
+        for page_data in pages_data:
+            is_valid, error_msg = self._validate_input(page_data, required_fields)
+            try:
+                if not is_valid:
+                    raise ValueError(error_msg)
+                lambda_pages.append(DataTransformer.django_to_lambda_page(page_data))
+            except Exception as e:
+                failed.append(page_data.get('page_id') or 'unknown')
+                self.logger.warning(f"Skipping invalid page in bulk create: {e}")
+        if not lambda_pages:
+            return {'created': [], 'failed': failed}
+        
+        try:
+            created = self.repository.batch_create(lambda_pages, raise_on_error=False)
+        except Exception as e:
+            error_response = self._handle_error(
+                e,
+                context=f"Failed to bulk create {len(lambda_pages)} pages",
+                record_monitoring=True
+            )
+            raise DocumentationError(
+                f"Failed to create pages: {error_response.get('error', str(e))}"
+            ) from e
+        
+        if created:
+            self._clear_list_cache()
+        created_ids = {page.get('page_id') for page in created}
+        failed.extend(
+            page.get('page_id') for page in lambda_pages
+            if page.get('page_id') not in created_ids
+        )
+        self.logger.info(f"Bulk created {len(created)} pages ({len(failed)} failed)")
+        return {'created': created, 'failed': failed}
+    
     def update_page(self, page_id: str, page_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Update page with data transformation.
@@ -8,6 +8,7 @@ from apps.documentation.repositories.postman_repository import PostmanRepository
 from apps.documentation.repositories.local_json_storage import LocalJSONStorage
 from apps.documentation.utils.retry import retry_on_network_error
 from apps.documentation.utils.exceptions import DocumentationError
+from apps.documentation.utils.resource_statistics import dimension_counts, read_aggregate
 
 logger = logging.getLogger(__name__)
 
@@ -269,6 +270,13 @@ class PostmanService(DocumentationServiceBase):
             DocumentationError: If retrieval fails after retries
         """
         try:
+            aggregate = read_aggregate('postman')
+            if aggregate is not None:
+                return {
+                    'total_configurations': aggregate.get('total', 0),
+                    'by_state': dimension_counts(aggregate, 'by_state'),
+                    'updated_at': aggregate.get('last_updated'),
+                }
             result = self.list_configurations(limit=10000)
             configs = result.get('configurations', [])
             by_state = {}
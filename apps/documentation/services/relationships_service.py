@@ -8,6 +8,13 @@ from apps.documentation.repositories.relationships_repository import Relationshi
 from apps.documentation.repositories.local_json_storage import LocalJSONStorage
 from apps.documentation.utils.retry import retry_on_network_error
 from apps.documentation.utils.exceptions import DocumentationError
+from apps.documentation.utils.conditional_get import get_generation
+from apps.documentation.utils.relationship_graph import (
+    record_relationship_delete,
+    record_relationship_write,
+    record_relationship_writes,
+)
+from apps.documentation.utils.resource_statistics import dimension_counts, read_aggregate
 
 logger = logging.getLogger(__name__)
 
@@ -276,6 +283,8 @@ class RelationshipsService(DocumentationServiceBase):
             raise ValueError(error_msg)
         
         try:
+            generation = get_generation('relationships')
+            
             # Retry logic for external API calls
             @retry_on_network_error(max_retries=3, initial_delay=1.0)
             def _create_relationship_with_retry():
@@ -291,6 +300,7 @@ class RelationshipsService(DocumentationServiceBase):
                 # Clear all list_relationships cache (pattern-based)
                 self.unified_storage.clear_cache('relationships')
                 self.logger.debug(f"Cleared cache for relationship {relationship_id} and all relationships lists after create")
+                record_relationship_write(result, generation)
             
             return result
             
@@ -304,6 +314,61 @@ class RelationshipsService(DocumentationServiceBase):
                 f"Failed to create relationship: {error_response.get('error', str(e))}"
             ) from e
     
+    def create_relationships(self, relationships_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many relationships with one index write (bulk import).
+        
+        Files are uploaded concurrently by RelationshipsRepository.batch_create.
+        Cache invalidation (and with it the ETag generation bump) and the
+        relationship graph update happen once for the whole batch.
+        
+        Args:
+            relationships_data: Relationship data dictionaries
+            
+        Returns:
+            Dictionary with 'created' (relationship dicts) and 'failed'
+            (relationship ids that were invalid or could not be written)
+            
+        Raises:
+            DocumentationError: If the batch cannot be written at all
+        """
+        required_fields = ['relationship_id', 'page_path', 'endpoint_path', 'method']
+        valid: List[Dict[str, Any]] = []
+        failed: List[str] = []
+        for relationship_data in relationships_data:
+            is_valid, error_msg = self._validate_input(relationship_data, required_fields)
+            if is_valid:
+                valid.append(relationship_data)
+            else:
+                failed.append(relationship_data.get('relationship_id') or 'unknown')
+                self.logger.warning(f"Skipping invalid relationship in bulk create: {error_msg}")
+        if not valid:
+            return {'created': [], 'failed': failed}
+        
+        try:
+            generation = get_generation('relationships')
+            created = self.repository.batch_create(valid, raise_on_error=False)
+        except Exception as e:
+            error_response = self._handle_error(
+                e,
+                context=f"Failed to bulk create {len(valid)} relationships",
+                record_monitoring=True
+            )
+            raise DocumentationError(
+                f"Failed to create relationships: {error_response.get('error', str(e))}"
+            ) from e
+        
+        if created:
+            self.unified_storage.clear_cache('relationships')
+            record_relationship_writes(created, generation)
+        created_ids = {rel.get('relationship_id') for rel in created}
+        failed.extend(
+            rel.get('relationship_id') for rel in valid
+            if rel.get('relationship_id') not in created_ids
+        )
+        self.logger.info(f"Bulk created {len(created)} relationships ({len(failed)} failed)")
+        return {'created': created, 'failed': failed}
+    
     def update_relationship(self, relationship_id: str, relationship_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Update relationship (use S3 direct for writes).
@@ -325,6 +390,8 @@ class RelationshipsService(DocumentationServiceBase):
             raise ValueError(f"Relationship not found: {relationship_id}")
         
         try:
+            generation = get_generation('relationships')
+            
             # Retry logic for external API calls
             @retry_on_network_error(max_retries=3, initial_delay=1.0)
             def _update_relationship_with_retry():
@@ -339,6 +406,7 @@ class RelationshipsService(DocumentationServiceBase):
                 # Clear all list_relationships cache (pattern-based)
                 self.unified_storage.clear_cache('relationships')
                 self.logger.debug(f"Cleared cache for relationship {relationship_id} and all relationships lists after update")
+                record_relationship_write(result, generation)
             
             return result
             
@@ -378,6 +446,8 @@ class RelationshipsService(DocumentationServiceBase):
             DocumentationError: If deletion fails after retries
         """
         try:
+            generation = get_generation('relationships')
+            
             # Retry logic for external API calls
             @retry_on_network_error(max_retries=3, initial_delay=1.0)
             def _delete_relationship_with_retry():
@@ -392,6 +462,7 @@ class RelationshipsService(DocumentationServiceBase):
                 self.unified_storage.clear_cache('relationships', relationship_id)
                 self.unified_storage.clear_cache('relationships')
                 self._delete_local_relationship_file(relationship_id)
+                record_relationship_delete(relationship_id, generation)
                 self.logger.debug(f"Cleared cache for relationship {relationship_id} and all relationships lists after delete")
             
             return success
@@ -469,6 +540,23 @@ class RelationshipsService(DocumentationServiceBase):
             DocumentationError: If retrieval fails after retries
         """
         try:
+            aggregate = read_aggregate('relationships')
+            if aggregate is not None:
+                pages = dimension_counts(aggregate, 'by_page')
+                endpoints = dimension_counts(aggregate, 'by_endpoint')
+                return {
+                    'total_relationships': aggregate.get('total', 0),
+                    'unique_pages': len(pages),
+                    'unique_endpoints': len(endpoints),
+                    'by_api_version': dimension_counts(aggregate, 'by_api_version'),
+                    'by_usage_type': dimension_counts(aggregate, 'by_usage_type'),
+                    'by_usage_context': dimension_counts(aggregate, 'by_usage_context'),
+                    'total_endpoints_documented': 0,  # Would need endpoint count
+                    'total_pages_documented': 0,  # Would need page count
+                    'endpoints_with_pages': len(endpoints),
+                    'pages_with_endpoints': len(pages)
+                }
+            
             # Calculate from local data
             all_rels = self.list_relationships()
             relationships = all_rels.get('relationships', [])
@@ -0,0 +1,148 @@
+"""Tests for ETag / If-None-Match handling on documentation API v1 GETs."""
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import JsonResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.documentation.utils.cache_decorator import cache_documentation_get
+from apps.documentation.utils.conditional_get import (
+    CACHE_CONTROL,
+    bump_generation,
+    conditional_documentation_get,
+    get_generation,
+)
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ConditionalGetTest(TestCase):
+    """Test generation-based ETags and 304 short-circuiting."""
+
+    def setUp(self):
+        cache.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.media = override_settings(MEDIA_ROOT=self.tmp.name)
+        self.media.enable()
+        self.factory = RequestFactory()
+        self.calls = 0
+
+        @conditional_documentation_get(("pages",))
+        @cache_documentation_get(timeout=300)
+        def view(request):
+            self.calls += 1
+            return JsonResponse({"pages": [], "calls": self.calls})
+
+        self.view = view
+
+    def tearDown(self):
+        self.media.disable()
+        self.tmp.cleanup()
+        cache.clear()
+
+    def _get(self, etag=None, path="/api/v1/pages/"):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        return self.view(self.factory.get(path, **headers))
+
+    def test_sets_etag_and_cache_control(self):
+        """200 responses carry a strong ETag and the class Cache-Control."""
+        response = self._get()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(response["Cache-Control"], CACHE_CONTROL["list"])
+
+    def test_matching_etag_returns_304_without_calling_view(self):
+        """A matching If-None-Match short-circuits before the view and cache."""
+        etag = self._get()["ETag"]
+        response = self._get(etag=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(self.calls, 1)
+
+    def test_etag_varies_with_query(self):
+        """Different query strings get different ETags."""
+        self.assertNotEqual(self._get()["ETag"], self._get(path="/api/v1/pages/?limit=5")["ETag"])
+
+    def test_bump_generation_changes_etag(self):
+        """After a write the old ETag no longer matches and the view runs again."""
+        etag = self._get()["ETag"]
+        bump_generation("pages")
+        response = self._get(etag=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(self.calls, 2)
+
+    def test_unrelated_generation_keeps_etag(self):
+        """Changes to other resource types do not invalidate the ETag."""
+        etag = self._get()["ETag"]
+        bump_generation("postman")
+        self.assertEqual(self._get(etag=etag).status_code, 304)
+
+    def test_local_index_change_changes_etag(self):
+        """Rewriting media/<type>/index.json (another process) changes the ETag."""
+        index = Path(self.tmp.name) / "pages" / "index.json"
+        index.parent.mkdir(parents=True)
+        index.write_text("{}")
+        etag = self._get()["ETag"]
+        stat = index.stat()
+        os.utime(index, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(self._get(etag=etag).status_code, 200)
+
+
+class SharedGenerationTest(TestCase):
+    """The generation depends only on state shared by all workers."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.overrides = override_settings(
+            MEDIA_ROOT=os.path.join(self.tmp.name, "media"),
+            DOCS_GENERATION_DIR=os.path.join(self.tmp.name, "generation"),
+        )
+        self.overrides.enable()
+
+    def tearDown(self):
+        self.overrides.disable()
+        self.tmp.cleanup()
+
+    def _as_worker(self, backend):
+        return patch("apps.documentation.utils.conditional_get._backend", return_value=backend)
+
+    def test_per_process_caches_share_marker_files(self):
+        """Two LocMem caches (two workers): a bump in one is seen by the other."""
+        worker_a, worker_b = LocMemCache("worker-a", {}), LocMemCache("worker-b", {})
+        with self._as_worker(worker_b):
+            generation = get_generation("pages")
+        with self._as_worker(worker_a):
+            bump_generation("pages")
+            self.assertEqual(get_generation("pages"), get_generation("pages"))
+            bumped = get_generation("pages")
+        with self._as_worker(worker_b):
+            self.assertNotEqual(get_generation("pages"), generation)
+            self.assertEqual(get_generation("pages"), bumped)
+            self.assertEqual(get_generation("postman"), get_generation("postman"))
+
+    def test_shared_cache_counter(self):
+        """Two instances of a shared backend see the same counter; no marker files are written."""
+        location = os.path.join(self.tmp.name, "cache")
+        worker_a, worker_b = FileBasedCache(location, {}), FileBasedCache(location, {})
+        with self._as_worker(worker_b):
+            generation = get_generation("pages")
+        with self._as_worker(worker_a):
+            bump_generation("pages")
+        with self._as_worker(worker_b):
+            self.assertNotEqual(get_generation("pages"), generation)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, "generation")))
+
+    @override_settings(USE_LOCAL_JSON_FILES=False)
+    @patch("apps.documentation.services.get_shared_s3_index_manager")
+    def test_no_storage_access(self, mock_manager):
+        """S3 mode: computing the generation never reads the S3 index."""
+        bump_generation("pages")
+        get_generation("pages")
+        mock_manager.assert_not_called()
@@ -0,0 +1,130 @@
+"""Tests for keyset (cursor) pagination of documentation list APIs."""
+import json
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+
+from apps.documentation.utils.conditional_get import bump_generation
+from apps.documentation.utils.cursor_pagination import (
+    InvalidCursor,
+    KeysetIndex,
+    decode_cursor,
+    encode_cursor,
+    get_keyset_index,
+    reset_keyset_indexes,
+)
+from apps.documentation.utils.list_projectors import to_relationship_list_item
+
+
+def _relationships(n):
+    return [
+        {"relationship_id": f"rel-{i:03d}", "page_id": "p", "updated_at": f"2024-01-{i % 28 + 1:02d}"}
+        for i in range(n)
+    ]
+
+
+class KeysetIndexTest(TestCase):
+    """Test sorted-key seeking and cursor tokens."""
+
+    def setUp(self):
+        reset_keyset_indexes()
+
+    def test_walks_every_record_exactly_once(self):
+        """Following next_cursor visits all records in (updated_at, id) order."""
+        records = _relationships(103)
+        by_id = {r["relationship_id"]: r for r in records}
+        index = KeysetIndex.from_records(records, "relationships")
+        fetched = []
+
+        def fetch(ids):
+            fetched.append(len(ids))
+            return {record_id: by_id[record_id] for record_id in ids}
+
+        seen, cursor = [], None
+        while True:
+            page = index.page(decode_cursor(cursor) if cursor else None, 10, fetch)
+            seen.extend(r["relationship_id"] for r in page["items"])
+            self.assertEqual(page["total"], 103)
+            if not page["has_more"]:
+                self.assertIsNone(page["next_cursor"])
+                break
+            cursor = page["next_cursor"]
+        expected = [r["relationship_id"] for r in sorted(records, key=lambda r: (r["updated_at"], r["relationship_id"]))]
+        self.assertEqual(seen, expected)
+        # Only keys are indexed; each page loads just its own records
+        self.assertFalse(hasattr(index, "records"))
+        self.assertEqual(max(fetched), 10)
+
+    def test_deleted_records_are_skipped(self):
+        index = KeysetIndex.from_records(_relationships(3), "relationships")
+        page = index.page(None, 3, lambda ids: {ids[0]: {"relationship_id": ids[0]}})
+        self.assertEqual(len(page["items"]), 1)
+        self.assertEqual(page["total"], 3)
+
+    def test_cursor_round_trip_and_invalid(self):
+        self.assertEqual(decode_cursor(encode_cursor(("2024-01-01", "a/b"))), ("2024-01-01", "a/b"))
+        self.assertIsNone(decode_cursor(""))
+        with self.assertRaises(InvalidCursor):
+            decode_cursor("not-a-cursor")
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_index_reused_until_generation_changes(self):
+        loader = Mock(return_value=_relationships(3))
+        get_keyset_index("relationships", {"page_id": "p"}, loader)
+        get_keyset_index("relationships", {"page_id": "p"}, loader)
+        self.assertEqual(loader.call_count, 1)
+        bump_generation("relationships")
+        get_keyset_index("relationships", {"page_id": "p"}, loader)
+        self.assertEqual(loader.call_count, 2)
+
+
+class CursorListViewTest(TestCase):
+    """Test ?cursor= on /api/v1/relationships/."""
+
+    def setUp(self):
+        cache.clear()
+        reset_keyset_indexes()
+        self.client = Client()
+
+    def tearDown(self):
+        cache.clear()
+        reset_keyset_indexes()
+
+    @patch("apps.documentation.services.get_relationships_service")
+    @patch("apps.documentation.api.v1.relationships_views.get_relationships_service")
+    def test_cursor_pages(self, mock_get_service, mock_shared_service):
+        service = Mock()
+        records = _relationships(5)
+        service.list_relationships.return_value = {"relationships": records, "total": 5}
+        by_id = {r["relationship_id"]: r for r in records}
+        service.get_relationship.side_effect = by_id.get
+        mock_get_service.return_value = service
+        mock_shared_service.return_value = service
+
+        first = json.loads(self.client.get("/api/v1/relationships/?cursor=&limit=2").content)
+        self.assertEqual(len(first["relationships"]), 2)
+        self.assertEqual(first["total"], 5)
+        self.assertTrue(first["has_more"])
+
+        second = json.loads(self.client.get(f"/api/v1/relationships/?cursor={first['next_cursor']}&limit=2").content)
+        self.assertEqual(len(second["relationships"]), 2)
+        self.assertNotEqual(first["relationships"][0]["relationship_id"], second["relationships"][0]["relationship_id"])
+        # The full filtered list is keyed once; list pages come from the index summaries
+        self.assertEqual(service.list_relationships.call_count, 1)
+        self.assertEqual(service.get_relationship.call_count, 0)
+        self.assertEqual(set(first["relationships"][0]), set(to_relationship_list_item({})))
+
+        # expand=full loads the page's records by id
+        full = json.loads(self.client.get("/api/v1/relationships/?cursor=&limit=2&expand=full").content)
+        self.assertEqual(full["relationships"][0], by_id[full["relationships"][0]["relationship_id"]])
+        self.assertEqual(service.get_relationship.call_count, 2)
+
+        bad = self.client.get("/api/v1/relationships/?cursor=%25%25")
+        self.assertEqual(bad.status_code, 400)
+
+    @patch("apps.documentation.api.v1.pages_views.get_pages_service")
+    def test_invalid_limit_is_a_client_error(self, mock_get_service):
+        mock_get_service.return_value.list_pages.return_value = {"pages": [], "total": 0}
+        response = self.client.get("/api/v1/pages/?cursor=&limit=abc")
+        self.assertEqual(response.status_code, 400)
@@ -10,6 +10,8 @@ Tests complete user workflows:
 - Bulk operations
 """
 
+from unittest.mock import patch
+
 from django.test import TestCase, Client
 from django.contrib.auth import get_user_model
 from django.urls import reverse
@@ -107,8 +109,10 @@ class DashboardE2ETestCase(TestCase):
         self.assertTrue(data['success'])
         self.assertIn('filters', data)
     
-    def test_bulk_delete_workflow(self):
-        """Test bulk delete workflow."""
+    @patch('apps.operations.services.OperationsService.start_job')
+    def test_bulk_delete_workflow(self, mock_start_job):
+        """Test bulk delete is queued as a background operation."""
+        mock_start_job.return_value = {'operation_id': 'op-1', 'status': 'queued'}
         url = reverse('documentation:api_dashboard_bulk_delete')
         
         # Test bulk delete request
@@ -121,12 +125,14 @@ class DashboardE2ETestCase(TestCase):
             content_type='application/json'
         )
         
-        # Should return success (even if items don't exist)
-        self.assertEqual(response.status_code, 200)
+        # Accepted right away; progress is followed through the operation
+        self.assertEqual(response.status_code, 202)
         data = json.loads(response.content)
-        self.assertIn('success', data)
-        self.assertIn('deleted_count', data)
-        self.assertIn('failed_count', data)
+        self.assertTrue(data['success'])
+        self.assertEqual(data['operation_id'], 'op-1')
+        self.assertEqual(data['total_requested'], 2)
+        self.assertIn('progress_url', data)
+        self.assertEqual(mock_start_job.call_args[1]['params']['ids'], ['test-page-1', 'test-page-2'])
     
     def test_bulk_delete_invalid_request(self):
         """Test bulk delete with invalid request."""
@@ -0,0 +1,151 @@
+"""Tests for streaming documentation export (export_service + /api/v1/export/)."""
+import json
+import tempfile
+from pathlib import Path
+
+from django.test import Client, TestCase, override_settings
+
+from apps.documentation.repositories.s3_json_storage import S3JSONStorage
+from apps.documentation.repositories.s3_object_cache import S3ObjectCache
+from apps.documentation.services.export_service import (
+    DocumentationExportService,
+    iter_json_array,
+    iter_ndjson,
+)
+
+
+class FakeS3Service:
+    """Listing-only stand-in for S3Service."""
+
+    def __init__(self, objects):
+        self.objects = objects
+
+    def iter_files(self, prefix, page_size=1000):
+        for key in sorted(self.objects):
+            if key.startswith(prefix):
+                yield {"key": key, "size": 0, "last_modified": None, "etag": ""}
+
+
+class FakeS3Storage:
+    def __init__(self, objects):
+        self.objects = objects
+        self.s3_service = FakeS3Service(objects)
+        self.reads = []
+
+    def _read_json_uncached(self, key):
+        self.reads.append(key)
+        return self.objects[key]
+
+
+class FakeUnifiedStorage:
+    def __init__(self, s3_storage, use_local_json_files=False):
+        self.s3_storage = s3_storage
+        self.use_local_json_files = use_local_json_files
+
+
+class ExportServiceTest(TestCase):
+    """Test lazy record iteration and streaming encoders."""
+
+    def test_s3_records_are_streamed_in_key_order(self):
+        """S3 export lists lazily and skips index files."""
+        objects = {
+            "data/pages/a.json": {"page_id": "a"},
+            "data/pages/b.json": {"page_id": "b"},
+            "data/pages/index.json": {"total": 2},
+            "data/endpoints/x.json": {"endpoint_id": "x"},
+        }
+        storage = FakeS3Storage(objects)
+        with override_settings(S3_DATA_PREFIX="data/"):
+            service = DocumentationExportService(unified_storage=FakeUnifiedStorage(storage), s3_prefetch=1)
+            records = service.iter_records("pages")
+            self.assertEqual(next(records), {"page_id": "a"})
+            # Only the first object (plus at most the prefetch window) has been read
+            self.assertLessEqual(len(storage.reads), 2)
+            self.assertEqual(list(records), [{"page_id": "b"}])
+        self.assertNotIn("data/pages/index.json", storage.reads)
+
+    def test_s3_relationships_export_canonical_records(self):
+        """Relationships stream from data/relationships/{id}.json, not the by-page/by-endpoint aggregates."""
+        objects = {
+            "data/relationships/rel-1.json": {"relationship_id": "rel-1"},
+            "data/relationships/rel-2.json": {"relationship_id": "rel-2"},
+            "data/relationships/index.json": {"total": 2},
+            "data/relationships/by-page/home.json": {"page_path": "/home", "endpoints": []},
+            "data/relationships/by-endpoint/GET_x.json": {"endpoint_path": "/x", "pages": []},
+        }
+        storage = FakeS3Storage(objects)
+        with override_settings(S3_DATA_PREFIX="data/"):
+            service = DocumentationExportService(unified_storage=FakeUnifiedStorage(storage))
+            records = list(service.iter_records("relationships"))
+        self.assertEqual(records, [{"relationship_id": "rel-1"}, {"relationship_id": "rel-2"}])
+
+    def test_s3_export_bypasses_object_cache(self):
+        """Streaming every record must not fill (and so evict) the S3 object cache."""
+        class DownloadingS3Service(FakeS3Service):
+            def download_file(self, key):
+                return json.dumps(self.objects[key]).encode("utf-8")
+
+        objects = {f"data/pages/p{i}.json": {"page_id": f"p{i}"} for i in range(5)}
+        cache = S3ObjectCache(max_memory_entries=2)
+        cache.put("data/pages/hot.json", "etag-hot", b'{"page_id": "hot"}')
+        with override_settings(S3_DATA_PREFIX="data/"):
+            storage = S3JSONStorage(s3_service=DownloadingS3Service(objects), object_cache=cache)
+            service = DocumentationExportService(unified_storage=FakeUnifiedStorage(storage))
+            records = list(service.iter_records("pages"))
+        self.assertEqual(len(records), 5)
+        self.assertIsNotNone(cache.get("data/pages/hot.json"))
+        self.assertIsNone(cache.get("data/pages/p0.json"))
+
+    def test_unknown_resource_type(self):
+        service = DocumentationExportService(unified_storage=FakeUnifiedStorage(FakeS3Storage({})))
+        with self.assertRaises(ValueError):
+            list(service.iter_records("widgets"))
+
+    def test_encoders(self):
+        """NDJSON yields one line per record; JSON arrays carry the total."""
+        records = [{"id": i} for i in range(3)]
+        lines = b"".join(iter_ndjson(iter(records))).splitlines()
+        self.assertEqual([json.loads(line) for line in lines], records)
+        document = json.loads(b"".join(iter_json_array(iter(records), "pages")))
+        self.assertEqual(document, {"pages": records, "total": 3})
+        self.assertEqual(json.loads(b"".join(iter_json_array(iter([]), "pages"))), {"pages": [], "total": 0})
+
+
+class ExportViewTest(TestCase):
+    """Test /api/v1/export/<resource_type>/ against local media files."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        pages = Path(self.tmp.name) / "pages"
+        pages.mkdir()
+        for page_id in ("alpha", "beta"):
+            (pages / f"{page_id}.json").write_text(json.dumps({
+                "page_id": page_id, "page_type": "docs", "metadata": {"route": f"/{page_id}"},
+            }))
+        (pages / "index.json").write_text(json.dumps({"total": 2}))
+        self.settings_override = override_settings(MEDIA_ROOT=self.tmp.name, USE_LOCAL_JSON_FILES=True)
+        self.settings_override.enable()
+        self.client = Client()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.tmp.cleanup()
+
+    def test_ndjson_export(self):
+        response = self.client.get("/api/v1/export/pages/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual([json.loads(line)["page_id"] for line in lines], ["alpha", "beta"])
+
+    def test_json_export_with_summary(self):
+        response = self.client.get("/api/v1/export/pages/?format=json&expand=summary")
+        document = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(document["total"], 2)
+        self.assertEqual(document["pages"][0]["route"], "/alpha")
+        self.assertNotIn("metadata", document["pages"][0])
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.client.get("/api/v1/export/widgets/").status_code, 404)
+        self.assertEqual(self.client.get("/api/v1/export/pages/?format=xml").status_code, 400)
@@ -0,0 +1,150 @@
+"""Tests for diff-based media -> S3 sync."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from apps.documentation.services.media_jobs import BulkSyncJob
+from apps.documentation.services.media_sync_service import MediaSyncService
+
+
+class FakeS3Service:
+    """In-memory S3Service with call counters."""
+
+    def __init__(self, etag_is_md5=True):
+        self.objects = {}
+        self.etag_is_md5 = etag_is_md5
+        self.calls = {"list": 0, "upload": 0, "delete": 0}
+        self._lock = threading.Lock()
+
+    def list_files(self, prefix, max_keys=None):
+        self.calls["list"] += 1
+        return [
+            {"key": key, "size": len(body), "last_modified": None, "etag": etag}
+            for key, (body, etag) in self.objects.items()
+            if key.startswith(prefix)
+        ]
+
+    def upload_file(self, file_content, s3_key, content_type="text/plain"):
+        with self._lock:
+            self.calls["upload"] += 1
+            etag = hashlib.md5(file_content).hexdigest() if self.etag_is_md5 else f"kms-{len(self.objects)}"
+            self.objects[s3_key] = (file_content, etag)
+        return etag
+
+    def delete_file(self, s3_key):
+        self.calls["delete"] += 1
+        self.objects.pop(s3_key, None)
+        return True
+
+
+class MediaSyncServiceTestCase(TestCase):
+    """Test MediaSyncService diffing, manifest and orphan deletion."""
+
+    def setUp(self):
+        """Create a temporary media tree."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.media = Path(self.tmp.name)
+        (self.media / "pages").mkdir()
+        for i in range(5):
+            (self.media / "pages" / f"page_{i}.json").write_text(json.dumps({"page_id": f"page_{i}"}))
+        (self.media / "pages" / "index.json").write_text("{}")
+        self.settings_override = override_settings(
+            MEDIA_ROOT=str(self.media),
+            MEDIA_SYNC_MANIFEST_PATH=str(self.media / ".manifest.json"),
+            S3_DATA_PREFIX="data/",
+        )
+        self.settings_override.enable()
+
+    def tearDown(self):
+        """Remove the temporary media tree."""
+        self.settings_override.disable()
+        self.tmp.cleanup()
+
+    def test_first_sync_uploads_everything_then_noop(self):
+        """Test a second sync makes only the listing call."""
+        s3 = FakeS3Service()
+        result = MediaSyncService(s3_service=s3).sync_pages_to_s3()
+        self.assertEqual(result["synced"], 5)
+        self.assertEqual(result["created"], 5)
+        self.assertNotIn("data/pages/index.json", s3.objects)
+
+        s3.calls = {"list": 0, "upload": 0, "delete": 0}
+        result = MediaSyncService(s3_service=s3).sync_pages_to_s3()
+        self.assertEqual(result["synced"], 0)
+        self.assertEqual(result["unchanged"], 5)
+        self.assertEqual(s3.calls, {"list": 1, "upload": 0, "delete": 0})
+
+    def test_only_changed_files_upload(self):
+        """Test editing one file uploads only that file."""
+        s3 = FakeS3Service()
+        MediaSyncService(s3_service=s3).sync_pages_to_s3()
+        changed = self.media / "pages" / "page_2.json"
+        changed.write_text(json.dumps({"page_id": "page_2", "title": "new"}))
+        os.utime(changed, ns=(1, 1))
+
+        s3.calls["upload"] = 0
+        result = MediaSyncService(s3_service=s3).sync_pages_to_s3()
+        self.assertEqual(result["updated"], 1)
+        self.assertEqual(s3.calls["upload"], 1)
+
+    def test_manifest_handles_non_md5_etags(self):
+        """Test unchanged files are skipped when S3 ETags are not content MD5s."""
+        s3 = FakeS3Service(etag_is_md5=False)
+        MediaSyncService(s3_service=s3).sync_pages_to_s3()
+
+        s3.calls["upload"] = 0
+        result = MediaSyncService(s3_service=s3).sync_pages_to_s3()
+        self.assertEqual(result["unchanged"], 5)
+        self.assertEqual(s3.calls["upload"], 0)
+
+    def test_delete_orphans_and_dry_run(self):
+        """Test orphaned remote keys are deleted only when requested."""
+        s3 = FakeS3Service()
+        s3.objects["data/pages/gone.json"] = (b"{}", "x")
+        s3.objects["data/pages/index.json"] = (b"{}", "y")
+
+        plan = MediaSyncService(s3_service=s3).sync_pages_to_s3(dry_run=True, delete_orphans=True)
+        self.assertEqual(plan["synced"], 5)
+        self.assertEqual(plan["deleted"], 1)
+        self.assertEqual(s3.calls["upload"], 0)
+
+        result = MediaSyncService(s3_service=s3).sync_pages_to_s3(delete_orphans=True)
+        self.assertEqual(result["deleted"], 1)
+        self.assertNotIn("data/pages/gone.json", s3.objects)
+        self.assertIn("data/pages/index.json", s3.objects)
+
+    def test_invalid_json_is_not_uploaded(self):
+        """Test corrupt documents are reported instead of published."""
+        (self.media / "pages" / "broken.json").write_text("{oops")
+        s3 = FakeS3Service()
+        result = MediaSyncService(s3_service=s3).sync_pages_to_s3()
+        self.assertEqual(result["errors"], 1)
+        self.assertNotIn("data/pages/broken.json", s3.objects)
+
+    def test_bulk_sync_job_plans_upload_batches(self):
+        """Test the background sync job splits a resource type into upload batches."""
+        s3 = FakeS3Service()
+        s3.objects["data/pages/gone.json"] = (b"{}", "x")
+        params = {"resource_type": "pages", "direction": "to_lambda", "delete_orphans": True}
+        job = BulkSyncJob()
+        with mock.patch("apps.core.services.s3_service.S3Service", return_value=s3), \
+                mock.patch("apps.documentation.services.media_jobs.SYNC_BATCH_SIZE", 2):
+            items = job.plan(params)
+            self.assertEqual([len(item.get("uploads", [])) for item in items], [0, 2, 2, 1, 0])
+            self.assertEqual(items[-1]["deletes"], ["data/pages/gone.json"])
+            totals = {}
+            for item in items:
+                for key, value in job.process(params, item).items():
+                    totals[key] = totals.get(key, 0) + value
+        self.assertEqual(totals["synced"], 5)
+        self.assertEqual(totals["total_files"], 5)
+        self.assertEqual(totals["deleted"], 1)
+        self.assertEqual(s3.calls["upload"], 5)
+        self.assertNotIn("data/pages/gone.json", s3.objects)
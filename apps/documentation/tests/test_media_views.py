@@ -222,12 +222,12 @@ class MediaSyncAPITestCase(BaseAPITestCase):
         self.sync_file_url = reverse('documentation:api_media_sync_file', args=[self.file_path])
         self.bulk_sync_url = reverse('documentation:api_media_bulk_sync')
     
-    @patch('apps.documentation.views.media_views.MediaSyncService')
+    @patch('apps.documentation.views.media_views.MediaManagerService')
     def test_sync_status_api_success(self, mock_service_class):
         """Test successful sync status API."""
         mock_service = Mock()
         mock_service_class.return_value = mock_service
-        mock_service.get_sync_status.return_value = {
+        mock_service.get_sync_summary.return_value = {
             "synced": 10,
             "pending": 2,
             "failed": 0
@@ -242,14 +242,14 @@ class MediaSyncAPITestCase(BaseAPITestCase):
             expected_success=True
         )
     
-    @patch('apps.documentation.views.media_views.MediaSyncService')
+    @patch('apps.documentation.views.media_views.MediaManagerService')
     def test_sync_file_api_success(self, mock_service_class):
         """Test successful file sync API."""
         mock_service = Mock()
         mock_service_class.return_value = mock_service
         mock_service.sync_file.return_value = {
             "path": self.file_path,
-            "synced": True
+            "success": True
         }
         
         response = self.client.post(self.sync_file_url)
@@ -286,16 +286,20 @@ class MediaIndexRegenerationAPITestCase(BaseAPITestCase):
             expected_success=True
         )
     
-    @patch('apps.documentation.views.media_views._regenerate_index')
-    def test_regenerate_all_indexes_api_success(self, mock_regenerate):
-        """Test successful all indexes regeneration."""
-        mock_regenerate.return_value = None
+    @patch('apps.operations.services.OperationsService.start_job')
+    def test_regenerate_all_indexes_api_success(self, mock_start_job):
+        """Test all indexes regeneration is queued as a background operation."""
+        mock_start_job.return_value = {'operation_id': 'op-1', 'status': 'queued'}
         
         response = self.client.post(self.regenerate_all_url)
         
         assert_api_response(
             self,
             response,
-            expected_status=200,
+            expected_status=202,
             expected_success=True
         )
+        data = json.loads(response.content)['data']
+        self.assertEqual(data['operation_id'], 'op-1')
+        self.assertIn('op-1', data['events_url'])
+        self.assertEqual(mock_start_job.call_args[0][0].operation_type, 'regenerate_indexes')
@@ -0,0 +1,120 @@
+"""Tests for the incremental relationship graph model."""
+
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase
+
+from apps.documentation.utils import relationship_graph
+from apps.documentation.utils.relationship_graph import RelationshipGraph
+
+
+def _rel(rel_id, page_id, endpoint_id, usage_type="primary"):
+    return {"relationship_id": rel_id, "page_id": page_id, "endpoint_id": endpoint_id, "usage_type": usage_type}
+
+
+class RelationshipGraphTest(SimpleTestCase):
+
+    def setUp(self):
+        self.graph = RelationshipGraph()
+        self.graph.set_pages([{"page_id": p, "page_type": "docs"} for p in ("p1", "p2", "p3")])
+        self.graph.set_endpoints([{"endpoint_id": e, "method": "QUERY"} for e in ("e1", "e2")])
+        self.graph.set_relationships([
+            _rel("r1", "p1", "e1"),
+            _rel("r2", "p2", "e1", usage_type="secondary"),
+            _rel("r3", "p2", "e2"),
+            _rel("r4", "p3", "missing-endpoint"),
+        ])
+
+    def test_full_graph_hides_edges_to_unknown_nodes(self):
+        result = self.graph.query()
+        self.assertEqual([e["id"] for e in result["edges"]], ["r1", "r2", "r3"])
+        self.assertEqual(result["statistics"]["total_nodes"], 5)
+        self.assertEqual(result["statistics"]["pages_count"], 3)
+
+    def test_k_hop_neighbourhood(self):
+        one_hop = self.graph.query(node="page_p1", hops=1)
+        self.assertEqual({n["id"] for n in one_hop["nodes"]}, {"page_p1", "endpoint_e1"})
+        two_hops = self.graph.query(node="page_p1", hops=2)
+        self.assertEqual({n["id"] for n in two_hops["nodes"]}, {"page_p1", "endpoint_e1", "page_p2"})
+        self.assertEqual({e["id"] for e in two_hops["edges"]}, {"r1", "r2"})
+        self.assertEqual(self.graph.query(node="page_nope")["nodes"], [])
+
+    def test_filters_and_edge_pagination(self):
+        secondary = self.graph.query(filters={"usage_type": "secondary"})
+        self.assertEqual([e["id"] for e in secondary["edges"]], ["r2"])
+
+        first = self.graph.query(offset=0, limit=2)
+        self.assertEqual([e["id"] for e in first["edges"]], ["r1", "r2"])
+        self.assertEqual({n["id"] for n in first["nodes"]}, {"page_p1", "page_p2", "endpoint_e1"})
+        self.assertTrue(first["statistics"]["has_more"])
+        second = self.graph.query(offset=2, limit=2)
+        self.assertEqual([e["id"] for e in second["edges"]], ["r3"])
+        self.assertFalse(second["statistics"]["has_more"])
+
+    def test_include_isolated_nodes_on_first_page(self):
+        self.graph.set_pages([{"page_id": p} for p in ("p1", "p2", "p3", "p4")])
+        first = self.graph.query(offset=0, limit=1, include_isolated=True)
+        self.assertEqual([e["id"] for e in first["edges"]], ["r1"])
+        self.assertEqual(
+            {n["id"] for n in first["nodes"]},
+            {"page_p1", "endpoint_e1", "page_p3", "page_p4"},
+        )
+        second = self.graph.query(offset=1, limit=1, include_isolated=True)
+        self.assertNotIn("page_p4", {n["id"] for n in second["nodes"]})
+
+    def test_incremental_update_and_delete_maintain_adjacency(self):
+        self.graph.add_relationship(_rel("r1", "p3", "e2"))
+        self.assertNotIn("page_p1", self.graph.by_page)
+        self.assertEqual(self.graph.by_endpoint["endpoint_e2"], {"r1", "r3"})
+        self.graph.remove_edge("r3")
+        self.assertEqual(self.graph.by_page["page_p2"], {"r2"})
+        self.assertEqual(self.graph.by_endpoint["endpoint_e2"], {"r1"})
+
+
+class SharedGraphSyncTest(SimpleTestCase):
+
+    def setUp(self):
+        relationship_graph.reset_relationship_graph()
+        self.addCleanup(relationship_graph.reset_relationship_graph)
+        self.pages = Mock(**{"list_pages.return_value": {"pages": [{"page_id": "p1"}]}})
+        self.endpoints = Mock(**{"list_endpoints.return_value": {"endpoints": [{"endpoint_id": "e1"}]}})
+        self.relationships = Mock(**{"list_relationships.return_value": {"relationships": [_rel("r1", "p1", "e1")]}})
+
+    @patch("apps.documentation.utils.relationship_graph.get_generation")
+    def test_local_writes_apply_without_reload(self, mock_generation):
+        generations = {"pages": "p", "endpoints": "e", "relationships": "g1"}
+        mock_generation.side_effect = generations.get
+        services = (self.pages, self.endpoints, self.relationships)
+        self.assertEqual(len(relationship_graph.query_graph(*services)["edges"]), 1)
+
+        # The write bumps the generation; the graph absorbs it instead of reloading
+        generations["relationships"] = "g2"
+        relationship_graph.record_relationship_delete("r1", "g1")
+        self.assertEqual(relationship_graph.query_graph(*services)["edges"], [])
+        self.assertEqual(self.relationships.list_relationships.call_count, 1)
+
+        # A write recorded against an older generation is ignored
+        relationship_graph.record_relationship_write(_rel("r9", "p1", "e1"), "g1")
+        self.assertEqual(relationship_graph.query_graph(*services)["edges"], [])
+
+        # A change made elsewhere moves the generation and reloads only that table
+        generations["relationships"] = "g3"
+        self.assertEqual([e["id"] for e in relationship_graph.query_graph(*services)["edges"]], ["r1"])
+        self.assertEqual(self.relationships.list_relationships.call_count, 2)
+        self.assertEqual(self.pages.list_pages.call_count, 1)
+
+    @patch("apps.documentation.utils.relationship_graph.time.monotonic")
+    @patch("apps.documentation.utils.relationship_graph.get_generation", return_value="g1")
+    def test_tables_reload_after_max_age(self, mock_generation, mock_monotonic):
+        """Without a generation change the graph still reloads once a table is too old."""
+        services = (self.pages, self.endpoints, self.relationships)
+        mock_monotonic.return_value = 1000.0
+        with self.settings(RELATIONSHIP_GRAPH_MAX_AGE=60):
+            relationship_graph.query_graph(*services)
+            mock_monotonic.return_value = 1059.0
+            relationship_graph.query_graph(*services)
+            self.assertEqual(self.relationships.list_relationships.call_count, 1)
+            mock_monotonic.return_value = 1061.0
+            relationship_graph.query_graph(*services)
+        self.assertEqual(self.relationships.list_relationships.call_count, 2)
+        self.assertEqual(self.pages.list_pages.call_count, 2)
@@ -149,6 +149,20 @@ class PagesRepositoryTestCase(TestCase):
             self.repo.create({"metadata": {}})
         self.assertIn("page_id", str(ctx.exception))
 
+    @patch("apps.documentation.schemas.lambda_models.validate_page_data", side_effect=lambda data: data)
+    def test_batch_create_writes_index_once(self, _validate):
+        pages = [{"page_id": f"p{i}", "metadata": {"route": f"/p{i}"}} for i in range(3)]
+
+        result = self.repo.batch_create(pages)
+
+        self.assertEqual([page["page_id"] for page in result], ["p0", "p1", "p2"])
+        self.assertEqual(self.mock_storage.write_json.call_count, 3)
+        self.mock_index.add_item_to_index.assert_not_called()
+        self.mock_index.add_items_to_index.assert_called_once()
+        resource_type, items = self.mock_index.add_items_to_index.call_args[0]
+        self.assertEqual(resource_type, "pages")
+        self.assertEqual([page_id for page_id, _ in items], ["p0", "p1", "p2"])
+
     def test__get_page_key(self):
         key = self.repo._get_page_key("my-page")
         self.assertIn("pages/", key)
@@ -235,6 +249,43 @@ class RelationshipsRepositoryTestCase(TestCase):
         self.mock_index.read_index.assert_called_once_with("relationships")
 
 
+    @patch(
+        "apps.documentation.repositories.relationships_repository.validate_relationship_data",
+        side_effect=lambda data: data,
+    )
+    def test_batch_create_indexes_written_items_once(self, _validate):
+        rels = [RelationshipFactory.create(relationship_id=f"rel-{i}") for i in range(3)]
+
+        def write_json(key, data):
+            if key.endswith("rel-1.json"):
+                raise RuntimeError("upload failed")
+
+        self.mock_storage.write_json.side_effect = write_json
+
+        with self.assertRaises(RepositoryError) as ctx:
+            self.repo.batch_create(rels + [{"metadata": {}}])
+
+        self.assertEqual(ctx.exception.error_code, "BATCH_CREATE_PARTIAL_FAILURE")
+        self.assertIn("2/4", ctx.exception.message)
+        self.mock_index.add_item_to_index.assert_not_called()
+        self.mock_index.add_items_to_index.assert_called_once()
+        resource_type, items = self.mock_index.add_items_to_index.call_args[0]
+        self.assertEqual(resource_type, "relationships")
+        self.assertEqual([rel_id for rel_id, _ in items], ["rel-0", "rel-2"])
+
+    @patch(
+        "apps.documentation.repositories.relationships_repository.validate_relationship_data",
+        side_effect=lambda data: data,
+    )
+    def test_batch_create_can_return_partial_results(self, _validate):
+        rels = [RelationshipFactory.create(relationship_id=f"rel-{i}") for i in range(2)]
+
+        result = self.repo.batch_create(rels + [{"metadata": {}}], raise_on_error=False)
+
+        self.assertEqual([rel["relationship_id"] for rel in result], ["rel-0", "rel-1"])
+        self.mock_index.add_items_to_index.assert_called_once()
+
+
 class PostmanRepositoryTestCase(TestCase):
     """Basic test cases for PostmanRepository."""
 
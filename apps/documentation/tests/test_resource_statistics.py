@@ -0,0 +1,106 @@
+"""Tests for incrementally maintained resource statistics aggregates."""
+
+import copy
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase
+
+from apps.documentation.services.postman_service import PostmanService
+from apps.documentation.utils.resource_statistics import (
+    AGGREGATE_KEY,
+    build_aggregate,
+    read_aggregate,
+)
+from apps.documentation.utils.s3_index_manager import S3IndexManager
+
+
+def _page(page_id, page_type="docs", status="published", uses_endpoints=None):
+    return {
+        "page_id": page_id,
+        "page_type": page_type,
+        "metadata": {"status": status, "route": f"/{page_id}", "uses_endpoints": uses_endpoints or []},
+    }
+
+
+class IndexAggregateMaintenanceTest(SimpleTestCase):
+    """add/remove on the index must keep the aggregate equal to a full rebuild."""
+
+    def setUp(self):
+        self.manager = S3IndexManager(storage=Mock())
+        self.stored = {"version": "2.0", "pages": [], "indexes": {}, "statistics": {}}
+        self.manager.read_index = lambda resource_type, **kwargs: copy.deepcopy(self.stored)
+
+        def update_index(resource_type, data):
+            self.stored = data
+            return True
+
+        self.manager.update_index = update_index
+
+    def test_create_update_delete_match_rebuild(self):
+        documents = {
+            "a": _page("a"),
+            "b": _page("b", page_type="marketing", status="draft"),
+            "c": _page("c", uses_endpoints=[{"endpoint_path": "/x"}]),
+        }
+        for page_id, page in documents.items():
+            self.manager.add_item_to_index("pages", page_id, page)
+        documents["b"] = _page("b", page_type="docs", status="published")
+        self.manager.add_item_to_index("pages", "b", documents["b"])
+        del documents["a"]
+        self.manager.remove_item_from_index("pages", "a")
+
+        aggregate = self.stored[AGGREGATE_KEY]
+        self.assertEqual(aggregate, build_aggregate("pages", documents.values()))
+        self.assertEqual(aggregate["total"], 2)
+        self.assertEqual(aggregate["by_type"], {"docs": 2})
+        self.assertEqual(aggregate["with_endpoints"], {"yes": 1, "no": 1})
+
+    def test_legacy_entries_drop_aggregate(self):
+        """Entries written before per-item stats cannot be subtracted; the aggregate is dropped."""
+        self.stored["pages"] = [{"page_id": "old", "page_type": "docs"}]
+        self.manager.add_item_to_index("pages", "new", _page("new"))
+        self.assertNotIn(AGGREGATE_KEY, self.stored)
+        self.manager.add_item_to_index("pages", "old", _page("old"))
+        self.assertNotIn(AGGREGATE_KEY, self.stored)
+
+
+    def test_bulk_add_matches_single_adds_with_one_write(self):
+        pages = [_page("a"), _page("b", page_type="marketing"), _page("a", status="draft")]
+        for page in pages:
+            self.manager.add_item_to_index("pages", page["page_id"], page)
+        expected = self.stored
+
+        self.stored = {"version": "2.0", "pages": [], "indexes": {}, "statistics": {}}
+        writes = []
+        update_index = self.manager.update_index
+        self.manager.update_index = lambda resource_type, data: writes.append(data) or update_index(resource_type, data)
+        self.manager.add_items_to_index("pages", [(page["page_id"], page) for page in pages])
+
+        self.assertEqual(len(writes), 1)
+        for key in ("pages", "indexes", "total", AGGREGATE_KEY):
+            self.assertEqual(self.stored[key], expected[key])
+
+
+class AggregateReadersTest(SimpleTestCase):
+
+    @patch("apps.documentation.services.get_shared_local_storage")
+    def test_read_aggregate_from_local_index(self, mock_local):
+        aggregate = build_aggregate("postman", [{"state": "published"}, {}])
+        mock_local.return_value.get_index.return_value = {"last_updated": "2024-01-01", AGGREGATE_KEY: aggregate}
+        with self.settings(USE_LOCAL_JSON_FILES=True):
+            result = read_aggregate("postman")
+        self.assertEqual(result["by_state"], {"published": 1, "draft": 1})
+        self.assertEqual(result["last_updated"], "2024-01-01")
+
+        mock_local.return_value.get_index.return_value = {"total": 3}
+        with self.settings(USE_LOCAL_JSON_FILES=True):
+            self.assertIsNone(read_aggregate("postman"))
+
+    @patch("apps.documentation.services.postman_service.read_aggregate")
+    def test_statistics_do_not_list_documents(self, mock_read):
+        mock_read.return_value = {"total": 2, "by_state": {"draft": 2}, "last_updated": "2024-01-01"}
+        service = PostmanService()
+        with patch.object(service, "list_configurations") as mock_list:
+            stats = service.get_statistics()
+        mock_list.assert_not_called()
+        self.assertEqual(stats, {"total_configurations": 2, "by_state": {"draft": 2}, "updated_at": "2024-01-01"})
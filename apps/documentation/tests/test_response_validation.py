@@ -4,13 +4,15 @@ Unit tests for response_validation module.
 
 import json
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from django.http import HttpRequest, JsonResponse
 from pydantic import BaseModel, Field
 from apps.documentation.utils.response_validation import (
     validate_response,
     validate_response_list,
     validate_response_type,
+    get_validation_metrics,
+    reset_validation_metrics,
 )
 from apps.documentation.utils.api_responses import success_response, error_response
 
@@ -247,5 +249,56 @@ class TestResponseTypeValidation(unittest.TestCase):
             test_api(request)
 
 
+class TestStructuredResponseValidation(unittest.TestCase):
+    """Test validation of structured results, sampling and metrics."""
+
+    def setUp(self):
+        reset_validation_metrics()
+
+    def test_api_response_result_is_validated_then_serialised(self):
+        """Views may return an APIResponse; it is serialised after validation."""
+        @validate_response(TestResponseSchema)
+        def test_api(request: HttpRequest):
+            return success_response({"id": 1, "name": "Test"})
+
+        response = test_api(Mock(spec=HttpRequest))
+        self.assertIsInstance(response, JsonResponse)
+        self.assertEqual(json.loads(response.content)['data']['name'], "Test")
+
+    def test_json_response_body_is_not_reparsed(self):
+        """JsonResponses from APIResponse are validated from their payload."""
+        @validate_response_list(TestListResponseSchema)
+        def test_api(request: HttpRequest) -> JsonResponse:
+            return success_response([{"id": 1, "title": "Page 1"}]).to_json_response()
+
+        with patch('apps.documentation.utils.response_validation.json.loads') as mock_loads:
+            response = test_api(Mock(spec=HttpRequest))
+        mock_loads.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        metrics = get_validation_metrics()
+        self.assertEqual(metrics['passed'], 1)
+        self.assertEqual(metrics['reparsed'], 0)
+
+    def test_dict_result_failure(self):
+        @validate_response(TestResponseSchema, validate_data_only=False)
+        def test_api(request: HttpRequest):
+            return {"id": "x"}
+
+        self.assertEqual(test_api(Mock(spec=HttpRequest)).status_code, 500)
+        self.assertEqual(get_validation_metrics()['failed'], 1)
+
+    def test_sampling_skips_validation(self):
+        """With a sample rate of 0 invalid payloads are served and counted as sampled out."""
+        @validate_response(TestResponseSchema, sample_rate=0.0)
+        def test_api(request: HttpRequest):
+            return success_response({"id": 1})
+
+        response = test_api(Mock(spec=HttpRequest))
+        self.assertEqual(response.status_code, 200)
+        metrics = get_validation_metrics()
+        self.assertEqual(metrics['sampled_out'], 1)
+        self.assertEqual(metrics['validated'], 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,147 @@
+"""Tests for ETag-validated S3JSONStorage reads (S3ObjectCache)."""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import boto3
+from django.test import TestCase, override_settings
+from moto import mock_aws
+
+from apps.core.services.s3_client import reset_s3_clients
+from apps.core.services.s3_service import S3Service
+from apps.documentation.repositories.s3_json_storage import S3JSONStorage
+from apps.documentation.repositories.s3_object_cache import S3ObjectCache
+
+BUCKET = 'test-bucket'
+
+
+class CountingS3Service(S3Service):
+    """S3Service that records whether each conditional read was a 304."""
+
+    def __init__(self):
+        super().__init__()
+        self.responses = []
+
+    def download_file_if_changed(self, s3_key, etag=None):
+        content, new_etag = super().download_file_if_changed(s3_key, etag)
+        self.responses.append(304 if content is None else 200)
+        return content, new_etag
+
+
+@override_settings(
+    AWS_ACCESS_KEY_ID='testing',
+    AWS_SECRET_ACCESS_KEY='testing',
+    AWS_REGION='us-east-1',
+    S3_BUCKET_NAME=BUCKET,
+)
+class S3ObjectCacheTest(TestCase):
+    """Test conditional GETs, parse memoization and the disk cache."""
+
+    def setUp(self):
+        self.mock = mock_aws()
+        self.mock.start()
+        reset_s3_clients()
+        self.raw = boto3.client('s3', region_name='us-east-1')
+        self.raw.create_bucket(Bucket=BUCKET)
+        self.service = CountingS3Service()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = S3ObjectCache(cache_dir=self.tmp.name)
+        self.storage = S3JSONStorage(s3_service=self.service, object_cache=self.cache)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        reset_s3_clients()
+        self.mock.stop()
+
+    def _put(self, key, data):
+        self.raw.put_object(Bucket=BUCKET, Key=key, Body=json.dumps(data).encode('utf-8'))
+
+    def test_unchanged_object_revalidates_with_304(self):
+        """Second read of an unchanged object is a 304, not a download."""
+        self._put('models/x/index.json', {'total': 1})
+        self.assertEqual(self.storage.read_json('models/x/index.json'), {'total': 1})
+        self.assertEqual(self.storage.read_json('models/x/index.json'), {'total': 1})
+        self.assertEqual(self.service.responses, [200, 304])
+
+    def test_changed_object_is_refetched(self):
+        """A new object version is downloaded and replaces the cached one."""
+        self._put('a.json', {'v': 1})
+        self.storage.read_json('a.json')
+        self._put('a.json', {'v': 2})
+        self.assertEqual(self.storage.read_json('a.json'), {'v': 2})
+        self.assertEqual(self.service.responses, [200, 200])
+
+    def test_readonly_reads_share_parsed_object(self):
+        """readonly reads reuse the parse for the same ETag; default reads are copies."""
+        self._put('a.json', {'items': [1, 2]})
+        first = self.storage.read_json('a.json', readonly=True)
+        self.assertIs(self.storage.read_json('a.json', readonly=True), first)
+        copy = self.storage.read_json('a.json')
+        self.assertIsNot(copy, first)
+        copy['items'].append(3)
+        self.assertEqual(self.storage.read_json('a.json', readonly=True), {'items': [1, 2]})
+
+    def test_write_primes_cache(self):
+        """write_json records the written version so the next read is a 304."""
+        self.storage.write_json('w.json', {'a': 1})
+        self.assertEqual(self.storage.read_json('w.json'), {'a': 1})
+        self.assertEqual(self.service.responses, [304])
+
+    def test_delete_and_missing(self):
+        """Deleted or vanished objects read as None and are evicted."""
+        self.storage.write_json('d.json', {'a': 1})
+        self.storage.delete_json('d.json')
+        self.assertIsNone(self.cache.get('d.json'))
+        self.assertIsNone(self.storage.read_json('d.json'))
+
+        self._put('gone.json', {'a': 1})
+        self.storage.read_json('gone.json')
+        self.raw.delete_object(Bucket=BUCKET, Key='gone.json')
+        self.assertIsNone(self.storage.read_json('gone.json'))
+        self.assertIsNone(self.cache.get('gone.json'))
+
+    def test_disk_cache_survives_new_process(self):
+        """A fresh cache over the same directory revalidates instead of downloading."""
+        self._put('big/index.json', {'items': list(range(100))})
+        self.storage.read_json('big/index.json')
+
+        fresh = S3JSONStorage(s3_service=self.service, object_cache=S3ObjectCache(cache_dir=self.tmp.name))
+        self.assertEqual(fresh.read_json('big/index.json'), {'items': list(range(100))})
+        self.assertEqual(self.service.responses, [200, 304])
+
+
+class S3ObjectCacheDiskBudgetTest(TestCase):
+    """The on-disk copy stays within its byte budget, evicting LRU entries."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _disk_bytes(self):
+        return sum(path.stat().st_size for path in self.dir.glob('*.obj'))
+
+    def test_disk_pruned_least_recently_used_first(self):
+        cache = S3ObjectCache(cache_dir=self.dir, max_memory_entries=1, max_disk_bytes=10_000)
+        body = b'x' * 900
+        cache.put('keep.json', 'e0', body)
+        for i in range(30):
+            path = cache._disk_path('keep.json')
+            # Age every other entry so 'keep.json' is always the freshest
+            for other in self.dir.glob('*.obj'):
+                if other != path:
+                    os.utime(other, (1, 1))
+            cache.put(f'item-{i}.json', f'e{i}', body)
+            self.assertLessEqual(self._disk_bytes(), 10_000)
+        fresh = S3ObjectCache(cache_dir=self.dir)
+        self.assertEqual(fresh.get('keep.json').etag, 'e0')
+        self.assertIsNone(fresh.get('item-0.json'))
+
+    def test_oversized_object_stays_in_memory_only(self):
+        cache = S3ObjectCache(cache_dir=self.dir, max_disk_bytes=1_000)
+        cache.put('big.json', 'e', b'x' * 2_000)
+        self.assertEqual(self._disk_bytes(), 0)
+        self.assertEqual(cache.get('big.json').etag, 'e')
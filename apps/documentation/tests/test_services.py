@@ -322,6 +322,52 @@ class RelationshipsServiceTestCase(TestCase):
         mock_repo.create.assert_called_once()
 
 
+class BulkCreateServiceTestCase(TestCase):
+    """Bulk creates write once and do the cache/graph bookkeeping once per batch."""
+
+    def _rel(self, relationship_id):
+        return {
+            "relationship_id": relationship_id,
+            "page_path": "/page",
+            "endpoint_path": "/api/endpoint",
+            "method": "QUERY",
+        }
+
+    @patch('apps.documentation.services.relationships_service.record_relationship_writes')
+    def test_create_relationships(self, mock_record):
+        mock_storage, mock_repo = Mock(), Mock()
+        mock_repo.batch_create.side_effect = lambda rels, raise_on_error: [r for r in rels if r["relationship_id"] != "rel-1"]
+        service = RelationshipsService(unified_storage=mock_storage, repository=mock_repo, local_storage=Mock())
+
+        result = service.create_relationships([self._rel("rel-0"), self._rel("rel-1"), {"relationship_id": "bad"}])
+
+        self.assertEqual([r["relationship_id"] for r in result["created"]], ["rel-0"])
+        self.assertEqual(result["failed"], ["bad", "rel-1"])
+        mock_repo.batch_create.assert_called_once()
+        mock_repo.create.assert_not_called()
+        mock_storage.clear_cache.assert_called_once_with('relationships')
+        mock_record.assert_called_once()
+        self.assertEqual(mock_record.call_args[0][0], result["created"])
+
+    @patch('apps.documentation.utils.data_transformers.DataTransformer.django_to_lambda_page', side_effect=lambda data: data)
+    def test_create_pages(self, _transform):
+        mock_storage, mock_repo = Mock(), Mock()
+        mock_repo.batch_create.side_effect = lambda pages, raise_on_error: pages
+        service = PagesService(unified_storage=mock_storage, repository=mock_repo)
+
+        result = service.create_pages([
+            {"page_id": "p1", "title": "One"},
+            {"page_id": "p2", "title": "Two"},
+            {"page_id": "p3"},
+        ])
+
+        self.assertEqual([p["page_id"] for p in result["created"]], ["p1", "p2"])
+        self.assertEqual(result["failed"], ["p3"])
+        mock_repo.batch_create.assert_called_once()
+        self.assertFalse(mock_repo.batch_create.call_args.kwargs["raise_on_error"])
+        mock_storage.clear_cache.assert_called_once_with('pages')
+
+
 class PostmanServiceTestCase(TestCase):
     """Test cases for PostmanService."""
     
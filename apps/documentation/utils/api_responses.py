@@ -7,6 +7,8 @@ import logging
 from typing import Any, Dict, Optional
 from django.http import JsonResponse
 
+from apps.core.utils.json_codec import CodecJsonResponse
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,12 +73,19 @@ class APIResponse:
         return response
 
     def to_json_response(self) -> JsonResponse:
-        """Convert to Django JsonResponse."""
-        return JsonResponse(
-            self.to_dict(),
+        """Convert to Django JsonResponse.
+
+        The structured payload is kept on ``response.payload`` so response
+        validation never has to parse the serialised body again.
+        """
+        payload = self.to_dict()
+        response = CodecJsonResponse(
+            payload,
             status=self.status_code,
             safe=False
         )
+        response.payload = payload
+        return response
 
 
 # Convenience functions
@@ -85,6 +94,11 @@ def success_response(data: Any = None, message: str = "", meta: Optional[Dict] =
     return APIResponse(success=True, data=data, message=message, meta=meta)
 
 
+def accepted_response(data: Any = None, message: str = "") -> APIResponse:
+    """Create 202 response for work queued to run in the background."""
+    return APIResponse(success=True, data=data, message=message, status_code=202)
+
+
 def error_response(message: str = "An error occurred", errors: Optional[list] = None,
                   status_code: int = 400) -> APIResponse:
     """Create error response."""
@@ -105,6 +119,20 @@ def paginated_response(data: Any, total: int, page: int = 1, page_size: int = 50
     return APIResponse(success=True, data=data, message=message, meta=meta)
 
 
+def cursor_paginated_response(data: Any, total: int, page_size: int, next_cursor: Optional[str],
+                              has_more: bool, message: str = "") -> APIResponse:
+    """Create keyset-paginated response (clients pass next_cursor back as ?cursor=)."""
+    meta = {
+        "pagination": {
+            "total": total,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        }
+    }
+    return APIResponse(success=True, data=data, message=message, meta=meta)
+
+
 def validation_error_response(errors: list) -> APIResponse:
     """Create validation error response."""
     return APIResponse(
@@ -24,16 +24,23 @@ def cache_documentation_get(
     Cache GET responses for documentation API v1.
 
     Same as core cache_response but with namespace=documentation_api and
-    default timeout suitable for list/statistics/format endpoints.
+    default timeout suitable for list/statistics/format endpoints. Under
+    conditional_documentation_get the key includes the resource generation,
+    so a cached body is never older than the ETag sent with it.
     """
     return cache_response(
         timeout=timeout,
         key_prefix=key_prefix or "doc_api",
         namespace=DOCUMENTATION_CACHE_NAMESPACE,
         vary_on_query_params=vary_on_query_params,
+        vary_on=_docs_generation,
     )
 
 
+def _docs_generation(request) -> str:
+    return getattr(request, "docs_generation", "")
+
+
 # Convenience for common TTLs (in seconds)
 CACHE_SHORT = 60
 CACHE_MEDIUM = 300
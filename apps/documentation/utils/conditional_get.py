@@ -0,0 +1,199 @@
+"""
+Conditional GET (ETag / If-None-Match) support for documentation API v1.
+
+ETags are derived from a per-resource-type *generation* instead of the
+response body, so an unchanged resource is answered with 304 before any
+storage access or serialization. Every worker must compute the same
+generation for the same data, so it is built only from shared state:
+
+- a write token, changed by ``bump_generation`` whenever UnifiedStorage
+  clears a resource type's cache (every create/update/delete and index
+  update goes through it). It is a counter in the Django cache when that
+  cache is shared (Redis, memcached, database, file based); with a
+  per-process cache (LocMem, Dummy) it is a marker file under
+  DOCS_GENERATION_DIR, shared by the workers of one host. Multi-host
+  deployments therefore need a shared cache (USE_REDIS_CACHE).
+- the mtime and size of the local ``media/<type>/index.json``, so index
+  regeneration and media syncs also change the ETag.
+"""
+
+import hashlib
+import logging
+import os
+import uuid
+from functools import wraps
+from typing import Callable, Dict, Iterable, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+from apps.documentation.utils.paths import (
+    get_endpoints_dir,
+    get_pages_dir,
+    get_postman_dir,
+    get_relationships_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+GENERATION_CACHE_PREFIX = "docs_generation"
+# Counters outlive response caches; they only need to survive between writes
+GENERATION_CACHE_TTL = 7 * 24 * 3600
+
+RESOURCE_TYPES = ("pages", "endpoints", "relationships", "postman")
+
+_INDEX_DIRS: Dict[str, Callable] = {
+    "pages": get_pages_dir,
+    "endpoints": get_endpoints_dir,
+    "relationships": get_relationships_dir,
+    "postman": get_postman_dir,
+}
+
+# Cache-Control per endpoint class. Lists and details must revalidate on
+# every use (cheap thanks to 304s); format/example payloads are static.
+CACHE_CONTROL = {
+    "list": "private, no-cache",
+    "detail": "private, no-cache",
+    "stats": "private, max-age=60, must-revalidate",
+    "static": "public, max-age=3600",
+}
+
+
+def _counter_key(resource_type: str) -> str:
+    return f"{GENERATION_CACHE_PREFIX}:{resource_type}"
+
+
+def _backend():
+    return caches["default"]
+
+
+def _shared_cache():
+    """The default cache if every worker sees the same one, else None."""
+    backend = _backend()
+    return None if isinstance(backend, (LocMemCache, DummyCache)) else backend
+
+
+def _marker_path(resource_type: str) -> str:
+    return os.path.join(settings.DOCS_GENERATION_DIR, resource_type)
+
+
+def _write_token(resource_type: str) -> str:
+    shared = _shared_cache()
+    if shared is not None:
+        key = _counter_key(resource_type)
+        value = shared.get(key)
+        if value is None:
+            # A lost counter restarts at 0; the index stat still tells versions apart
+            shared.add(key, 0, GENERATION_CACHE_TTL)
+            value = shared.get(key, 0)
+        return str(value)
+    try:
+        stat = os.stat(_marker_path(resource_type))
+    except OSError:
+        return "0"
+    # The marker is replaced on every bump, so the inode changes even within one mtime tick
+    return f"{stat.st_mtime_ns}-{stat.st_ino}"
+
+
+def bump_generation(*resource_types: str) -> None:
+    """Mark resource types as changed (all types when none are given)."""
+    shared = _shared_cache()
+    for resource_type in resource_types or RESOURCE_TYPES:
+        try:
+            if shared is not None:
+                key = _counter_key(resource_type)
+                try:
+                    shared.incr(key)
+                except ValueError:
+                    # Missing counter: start above the implicit 0 of a cold cache
+                    shared.set(key, 1, GENERATION_CACHE_TTL)
+            else:
+                path = _marker_path(resource_type)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+                with open(tmp, "w") as f:
+                    f.write(uuid.uuid4().hex)
+                os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"Failed to bump generation for {resource_type}: {e}")
+
+
+def get_generation(resource_type: str) -> str:
+    """Current generation token for one resource type."""
+    index_dir = _INDEX_DIRS.get(resource_type)
+    index_stat = "0"
+    if index_dir is not None:
+        try:
+            stat = (index_dir() / "index.json").stat()
+            index_stat = f"{stat.st_mtime_ns}-{stat.st_size}"
+        except OSError:
+            pass
+    try:
+        token = _write_token(resource_type)
+    except Exception as e:
+        logger.warning(f"Generation lookup failed for {resource_type}: {e}")
+        token = "0"
+    return f"{token}.{index_stat}"
+
+
+def compute_etag(request: HttpRequest, resource_types: Iterable[str], variant: str = "") -> str:
+    """Strong ETag for a request: path + query + generations (no body hashing)."""
+    query = "&".join(sorted(f"{k}={v}" for k, values in request.GET.lists() for v in values))
+    generations = ",".join(get_generation(rt) for rt in resource_types)
+    raw = f"{variant}|{request.path}|{query}|{generations}"
+    return '"%s"' % hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _etag_matches(request: HttpRequest, etag: str) -> bool:
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return "*" in etags or etag in etags
+
+
+def conditional_documentation_get(
+    resource_types: Tuple[str, ...],
+    endpoint_class: str = "list",
+):
+    """
+    Add ETag / If-None-Match handling to a documentation GET view.
+
+    Apply above ``cache_documentation_get`` so a matching request is answered
+    with 304 before the response cache or storage are touched. The generation
+    token is exposed as ``request.docs_generation`` so the response cache can
+    key on it and never serve a body older than the ETag.
+
+    Args:
+        resource_types: Resource types the response is derived from
+        endpoint_class: Key of CACHE_CONTROL ('list', 'detail', 'stats', 'static')
+    """
+    cache_control = CACHE_CONTROL[endpoint_class]
+
+    def decorator(view_func: Callable) -> Callable:
+        @wraps(view_func)
+        def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            if request.method not in ("GET", "HEAD"):
+                return view_func(request, *args, **kwargs)
+
+            etag = compute_etag(request, resource_types, variant=view_func.__name__)
+            if _etag_matches(request, etag):
+                response = HttpResponseNotModified()
+                response["ETag"] = etag
+                response["Cache-Control"] = cache_control
+                return response
+
+            request.docs_generation = etag
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200 and not response.has_header("ETag"):
+                response["ETag"] = etag
+                if not response.has_header("Cache-Control"):
+                    response["Cache-Control"] = cache_control
+            return response
+
+        return wrapper
+    return decorator
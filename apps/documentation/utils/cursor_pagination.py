@@ -0,0 +1,243 @@
+"""
+Cursor-based (keyset) pagination for documentation list APIs.
+
+A filtered result set is sorted once into a ``KeysetIndex`` of
+``(updated_at, id)`` keys and kept per process until the resource type's
+generation changes (see ``conditional_get``). The index never holds full
+records: each page is a bisect plus a bounded slice of keys. Default
+(list-item) responses are served from the small summaries the index keeps
+per id, without any storage read; ``expand=full`` pages load their records
+by id through the resource's service (the same path as the detail
+endpoints).
+
+Cursors are opaque, URL-safe tokens encoding the last key of the previous
+page; clients pass back ``next_cursor`` unchanged.
+"""
+
+import base64
+import json
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from apps.documentation.utils.conditional_get import get_generation
+
+# Identifier field per resource type (first non-empty value wins)
+ID_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "pages": ("page_id",),
+    "endpoints": ("endpoint_id",),
+    "relationships": ("relationship_id",),
+    "postman": ("config_id", "id"),
+}
+
+MAX_CURSOR_PAGE_SIZE = 500
+# Distinct (resource type, filters) key sets kept per process
+MAX_KEYSET_INDEXES = 64
+# Parallel by-id reads when loading one page
+PAGE_FETCH_WORKERS = 8
+
+SortKey = Tuple[str, str]
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor token cannot be decoded."""
+
+
+def record_sort_key(record: Dict[str, Any], resource_type: str) -> SortKey:
+    """``(updated_at, id)`` key for a record; missing values sort first."""
+    metadata = record.get("metadata") or {}
+    updated = (
+        record.get("updated_at")
+        or metadata.get("last_updated")
+        or record.get("created_at")
+        or ""
+    )
+    record_id = next(
+        (record.get(f) for f in ID_FIELDS.get(resource_type, ("id",)) if record.get(f)),
+        "",
+    )
+    return str(updated), str(record_id)
+
+
+def encode_cursor(key: SortKey) -> str:
+    raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Optional[SortKey]:
+    """Decode a cursor token; an empty token means "first page"."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        updated, record_id = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {token}") from e
+    return str(updated), str(record_id)
+
+
+class KeysetIndex:
+    """
+    Sorted ``(updated_at, id)`` keys of a result set, paged by seeking past the
+    previous key, plus optional per-id list summaries.
+    """
+
+    def __init__(self, keys: Iterable[SortKey], summaries: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.keys: List[SortKey] = sorted(keys)
+        self.summaries = summaries
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        resource_type: str,
+        project: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> "KeysetIndex":
+        """
+        Index the keys of records (and their ``project``-ed summaries);
+        records without an id cannot be fetched and are left out.
+        """
+        keys: List[SortKey] = []
+        summaries: Optional[Dict[str, Dict[str, Any]]] = {} if project else None
+        for record in records:
+            key = record_sort_key(record, resource_type)
+            if not key[1]:
+                continue
+            keys.append(key)
+            if project:
+                summaries[key[1]] = project(record)
+        return cls(keys, summaries)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def page(
+        self,
+        after: Optional[SortKey],
+        limit: int,
+        fetch: Callable[[List[str]], Dict[str, Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        One page of records after ``after``.
+
+        Args:
+            after: Last key of the previous page (None for the first page)
+            limit: Page size
+            fetch: Loads records for a list of ids, returning ``{id: record}``
+        """
+        start = bisect_right(self.keys, after) if after is not None else 0
+        end = min(start + limit, len(self.keys))
+        has_more = end < len(self.keys)
+        ids = [record_id for _, record_id in self.keys[start:end]]
+        records = fetch(ids) if ids else {}
+        return {
+            # Records deleted since the index was built are skipped
+            "items": [records[record_id] for record_id in ids if records.get(record_id)],
+            "next_cursor": encode_cursor(self.keys[end - 1]) if has_more and end > start else None,
+            "has_more": has_more,
+            "total": len(self.keys),
+        }
+
+
+def fetch_records(resource_type: str, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Load records by id through the resource's service, a few at a time in parallel."""
+    from apps.documentation import services
+
+    getters: Dict[str, Callable[[str], Optional[Dict[str, Any]]]] = {
+        "pages": lambda record_id: services.get_pages_service().get_page(record_id),
+        "endpoints": lambda record_id: services.get_endpoints_service().get_endpoint(record_id),
+        "relationships": lambda record_id: services.get_relationships_service().get_relationship(record_id),
+        "postman": lambda record_id: services.get_postman_service().get_configuration(record_id),
+    }
+    get = getters[resource_type]
+    with ThreadPoolExecutor(max_workers=max(1, min(PAGE_FETCH_WORKERS, len(ids)))) as executor:
+        return dict(zip(ids, executor.map(get, ids)))
+
+
+_indexes: "OrderedDict[Tuple, Tuple[str, KeysetIndex]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_keyset_index(
+    resource_type: str,
+    filters: Dict[str, Any],
+    loader: Callable[[], List[Dict[str, Any]]],
+    project: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+) -> KeysetIndex:
+    """
+    Return the sorted key index for a filtered result set, rebuilding it only
+    when the resource type's generation has changed. Only the keys (and the
+    ``project``-ed summaries) are kept; the loaded records are discarded once
+    indexed.
+
+    Args:
+        resource_type: 'pages', 'endpoints', 'relationships' or 'postman'
+        filters: Filter values that identify the result set
+        loader: Returns every matching record (no limit/offset)
+        project: Builds the list summary kept for each record
+    """
+    cache_key = (
+        resource_type,
+        tuple(sorted((k, str(v)) for k, v in filters.items() if v is not None)),
+        project,
+    )
+    generation = get_generation(resource_type)
+    with _lock:
+        entry = _indexes.get(cache_key)
+        if entry is not None and entry[0] == generation:
+            _indexes.move_to_end(cache_key)
+            return entry[1]
+
+    index = KeysetIndex.from_records(loader(), resource_type, project)
+    with _lock:
+        _indexes[cache_key] = (generation, index)
+        _indexes.move_to_end(cache_key)
+        while len(_indexes) > MAX_KEYSET_INDEXES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def reset_keyset_indexes() -> None:
+    """Drop all cached keyset indexes (tests)."""
+    with _lock:
+        _indexes.clear()
+
+
+def wants_cursor(query_params: Any) -> bool:
+    """Cursor mode is selected by passing ``cursor`` (empty for the first page)."""
+    return "cursor" in query_params
+
+
+def cursor_page(
+    resource_type: str,
+    query_params: Any,
+    filters: Dict[str, Any],
+    loader: Callable[[], List[Dict[str, Any]]],
+    default_limit: int = 50,
+    fetch: Optional[Callable[[List[str]], Dict[str, Dict[str, Any]]]] = None,
+    project: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    full: bool = False,
+) -> Dict[str, Any]:
+    """
+    Serve one keyset page for a list request.
+
+    With ``project`` and not ``full``, items are the list summaries kept in
+    the index and no record is read. Otherwise ``fetch`` loads the page's
+    records by id (default: ``fetch_records``).
+
+    Raises:
+        InvalidCursor: If the cursor token is malformed
+        ValueError: If limit is not an integer
+    """
+    limit = max(1, min(int(query_params.get("limit") or default_limit), MAX_CURSOR_PAGE_SIZE))
+    after = decode_cursor(query_params.get("cursor", ""))
+    index = get_keyset_index(resource_type, filters, loader, project if not full else None)
+    if index.summaries is not None:
+        summaries = index.summaries
+        result = index.page(after, limit, lambda ids: {record_id: summaries.get(record_id) for record_id in ids})
+    else:
+        result = index.page(after, limit, fetch or (lambda ids: fetch_records(resource_type, ids)))
+    result["limit"] = limit
+    return result
@@ -67,6 +67,14 @@ def get_project_dir() -> Path:
     return get_media_root() / "project"
 
 
+def get_media_sync_manifest_path() -> Path:
+    """Get path of the local manifest of content hashes uploaded by media -> S3 sync."""
+    manifest = getattr(settings, "MEDIA_SYNC_MANIFEST_PATH", None)
+    if manifest:
+        return Path(manifest)
+    return get_media_root() / ".s3_sync_manifest.json"
+
+
 def get_scripts_dir() -> Path:
     """Get scripts directory."""
     return Path(settings.BASE_DIR) / "scripts"
@@ -0,0 +1,381 @@
+"""
+In-process page–endpoint graph shared by the dashboard graph, the
+relationship graph API and the graph app.
+
+Nodes (pages, endpoints) and edges (relationships) are loaded once per
+process and then kept current:
+
+- relationship writes made through ``RelationshipsService`` are applied in
+  place via ``record_relationship_write`` / ``record_relationship_delete``,
+  updating the edge table and the by-page / by-endpoint adjacency sets;
+- any other change (another process, index regeneration, page or endpoint
+  edits) shows up as a new ``conditional_get`` generation and reloads only
+  the affected table.
+
+Tables reloaded by generation are also reloaded once they are older than
+RELATIONSHIP_GRAPH_MAX_AGE seconds, which bounds staleness when a change
+does not move the generation (e.g. a write on another host without a
+shared cache).
+
+Queries return a subset of the graph: k-hop neighbourhoods, node/edge
+attribute filters and offset/limit pages of edges, so views serialise only
+what is visible.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+
+from apps.documentation.utils.conditional_get import get_generation
+
+logger = logging.getLogger(__name__)
+
+GRAPH_RESOURCE_TYPES = ("pages", "endpoints", "relationships")
+MAX_GRAPH_HOPS = 5
+# Edge filters apply to relationship fields, node filters to node data
+EDGE_FILTERS = ("usage_type", "usage_context")
+NODE_FILTERS = ("page_type", "method", "api_version")
+
+Edge = Tuple[str, str, Dict[str, Any]]
+
+
+def page_node_id(key: str) -> str:
+    return f"page_{key}"
+
+
+def endpoint_node_id(key: str) -> str:
+    return f"endpoint_{key}"
+
+
+def _page_node(page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    page_id = page.get("page_id") or page.get("_id")
+    if not page_id:
+        return None
+    metadata = page.get("metadata") or {}
+    content_sections = metadata.get("content_sections") or {}
+    return {
+        "id": page_node_id(page_id),
+        "label": content_sections.get("title") or page_id,
+        "type": "page",
+        "data": {
+            "page_id": page_id,
+            "route": metadata.get("route") or page.get("route"),
+            "page_type": page.get("page_type"),
+            "status": metadata.get("status"),
+        },
+    }
+
+
+def _endpoint_node(endpoint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    endpoint_id = endpoint.get("endpoint_id") or endpoint.get("_id")
+    if not endpoint_id:
+        return None
+    return {
+        "id": endpoint_node_id(endpoint_id),
+        "label": endpoint_id,
+        "type": "endpoint",
+        "data": {
+            "endpoint_id": endpoint_id,
+            "endpoint_path": endpoint.get("endpoint_path"),
+            "method": endpoint.get("method", "QUERY"),
+            "api_version": endpoint.get("api_version"),
+        },
+    }
+
+
+def _edge_payload(edge_id: str, source: str, target: str, rel: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": edge_id,
+        "source": source,
+        "target": target,
+        "type": rel.get("usage_type", "primary"),
+        "label": rel.get("usage_type", "primary"),
+        "data": {
+            "relationship_id": rel.get("relationship_id"),
+            "usage_type": rel.get("usage_type"),
+            "usage_context": rel.get("usage_context"),
+            "method": rel.get("method"),
+        },
+    }
+
+
+class RelationshipGraph:
+    """Node tables plus an edge table with adjacency sets by page and by endpoint."""
+
+    def __init__(self) -> None:
+        self.nodes: Dict[str, Dict[str, Dict[str, Any]]] = {"page": {}, "endpoint": {}}
+        self.edges: Dict[str, Edge] = {}
+        self.by_page: Dict[str, Set[str]] = {}
+        self.by_endpoint: Dict[str, Set[str]] = {}
+
+    def set_pages(self, pages: Iterable[Dict[str, Any]]) -> None:
+        self.nodes["page"] = self._node_table(pages, _page_node)
+
+    def set_endpoints(self, endpoints: Iterable[Dict[str, Any]]) -> None:
+        self.nodes["endpoint"] = self._node_table(endpoints, _endpoint_node)
+
+    @staticmethod
+    def _node_table(records: Iterable[Dict[str, Any]], build: Callable) -> Dict[str, Dict[str, Any]]:
+        table: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            node = build(record) if isinstance(record, dict) else None
+            if node is not None and node["id"] not in table:
+                table[node["id"]] = node
+        return table
+
+    def set_relationships(self, relationships: Iterable[Dict[str, Any]]) -> None:
+        self.edges, self.by_page, self.by_endpoint = {}, {}, {}
+        for rel in relationships:
+            if isinstance(rel, dict):
+                self.add_relationship(rel)
+
+    def add_relationship(self, rel: Dict[str, Any]) -> Optional[str]:
+        """Insert or replace the edge for one relationship; returns its edge id."""
+        pid = rel.get("page_id") or rel.get("page_path")
+        eid = rel.get("endpoint_id") or rel.get("endpoint_path")
+        if not pid or not eid:
+            return None
+        source, target = page_node_id(pid), endpoint_node_id(eid)
+        edge_id = rel.get("relationship_id") or f"{source}_{target}"
+        self.remove_edge(edge_id)
+        self.edges[edge_id] = (source, target, rel)
+        self.by_page.setdefault(source, set()).add(edge_id)
+        self.by_endpoint.setdefault(target, set()).add(edge_id)
+        return edge_id
+
+    def remove_edge(self, edge_id: str) -> bool:
+        edge = self.edges.pop(edge_id, None)
+        if edge is None:
+            return False
+        for adjacency, node_id in ((self.by_page, edge[0]), (self.by_endpoint, edge[1])):
+            edge_ids = adjacency.get(node_id)
+            if edge_ids is not None:
+                edge_ids.discard(edge_id)
+                if not edge_ids:
+                    del adjacency[node_id]
+        return True
+
+    def node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        return self.nodes["page"].get(node_id) or self.nodes["endpoint"].get(node_id)
+
+    def _visible(self, edge_id: str) -> bool:
+        source, target, _ = self.edges[edge_id]
+        return source in self.nodes["page"] and target in self.nodes["endpoint"]
+
+    def incident_edges(self, node_id: str) -> Set[str]:
+        return self.by_page.get(node_id) or self.by_endpoint.get(node_id) or set()
+
+    def neighbourhood(self, node_id: str, hops: int = 1) -> Tuple[Set[str], Set[str]]:
+        """Node and edge ids within ``hops`` edges of ``node_id`` (breadth-first)."""
+        if self.node(node_id) is None:
+            return set(), set()
+        seen_nodes, seen_edges = {node_id}, set()
+        frontier = deque([(node_id, 0)])
+        while frontier:
+            current, depth = frontier.popleft()
+            if depth >= hops:
+                continue
+            for edge_id in self.incident_edges(current):
+                if edge_id in seen_edges or not self._visible(edge_id):
+                    continue
+                seen_edges.add(edge_id)
+                source, target, _ = self.edges[edge_id]
+                other = target if current == source else source
+                if other not in seen_nodes:
+                    seen_nodes.add(other)
+                    frontier.append((other, depth + 1))
+        return seen_nodes, seen_edges
+
+    def query(
+        self,
+        node: Optional[str] = None,
+        hops: int = 1,
+        node_type: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        include_isolated: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Subgraph as ``{nodes, edges, statistics}``.
+
+        Args:
+            node: Centre node id ('page_<id>' / 'endpoint_<id>') for a k-hop view
+            hops: Neighbourhood radius when ``node`` is given
+            node_type: Keep only 'page' or 'endpoint' nodes (and edges between kept nodes)
+            filters: Values for NODE_FILTERS (node data) and EDGE_FILTERS (relationship fields)
+            offset, limit: Page of edges to return; nodes are then those the page touches
+            include_isolated: With ``limit``, also return kept nodes without any kept
+                edge on the first page (offset 0)
+        """
+        filters = {k: v for k, v in (filters or {}).items() if v not in (None, "")}
+        if node:
+            node_ids, edge_ids = self.neighbourhood(node, max(0, min(hops, MAX_GRAPH_HOPS)))
+        else:
+            node_ids = set(self.nodes["page"]) | set(self.nodes["endpoint"])
+            edge_ids = None
+
+        def keep_node(node_id: str) -> bool:
+            data = self.node(node_id)
+            if node_type and data["type"] != node_type:
+                return False
+            return all(
+                data["data"].get(k) == v
+                for k, v in filters.items()
+                if k in NODE_FILTERS and k in data["data"]
+            )
+
+        if node_type or any(k in NODE_FILTERS for k in filters):
+            node_ids = {n for n in node_ids if keep_node(n)}
+
+        ordered_edges: List[str] = []
+        for edge_id in self.edges if edge_ids is None else sorted(edge_ids):
+            source, target, rel = self.edges[edge_id]
+            if source not in node_ids or target not in node_ids or not self._visible(edge_id):
+                continue
+            if any(rel.get(k) != v for k, v in filters.items() if k in EDGE_FILTERS):
+                continue
+            ordered_edges.append(edge_id)
+
+        total_edges = len(ordered_edges)
+        if limit is not None:
+            if include_isolated and offset == 0:
+                connected = {n for edge_id in ordered_edges for n in self.edges[edge_id][:2]}
+                isolated = node_ids - connected
+            else:
+                isolated = set()
+            ordered_edges = ordered_edges[offset:offset + limit]
+            node_ids = {n for edge_id in ordered_edges for n in self.edges[edge_id][:2]} | isolated
+            if node and self.node(node) is not None:
+                node_ids.add(node)
+
+        nodes = [n for table in self.nodes.values() for node_id, n in table.items() if node_id in node_ids]
+        edges = [_edge_payload(edge_id, *self.edges[edge_id]) for edge_id in ordered_edges]
+        pages_count = sum(1 for n in nodes if n["type"] == "page")
+        statistics = {
+            "total_nodes": len(nodes),
+            "total_edges": total_edges,
+            "pages_count": pages_count,
+            "endpoints_count": len(nodes) - pages_count,
+            "relationships_count": total_edges,
+        }
+        if limit is not None:
+            statistics.update({
+                "offset": offset,
+                "limit": limit,
+                "returned_edges": len(edges),
+                "has_more": offset + len(edges) < total_edges,
+            })
+        return {"nodes": nodes, "edges": edges, "statistics": statistics}
+
+
+_graph = RelationshipGraph()
+_generations: Dict[str, str] = {}
+_loaded_at: Dict[str, float] = {}
+_lock = threading.RLock()
+
+
+def _loaders(pages_service: Any, endpoints_service: Any, relationships_service: Any) -> Dict[str, Callable[[], None]]:
+    from apps.documentation.services import (
+        get_endpoints_service,
+        get_pages_service,
+        get_relationships_service,
+    )
+    pages_service = pages_service or get_pages_service()
+    endpoints_service = endpoints_service or get_endpoints_service()
+    relationships_service = relationships_service or get_relationships_service()
+    return {
+        "pages": lambda: _graph.set_pages(pages_service.list_pages(limit=None).get("pages", [])),
+        "endpoints": lambda: _graph.set_endpoints(endpoints_service.list_endpoints(limit=None).get("endpoints", [])),
+        "relationships": lambda: _graph.set_relationships(
+            relationships_service.list_relationships(limit=None).get("relationships", [])
+        ),
+    }
+
+
+def _sync(
+    pages_service: Any = None,
+    endpoints_service: Any = None,
+    relationships_service: Any = None,
+    resource_types: Tuple[str, ...] = GRAPH_RESOURCE_TYPES,
+) -> None:
+    """Reload each table whose generation moved or that outlived the max age (caller holds _lock)."""
+    loaders = None
+    max_age = getattr(settings, "RELATIONSHIP_GRAPH_MAX_AGE", 300)
+    for resource_type in resource_types:
+        generation = get_generation(resource_type)
+        fresh = time.monotonic() - _loaded_at.get(resource_type, float("-inf")) < max_age
+        if _generations.get(resource_type) == generation and fresh:
+            continue
+        loaders = loaders or _loaders(pages_service, endpoints_service, relationships_service)
+        try:
+            loaders[resource_type]()
+        except Exception as e:
+            logger.warning(f"Graph reload of {resource_type} failed: {e}")
+            continue
+        _generations[resource_type] = generation
+        _loaded_at[resource_type] = time.monotonic()
+
+
+def query_graph(
+    pages_service: Any = None,
+    endpoints_service: Any = None,
+    relationships_service: Any = None,
+    **query: Any,
+) -> Dict[str, Any]:
+    """Bring the shared graph up to date and run ``RelationshipGraph.query``."""
+    with _lock:
+        _sync(pages_service, endpoints_service, relationships_service)
+        return _graph.query(**query)
+
+
+def relationship_records() -> List[Dict[str, Any]]:
+    """Every relationship currently in the graph (no storage round trip when current)."""
+    with _lock:
+        _sync(resource_types=("relationships",))
+        return [rel for _, _, rel in _graph.edges.values()]
+
+
+def record_relationship_write(relationship: Dict[str, Any], generation_before: str) -> None:
+    """
+    Apply a relationship create/update made by this process.
+
+    ``generation_before`` is the relationships generation read before the
+    write. If the graph was not current at that point it is left to reload.
+    """
+    record_relationship_writes([relationship], generation_before)
+
+
+def record_relationship_writes(relationships: List[Dict[str, Any]], generation_before: str) -> None:
+    """Apply several relationship creates/updates at once (see record_relationship_write)."""
+    with _lock:
+        if _generations.get("relationships") != generation_before:
+            return
+        if not all(isinstance(rel, dict) for rel in relationships):
+            _generations.pop("relationships", None)
+            return
+        for rel in relationships:
+            _graph.add_relationship(rel)
+        _generations["relationships"] = get_generation("relationships")
+
+
+def record_relationship_delete(relationship_id: str, generation_before: str) -> None:
+    """Apply a relationship delete made by this process (see record_relationship_write)."""
+    with _lock:
+        if _generations.get("relationships") != generation_before:
+            return
+        _graph.remove_edge(relationship_id)
+        _generations["relationships"] = get_generation("relationships")
+
+
+def reset_relationship_graph() -> None:
+    """Forget the loaded graph (tests)."""
+    global _graph
+    with _lock:
+        _graph = RelationshipGraph()
+        _generations.clear()
+        _loaded_at.clear()
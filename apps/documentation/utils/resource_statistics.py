@@ -0,0 +1,167 @@
+"""
+Precomputed statistics aggregates for documentation resources.
+
+Each resource type's index.json carries an ``aggregates`` block of counters
+(``total`` plus one ``{value: count}`` map per dimension). It is built in
+full by the index generators and kept up to date incrementally by
+``S3IndexManager.add_item_to_index`` / ``remove_item_from_index``: every
+summary entry in the index stores the dimension values it contributed
+(``stats``), so an update or delete subtracts the old contribution without
+reading the old document. Dashboards and ``*_statistics`` / ``*_count``
+views read the counters instead of listing documents.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+AGGREGATE_KEY = "aggregates"
+ITEM_STATS_KEY = "stats"
+
+
+def _metadata(item: Dict[str, Any]) -> Dict[str, Any]:
+    metadata = item.get("metadata")
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def _page_status(item: Dict[str, Any]) -> str:
+    return _metadata(item).get("status") or item.get("status") or "published"
+
+
+def _page_type(item: Dict[str, Any]) -> str:
+    return item.get("page_type") or "docs"
+
+
+# Dimension name -> value extractor, per resource type. Extractors must work on
+# full documents; None means "not counted" for that dimension.
+STAT_DIMENSIONS: Dict[str, Dict[str, Callable[[Dict[str, Any]], Optional[str]]]] = {
+    "pages": {
+        "by_type": _page_type,
+        "by_status": _page_status,
+        "by_state": lambda p: _metadata(p).get("page_state") or _page_status(p),
+        "by_type_status": lambda p: f"{_page_type(p)}:{_page_status(p)}",
+        "with_endpoints": lambda p: "yes" if _metadata(p).get("uses_endpoints") else "no",
+    },
+    "endpoints": {
+        "by_method": lambda e: (e.get("method") or "GET").upper(),
+        "by_api_version": lambda e: e.get("api_version") or "v1",
+        "by_state": lambda e: e.get("endpoint_state") or "development",
+    },
+    "relationships": {
+        "by_usage_type": lambda r: r.get("usage_type") or "primary",
+        "by_usage_context": lambda r: r.get("usage_context") or "data_fetching",
+        "by_api_version": lambda r: r.get("api_version") or "unknown",
+        "by_page": lambda r: r.get("page_path") or r.get("page_id"),
+        "by_endpoint": lambda r: r.get("endpoint_path"),
+    },
+    "postman": {
+        "by_state": lambda c: c.get("state") or "draft",
+    },
+}
+
+
+def item_stat_keys(resource_type: str, item: Dict[str, Any]) -> Dict[str, str]:
+    """Dimension values one document contributes to its type's aggregate."""
+    keys = {}
+    for dimension, extract in STAT_DIMENSIONS.get(resource_type, {}).items():
+        value = extract(item)
+        if value is not None:
+            keys[dimension] = str(value)
+    return keys
+
+
+def empty_aggregate(resource_type: str) -> Dict[str, Any]:
+    aggregate: Dict[str, Any] = {"total": 0}
+    for dimension in STAT_DIMENSIONS.get(resource_type, {}):
+        aggregate[dimension] = {}
+    return aggregate
+
+
+def apply_stat_keys(aggregate: Dict[str, Any], keys: Dict[str, str], sign: int) -> None:
+    """Add (sign=1) or subtract (sign=-1) one item's contribution in place."""
+    aggregate["total"] = max(0, aggregate.get("total", 0) + sign)
+    for dimension, value in keys.items():
+        counts = aggregate.setdefault(dimension, {})
+        count = counts.get(value, 0) + sign
+        if count > 0:
+            counts[value] = count
+        else:
+            counts.pop(value, None)
+
+
+def build_aggregate(resource_type: str, items: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Full (re)computation from documents, used by index generation/rebuilds."""
+    aggregate = empty_aggregate(resource_type)
+    for item in items:
+        if isinstance(item, dict):
+            apply_stat_keys(aggregate, item_stat_keys(resource_type, item), 1)
+    return aggregate
+
+
+def aggregate_from_entries(resource_type: str, entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum the ``stats`` already stored on index summary entries."""
+    aggregate = empty_aggregate(resource_type)
+    for entry in entries:
+        apply_stat_keys(aggregate, entry.get(ITEM_STATS_KEY) or {}, 1)
+    return aggregate
+
+
+def update_index_aggregate(
+    index_data: Dict[str, Any],
+    resource_type: str,
+    old_entry: Optional[Dict[str, Any]],
+    new_keys: Optional[Dict[str, str]],
+) -> None:
+    """
+    Apply one create/update/delete to ``index_data['aggregates']`` in place.
+
+    An aggregate is started when the index is empty. If the replaced entry
+    predates per-item stats the counters can no longer be corrected, so the
+    aggregate is dropped and readers fall back until the next rebuild.
+    """
+    aggregate = index_data.get(AGGREGATE_KEY)
+    if aggregate is None:
+        if index_data.get(resource_type) or old_entry is not None:
+            return
+        aggregate = index_data[AGGREGATE_KEY] = empty_aggregate(resource_type)
+    if old_entry is not None:
+        old_keys = old_entry.get(ITEM_STATS_KEY)
+        if old_keys is None:
+            logger.info(f"Dropping {resource_type} aggregate: index entry without stats")
+            index_data.pop(AGGREGATE_KEY, None)
+            return
+        apply_stat_keys(aggregate, old_keys, -1)
+    if new_keys is not None:
+        apply_stat_keys(aggregate, new_keys, 1)
+
+
+def read_aggregate(resource_type: str) -> Optional[Dict[str, Any]]:
+    """
+    The persisted aggregate for a resource type, from the same index the
+    list APIs read (local media/ when USE_LOCAL_JSON_FILES, otherwise S3),
+    with the index's ``last_updated``. Returns None when that index does not
+    carry one yet.
+    """
+    from apps.documentation.services import get_shared_local_storage, get_shared_s3_index_manager
+
+    try:
+        if getattr(settings, "USE_LOCAL_JSON_FILES", True):
+            index_data = get_shared_local_storage().get_index(resource_type)
+        else:
+            index_data = get_shared_s3_index_manager().read_index(resource_type)
+    except Exception as e:
+        logger.debug(f"Index read for {resource_type} statistics failed: {e}")
+        return None
+    aggregate = (index_data or {}).get(AGGREGATE_KEY)
+    if not isinstance(aggregate, dict):
+        return None
+    return {**aggregate, "last_updated": index_data.get("last_updated")}
+
+
+def dimension_counts(aggregate: Dict[str, Any], dimension: str) -> Dict[str, int]:
+    """``{value: count}`` for one dimension of an aggregate (copy, safe to mutate)."""
+    counts = aggregate.get(dimension)
+    return dict(counts) if isinstance(counts, dict) else {}
@@ -3,16 +3,28 @@ Response validation utilities using Pydantic.
 
 Provides decorators for validating API response data before returning to clients.
 This ensures API responses match expected schemas and helps catch bugs early.
+
+Validation runs on the structured payload, never on re-parsed JSON: views may
+return an ``APIResponse``, a plain dict/list, or a ``JsonResponse`` built by
+``APIResponse.to_json_response()`` (which keeps its payload on the response).
+The payload is validated once with a cached ``TypeAdapter`` and serialised
+once. ``RESPONSE_VALIDATION_SAMPLE_RATE`` (0.0-1.0) validates only a fraction
+of responses; outcomes are counted in ``get_validation_metrics()``.
 """
 
 from __future__ import annotations
 
 import functools
+import json
 import logging
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
 
+from django.conf import settings
 from django.http import HttpRequest, JsonResponse
-from pydantic import BaseModel, ValidationError as PydanticValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError as PydanticValidationError
 
 from apps.documentation.utils.api_responses import APIResponse, server_error_response
 
@@ -21,11 +33,177 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 F = TypeVar("F", bound=Callable)
 
+_SKIP = object()
+
+_metrics_lock = threading.Lock()
+_metrics: Dict[str, Any] = {}
+
+
+def _empty_metrics() -> Dict[str, Any]:
+    return {
+        'validated': 0,
+        'sampled_out': 0,
+        'passed': 0,
+        'failed': 0,
+        'reparsed': 0,
+        'validation_ms': 0.0,
+    }
+
+
+def _record(outcome: str, elapsed_ms: float = 0.0) -> None:
+    with _metrics_lock:
+        if not _metrics:
+            _metrics.update(_empty_metrics())
+        _metrics[outcome] += 1
+        _metrics['validation_ms'] += elapsed_ms
+
+
+def get_validation_metrics() -> Dict[str, Any]:
+    """Counters for response validation in this process."""
+    with _metrics_lock:
+        metrics = dict(_metrics or _empty_metrics())
+    checked = metrics['passed'] + metrics['failed']
+    metrics['avg_validation_ms'] = round(metrics['validation_ms'] / checked, 3) if checked else 0.0
+    metrics['validation_ms'] = round(metrics['validation_ms'], 3)
+    return metrics
+
+
+def reset_validation_metrics() -> None:
+    """Reset all response validation counters."""
+    with _metrics_lock:
+        _metrics.clear()
+
+
+@functools.lru_cache(maxsize=256)
+def _type_adapter(schema: Any) -> TypeAdapter:
+    """Build (once per schema) the TypeAdapter used to validate payloads."""
+    return TypeAdapter(schema)
+
+
+def _list_adapter(item_schema: Any) -> TypeAdapter:
+    return _type_adapter(List[item_schema])
+
+
+def _sample_rate(override: Optional[float]) -> float:
+    if override is not None:
+        return override
+    return float(getattr(settings, 'RESPONSE_VALIDATION_SAMPLE_RATE', 1.0))
+
+
+def _should_validate(sample_rate: Optional[float]) -> bool:
+    rate = _sample_rate(sample_rate)
+    if rate >= 1.0:
+        return True
+    return rate > 0.0 and random.random() < rate
+
+
+def _structured_payload(response: Any, func_name: str) -> Any:
+    """
+    Return the structured payload behind a view result, or _SKIP.
+
+    Raises:
+        json.JSONDecodeError: If a legacy JsonResponse body is not JSON
+    """
+    if isinstance(response, APIResponse):
+        return response.to_dict()
+    if isinstance(response, (dict, list)):
+        return response
+    if isinstance(response, JsonResponse):
+        payload = getattr(response, 'payload', _SKIP)
+        if payload is not _SKIP:
+            return payload
+        # JsonResponse built by hand: fall back to parsing the body
+        _record('reparsed')
+        return json.loads(response.content)
+    logger.warning(f"{func_name} returned non-JsonResponse, skipping validation")
+    return _SKIP
+
+
+def _serialize(response: Any) -> Any:
+    """Serialise a structured view result exactly once."""
+    if isinstance(response, APIResponse):
+        return response.to_json_response()
+    if isinstance(response, (dict, list)):
+        return JsonResponse(response, safe=False)
+    return response
+
+
+def _validated_view(
+    func: Callable,
+    check: Callable[[Any, str], Optional[JsonResponse]],
+    validate_data_only: bool,
+    strict: bool,
+    sample_rate: Optional[float],
+) -> Callable:
+    """
+    Wrap a view so ``check(data, func_name)`` runs on its payload.
+
+    ``check`` returns None when the data is valid, an error response otherwise
+    (or raises in strict mode).
+    """
+    @functools.wraps(func)
+    def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
+        response = func(request, *args, **kwargs)
+
+        if not _should_validate(sample_rate):
+            _record('sampled_out')
+            return _serialize(response)
+
+        try:
+            response_data = _structured_payload(response, func.__name__)
+            if response_data is _SKIP:
+                return response
+
+            if validate_data_only:
+                if not isinstance(response_data, dict) or 'data' not in response_data:
+                    logger.debug(
+                        f"{func.__name__} response has no 'data' field, skipping validation"
+                    )
+                    return _serialize(response)
+                data_to_validate = response_data['data']
+            else:
+                data_to_validate = response_data
+
+            started = time.perf_counter()
+            try:
+                error_response = check(data_to_validate, func.__name__)
+            finally:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+            _record('validated')
+            if error_response is not None:
+                _record('failed', elapsed_ms)
+                return error_response
+            _record('passed', elapsed_ms)
+            logger.debug(f"Response validation passed for {func.__name__}")
+
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse response JSON from {func.__name__}: {e}")
+            if strict:
+                raise
+            return server_error_response(
+                "Invalid response format"
+            ).to_json_response()
+        except Exception as e:
+            if strict:
+                _record('failed')
+                raise
+            logger.error(
+                f"Unexpected error during response validation in {func.__name__}: {e}",
+                exc_info=True
+            )
+            # Return original response on unexpected errors
+            return _serialize(response)
+
+        return _serialize(response)
+
+    return wrapper
+
 
 def validate_response(
     schema: Type[T],
     validate_data_only: bool = True,
     strict: bool = False,
+    sample_rate: Optional[float] = None,
 ) -> Callable[[F], F]:
     """
     Decorator to validate API response data against a Pydantic schema.
@@ -40,6 +218,7 @@ def validate_response(
                            If False, validates the entire response structure (default: True)
         strict: If True, raises exceptions on validation errors (default: False).
                 If False, logs warning and returns error response
+        sample_rate: Fraction of responses to validate (default: RESPONSE_VALIDATION_SAMPLE_RATE)
         
     Returns:
         Decorated function with response validation
@@ -49,83 +228,30 @@ def validate_response(
         from apps.documentation.schemas.response_schemas import PageResponseSchema
         
         @validate_response(PageResponseSchema)
-        def get_page_api(request: HttpRequest) -> JsonResponse:
+        def get_page_api(request: HttpRequest) -> APIResponse:
             page = pages_service.get_page(page_id)
-            return success_response(page).to_json_response()
+            return success_response(page)
         ```
     """
+    adapter = _type_adapter(schema)
+
+    def check(data: Any, func_name: str) -> Optional[JsonResponse]:
+        try:
+            adapter.validate_python(data)
+        except PydanticValidationError as e:
+            error_msg = f"Response validation failed for {func_name}: {e.errors()}"
+            if strict:
+                logger.error(error_msg)
+                raise ValueError(error_msg) from e
+            logger.warning(error_msg)
+            # Return error response instead of original response
+            return server_error_response(
+                "Response validation failed - this is a server error"
+            ).to_json_response()
+        return None
+
     def decorator(func: F) -> F:
-        @functools.wraps(func)
-        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
-            # Call original function
-            response = func(request, *args, **kwargs)
-            
-            # Only validate JsonResponse objects
-            if not isinstance(response, JsonResponse):
-                logger.warning(
-                    f"{func.__name__} returned non-JsonResponse, skipping validation"
-                )
-                return response
-            
-            try:
-                # Parse response content
-                import json
-                response_data = json.loads(response.content)
-                
-                # Extract data to validate
-                if validate_data_only:
-                    # Validate only the 'data' field
-                    if not isinstance(response_data, dict):
-                        raise ValueError("Response is not a dictionary")
-                    
-                    if 'data' not in response_data:
-                        logger.debug(
-                            f"{func.__name__} response has no 'data' field, skipping validation"
-                        )
-                        return response
-                    
-                    data_to_validate = response_data['data']
-                else:
-                    # Validate entire response structure
-                    data_to_validate = response_data
-                
-                # Validate against schema
-                try:
-                    validated_data = schema(**data_to_validate) if isinstance(data_to_validate, dict) else schema(data_to_validate)
-                    logger.debug(f"Response validation passed for {func.__name__}")
-                except PydanticValidationError as e:
-                    error_msg = f"Response validation failed for {func.__name__}: {e.errors()}"
-                    
-                    if strict:
-                        logger.error(error_msg)
-                        raise ValueError(error_msg) from e
-                    else:
-                        logger.warning(error_msg)
-                        # Return error response instead of original response
-                        return server_error_response(
-                            "Response validation failed - this is a server error"
-                        ).to_json_response()
-                
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse response JSON from {func.__name__}: {e}")
-                if strict:
-                    raise
-                return server_error_response(
-                    "Invalid response format"
-                ).to_json_response()
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error during response validation in {func.__name__}: {e}",
-                    exc_info=True
-                )
-                if strict:
-                    raise
-                # Return original response on unexpected errors
-                return response
-            
-            return response
-        
-        return wrapper  # type: ignore
+        return _validated_view(func, check, validate_data_only, strict, sample_rate)  # type: ignore
     return decorator
 
 
@@ -133,17 +259,19 @@ def validate_response_list(
     item_schema: Type[T],
     validate_data_only: bool = True,
     strict: bool = False,
+    sample_rate: Optional[float] = None,
 ) -> Callable[[F], F]:
     """
     Decorator to validate API response data that is a list of items.
     
     This decorator validates that each item in the response list matches
-    the expected schema.
+    the expected schema (one TypeAdapter pass over the whole list).
     
     Args:
         item_schema: Pydantic model class to validate each list item against
         validate_data_only: If True, validates only the 'data' field (default: True)
         strict: If True, raises exceptions on validation errors (default: False)
+        sample_rate: Fraction of responses to validate (default: RESPONSE_VALIDATION_SAMPLE_RATE)
         
     Returns:
         Decorated function with list response validation
@@ -153,101 +281,46 @@ def validate_response_list(
         from apps.documentation.schemas.response_schemas import PageResponseSchema
         
         @validate_response_list(PageResponseSchema)
-        def list_pages_api(request: HttpRequest) -> JsonResponse:
+        def list_pages_api(request: HttpRequest) -> APIResponse:
             pages = pages_service.list_pages()
-            return success_response(pages).to_json_response()
+            return success_response(pages)
         ```
     """
+    adapter = _list_adapter(item_schema)
+
+    def check(data: Any, func_name: str) -> Optional[JsonResponse]:
+        # Ensure data is a list
+        if not isinstance(data, list):
+            error_msg = f"Expected list response in {func_name}, got {type(data)}"
+            if strict:
+                raise ValueError(error_msg)
+            logger.warning(error_msg)
+            return server_error_response(
+                "Invalid response format - expected list"
+            ).to_json_response()
+
+        try:
+            adapter.validate_python(data)
+        except PydanticValidationError as e:
+            validation_errors: Dict[Any, list] = {}
+            for error in e.errors():
+                index = error['loc'][0] if error['loc'] else None
+                validation_errors.setdefault(index, []).append(error)
+            error_msg = (
+                f"Response list validation failed for {func_name}: "
+                f"{len(validation_errors)} items failed validation"
+            )
+            if strict:
+                logger.error(error_msg)
+                raise ValueError(error_msg) from e
+            logger.warning(f"{error_msg}. Errors: {validation_errors}")
+            return server_error_response(
+                "Response validation failed - this is a server error"
+            ).to_json_response()
+        return None
+
     def decorator(func: F) -> F:
-        @functools.wraps(func)
-        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
-            # Call original function
-            response = func(request, *args, **kwargs)
-            
-            # Only validate JsonResponse objects
-            if not isinstance(response, JsonResponse):
-                logger.warning(
-                    f"{func.__name__} returned non-JsonResponse, skipping validation"
-                )
-                return response
-            
-            try:
-                # Parse response content
-                import json
-                response_data = json.loads(response.content)
-                
-                # Extract data to validate
-                if validate_data_only:
-                    if not isinstance(response_data, dict) or 'data' not in response_data:
-                        logger.debug(
-                            f"{func.__name__} response has no 'data' field, skipping validation"
-                        )
-                        return response
-                    
-                    data_to_validate = response_data['data']
-                else:
-                    data_to_validate = response_data
-                
-                # Ensure data is a list
-                if not isinstance(data_to_validate, list):
-                    error_msg = f"Expected list response in {func.__name__}, got {type(data_to_validate)}"
-                    if strict:
-                        raise ValueError(error_msg)
-                    logger.warning(error_msg)
-                    return server_error_response(
-                        "Invalid response format - expected list"
-                    ).to_json_response()
-                
-                # Validate each item
-                validation_errors = []
-                for idx, item in enumerate(data_to_validate):
-                    try:
-                        if isinstance(item, dict):
-                            item_schema(**item)
-                        else:
-                            item_schema(item)
-                    except PydanticValidationError as e:
-                        validation_errors.append({
-                            'index': idx,
-                            'errors': e.errors()
-                        })
-                
-                if validation_errors:
-                    error_msg = (
-                        f"Response list validation failed for {func.__name__}: "
-                        f"{len(validation_errors)} items failed validation"
-                    )
-                    
-                    if strict:
-                        logger.error(error_msg)
-                        raise ValueError(error_msg)
-                    else:
-                        logger.warning(f"{error_msg}. Errors: {validation_errors}")
-                        return server_error_response(
-                            "Response validation failed - this is a server error"
-                        ).to_json_response()
-                
-                logger.debug(f"Response list validation passed for {func.__name__}")
-                
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse response JSON from {func.__name__}: {e}")
-                if strict:
-                    raise
-                return server_error_response(
-                    "Invalid response format"
-                ).to_json_response()
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error during response validation in {func.__name__}: {e}",
-                    exc_info=True
-                )
-                if strict:
-                    raise
-                return response
-            
-            return response
-        
-        return wrapper  # type: ignore
+        return _validated_view(func, check, validate_data_only, strict, sample_rate)  # type: ignore
     return decorator
 
 
@@ -255,6 +328,7 @@ def validate_response_type(
     expected_type: type,
     validate_data_only: bool = True,
     strict: bool = False,
+    sample_rate: Optional[float] = None,
 ) -> Callable[[F], F]:
     """
     Decorator to validate API response data type (simple type checking).
@@ -266,6 +340,7 @@ def validate_response_type(
         expected_type: Python type to validate against (e.g., dict, list, str, int)
         validate_data_only: If True, validates only the 'data' field (default: True)
         strict: If True, raises exceptions on validation errors (default: False)
+        sample_rate: Fraction of responses to validate (default: RESPONSE_VALIDATION_SAMPLE_RATE)
         
     Returns:
         Decorated function with type validation
@@ -278,71 +353,21 @@ def validate_response_type(
             return success_response(page).to_json_response()
         ```
     """
+    def check(data: Any, func_name: str) -> Optional[JsonResponse]:
+        if isinstance(data, expected_type):
+            return None
+        error_msg = (
+            f"Response type validation failed for {func_name}: "
+            f"expected {expected_type.__name__}, got {type(data).__name__}"
+        )
+        if strict:
+            logger.error(error_msg)
+            raise TypeError(error_msg)
+        logger.warning(error_msg)
+        return server_error_response(
+            "Response type validation failed - this is a server error"
+        ).to_json_response()
+
     def decorator(func: F) -> F:
-        @functools.wraps(func)
-        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
-            # Call original function
-            response = func(request, *args, **kwargs)
-            
-            # Only validate JsonResponse objects
-            if not isinstance(response, JsonResponse):
-                logger.warning(
-                    f"{func.__name__} returned non-JsonResponse, skipping validation"
-                )
-                return response
-            
-            try:
-                # Parse response content
-                import json
-                response_data = json.loads(response.content)
-                
-                # Extract data to validate
-                if validate_data_only:
-                    if not isinstance(response_data, dict) or 'data' not in response_data:
-                        logger.debug(
-                            f"{func.__name__} response has no 'data' field, skipping validation"
-                        )
-                        return response
-                    
-                    data_to_validate = response_data['data']
-                else:
-                    data_to_validate = response_data
-                
-                # Validate type
-                if not isinstance(data_to_validate, expected_type):
-                    error_msg = (
-                        f"Response type validation failed for {func.__name__}: "
-                        f"expected {expected_type.__name__}, got {type(data_to_validate).__name__}"
-                    )
-                    
-                    if strict:
-                        logger.error(error_msg)
-                        raise TypeError(error_msg)
-                    else:
-                        logger.warning(error_msg)
-                        return server_error_response(
-                            "Response type validation failed - this is a server error"
-                        ).to_json_response()
-                
-                logger.debug(f"Response type validation passed for {func.__name__}")
-                
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse response JSON from {func.__name__}: {e}")
-                if strict:
-                    raise
-                return server_error_response(
-                    "Invalid response format"
-                ).to_json_response()
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error during response validation in {func.__name__}: {e}",
-                    exc_info=True
-                )
-                if strict:
-                    raise
-                return response
-            
-            return response
-        
-        return wrapper  # type: ignore
+        return _validated_view(func, check, validate_data_only, strict, sample_rate)  # type: ignore
     return decorator
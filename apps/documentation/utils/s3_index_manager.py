@@ -2,10 +2,17 @@
 
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from apps.documentation.repositories.s3_json_storage import S3JSONStorage
 from django.conf import settings
 from django.core.cache import cache
+from apps.documentation.utils.resource_statistics import (
+    AGGREGATE_KEY,
+    ITEM_STATS_KEY,
+    build_aggregate,
+    item_stat_keys,
+    update_index_aggregate,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -236,108 +243,53 @@ class S3IndexManager:
         Returns:
             True if successful
         """
-        from datetime import datetime, timezone
+        return self.add_items_to_index(resource_type, [(item_id, item_data)])
+    
+    def add_items_to_index(
+        self,
+        resource_type: str,
+        items: List[Tuple[str, Dict[str, Any]]]
+    ) -> bool:
+        """
+        Add (or replace) many items in the index with a single write.
+        
+        Summaries, secondary indexes and the statistics aggregate are updated
+        in memory, then index.json is written and the related caches are
+        invalidated once for the whole batch.
+        
+        Args:
+            resource_type: Type of resource ('pages', 'endpoints', 'relationships', 'postman')
+            items: List of tuples (item_id, item_data)
+            
+        Returns:
+            True if successful
+        """
+        if not items:
+            return True
         
         try:
             index_data = self.read_index(resource_type)
             items_list = index_data.get(resource_type, [])
             
-            # Remove existing entry if present (for updates)
-            items_list = [item for item in items_list if item.get('page_id' if resource_type == 'pages' else 'endpoint_id' if resource_type == 'endpoints' else 'relationship_id' if resource_type == 'relationships' else 'config_id') != item_id]
-            
-            # Create summary entry for index
-            if resource_type == 'pages':
-                page_type = item_data.get('page_type', 'docs')
-                route = item_data.get('metadata', {}).get('route') or item_data.get('route', '')
-                summary = {
-                    'page_id': item_id,
-                    'page_type': page_type,
-                    'route': route,
-                    'file_name': f"{item_id}.json"
-                }
-                items_list.append(summary)
-                
-                # Update indexes
-                indexes = index_data.setdefault('indexes', {})
-                by_type = indexes.setdefault('by_type', {})
-                if page_type not in by_type:
-                    by_type[page_type] = []
-                if item_id not in by_type[page_type]:
-                    by_type[page_type].append(item_id)
-                
-                by_route = indexes.setdefault('by_route', {})
-                if route:
-                    by_route[route] = item_id
-                    
-            elif resource_type == 'endpoints':
-                method = item_data.get('method', 'GET')
-                api_version = item_data.get('api_version', 'v1')
-                path = item_data.get('endpoint_path') or item_data.get('path', '')
-                summary = {
-                    'endpoint_id': item_id,
-                    'method': method,
-                    'api_version': api_version,
-                    'path': path,
-                    'file_name': f"{item_id}.json"
-                }
-                items_list.append(summary)
-                
-                # Update indexes
-                indexes = index_data.setdefault('indexes', {})
-                by_method = indexes.setdefault('by_method', {})
-                if method not in by_method:
-                    by_method[method] = []
-                if item_id not in by_method[method]:
-                    by_method[method].append(item_id)
-                
-                by_api_version = indexes.setdefault('by_api_version', {})
-                if api_version not in by_api_version:
-                    by_api_version[api_version] = []
-                if item_id not in by_api_version[api_version]:
-                    by_api_version[api_version].append(item_id)
-                
-                by_path = indexes.setdefault('by_path', {})
-                if path:
-                    by_path[path] = item_id
-                    
-            elif resource_type == 'relationships':
-                page_id = item_data.get('page_id') or item_data.get('page_path')
-                endpoint_path = item_data.get('endpoint_path')
-                method = item_data.get('method', 'GET')
-                usage_type = item_data.get('usage_type', 'primary')
-                
-                summary = {
-                    'relationship_id': item_id,
-                    'page_id': page_id,
-                    'endpoint_path': endpoint_path,
-                    'method': method,
-                    'usage_type': usage_type,
-                    'file_name': f"{item_id}.json"
-                }
-                items_list.append(summary)
-                
-                # Update indexes
-                indexes = index_data.setdefault('indexes', {})
-                by_page = indexes.setdefault('by_page', {})
-                if page_id:
-                    if page_id not in by_page:
-                        by_page[page_id] = []
-                    if item_id not in by_page[page_id]:
-                        by_page[page_id].append(item_id)
-                
-                by_endpoint = indexes.setdefault('by_endpoint', {})
-                if endpoint_path:
-                    endpoint_key = f"{method}:{endpoint_path}"
-                    if endpoint_key not in by_endpoint:
-                        by_endpoint[endpoint_key] = []
-                    if item_id not in by_endpoint[endpoint_key]:
-                        by_endpoint[endpoint_key].append(item_id)
-                
-                by_usage_type = indexes.setdefault('by_usage_type', {})
-                if usage_type not in by_usage_type:
-                    by_usage_type[usage_type] = []
-                if item_id not in by_usage_type[usage_type]:
-                    by_usage_type[usage_type].append(item_id)
+            # Remove existing entries if present (for updates)
+            id_field = 'page_id' if resource_type == 'pages' else 'endpoint_id' if resource_type == 'endpoints' else 'relationship_id' if resource_type == 'relationships' else 'config_id'
+            item_ids = {item_id for item_id, _ in items}
+            old_entries = {item.get(id_field): item for item in items_list if item.get(id_field) in item_ids}
+            kept = [item for item in items_list if item.get(id_field) not in item_ids]
+            indexes = index_data.setdefault('indexes', {})
+            
+            summaries: Dict[str, Dict[str, Any]] = {}
+            for item_id, item_data in items:
+                stat_keys = item_stat_keys(resource_type, item_data)
+                summary = self._index_item(resource_type, indexes, item_id, item_data, stat_keys)
+                if summary is not None:
+                    summaries.pop(item_id, None)
+                    summaries[item_id] = summary
+                # The aggregate moves by this item's old/new contribution
+                if resource_type in ('pages', 'endpoints', 'relationships'):
+                    update_index_aggregate(index_data, resource_type, old_entries.get(item_id), stat_keys)
+                old_entries[item_id] = summary
+            items_list = kept + list(summaries.values())
             
             # Update statistics
             stats = index_data.setdefault('statistics', {})
@@ -351,9 +303,114 @@ class S3IndexManager:
             return self.update_index(resource_type, index_data)
             
         except Exception as e:
-            logger.error(f"Failed to add item to index for {resource_type}: {e}", exc_info=True)
+            logger.error(f"Failed to add {len(items)} item(s) to index for {resource_type}: {e}", exc_info=True)
             return False
     
+    def _index_item(
+        self,
+        resource_type: str,
+        indexes: Dict[str, Any],
+        item_id: str,
+        item_data: Dict[str, Any],
+        stat_keys: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the index summary of an item and add it to the secondary indexes.
+        
+        Returns:
+            Summary entry, or None for resource types without summaries
+        """
+        if resource_type == 'pages':
+            page_type = item_data.get('page_type', 'docs')
+            route = item_data.get('metadata', {}).get('route') or item_data.get('route', '')
+            
+            by_type = indexes.setdefault('by_type', {})
+            if page_type not in by_type:
+                by_type[page_type] = []
+            if item_id not in by_type[page_type]:
+                by_type[page_type].append(item_id)
+            
+            by_route = indexes.setdefault('by_route', {})
+            if route:
+                by_route[route] = item_id
+            
+            return {
+                'page_id': item_id,
+                'page_type': page_type,
+                'route': route,
+                'file_name': f"{item_id}.json",
+                ITEM_STATS_KEY: stat_keys,
+            }
+        
+        if resource_type == 'endpoints':
+            method = item_data.get('method', 'GET')
+            api_version = item_data.get('api_version', 'v1')
+            path = item_data.get('endpoint_path') or item_data.get('path', '')
+            
+            by_method = indexes.setdefault('by_method', {})
+            if method not in by_method:
+                by_method[method] = []
+            if item_id not in by_method[method]:
+                by_method[method].append(item_id)
+            
+            by_api_version = indexes.setdefault('by_api_version', {})
+            if api_version not in by_api_version:
+                by_api_version[api_version] = []
+            if item_id not in by_api_version[api_version]:
+                by_api_version[api_version].append(item_id)
+            
+            by_path = indexes.setdefault('by_path', {})
+            if path:
+                by_path[path] = item_id
+            
+            return {
+                'endpoint_id': item_id,
+                'method': method,
+                'api_version': api_version,
+                'path': path,
+                'file_name': f"{item_id}.json",
+                ITEM_STATS_KEY: stat_keys,
+            }
+        
+        if resource_type == 'relationships':
+            page_id = item_data.get('page_id') or item_data.get('page_path')
+            endpoint_path = item_data.get('endpoint_path')
+            method = item_data.get('method', 'GET')
+            usage_type = item_data.get('usage_type', 'primary')
+            
+            by_page = indexes.setdefault('by_page', {})
+            if page_id:
+                if page_id not in by_page:
+                    by_page[page_id] = []
+                if item_id not in by_page[page_id]:
+                    by_page[page_id].append(item_id)
+            
+            by_endpoint = indexes.setdefault('by_endpoint', {})
+            if endpoint_path:
+                endpoint_key = f"{method}:{endpoint_path}"
+                if endpoint_key not in by_endpoint:
+                    by_endpoint[endpoint_key] = []
+                if item_id not in by_endpoint[endpoint_key]:
+                    by_endpoint[endpoint_key].append(item_id)
+            
+            by_usage_type = indexes.setdefault('by_usage_type', {})
+            if usage_type not in by_usage_type:
+                by_usage_type[usage_type] = []
+            if item_id not in by_usage_type[usage_type]:
+                by_usage_type[usage_type].append(item_id)
+            
+            return {
+                'relationship_id': item_id,
+                'page_id': page_id,
+                'endpoint_path': endpoint_path,
+                'method': method,
+                'usage_type': usage_type,
+                'file_name': f"{item_id}.json",
+                ITEM_STATS_KEY: stat_keys,
+            }
+        
+        return None
+    
     def remove_item_from_index(
         self,
         resource_type: str,
@@ -377,10 +434,10 @@ class S3IndexManager:
             
             # Find and remove the item
             id_field = 'page_id' if resource_type == 'pages' else 'endpoint_id' if resource_type == 'endpoints' else 'relationship_id' if resource_type == 'relationships' else 'config_id'
-            original_count = len(items_list)
+            old_entry = next((item for item in items_list if item.get(id_field) == item_id), None)
             items_list = [item for item in items_list if item.get(id_field) != item_id]
             
-            if len(items_list) == original_count:
+            if old_entry is None:
                 logger.warning(f"Item {item_id} not found in index for {resource_type}")
                 return False
             
@@ -397,6 +454,7 @@ class S3IndexManager:
             # Update statistics
             stats = index_data.setdefault('statistics', {})
             stats['total'] = len(items_list)
+            update_index_aggregate(index_data, resource_type, old_entry, None)
             
             # Update metadata
             index_data['last_updated'] = datetime.now(timezone.utc).isoformat()
@@ -635,7 +693,8 @@ class S3IndexManager:
                 items.append({
                     'id': item_id,
                     'page_id' if resource_type == 'pages' else 'endpoint_id' if resource_type == 'endpoints' else 'relationship_id': item_id,
-                    **{k: v for k, v in item_data.items() if k not in ['_id', 'created_at', 'updated_at']}
+                    **{k: v for k, v in item_data.items() if k not in ['_id', 'created_at', 'updated_at']},
+                    ITEM_STATS_KEY: item_stat_keys(resource_type, item_data),
                 })
                 
                 # Build indexes based on resource type
@@ -688,7 +747,8 @@ class S3IndexManager:
                 'statistics': {
                     'total_items': len(items),
                     'last_rebuild': datetime.now(timezone.utc).isoformat()
-                }
+                },
+                AGGREGATE_KEY: build_aggregate(resource_type, items),
             }
             
             # Write updated index
@@ -4,8 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
@@ -26,6 +25,8 @@ from apps.documentation.utils.api_responses import (
     server_error_response,
     success_response,
 )
+from apps.documentation.utils.relationship_graph import EDGE_FILTERS, NODE_FILTERS, query_graph
+from apps.documentation.utils.resource_statistics import AGGREGATE_KEY, dimension_counts
 from apps.core.utils.redis_cache import (
     cache_manager,
     CACHE_PREFIX_STATISTICS,
@@ -54,6 +55,10 @@ def build_graph_data(
     """
     Build graph structure from pages, endpoints, and relationships. Cached 10 min.
     
+    The nodes and edges come from the shared graph model
+    (apps.documentation.utils.relationship_graph), which is kept up to date
+    incrementally instead of being rebuilt from full list calls.
+    
     Args:
         pages_svc: Pages service instance
         endpoints_svc: Endpoints service instance
@@ -66,149 +71,11 @@ def build_graph_data(
     if cached is not None:
         return cached
 
-    nodes: List[Dict[str, Any]] = []
-    edges: List[Dict[str, Any]] = []
-    node_ids: Set[str] = set()
     fallback: Dict[str, Any] = {"nodes": [], "edges": [], "statistics": {}}
 
     try:
-        # Parallelize service calls for better performance
-        # Expected improvement: 3x faster (sequential → parallel)
-        pages_result = None
-        endpoints_result = None
-        relationships_result = None
-        
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            # Submit all three service calls concurrently
-            pages_future = executor.submit(pages_svc.list_pages, limit=1000)
-            endpoints_future = executor.submit(endpoints_svc.list_endpoints, limit=1000)
-            relationships_future = executor.submit(relationships_svc.list_relationships, limit=1000)
-            
-            # Wait for all results with error handling
-            try:
-                pages_result = pages_future.result(timeout=30)
-            except Exception as e:
-                logger.warning(f"Error fetching pages for graph: {e}")
-                pages_result = {"pages": []}
-            
-            try:
-                endpoints_result = endpoints_future.result(timeout=30)
-            except Exception as e:
-                logger.warning(f"Error fetching endpoints for graph: {e}")
-                endpoints_result = {"endpoints": []}
-            
-            try:
-                relationships_result = relationships_future.result(timeout=30)
-            except Exception as e:
-                logger.warning(f"Error fetching relationships for graph: {e}")
-                relationships_result = {"relationships": []}
-        
-        pages = pages_result.get("pages", []) if pages_result else []
-        endpoints = endpoints_result.get("endpoints", []) if endpoints_result else []
-        relationships = relationships_result.get("relationships", []) if relationships_result else []
-
-        # Optimize node processing with list comprehension where possible
-        # Pre-compile metadata access patterns for better performance
-        for page in pages:
-            try:
-                page_id = page.get("page_id") or page.get("_id")
-                if not page_id or page_id in node_ids:
-                    continue
-                
-                # Safely access nested metadata (optimized access pattern)
-                metadata = page.get("metadata") or {}
-                content_sections = metadata.get("content_sections") or {}
-                title = content_sections.get("title") or page_id
-                route = metadata.get("route") or page.get("route")
-                status = metadata.get("status")
-                
-                node_id = f"page_{page_id}"
-                nodes.append({
-                    "id": node_id,
-                    "label": title,
-                    "type": "page",
-                    "data": {
-                        "page_id": page_id,
-                        "route": route,
-                        "page_type": page.get("page_type"),
-                        "status": status,
-                    },
-                })
-                node_ids.add(node_id)
-            except Exception as e:
-                logger.warning(f"Error processing page node: {e}")
-                continue
-
-        # Optimize endpoint node processing
-        for endpoint in endpoints:
-            try:
-                endpoint_id = endpoint.get("endpoint_id") or endpoint.get("_id")
-                if not endpoint_id:
-                    continue
-                
-                node_id = f"endpoint_{endpoint_id}"
-                if node_id in node_ids:
-                    continue
-                
-                nodes.append({
-                    "id": node_id,
-                    "label": endpoint_id,
-                    "type": "endpoint",
-                    "data": {
-                        "endpoint_id": endpoint_id,
-                        "endpoint_path": endpoint.get("endpoint_path"),
-                        "method": endpoint.get("method", "QUERY"),
-                        "api_version": endpoint.get("api_version"),
-                    },
-                })
-                node_ids.add(node_id)
-            except Exception as e:
-                logger.warning(f"Error processing endpoint node: {e}")
-                continue
-
-        # Optimize edge processing with set operations for faster lookups
-        for rel in relationships:
-            try:
-                pid = rel.get("page_id") or rel.get("page_path")
-                eid = rel.get("endpoint_id") or rel.get("endpoint_path")
-                
-                if not pid or not eid:
-                    continue
-                
-                source_id = f"page_{pid}"
-                target_id = f"endpoint_{eid}"
-                
-                # Use set membership check (O(1)) instead of list check (O(n))
-                if source_id in node_ids and target_id in node_ids:
-                    edges.append({
-                        "id": rel.get("relationship_id", f"{source_id}_{target_id}"),
-                        "source": source_id,
-                        "target": target_id,
-                        "type": rel.get("usage_type", "primary"),
-                        "label": rel.get("usage_type", "primary"),
-                        "data": {
-                            "relationship_id": rel.get("relationship_id"),
-                            "usage_type": rel.get("usage_type"),
-                            "usage_context": rel.get("usage_context"),
-                            "method": rel.get("method"),
-                        },
-                    })
-            except Exception as e:
-                logger.warning(f"Error processing relationship edge: {e}")
-                continue
-
-        # Optimize statistics calculation using pre-computed values
-        pages_count = sum(1 for n in nodes if n.get("type") == "page")
-        endpoints_count = sum(1 for n in nodes if n.get("type") == "endpoint")
-        
-        stats = {
-            "total_nodes": len(nodes),
-            "total_edges": len(edges),
-            "pages_count": pages_count,
-            "endpoints_count": endpoints_count,
-            "relationships_count": len(edges),
-        }
-        result: Dict[str, Any] = {"nodes": nodes, "edges": edges, "statistics": stats}
+        # Served from the shared incremental graph model; only stale tables are reloaded
+        result = query_graph(pages_svc, endpoints_svc, relationships_svc)
         
         # Cache using RedisCacheManager with namespace and dynamic TTL (Task 2.2.2)
         cache_manager.set(
@@ -493,12 +360,24 @@ def dashboard_stats_api(request: HttpRequest) -> JsonResponse:
             except Exception:
                 stats["total_postman"] = 0
 
-        stats["pages_by_type"] = pages_index.get("statistics", {}).get("by_type", {})
-        by_method = endpoints_index.get("statistics", {}).get("by_method", {})
-        stats["endpoints_by_method"] = {
-            "QUERY": len(by_method.get("QUERY", [])),
-            "MUTATION": len(by_method.get("MUTATION", [])),
-        }
+        pages_aggregate = pages_index.get(AGGREGATE_KEY)
+        endpoints_aggregate = endpoints_index.get(AGGREGATE_KEY)
+        if pages_aggregate:
+            stats["pages_by_type"] = dimension_counts(pages_aggregate, "by_type")
+        else:
+            stats["pages_by_type"] = pages_index.get("statistics", {}).get("by_type", {})
+        if endpoints_aggregate:
+            method_counts = dimension_counts(endpoints_aggregate, "by_method")
+            stats["endpoints_by_method"] = {
+                "QUERY": method_counts.get("QUERY", 0),
+                "MUTATION": method_counts.get("MUTATION", 0),
+            }
+        else:
+            by_method = endpoints_index.get("statistics", {}).get("by_method", {})
+            stats["endpoints_by_method"] = {
+                "QUERY": len(by_method.get("QUERY", [])),
+                "MUTATION": len(by_method.get("MUTATION", [])),
+            }
         
         # Cache statistics using RedisCacheManager
         cache_manager.set(
@@ -522,9 +401,33 @@ def dashboard_graph_api(request: HttpRequest) -> JsonResponse:
     API endpoint for graph data.
     
     GET /docs/api/graph/ (or equivalent)
+    Query params (all optional; without them the full cached graph is returned):
+    - node, hops: k-hop neighbourhood around a node id (page_<id> / endpoint_<id>)
+    - node_type (page|endpoint), page_type, method, api_version, usage_type, usage_context
+    - offset, limit: page of edges; nodes are limited to those the page touches
     Returns: { success, data: { nodes, edges, statistics } }
     """
+    params = request.GET
     try:
+        if any(k in params for k in ("node", "node_type", "offset", "limit") + NODE_FILTERS + EDGE_FILTERS):
+            try:
+                hops = int(params.get("hops", 1))
+                offset = max(0, int(params.get("offset", 0)))
+                limit = max(1, int(params["limit"])) if params.get("limit") else None
+            except ValueError:
+                return error_response("hops, offset and limit must be integers").to_json_response()
+            graph_data = query_graph(
+                pages_service,
+                endpoints_service,
+                relationships_service,
+                node=params.get("node") or None,
+                hops=hops,
+                node_type=params.get("node_type") or None,
+                filters={k: params.get(k) for k in NODE_FILTERS + EDGE_FILTERS},
+                offset=offset,
+                limit=limit,
+            )
+            return success_response(data=graph_data, message="Graph data retrieved successfully").to_json_response()
         graph_data = build_graph_data(pages_service, endpoints_service, relationships_service)
         return success_response(data=graph_data, message="Graph data retrieved successfully").to_json_response()
     except Exception as e:
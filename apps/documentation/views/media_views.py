@@ -15,13 +15,14 @@ from django.shortcuts import redirect, render
 from django.views.decorators.http import require_http_methods
 
 from apps.documentation.services.file_operations import FileOperationsService
+from apps.documentation.services.media_jobs import BulkSyncJob, RegenerateIndexesJob
 from apps.documentation.services.media_manager_service import MediaManagerService
-from apps.documentation.services.media_sync_service import MediaSyncService
 from apps.documentation.services import pages_service, endpoints_service, relationships_service, postman_service
 from apps.documentation.utils.relationship_id import generate_relationship_id
 import markdown
 from apps.documentation.utils.api_responses import (
     APIResponse,
+    accepted_response,
     error_response,
     not_found_response,
     server_error_response,
@@ -288,7 +289,7 @@ def sync_file_api(request: HttpRequest, file_path: str) -> JsonResponse:
 @login_required
 @require_http_methods(["POST"])
 def bulk_sync_api(request: HttpRequest) -> JsonResponse:
-    """POST /docs/api/media/bulk-sync/ body: {resource_type, direction, file_paths?}"""
+    """POST /docs/api/media/bulk-sync/ body: {resource_type, direction, file_paths?, delete_orphans?}"""
     data, error_msg = _parse_json_body(request)
     if error_msg and request.body:
         logger.warning("Invalid request body in bulk_sync_api: %s", error_msg)
@@ -296,29 +297,36 @@ def bulk_sync_api(request: HttpRequest) -> JsonResponse:
 
     try:
         data = data or {}
-        resource_type = data.get("resource_type", "all")
-        direction = data.get("direction", "to_lambda")
-        file_paths = data.get("file_paths", [])
-        sync_svc = MediaSyncService()
-        results: Dict[str, Any] = {}
-        types = (
-            ["pages", "endpoints", "relationships", "postman"]
-            if resource_type == "all"
-            else [resource_type]
-        )
-        for rt in types:
-            if direction == "to_lambda" and file_paths:
-                for fpath in file_paths:
-                    results[fpath] = sync_svc.sync_file_to_s3(fpath)
-            else:
-                results[rt] = sync_svc._sync_resource_type(rt, dry_run=False)
-        logger.info("Bulk sync completed: %s files/resources", len(results))
-        return success_response(data={"results": results}, message="Bulk sync completed").to_json_response()
+        params = {
+            "resource_type": data.get("resource_type", "all"),
+            "direction": data.get("direction", "to_lambda"),
+            "file_paths": data.get("file_paths", []),
+            "delete_orphans": bool(data.get("delete_orphans", False)),
+        }
+        return _start_media_job(request, BulkSyncJob(), "Bulk sync", params)
     except Exception as e:
         logger.exception("bulk_sync_api")
         return server_error_response(f"Error performing bulk sync: {str(e)}").to_json_response()
 
 
+def _start_media_job(request: HttpRequest, job, name: str, params: Dict[str, Any]) -> JsonResponse:
+    """Queue a media background job and answer 202 with where to follow it."""
+    from apps.operations.api.views import job_links
+    from apps.operations.services import OperationsService
+
+    operation = OperationsService().start_job(job, name, params=params, started_by=request.user)
+    operation_id = operation["operation_id"]
+    logger.info("Queued %s operation %s", job.operation_type, operation_id)
+    return accepted_response(
+        data={
+            "operation_id": operation_id,
+            "status": operation.get("status"),
+            **job_links(operation_id),
+        },
+        message=f"{name} queued",
+    ).to_json_response()
+
+
 # -----------------------------------------------------------------------------
 # Index regeneration APIs
 # -----------------------------------------------------------------------------
@@ -374,16 +382,12 @@ def regenerate_relationships_index_api(request: HttpRequest) -> JsonResponse:
 @login_required
 @require_http_methods(["POST"])
 def regenerate_all_indexes_api(request: HttpRequest) -> JsonResponse:
-    """POST /docs/api/media/regenerate/all/"""
-    from apps.documentation.services.index_generator_service import IndexGeneratorService
-
-    gen = IndexGeneratorService()
-    out = gen.generate_all_indexes()
-    if out.get("success"):
-        logger.info("All indexes regenerated successfully")
-        return success_response(data=out, message="All indexes regenerated successfully").to_json_response()
-    logger.error("Failed to regenerate all indexes")
-    return server_error_response(out.get("error", "Index regeneration failed")).to_json_response()
+    """POST /docs/api/media/regenerate/all/ - queued as a background operation."""
+    try:
+        return _start_media_job(request, RegenerateIndexesJob(), "Regenerate all indexes", {})
+    except Exception as e:
+        logger.exception("regenerate_all_indexes_api")
+        return server_error_response(f"Error queueing index regeneration: {str(e)}").to_json_response()
 
 
 # -----------------------------------------------------------------------------
@@ -36,4 +36,5 @@ urlpatterns = [
     
     # Stats
     path('stats/', views.stats, name='stats'),
+    path('scheduler/', views.scheduler_status, name='scheduler_status'),
 ]
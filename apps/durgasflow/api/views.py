@@ -11,6 +11,7 @@ from apps.core.decorators.auth import require_super_admin
 from ..services.workflow_service import WorkflowService
 from ..services.execution_engine import ExecutionEngine
 from ..services.node_registry import NodeRegistry
+from ..services.scheduler_service import WorkflowScheduler
 from ..services.workflow_storage_service import (
     WorkflowStorageService,
     CredentialStorageService,
@@ -574,3 +575,15 @@ def stats(request):
     stats_data = WorkflowService.get_workflow_stats(user_uuid)
     serializer = StatsSerializer(stats_data)
     return Response(serializer.data)
+
+
+@require_super_admin
+@api_view(['GET'])
+def scheduler_status(request):
+    """Get lag and throughput metrics last persisted by the workflow scheduler"""
+    try:
+        return Response(WorkflowScheduler.get_persisted_metrics())
+    except Exception as e:
+        return Response({
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
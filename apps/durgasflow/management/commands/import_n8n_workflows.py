@@ -0,0 +1,69 @@
+"""Django management command to bulk import n8n workflow exports."""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.durgasflow.services.workflow_service import WorkflowService
+
+
+class Command(BaseCommand):
+    """Import every n8n export under a directory as durgasflow workflows."""
+
+    help = 'Bulk import n8n workflow exports (default: media/n8n) into durgasflow'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--directory',
+            type=str,
+            default=None,
+            help='Directory to scan recursively for n8n JSON exports'
+        )
+        parser.add_argument(
+            '--user-uuid',
+            type=str,
+            default=None,
+            help='UUID of the user who will own the imported workflows'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of parser processes (default: CPU count)'
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the full import report as JSON'
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        try:
+            report = WorkflowService.import_n8n_directory(
+                user_uuid=options['user_uuid'],
+                directory=options['directory'],
+                max_workers=options['workers'],
+            )
+        except FileNotFoundError as e:
+            raise CommandError(str(e))
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2, default=str))
+            return
+
+        for error in report['errors']:
+            self.stdout.write(self.style.WARNING(f"  {error['path']}: {error['error']}"))
+
+        stats = report['mapping_stats']
+        self.stdout.write(
+            f"Nodes: {stats['total_nodes']} total, {stats['supported_nodes']} supported, "
+            f"{stats['partially_supported_nodes']} partially supported, "
+            f"{stats['unsupported_nodes']} unsupported "
+            f"(confidence {stats['conversion_confidence']:.0%})"
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['imported']}/{report['total_files']} workflows "
+            f"in {report['timings']['total_seconds']}s"
+        ))
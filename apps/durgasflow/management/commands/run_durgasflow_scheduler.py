@@ -0,0 +1,54 @@
+"""Django management command to run the Durgasflow in-app scheduler."""
+
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from apps.durgasflow.services.scheduler_service import WorkflowScheduler
+
+
+class Command(BaseCommand):
+    """Run the scheduler loop for schedule/interval triggered workflows."""
+
+    help = 'Run the Durgasflow workflow scheduler (schedule and interval triggers)'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--sync-interval',
+            type=float,
+            default=60.0,
+            help='Seconds between re-syncs of active workflows from storage'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Sync, fire due workflows, print metrics and exit'
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        scheduler = WorkflowScheduler()
+
+        if options['once']:
+            scheduler.load_state()
+            scheduler.sync_from_storage()
+            fired = scheduler.tick()
+            self.stdout.write(self.style.SUCCESS(f'Dispatched {len(fired)} workflow(s)'))
+            self.stdout.write(str(scheduler.get_metrics()))
+            return
+
+        stop_event = threading.Event()
+
+        def _stop(signum, frame):
+            self.stdout.write('Stopping scheduler...')
+            stop_event.set()
+
+        signal.signal(signal.SIGINT, _stop)
+        signal.signal(signal.SIGTERM, _stop)
+
+        self.stdout.write(self.style.SUCCESS('Durgasflow scheduler started'))
+        scheduler.run_forever(stop_event=stop_event, sync_interval=options['sync_interval'])
+        scheduler.save_state()
+        self.stdout.write(self.style.SUCCESS('Durgasflow scheduler stopped'))
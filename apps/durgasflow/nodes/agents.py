@@ -38,7 +38,7 @@ class ChatCompletionNode(BaseNodeHandler):
     ]
     
     def execute(self, config: Dict, input_data: Any, context: Any) -> Any:
-        from apps.ai_agent.services.ai_service import AIService
+        from apps.ai_agent.services.ai_service import get_ai_service
         
         # Build prompt
         if config.get('use_input_as_prompt') and input_data:
@@ -52,7 +52,7 @@ class ChatCompletionNode(BaseNodeHandler):
         system_prompt = config.get('system_prompt', 'You are a helpful assistant.')
         
         # Call AI service
-        ai_service = AIService()
+        ai_service = get_ai_service()
         
         try:
             response = ai_service.get_completion(
@@ -95,7 +95,7 @@ class CodeGeneratorNode(BaseNodeHandler):
     ]
     
     def execute(self, config: Dict, input_data: Any, context: Any) -> Any:
-        from apps.ai_agent.services.ai_service import AIService
+        from apps.ai_agent.services.ai_service import get_ai_service
         
         language = config.get('language', 'python')
         task = config.get('task_description', '')
@@ -111,7 +111,7 @@ Context data:
 
 Return only the code, no explanations."""
         
-        ai_service = AIService()
+        ai_service = get_ai_service()
         
         try:
             code = ai_service.get_completion(
@@ -153,7 +153,7 @@ class SummarizerNode(BaseNodeHandler):
     ]
     
     def execute(self, config: Dict, input_data: Any, context: Any) -> Any:
-        from apps.ai_agent.services.ai_service import AIService
+        from apps.ai_agent.services.ai_service import get_ai_service
         
         # Extract text from input
         text_field = config.get('text_field', 'text')
@@ -178,7 +178,7 @@ class SummarizerNode(BaseNodeHandler):
 
 {type_instructions.get(summary_type, type_instructions['brief'])}"""
         
-        ai_service = AIService()
+        ai_service = get_ai_service()
         
         try:
             summary = ai_service.get_completion(
@@ -215,7 +215,7 @@ class DataExtractorNode(BaseNodeHandler):
     ]
     
     def execute(self, config: Dict, input_data: Any, context: Any) -> Any:
-        from apps.ai_agent.services.ai_service import AIService
+        from apps.ai_agent.services.ai_service import get_ai_service
         
         schema = config.get('schema', {})
         if isinstance(schema, str):
@@ -241,7 +241,7 @@ Text:
 
 Return the extracted data as JSON with the field names as keys."""
         
-        ai_service = AIService()
+        ai_service = get_ai_service()
         
         try:
             result = ai_service.get_completion(
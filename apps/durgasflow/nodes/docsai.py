@@ -263,7 +263,7 @@ class GenerateDocumentationNode(BaseNodeHandler):
     ]
     
     def execute(self, config: Dict, input_data: Any, context: Any) -> Any:
-        from apps.ai_agent.services.ai_service import AIService
+        from apps.ai_agent.services.ai_service import get_ai_service
         
         doc_type = config.get('doc_type', 'api')
         style = config.get('style', 'technical')
@@ -289,7 +289,7 @@ Create comprehensive documentation including:
 
 Format the documentation in Markdown."""
         
-        ai_service = AIService()
+        ai_service = get_ai_service()
         
         try:
             documentation = ai_service.get_completion(
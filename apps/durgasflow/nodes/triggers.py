@@ -69,6 +69,20 @@ class IntervalTriggerNode(BaseNodeHandler):
             "type": "select",
             "options": ["seconds", "minutes", "hours", "days"],
             "default": "minutes"
+        },
+        {
+            "name": "overlap_policy",
+            "type": "select",
+            "options": ["skip", "queue"],
+            "default": "skip",
+            "description": "What to do if the previous run is still in progress"
+        },
+        {
+            "name": "misfire_policy",
+            "type": "select",
+            "options": ["skip", "run_once", "catch_up"],
+            "default": "run_once",
+            "description": "What to do with runs missed while the scheduler was down"
         }
     ]
     
@@ -3,10 +3,12 @@ from .workflow_service import WorkflowService
 from .execution_engine import ExecutionEngine
 from .node_registry import NodeRegistry
 from .worker_service import WorkerService
+from .scheduler_service import WorkflowScheduler
 
 __all__ = [
     'WorkflowService',
     'ExecutionEngine',
     'NodeRegistry',
     'WorkerService',
+    'WorkflowScheduler',
 ]
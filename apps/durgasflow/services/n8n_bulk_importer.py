@@ -0,0 +1,204 @@
+"""
+N8n Bulk Importer - Import a directory of n8n workflow exports in one pass
+
+Parsing and conversion run in a process pool; the resulting workflows are
+written through WorkflowStorageService in a single batch and summarized in
+one consolidated report.
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+
+from .n8n_parser import N8nParser
+from .workflow_storage_service import WorkflowStorageService
+
+logger = logging.getLogger(__name__)
+
+
+def prepare_n8n_file(file_path: str) -> Dict[str, Any]:
+    """
+    Read and convert one n8n export (process pool worker).
+
+    Args:
+        file_path: Absolute path of the n8n JSON export
+
+    Returns:
+        Dict with 'path' and either 'prepared' (WorkflowService.prepare_n8n_import
+        result) or 'error'
+    """
+    from .workflow_service import WorkflowService
+
+    try:
+        with open(file_path, 'rb') as f:
+            n8n_data = json.loads(f.read())
+        return {'path': file_path, 'prepared': WorkflowService.prepare_n8n_import(n8n_data)}
+    except (OSError, ValueError) as e:
+        # json.JSONDecodeError is a ValueError
+        return {'path': file_path, 'error': str(e)}
+    except Exception as e:
+        logger.warning(f"Unexpected error converting n8n workflow {file_path}: {e}")
+        return {'path': file_path, 'error': str(e)}
+
+
+class N8nBulkImporter:
+    """Bulk importer for directories of n8n workflow exports"""
+
+    # Below this many files the pool start-up cost outweighs the parallelism
+    MIN_FILES_FOR_POOL = 8
+    SKIP_FILES = {'index.json'}
+
+    def __init__(
+        self,
+        storage: Optional[WorkflowStorageService] = None,
+        max_workers: Optional[int] = None,
+        batch_size: int = 100
+    ):
+        """
+        Initialize bulk importer.
+
+        Args:
+            storage: Optional WorkflowStorageService instance
+            max_workers: Process pool size (default: CPU count)
+            batch_size: Number of workflows written per storage batch
+        """
+        self.storage = storage or WorkflowStorageService()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+
+    @staticmethod
+    def default_directory() -> Path:
+        return Path(settings.BASE_DIR) / 'media' / 'n8n'
+
+    def discover_files(self, directory: Path) -> List[str]:
+        """Find every n8n export under a directory, sorted for stable reports"""
+        return sorted(
+            str(path) for path in directory.rglob('*.json')
+            if path.is_file() and path.name not in self.SKIP_FILES
+        )
+
+    def prepare_files(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Convert files, in a process pool when the batch is large enough.
+
+        Results are returned in the same order as ``file_paths``.
+        """
+        # Build the mapping index once so forked workers inherit it
+        N8nParser.get_mapping_index()
+
+        if self.max_workers <= 1 or len(file_paths) < self.MIN_FILES_FOR_POOL:
+            return [prepare_n8n_file(path) for path in file_paths]
+
+        workers = min(self.max_workers, len(file_paths))
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(prepare_n8n_file, file_paths, chunksize=chunksize))
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Process pool unavailable ({e}), converting n8n workflows sequentially")
+            return [prepare_n8n_file(path) for path in file_paths]
+
+    def import_files(self, file_paths: List[str], user_uuid: Optional[str] = None,
+                     base_dir: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Convert and store a list of n8n export files.
+
+        Args:
+            file_paths: Paths of n8n JSON exports
+            user_uuid: Owner of the created workflows
+            base_dir: Directory that report paths are made relative to
+
+        Returns:
+            Consolidated report with per-file results, errors and merged
+            get_mapping_stats for the whole batch
+        """
+        started = time.perf_counter()
+        results = self.prepare_files(file_paths)
+        parsed_at = time.perf_counter()
+
+        def display_path(path: str) -> str:
+            if base_dir:
+                try:
+                    return str(Path(path).relative_to(base_dir))
+                except ValueError:
+                    pass
+            return path
+
+        errors = []
+        pending = []
+        for result in results:
+            if 'error' in result:
+                errors.append({'path': display_path(result['path']), 'error': result['error']})
+            else:
+                pending.append(result)
+
+        imported = []
+        stats_list = []
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start:start + self.batch_size]
+            workflows = []
+            for result in chunk:
+                prepared = dict(result['prepared'])
+                prepared.pop('stats')
+                workflows.append({**prepared, 'created_by': user_uuid, 'status': 'draft'})
+            try:
+                created = self.storage.create_workflows(workflows)
+            except Exception as e:
+                logger.error(f"Failed to store n8n import batch: {e}")
+                errors.extend(
+                    {'path': display_path(result['path']), 'error': f"Storage error: {e}"}
+                    for result in chunk
+                )
+                continue
+
+            for result, workflow in zip(chunk, created):
+                stats = result['prepared']['stats']
+                stats_list.append(stats)
+                imported.append({
+                    'id': workflow.get('id'),
+                    'name': workflow.get('name'),
+                    'path': display_path(result['path']),
+                    'trigger_type': workflow.get('trigger_type'),
+                    'stats': stats,
+                })
+
+        finished = time.perf_counter()
+        report = {
+            'total_files': len(file_paths),
+            'imported': len(imported),
+            'failed': len(errors),
+            'workflows': imported,
+            'errors': errors,
+            'mapping_stats': N8nParser.merge_mapping_stats(stats_list),
+            'timings': {
+                'parse_seconds': round(parsed_at - started, 3),
+                'store_seconds': round(finished - parsed_at, 3),
+                'total_seconds': round(finished - started, 3),
+            },
+        }
+        logger.info(
+            f"Bulk imported {len(imported)}/{len(file_paths)} n8n workflows "
+            f"in {report['timings']['total_seconds']}s"
+        )
+        return report
+
+    def import_directory(self, directory: Optional[str] = None,
+                         user_uuid: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Import every n8n export under a directory (default: media/n8n).
+
+        Raises:
+            FileNotFoundError: If the directory does not exist
+        """
+        base_dir = Path(directory) if directory else self.default_directory()
+        if not base_dir.is_dir():
+            raise FileNotFoundError(f"n8n directory not found: {base_dir}")
+        report = self.import_files(self.discover_files(base_dir), user_uuid=user_uuid, base_dir=base_dir)
+        report['directory'] = str(base_dir)
+        return report
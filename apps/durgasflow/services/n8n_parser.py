@@ -26,11 +26,86 @@ class N8nNodeMapping:
     color: str = "#666666"
 
 
+class N8nMappingIndex:
+    """
+    Precompiled lookup structure for n8n node type mappings.
+
+    Resolution order for a node type:
+    1. exact match on the normalized type (lowercased, ``@n8n/`` scope dropped)
+    2. longest registered node name that prefixes the type's node name
+       (e.g. ``postgresTrigger`` -> ``postgres``), via a character trie
+    3. the keyword rules of ``N8nParser._find_best_mapping``
+
+    Every resolved type is memoized, so each distinct type is looked up once.
+    """
+
+    _TERMINAL = '$'
+
+    def __init__(self, mappings: Dict[str, N8nNodeMapping], fallback):
+        self._exact: Dict[str, N8nNodeMapping] = {}
+        self._trie: Dict[str, Any] = {}
+        self._fallback = fallback
+        self._resolved: Dict[str, Tuple[Optional[N8nNodeMapping], bool]] = {}
+
+        for n8n_type, mapping in mappings.items():
+            normalized = self.normalize(n8n_type)
+            self._exact[normalized] = mapping
+            node = self._trie
+            for char in self.node_name(normalized):
+                node = node.setdefault(char, {})
+            node.setdefault(self._TERMINAL, mapping)
+
+    @staticmethod
+    def normalize(n8n_type: str) -> str:
+        normalized = (n8n_type or '').strip().lower()
+        if normalized.startswith('@n8n/'):
+            normalized = normalized[len('@n8n/'):]
+        return normalized
+
+    @staticmethod
+    def node_name(normalized_type: str) -> str:
+        return normalized_type.rsplit('.', 1)[-1]
+
+    def _longest_prefix(self, name: str) -> Optional[N8nNodeMapping]:
+        node = self._trie
+        best = None
+        for char in name:
+            node = node.get(char)
+            if node is None:
+                break
+            best = node.get(self._TERMINAL, best)
+        return best
+
+    def resolve(self, n8n_type: str) -> Tuple[Optional[N8nNodeMapping], bool]:
+        """
+        Resolve an n8n node type.
+
+        Returns:
+            Tuple of (mapping or None, is_exact)
+        """
+        cached = self._resolved.get(n8n_type)
+        if cached is not None:
+            return cached
+
+        normalized = self.normalize(n8n_type)
+        mapping = self._exact.get(normalized)
+        if mapping:
+            result = (mapping, True)
+        else:
+            mapping = self._longest_prefix(self.node_name(normalized)) or self._fallback(n8n_type)
+            result = (mapping, False)
+
+        self._resolved[n8n_type] = result
+        return result
+
+
 class N8nParser:
     """
     Parser for converting n8n workflow JSON to LiteGraph format
     """
 
+    _mapping_index: Optional[N8nMappingIndex] = None
+
     # N8n node type mappings to durgasflow equivalents
     NODE_MAPPINGS = {
         # Triggers
@@ -213,6 +288,26 @@ class N8nParser:
         )
     }
 
+    @classmethod
+    def get_mapping_index(cls) -> N8nMappingIndex:
+        """Get the precompiled mapping index, building it on first use"""
+        if cls._mapping_index is None:
+            cls._mapping_index = N8nMappingIndex(cls.NODE_MAPPINGS, cls._find_best_mapping)
+        return cls._mapping_index
+
+    @classmethod
+    def resolve_mapping(cls, n8n_type: str) -> Tuple[Optional[N8nNodeMapping], bool]:
+        """
+        Resolve the durgasflow mapping for an n8n node type.
+
+        Args:
+            n8n_type: The n8n node type
+
+        Returns:
+            Tuple of (mapping or None, True if it was an exact match)
+        """
+        return cls.get_mapping_index().resolve(n8n_type)
+
     @classmethod
     def parse_n8n_workflow(cls, n8n_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -278,11 +373,7 @@ class N8nParser:
             Tuple of (litegraph_node_dict, node_id) or (None, None) if conversion fails
         """
         n8n_type = n8n_node.get('type', '')
-        mapping = cls.NODE_MAPPINGS.get(n8n_type)
-
-        if not mapping:
-            # Try fuzzy matching for custom nodes
-            mapping = cls._find_best_mapping(n8n_type)
+        mapping, _ = cls.resolve_mapping(n8n_type)
 
         if not mapping:
             logger.info(f"No mapping found for n8n node type: {n8n_type}")
@@ -602,19 +693,17 @@ class N8nParser:
 
         for node in nodes:
             node_type = node.get('type', '')
-            mapping = cls.NODE_MAPPINGS.get(node_type)
+            mapping, is_exact = cls.resolve_mapping(node_type)
 
-            if mapping:
+            if mapping and is_exact:
                 supported_nodes += 1
                 supported_types.append(node_type)
+            elif mapping:
+                partially_supported += 1
+                supported_types.append(f"{node_type} (mapped to {mapping.durgasflow_type})")
             else:
-                mapping = cls._find_best_mapping(node_type)
-                if mapping:
-                    partially_supported += 1
-                    supported_types.append(f"{node_type} (mapped to {mapping.durgasflow_type})")
-                else:
-                    unsupported_nodes += 1
-                    unsupported_types.append(node_type)
+                unsupported_nodes += 1
+                unsupported_types.append(node_type)
 
         return {
             'total_nodes': total_nodes,
@@ -624,4 +713,41 @@ class N8nParser:
             'supported_types': list(set(supported_types)),
             'unsupported_types': list(set(unsupported_types)),
             'conversion_confidence': (supported_nodes + partially_supported) / total_nodes if total_nodes > 0 else 0
-        }
\ No newline at end of file
+        }
+
+    @classmethod
+    def merge_mapping_stats(cls, stats_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine per-workflow results of get_mapping_stats into one report
+
+        Args:
+            stats_list: List of get_mapping_stats results
+
+        Returns:
+            Dictionary with the same keys as get_mapping_stats, summed over
+            all workflows, plus 'workflows' (number of inputs)
+        """
+        merged = {
+            'workflows': len(stats_list),
+            'total_nodes': 0,
+            'supported_nodes': 0,
+            'partially_supported_nodes': 0,
+            'unsupported_nodes': 0,
+        }
+        supported_types = set()
+        unsupported_types = set()
+
+        for stats in stats_list:
+            for key in ('total_nodes', 'supported_nodes', 'partially_supported_nodes', 'unsupported_nodes'):
+                merged[key] += stats.get(key, 0)
+            supported_types.update(stats.get('supported_types', []))
+            unsupported_types.update(stats.get('unsupported_types', []))
+
+        total_nodes = merged['total_nodes']
+        merged['supported_types'] = sorted(supported_types)
+        merged['unsupported_types'] = sorted(unsupported_types)
+        merged['conversion_confidence'] = (
+            (merged['supported_nodes'] + merged['partially_supported_nodes']) / total_nodes
+            if total_nodes > 0 else 0
+        )
+        return merged
@@ -184,6 +184,8 @@ class ScheduleTriggerNode(BaseNodeHandler):
     properties = [
         {"name": "cron", "type": "string", "default": "0 * * * *"},
         {"name": "timezone", "type": "string", "default": "UTC"},
+        {"name": "overlap_policy", "type": "select", "options": ["skip", "queue"], "default": "skip"},
+        {"name": "misfire_policy", "type": "select", "options": ["skip", "run_once", "catch_up"], "default": "run_once"},
     ]
     
     def execute(self, config: Dict, input_data: Any, context: Any) -> Any:
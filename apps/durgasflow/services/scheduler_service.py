@@ -0,0 +1,727 @@
+"""
+SchedulerService - In-app scheduler for schedule/interval triggered workflows
+
+Keeps a min-heap of next fire times for every active workflow that starts
+with a ``trigger/schedule`` or ``trigger/interval`` node, spreads workflows
+sharing the same cron across a jitter window, applies an overlap policy when
+the previous run is still in flight and a misfire policy for runs missed
+while the scheduler was down. State is persisted to S3 so restarts resume
+where they left off.
+"""
+
+import hashlib
+import heapq
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class OverlapPolicy:
+    """What to do when a run is due while the previous one is still running"""
+    SKIP = 'skip'
+    QUEUE = 'queue'
+
+
+class MisfirePolicy:
+    """What to do with runs that were missed (scheduler down or stalled)"""
+    SKIP = 'skip'
+    RUN_ONCE = 'run_once'
+    CATCH_UP = 'catch_up'
+
+
+INTERVAL_UNITS = {
+    'seconds': 1,
+    'minutes': 60,
+    'hours': 3600,
+    'days': 86400,
+}
+
+ACTIVE_EXECUTION_STATUSES = ('pending', 'running')
+
+
+# ============================================
+# Schedule expressions
+# ============================================
+
+class CronSchedule:
+    """
+    Minimal five-field cron expression (minute hour day month weekday).
+
+    Supports ``*``, lists, ranges, steps, month/weekday names and the usual
+    ``@hourly``/``@daily``/... aliases. Day-of-month and day-of-week are
+    OR-ed when both are restricted, matching Vixie cron.
+    """
+
+    ALIASES = {
+        '@yearly': '0 0 1 1 *',
+        '@annually': '0 0 1 1 *',
+        '@monthly': '0 0 1 * *',
+        '@weekly': '0 0 * * 0',
+        '@daily': '0 0 * * *',
+        '@midnight': '0 0 * * *',
+        '@hourly': '0 * * * *',
+    }
+    MONTH_NAMES = {
+        name: i + 1 for i, name in enumerate(
+            ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
+             'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
+        )
+    }
+    DAY_NAMES = {
+        name: i for i, name in enumerate(
+            ['sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat']
+        )
+    }
+    MAX_ITERATIONS = 50000
+
+    def __init__(self, expression: str):
+        self.expression = (expression or '').strip()
+        parts = self.ALIASES.get(self.expression.lower(), self.expression).split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: '{expression}'")
+
+        self.minutes = self._parse_field(parts[0], 0, 59)
+        self.hours = self._parse_field(parts[1], 0, 23)
+        self.days = self._parse_field(parts[2], 1, 31)
+        self.months = self._parse_field(parts[3], 1, 12, self.MONTH_NAMES)
+        weekdays = self._parse_field(parts[4], 0, 7, self.DAY_NAMES)
+        self.weekdays = {0 if d == 7 else d for d in weekdays}
+        self._days_restricted = not parts[2].startswith('*')
+        self._weekdays_restricted = not parts[4].startswith('*')
+
+    @staticmethod
+    def _parse_field(
+        raw: str,
+        low: int,
+        high: int,
+        names: Optional[Dict[str, int]] = None
+    ) -> Set[int]:
+        """Parse one cron field into the set of values it matches"""
+        def to_int(token: str) -> int:
+            token = token.lower()
+            if names and token in names:
+                return names[token]
+            return int(token)
+
+        values: Set[int] = set()
+        for part in raw.split(','):
+            step = 1
+            if '/' in part:
+                part, step_str = part.split('/', 1)
+                step = int(step_str)
+                if step < 1:
+                    raise ValueError(f"Invalid cron step in '{raw}'")
+
+            if part in ('*', ''):
+                start, end = low, high
+            elif '-' in part:
+                start_str, end_str = part.split('-', 1)
+                start, end = to_int(start_str), to_int(end_str)
+            else:
+                start = to_int(part)
+                end = high if step > 1 else start
+
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field '{raw}' out of range {low}-{high}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        in_days = dt.day in self.days
+        in_weekdays = (dt.weekday() + 1) % 7 in self.weekdays
+        if self._days_restricted and self._weekdays_restricted:
+            return in_days or in_weekdays
+        if self._days_restricted:
+            return in_days
+        if self._weekdays_restricted:
+            return in_weekdays
+        return True
+
+    def next_after(self, dt: datetime) -> datetime:
+        """
+        Get the first matching wall-clock time strictly after ``dt``.
+
+        Args:
+            dt: Naive datetime in the schedule's timezone
+
+        Returns:
+            Naive datetime of the next match
+        """
+        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        for _ in range(self.MAX_ITERATIONS):
+            if candidate.month not in self.months:
+                year = candidate.year + (1 if candidate.month == 12 else 0)
+                month = 1 if candidate.month == 12 else candidate.month + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression never fires: '{self.expression}'")
+
+
+def _get_timezone(name: Optional[str]):
+    try:
+        return ZoneInfo(name or 'UTC')
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning(f"Unknown timezone '{name}', falling back to UTC")
+        return dt_timezone.utc
+
+
+# ============================================
+# Schedule entries and state persistence
+# ============================================
+
+@dataclass
+class ScheduleEntry:
+    """Scheduling state for one workflow"""
+    workflow_id: str
+    kind: str  # 'cron' or 'interval'
+    cron: str = ''
+    interval_seconds: float = 0.0
+    timezone: str = 'UTC'
+    overlap_policy: str = OverlapPolicy.SKIP
+    misfire_policy: str = MisfirePolicy.RUN_ONCE
+    jitter_offset: float = 0.0
+    next_run_at: float = 0.0  # Nominal fire time (epoch seconds)
+    fire_at: float = 0.0  # next_run_at + jitter_offset
+    retry_at: Optional[float] = None  # Re-check for a queued run
+    pending_runs: int = 0
+    catch_up_runs: int = 0  # Pending runs that replay misfires; never skipped as overlaps
+    last_fired_at: Optional[float] = None
+    fired_count: int = 0
+    skipped_count: int = 0
+    missed_count: int = 0
+    last_lag: float = 0.0
+    seq: int = field(default=0, compare=False)
+
+    def spec(self) -> Tuple:
+        """Fields that define when the entry fires"""
+        return (self.kind, self.cron, self.interval_seconds, self.timezone)
+
+    def due_at(self) -> float:
+        if self.retry_at is not None:
+            return min(self.fire_at, self.retry_at)
+        return self.fire_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.pop('seq', None)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScheduleEntry':
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+class SchedulerStateStore:
+    """Persists scheduler state as a single JSON document in S3"""
+
+    def __init__(self, storage=None, key: Optional[str] = None):
+        if storage is None:
+            from apps.documentation.repositories.s3_json_storage import S3JSONStorage
+            storage = S3JSONStorage()
+        self.storage = storage
+        self.key = key or getattr(
+            settings, 'DURGASFLOW_SCHEDULER_STATE_KEY',
+            'models/workflow_scheduler/state.json'
+        )
+
+    def load(self) -> Dict[str, Any]:
+        try:
+            return self.storage.read_json(self.key) or {}
+        except Exception as e:
+            logger.error(f"Failed to load scheduler state: {e}")
+            return {}
+
+    def save(self, state: Dict[str, Any]) -> None:
+        try:
+            self.storage.write_json(self.key, state)
+        except Exception as e:
+            logger.error(f"Failed to save scheduler state: {e}")
+
+
+def extract_trigger_spec(workflow: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Find the schedule/interval trigger configuration of a workflow.
+
+    Looks at the synced ``nodes`` list first, then the raw LiteGraph
+    ``graph_data``, and finally the legacy ``schedule_cron`` field.
+
+    Args:
+        workflow: Workflow data dictionary
+
+    Returns:
+        Dict with 'kind' plus cron/interval settings, or None if the
+        workflow is not time-triggered
+    """
+    candidates = []
+    for node in workflow.get('nodes') or []:
+        candidates.append((node.get('node_type'), node.get('config') or node.get('properties') or {}))
+    for node in (workflow.get('graph_data') or {}).get('nodes') or []:
+        candidates.append((node.get('type'), node.get('properties') or {}))
+
+    workflow_settings = workflow.get('settings') or {}
+    policies = {
+        'overlap_policy': workflow_settings.get('schedule_overlap_policy'),
+        'misfire_policy': workflow_settings.get('schedule_misfire_policy'),
+    }
+
+    for node_type, config in candidates:
+        if node_type == 'trigger/schedule' and config.get('cron'):
+            spec = {'kind': 'cron', 'cron': config['cron'], 'timezone': config.get('timezone') or 'UTC'}
+        elif node_type == 'trigger/interval':
+            try:
+                interval = float(config.get('interval', 60))
+            except (TypeError, ValueError):
+                continue
+            unit = INTERVAL_UNITS.get(config.get('unit', 'minutes'), 60)
+            if interval <= 0:
+                continue
+            spec = {'kind': 'interval', 'interval_seconds': interval * unit}
+        else:
+            continue
+        for key, value in policies.items():
+            spec[key] = config.get(key) or value
+        return spec
+
+    if workflow.get('trigger_type') == 'schedule' and workflow.get('schedule_cron'):
+        return {'kind': 'cron', 'cron': workflow['schedule_cron'], 'timezone': 'UTC', **policies}
+    return None
+
+
+# ============================================
+# Scheduler
+# ============================================
+
+class WorkflowScheduler:
+    """
+    Heap-based scheduler for time-triggered workflows.
+
+    All time comes from the injected ``clock`` and all side effects go
+    through ``dispatcher``, ``is_running`` and ``state_store``, so the
+    scheduler can be driven deterministically in tests.
+    """
+
+    LAG_SAMPLE_SIZE = 500
+
+    def __init__(
+        self,
+        dispatcher: Optional[Callable[[str], Any]] = None,
+        is_running: Optional[Callable[[str], bool]] = None,
+        state_store: Optional[SchedulerStateStore] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        max_jitter_seconds: Optional[float] = None,
+        misfire_grace_seconds: Optional[float] = None,
+        max_catch_up_runs: Optional[int] = None,
+        max_queued_runs: Optional[int] = None,
+        queue_retry_seconds: float = 5.0,
+        dispatch_grace_seconds: float = 5.0,
+    ):
+        self.dispatcher = dispatcher or self._default_dispatcher
+        self.is_running = is_running or self._default_is_running
+        self.state_store = state_store if state_store is not None else SchedulerStateStore()
+        self.clock = clock
+        self.sleep = sleep
+        self.max_jitter_seconds = self._setting('MAX_JITTER_SECONDS', max_jitter_seconds, 30.0)
+        self.misfire_grace_seconds = self._setting('MISFIRE_GRACE_SECONDS', misfire_grace_seconds, 60.0)
+        self.max_catch_up_runs = int(self._setting('MAX_CATCH_UP_RUNS', max_catch_up_runs, 10))
+        self.max_queued_runs = int(self._setting('MAX_QUEUED_RUNS', max_queued_runs, 3))
+        self.queue_retry_seconds = queue_retry_seconds
+        self.dispatch_grace_seconds = dispatch_grace_seconds
+
+        self._entries: Dict[str, ScheduleEntry] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._lags: deque = deque(maxlen=self.LAG_SAMPLE_SIZE)
+        self._counters = {'fired': 0, 'skipped_overlap': 0, 'missed': 0, 'queued': 0, 'dispatch_errors': 0}
+
+    @staticmethod
+    def _setting(name: str, value: Optional[float], default: float) -> float:
+        if value is not None:
+            return value
+        return getattr(settings, f'DURGASFLOW_SCHEDULER_{name}', default)
+
+    # ---------- defaults ----------
+
+    @staticmethod
+    def _default_dispatcher(workflow_id: str) -> Optional[str]:
+        from .worker_service import WorkerService
+        return WorkerService.queue_scheduled_workflow(workflow_id)
+
+    @staticmethod
+    def _default_is_running(workflow_id: str) -> bool:
+        from .workflow_storage_service import WorkflowStorageService
+        workflow = WorkflowStorageService().get_workflow(workflow_id) or {}
+        return any(
+            execution.get('status') in ACTIVE_EXECUTION_STATUSES
+            for execution in workflow.get('executions', [])
+        )
+
+    # ---------- time helpers ----------
+
+    def _jitter_for(self, workflow_id: str, kind: str, interval_seconds: float) -> float:
+        """Stable per-workflow offset so identical schedules spread out"""
+        window = self.max_jitter_seconds
+        if kind == 'interval':
+            window = min(window, interval_seconds / 2)
+        if window <= 0:
+            return 0.0
+        digest = hashlib.sha1(workflow_id.encode('utf-8')).hexdigest()
+        return (int(digest[:8], 16) / 0xFFFFFFFF) * window
+
+    def _next_nominal(self, entry: ScheduleEntry, after: float) -> float:
+        if entry.kind == 'interval':
+            return after + entry.interval_seconds
+        tz = _get_timezone(entry.timezone)
+        local = datetime.fromtimestamp(after, tz).replace(tzinfo=None)
+        return CronSchedule(entry.cron).next_after(local).replace(tzinfo=tz).timestamp()
+
+    def _set_next_run(self, entry: ScheduleEntry, nominal: float) -> None:
+        entry.next_run_at = nominal
+        entry.fire_at = nominal + entry.jitter_offset
+
+    # ---------- heap management ----------
+
+    def _push(self, entry: ScheduleEntry) -> None:
+        self._seq += 1
+        entry.seq = self._seq
+        heapq.heappush(self._heap, (entry.due_at(), entry.seq, entry.workflow_id))
+
+    def add_or_update(
+        self,
+        workflow_id: str,
+        kind: str,
+        cron: str = '',
+        interval_seconds: float = 0.0,
+        timezone: str = 'UTC',
+        overlap_policy: Optional[str] = None,
+        misfire_policy: Optional[str] = None,
+    ) -> ScheduleEntry:
+        """
+        Register a workflow schedule, keeping progress if the spec is unchanged.
+
+        Raises:
+            ValueError: If the cron expression or interval is invalid
+        """
+        workflow_id = str(workflow_id)
+        if kind == 'cron':
+            CronSchedule(cron)
+        elif kind != 'interval' or interval_seconds <= 0:
+            raise ValueError(f"Invalid schedule for workflow {workflow_id}")
+
+        with self._lock:
+            entry = ScheduleEntry(
+                workflow_id=workflow_id,
+                kind=kind,
+                cron=cron,
+                interval_seconds=float(interval_seconds),
+                timezone=timezone or 'UTC',
+                overlap_policy=overlap_policy or OverlapPolicy.SKIP,
+                misfire_policy=misfire_policy or MisfirePolicy.RUN_ONCE,
+            )
+            existing = self._entries.get(workflow_id)
+            if existing and existing.spec() == entry.spec():
+                existing.overlap_policy = entry.overlap_policy
+                existing.misfire_policy = entry.misfire_policy
+                return existing
+
+            entry.jitter_offset = self._jitter_for(workflow_id, kind, entry.interval_seconds)
+            self._set_next_run(entry, self._next_nominal(entry, self.clock()))
+            self._entries[workflow_id] = entry
+            self._push(entry)
+            self._dirty = True
+            return entry
+
+    def remove(self, workflow_id: str) -> bool:
+        """Stop scheduling a workflow. Stale heap items are skipped lazily."""
+        with self._lock:
+            removed = self._entries.pop(str(workflow_id), None) is not None
+            self._dirty = self._dirty or removed
+            return removed
+
+    def sync_workflows(self, workflows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Reconcile scheduled entries with the given active workflows.
+
+        Workflows without a schedule/interval trigger, or with an invalid
+        one, are removed from the scheduler.
+        """
+        seen = set()
+        for workflow in workflows:
+            workflow_id = str(workflow.get('id') or workflow.get('uuid') or '')
+            if not workflow_id or not workflow.get('is_active'):
+                continue
+            spec = extract_trigger_spec(workflow)
+            if not spec:
+                continue
+            try:
+                self.add_or_update(workflow_id, **spec)
+                seen.add(workflow_id)
+            except ValueError as e:
+                logger.warning(f"Not scheduling workflow {workflow_id}: {e}")
+
+        with self._lock:
+            for workflow_id in list(self._entries):
+                if workflow_id not in seen:
+                    self.remove(workflow_id)
+
+    def sync_from_storage(self) -> None:
+        """Reconcile with the active workflows in workflow storage"""
+        from .workflow_storage_service import WorkflowStorageService
+        result = WorkflowStorageService().list(filters={'is_active': True}, limit=None)
+        self.sync_workflows(result.get('items', []))
+
+    # ---------- firing ----------
+
+    def _advance_past(self, entry: ScheduleEntry, nominal: float, now: float) -> Tuple[float, int]:
+        """Return the first nominal time firing after ``now`` and how many occurrences were passed"""
+        occurrences = 0
+        while nominal + entry.jitter_offset <= now:
+            if entry.kind == 'interval':
+                # Jump over long outages arithmetically instead of one interval at a time
+                steps = int((now - entry.jitter_offset - nominal) // entry.interval_seconds) + 1
+                occurrences += steps
+                nominal += steps * entry.interval_seconds
+            else:
+                occurrences += 1
+                nominal = self._next_nominal(entry, nominal)
+        return nominal, occurrences
+
+    def _collect_due(self, entry: ScheduleEntry, now: float) -> None:
+        """Advance a due entry past ``now`` and add its runs to pending"""
+        lag = now - entry.fire_at
+        nominal, occurrences = self._advance_past(entry, entry.next_run_at, now)
+        self._set_next_run(entry, nominal)
+
+        catch_up = False
+        if lag <= self.misfire_grace_seconds:
+            runs = 1
+        elif entry.misfire_policy == MisfirePolicy.CATCH_UP:
+            runs = min(occurrences, self.max_catch_up_runs)
+            catch_up = True
+        elif entry.misfire_policy == MisfirePolicy.RUN_ONCE:
+            runs = 1
+        else:
+            runs = 0
+        missed = occurrences - runs
+
+        if missed:
+            entry.missed_count += missed
+            self._counters['missed'] += missed
+            logger.info(f"Workflow {entry.workflow_id} missed {missed} scheduled run(s)")
+
+        if runs:
+            entry.last_lag = lag
+            self._lags.append(lag)
+            limit = self.max_queued_runs if entry.overlap_policy == OverlapPolicy.QUEUE else 1
+            if catch_up:
+                # Replays are bounded by max_catch_up_runs, not by the overlap policy
+                limit = max(limit, self.max_catch_up_runs)
+            if entry.pending_runs + runs > limit:
+                dropped = entry.pending_runs + runs - limit
+                entry.skipped_count += dropped
+                self._counters['skipped_overlap'] += dropped
+            entry.pending_runs = min(entry.pending_runs + runs, limit)
+            if catch_up:
+                entry.catch_up_runs = entry.pending_runs
+
+    def _is_busy(self, entry: ScheduleEntry, now: float) -> bool:
+        if entry.last_fired_at is not None and now - entry.last_fired_at < self.dispatch_grace_seconds:
+            return True
+        try:
+            return bool(self.is_running(entry.workflow_id))
+        except Exception as e:
+            logger.warning(f"Could not check running state of workflow {entry.workflow_id}: {e}")
+            return False
+
+    def _process(self, entry: ScheduleEntry, now: float, fired: List[str]) -> None:
+        entry.retry_at = None
+        if entry.fire_at <= now:
+            self._collect_due(entry, now)
+
+        if entry.pending_runs and self._is_busy(entry, now):
+            if entry.overlap_policy == OverlapPolicy.QUEUE or entry.catch_up_runs:
+                entry.retry_at = now + self.queue_retry_seconds
+                self._counters['queued'] += 1
+            else:
+                entry.skipped_count += entry.pending_runs
+                self._counters['skipped_overlap'] += entry.pending_runs
+                logger.info(f"Skipped overlapping run of workflow {entry.workflow_id}")
+                entry.pending_runs = 0
+        elif entry.pending_runs:
+            try:
+                self.dispatcher(entry.workflow_id)
+                entry.fired_count += 1
+                self._counters['fired'] += 1
+                fired.append(entry.workflow_id)
+            except Exception as e:
+                self._counters['dispatch_errors'] += 1
+                logger.error(f"Failed to dispatch scheduled workflow {entry.workflow_id}: {e}")
+            entry.pending_runs -= 1
+            entry.catch_up_runs = min(entry.catch_up_runs, entry.pending_runs)
+            entry.last_fired_at = now
+            if entry.pending_runs:
+                entry.retry_at = now + self.queue_retry_seconds
+
+        self._dirty = True
+        self._push(entry)
+
+    def tick(self) -> List[str]:
+        """
+        Fire every entry that is due at the current clock time.
+
+        Returns:
+            Workflow IDs dispatched during this tick
+        """
+        fired: List[str] = []
+        with self._lock:
+            now = self.clock()
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, workflow_id = heapq.heappop(self._heap)
+                entry = self._entries.get(workflow_id)
+                if entry is None or entry.seq != seq:
+                    continue
+                self._process(entry, now, fired)
+            if self._dirty:
+                self.save_state()
+        return fired
+
+    def seconds_until_next(self) -> Optional[float]:
+        """Seconds until the earliest live heap item, or None if idle"""
+        with self._lock:
+            while self._heap:
+                due, seq, workflow_id = self._heap[0]
+                entry = self._entries.get(workflow_id)
+                if entry is not None and entry.seq == seq:
+                    return max(0.0, due - self.clock())
+                heapq.heappop(self._heap)
+        return None
+
+    def run_forever(
+        self,
+        stop_event: Optional[threading.Event] = None,
+        sync_interval: float = 60.0,
+        max_sleep: float = 1.0,
+    ) -> None:
+        """
+        Run the scheduler loop until ``stop_event`` is set.
+
+        Workflows are re-synced from storage every ``sync_interval``
+        seconds so activations and graph edits are picked up.
+        """
+        stop_event = stop_event or threading.Event()
+        self.load_state()
+        next_sync = 0.0
+        while not stop_event.is_set():
+            if self.clock() >= next_sync:
+                try:
+                    self.sync_from_storage()
+                except Exception as e:
+                    logger.error(f"Scheduler sync failed: {e}")
+                next_sync = self.clock() + sync_interval
+            self.tick()
+            wait = self.seconds_until_next()
+            self.sleep(max_sleep if wait is None else min(wait, max_sleep))
+
+    # ---------- persistence and metrics ----------
+
+    def load_state(self) -> None:
+        """Restore entries from the state store and rebuild the heap"""
+        state = self.state_store.load()
+        with self._lock:
+            self._entries.clear()
+            self._heap.clear()
+            for data in (state.get('entries') or {}).values():
+                try:
+                    entry = ScheduleEntry.from_dict(data)
+                except TypeError as e:
+                    logger.warning(f"Ignoring malformed scheduler entry: {e}")
+                    continue
+                self._entries[entry.workflow_id] = entry
+                self._push(entry)
+            self._counters.update(state.get('counters') or {})
+            self._dirty = False
+        logger.info(f"Loaded scheduler state with {len(self._entries)} workflow(s)")
+
+    def save_state(self) -> None:
+        with self._lock:
+            state = {
+                'version': 1,
+                'saved_at': datetime.utcnow().isoformat(),
+                'entries': {wid: entry.to_dict() for wid, entry in self._entries.items()},
+                'counters': dict(self._counters),
+                'metrics': self.get_metrics(include_workflows=False),
+            }
+            self._dirty = False
+        self.state_store.save(state)
+
+    def get_metrics(self, include_workflows: bool = True) -> Dict[str, Any]:
+        """
+        Get scheduler lag and throughput metrics.
+
+        Lag is the delay between a run's jittered fire time and the tick
+        that dispatched it.
+        """
+        with self._lock:
+            lags = sorted(self._lags)
+
+            def percentile(p: float) -> float:
+                if not lags:
+                    return 0.0
+                return lags[min(len(lags) - 1, int(round(p * (len(lags) - 1))))]
+
+            live = [entry.due_at() for entry in self._entries.values()]
+            metrics = {
+                'scheduled_workflows': len(self._entries),
+                'next_fire_at': min(live) if live else None,
+                'pending_runs': sum(e.pending_runs for e in self._entries.values()),
+                'lag_seconds': {
+                    'samples': len(lags),
+                    'p50': percentile(0.5),
+                    'p95': percentile(0.95),
+                    'max': lags[-1] if lags else 0.0,
+                },
+                **{f'{name}_total': value for name, value in self._counters.items()},
+            }
+            if include_workflows:
+                metrics['workflows'] = {
+                    wid: {
+                        'kind': entry.kind,
+                        'next_run_at': entry.next_run_at,
+                        'fire_at': entry.fire_at,
+                        'jitter_offset': round(entry.jitter_offset, 3),
+                        'pending_runs': entry.pending_runs,
+                        'fired': entry.fired_count,
+                        'skipped': entry.skipped_count,
+                        'missed': entry.missed_count,
+                        'last_lag': entry.last_lag,
+                    }
+                    for wid, entry in self._entries.items()
+                }
+            return metrics
+
+    @classmethod
+    def get_persisted_metrics(cls, state_store: Optional[SchedulerStateStore] = None) -> Dict[str, Any]:
+        """Read the metrics last saved by the running scheduler process"""
+        state = (state_store or SchedulerStateStore()).load()
+        metrics = dict(state.get('metrics') or {})
+        metrics['saved_at'] = state.get('saved_at')
+        return metrics
@@ -81,10 +81,19 @@ class WorkerService:
         """
         Set up a scheduled task for a workflow.
         
+        When the in-app scheduler is enabled (DURGASFLOW_SCHEDULER_ENABLED),
+        it picks active workflows up on its next sync, so any per-workflow
+        Django-Q schedule is removed instead of created.
+        
         Args:
             workflow_id: UUID of the workflow
             cron: Cron expression for the schedule
         """
+        if getattr(settings, 'DURGASFLOW_SCHEDULER_ENABLED', False):
+            cls.remove_schedule(workflow_id)
+            logger.info(f"Workflow {workflow_id} will be scheduled by the in-app scheduler: {cron}")
+            return
+        
         try:
             from django_q.models import Schedule
             
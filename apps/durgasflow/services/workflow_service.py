@@ -314,16 +314,21 @@ class WorkflowService:
         )
 
     @classmethod
-    def import_n8n_workflow(cls, n8n_data: Dict, user_uuid: str) -> Dict[str, Any]:
+    def prepare_n8n_import(cls, n8n_data: Dict) -> Dict[str, Any]:
         """
-        Import n8n workflow and convert to durgasflow format.
+        Validate and convert an n8n workflow without writing anything.
+
+        Safe to call from worker processes; used by both single and bulk import.
 
         Args:
             n8n_data: n8n workflow JSON data
-            user_uuid: User UUID who will own the imported workflow
 
         Returns:
-            Created workflow data dictionary
+            Dict with 'name', 'description', 'trigger_type', 'graph_data',
+            'tags' and 'stats' for the workflow to create
+
+        Raises:
+            ValueError: If the workflow is invalid or cannot be converted
         """
         from .n8n_parser import N8nParser
 
@@ -349,8 +354,30 @@ class WorkflowService:
         stats = N8nParser.get_mapping_stats(n8n_data)
         litegraph_data['extra']['conversion_stats'] = stats
 
-        # Determine trigger type from n8n workflow
-        trigger_type = cls._detect_trigger_type(n8n_data)
+        return {
+            'name': f"{n8n_data.get('name', 'Imported N8n Workflow')} (N8n)",
+            'description': f"Imported from n8n workflow. {stats['supported_nodes']}/{stats['total_nodes']} nodes converted successfully.",
+            # Determine trigger type from n8n workflow
+            'trigger_type': cls._detect_trigger_type(n8n_data),
+            'graph_data': litegraph_data,
+            'tags': ['n8n-import', 'imported'],
+            'stats': stats,
+        }
+
+    @classmethod
+    def import_n8n_workflow(cls, n8n_data: Dict, user_uuid: str) -> Dict[str, Any]:
+        """
+        Import n8n workflow and convert to durgasflow format.
+
+        Args:
+            n8n_data: n8n workflow JSON data
+            user_uuid: User UUID who will own the imported workflow
+
+        Returns:
+            Created workflow data dictionary
+        """
+        prepared = cls.prepare_n8n_import(n8n_data)
+        stats = prepared.pop('stats')
 
         # Convert user_uuid to string if needed
         if hasattr(user_uuid, 'uuid'):
@@ -361,18 +388,41 @@ class WorkflowService:
             user_uuid = str(user_uuid)
 
         # Create workflow
-        workflow = cls.create_workflow(
-            name=f"{n8n_data.get('name', 'Imported N8n Workflow')} (N8n)",
-            description=f"Imported from n8n workflow. {stats['supported_nodes']}/{stats['total_nodes']} nodes converted successfully.",
-            trigger_type=trigger_type,
-            graph_data=litegraph_data,
-            tags=['n8n-import', 'imported'],
-            user_uuid=user_uuid
-        )
+        workflow = cls.create_workflow(user_uuid=user_uuid, **prepared)
 
         logger.info(f"Successfully imported n8n workflow: {workflow.get('id')} - {stats['supported_nodes']}/{stats['total_nodes']} nodes converted")
         return workflow
 
+    @classmethod
+    def import_n8n_directory(
+        cls,
+        user_uuid: str,
+        directory: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Import every n8n workflow under a directory (default: media/n8n).
+
+        Args:
+            user_uuid: User UUID who will own the imported workflows
+            directory: Directory to scan recursively for *.json exports
+            max_workers: Process pool size (default: CPU count)
+
+        Returns:
+            Consolidated import report (see N8nBulkImporter.import_directory)
+        """
+        from .n8n_bulk_importer import N8nBulkImporter
+
+        if hasattr(user_uuid, 'uuid'):
+            user_uuid = str(user_uuid.uuid)
+        elif hasattr(user_uuid, 'id'):
+            user_uuid = str(user_uuid.id)
+        elif user_uuid is not None:
+            user_uuid = str(user_uuid)
+
+        importer = N8nBulkImporter(storage=cls._storage, max_workers=max_workers)
+        return importer.import_directory(directory=directory, user_uuid=user_uuid)
+
     @classmethod
     def _detect_trigger_type(cls, n8n_data: Dict) -> str:
         """
@@ -43,10 +43,44 @@ class WorkflowStorageService(S3ModelStorage):
         **kwargs
     ) -> Dict[str, Any]:
         """Create a new workflow."""
+        workflow_data = self.build_workflow_data(
+            name=name,
+            description=description,
+            graph_data=graph_data,
+            status=status,
+            trigger_type=trigger_type,
+            created_by=created_by,
+            **kwargs
+        )
+        return self.create(workflow_data, item_uuid=workflow_data['id'])
+    
+    def create_workflows(self, workflows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several workflows in one batch.
+        
+        Args:
+            workflows: List of create_workflow keyword-argument dicts
+            
+        Returns:
+            List of created workflow data
+        """
+        return self.batch_create([self.build_workflow_data(**workflow) for workflow in workflows])
+    
+    def build_workflow_data(
+        self,
+        name: str,
+        description: str = '',
+        graph_data: Optional[Dict] = None,
+        status: str = 'draft',
+        trigger_type: str = 'manual',
+        created_by: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build the stored document for a new workflow without writing it."""
         workflow_id = str(uuid_lib.uuid4())
         now = datetime.utcnow().isoformat()
         
-        workflow_data = {
+        return {
             'id': workflow_id,
             'name': name,
             'description': description,
@@ -70,8 +104,6 @@ class WorkflowStorageService(S3ModelStorage):
             'connections': [],  # WorkflowConnection data stored as nested list
             'executions': [],  # Execution data stored as nested list
         }
-        
-        return self.create(workflow_data, item_uuid=workflow_id)
     
     def get_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Get workflow by ID."""
@@ -0,0 +1 @@
+"""Durgasflow tests."""
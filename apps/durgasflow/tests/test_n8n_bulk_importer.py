@@ -0,0 +1,109 @@
+"""Tests for the n8n mapping index and bulk importer."""
+import json
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase
+
+from apps.durgasflow.services.n8n_bulk_importer import N8nBulkImporter
+from apps.durgasflow.services.n8n_parser import N8nParser
+
+
+class FakeWorkflowStorage:
+    """Records batches instead of writing to S3."""
+
+    def __init__(self):
+        self.batches = []
+
+    def create_workflows(self, workflows):
+        self.batches.append(workflows)
+        return [{**workflow, 'id': f"wf-{i}"} for i, workflow in enumerate(workflows)]
+
+
+def _n8n_export(name, node_types):
+    return {
+        'name': name,
+        'nodes': [
+            {'id': str(i), 'name': f'node {i}', 'type': node_type, 'parameters': {}}
+            for i, node_type in enumerate(node_types)
+        ],
+        'connections': {},
+    }
+
+
+class N8nMappingIndexTest(TestCase):
+    """Test exact, prefix and keyword resolution."""
+
+    def test_exact_match(self):
+        """Test registered types resolve exactly."""
+        mapping, is_exact = N8nParser.resolve_mapping('n8n-nodes-base.httpRequest')
+        self.assertTrue(is_exact)
+        self.assertEqual(mapping.durgasflow_type, 'action/http_request')
+
+    def test_prefix_match(self):
+        """Test longest registered node name prefix wins."""
+        mapping, is_exact = N8nParser.resolve_mapping('n8n-nodes-base.postgresTrigger')
+        self.assertFalse(is_exact)
+        self.assertEqual(mapping.durgasflow_type, 'action/database_query')
+
+    def test_keyword_fallback_and_unknown(self):
+        """Test keyword rules still apply and unknown types resolve to None."""
+        mapping, _ = N8nParser.resolve_mapping('n8n-nodes-base.emailReadImap')
+        self.assertEqual(mapping.durgasflow_type, 'action/email')
+        self.assertEqual(N8nParser.resolve_mapping('n8n-nodes-base.splitInBatches'), (None, False))
+
+
+class N8nBulkImporterTest(TestCase):
+    """Test bulk import of a directory of n8n exports."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        (self.base / 'team').mkdir()
+        (self.base / 'a.json').write_text(json.dumps(
+            _n8n_export('A', ['n8n-nodes-base.webhook', 'n8n-nodes-base.code'])
+        ))
+        (self.base / 'team' / 'b.json').write_text(json.dumps(
+            _n8n_export('B', ['n8n-nodes-base.scheduleTrigger', 'n8n-nodes-base.splitInBatches'])
+        ))
+        (self.base / 'broken.json').write_text('{not json')
+        (self.base / 'index.json').write_text('{}')
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.tmp.cleanup()
+
+    def test_import_directory_report(self):
+        """Test one consolidated report and one storage batch."""
+        storage = FakeWorkflowStorage()
+        report = N8nBulkImporter(storage=storage, max_workers=1).import_directory(
+            directory=str(self.base), user_uuid='user-1'
+        )
+
+        self.assertEqual(report['total_files'], 3)
+        self.assertEqual(report['imported'], 2)
+        self.assertEqual(report['failed'], 1)
+        self.assertEqual(report['errors'][0]['path'], 'broken.json')
+        self.assertEqual(len(storage.batches), 1)
+        self.assertEqual({w['created_by'] for w in storage.batches[0]}, {'user-1'})
+
+        stats = report['mapping_stats']
+        self.assertEqual(stats['workflows'], 2)
+        self.assertEqual(stats['total_nodes'], 4)
+        self.assertEqual(stats['supported_nodes'], 3)
+        self.assertEqual(stats['unsupported_types'], ['n8n-nodes-base.splitInBatches'])
+        triggers = {w['path']: w['trigger_type'] for w in report['workflows']}
+        self.assertEqual(triggers, {'a.json': 'webhook', 'team/b.json': 'schedule'})
+
+    def test_process_pool_matches_sequential(self):
+        """Test pooled conversion returns results in input order."""
+        files = []
+        for i in range(N8nBulkImporter.MIN_FILES_FOR_POOL):
+            path = self.base / f'w{i}.json'
+            path.write_text(json.dumps(_n8n_export(f'W{i}', ['n8n-nodes-base.set'])))
+            files.append(str(path))
+
+        results = N8nBulkImporter(storage=FakeWorkflowStorage(), max_workers=2).prepare_files(files)
+        self.assertEqual([r['path'] for r in results], files)
+        self.assertEqual(results[3]['prepared']['name'], 'W3 (N8n)')
@@ -0,0 +1,244 @@
+"""Tests for the Durgasflow workflow scheduler."""
+from datetime import datetime, timezone
+
+from django.test import TestCase
+
+from apps.durgasflow.services.scheduler_service import (
+    CronSchedule,
+    MisfirePolicy,
+    OverlapPolicy,
+    SchedulerStateStore,
+    WorkflowScheduler,
+    extract_trigger_spec,
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, start):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class InMemoryJSONStorage:
+    """Stand-in for S3JSONStorage."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def read_json(self, key):
+        return self.objects.get(key)
+
+    def write_json(self, key, data):
+        self.objects[key] = data
+        return key
+
+
+def _ts(*args):
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+class CronScheduleTest(TestCase):
+    """Test CronSchedule parsing and next fire computation."""
+
+    def test_every_fifteen_minutes(self):
+        """Test step expressions."""
+        cron = CronSchedule('*/15 * * * *')
+        self.assertEqual(cron.next_after(datetime(2024, 1, 1, 10, 7)), datetime(2024, 1, 1, 10, 15))
+        self.assertEqual(cron.next_after(datetime(2024, 1, 1, 10, 45)), datetime(2024, 1, 1, 11, 0))
+
+    def test_weekday_names_and_aliases(self):
+        """Test named weekdays and @daily alias."""
+        # 2024-01-06 is a Saturday
+        cron = CronSchedule('30 9 * * mon-fri')
+        self.assertEqual(cron.next_after(datetime(2024, 1, 6, 12, 0)), datetime(2024, 1, 8, 9, 30))
+        daily = CronSchedule('@daily')
+        self.assertEqual(daily.next_after(datetime(2024, 2, 28, 1, 0)), datetime(2024, 2, 29, 0, 0))
+
+    def test_invalid_expression(self):
+        """Test invalid expressions raise ValueError."""
+        with self.assertRaises(ValueError):
+            CronSchedule('61 * * * *')
+        with self.assertRaises(ValueError):
+            CronSchedule('* * *')
+
+
+class WorkflowSchedulerTest(TestCase):
+    """Test WorkflowScheduler with a fake clock and no external services."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock(_ts(2024, 1, 1, 0, 0))
+        self.storage = InMemoryJSONStorage()
+        self.dispatched = []
+        self.running = set()
+
+    def _make_scheduler(self, **kwargs):
+        options = {
+            'dispatcher': self.dispatched.append,
+            'is_running': lambda workflow_id: workflow_id in self.running,
+            'state_store': SchedulerStateStore(storage=self.storage, key='state.json'),
+            'clock': self.clock,
+            'sleep': lambda seconds: None,
+            'max_jitter_seconds': 0,
+            'misfire_grace_seconds': 60,
+            'dispatch_grace_seconds': 0,
+        }
+        options.update(kwargs)
+        return WorkflowScheduler(**options)
+
+    def test_interval_fires_in_order(self):
+        """Test interval workflows fire when due and not before."""
+        scheduler = self._make_scheduler()
+        scheduler.add_or_update('wf-a', kind='interval', interval_seconds=60)
+        scheduler.add_or_update('wf-b', kind='interval', interval_seconds=90)
+
+        self.clock.advance(59)
+        self.assertEqual(scheduler.tick(), [])
+        self.clock.advance(1)
+        self.assertEqual(scheduler.tick(), ['wf-a'])
+        self.clock.advance(30)
+        self.assertEqual(scheduler.tick(), ['wf-b'])
+        self.clock.advance(30)
+        self.assertEqual(scheduler.tick(), ['wf-a'])
+
+    def test_jitter_spreads_identical_crons(self):
+        """Test workflows on the same cron get distinct, stable offsets."""
+        scheduler = self._make_scheduler(max_jitter_seconds=30)
+        offsets = {
+            scheduler.add_or_update(f'wf-{i}', kind='cron', cron='0 * * * *').jitter_offset
+            for i in range(10)
+        }
+        self.assertGreater(len(offsets), 1)
+        self.assertTrue(all(0 <= offset <= 30 for offset in offsets))
+
+        again = self._make_scheduler(max_jitter_seconds=30)
+        self.assertEqual(
+            again.add_or_update('wf-0', kind='cron', cron='0 * * * *').jitter_offset,
+            scheduler._entries['wf-0'].jitter_offset,
+        )
+
+    def test_overlap_skip(self):
+        """Test a due run is skipped while the previous run is in flight."""
+        scheduler = self._make_scheduler()
+        scheduler.add_or_update('wf-a', kind='interval', interval_seconds=60)
+        self.running.add('wf-a')
+
+        self.clock.advance(60)
+        self.assertEqual(scheduler.tick(), [])
+        self.assertEqual(scheduler.get_metrics()['skipped_overlap_total'], 1)
+
+        self.running.clear()
+        self.clock.advance(60)
+        self.assertEqual(scheduler.tick(), ['wf-a'])
+
+    def test_overlap_queue(self):
+        """Test a queued run is dispatched once the previous run finishes."""
+        scheduler = self._make_scheduler(queue_retry_seconds=5)
+        scheduler.add_or_update(
+            'wf-a', kind='interval', interval_seconds=60, overlap_policy=OverlapPolicy.QUEUE
+        )
+        self.running.add('wf-a')
+
+        self.clock.advance(60)
+        self.assertEqual(scheduler.tick(), [])
+        self.running.clear()
+        self.clock.advance(5)
+        self.assertEqual(scheduler.tick(), ['wf-a'])
+
+    def test_state_survives_restart_with_run_once_misfire(self):
+        """Test persisted state is restored and missed runs collapse to one."""
+        scheduler = self._make_scheduler()
+        scheduler.add_or_update('wf-a', kind='interval', interval_seconds=60)
+        scheduler.save_state()
+
+        self.clock.advance(600)
+        restarted = self._make_scheduler()
+        restarted.load_state()
+        self.assertEqual(restarted.tick(), ['wf-a'])
+        metrics = restarted.get_metrics()
+        self.assertEqual(metrics['missed_total'], 9)
+        self.assertGreater(metrics['next_fire_at'], self.clock())
+
+    def test_catch_up_misfire(self):
+        """Test catch_up replays missed runs one at a time."""
+        scheduler = self._make_scheduler(queue_retry_seconds=1)
+        scheduler.add_or_update(
+            'wf-a', kind='interval', interval_seconds=60,
+            overlap_policy=OverlapPolicy.QUEUE, misfire_policy=MisfirePolicy.CATCH_UP,
+        )
+        self.clock.advance(180)
+        self.assertEqual(scheduler.tick(), ['wf-a'])
+        self.clock.advance(1)
+        self.assertEqual(scheduler.tick(), ['wf-a'])
+        self.clock.advance(1)
+        self.assertEqual(scheduler.tick(), ['wf-a'])
+        self.clock.advance(1)
+        self.assertEqual(scheduler.tick(), [])
+
+    def test_catch_up_after_long_outage(self):
+        """Test catch_up replays survive the skip policy and the rest count as missed."""
+        scheduler = self._make_scheduler(queue_retry_seconds=1, max_catch_up_runs=5)
+        scheduler.add_or_update(
+            'wf-a', kind='interval', interval_seconds=60, misfire_policy=MisfirePolicy.CATCH_UP,
+        )
+        self.clock.advance(24 * 3600)
+        self.assertEqual(scheduler.tick(), ['wf-a'])
+
+        # A replay still running delays the next one instead of skipping it
+        self.running.add('wf-a')
+        self.clock.advance(1)
+        self.assertEqual(scheduler.tick(), [])
+        self.running.clear()
+        for _ in range(4):
+            self.clock.advance(1)
+            self.assertEqual(scheduler.tick(), ['wf-a'])
+        self.clock.advance(1)
+        self.assertEqual(scheduler.tick(), [])
+
+        metrics = scheduler.get_metrics()
+        self.assertEqual(metrics['fired_total'], 5)
+        self.assertEqual(metrics['missed_total'], 24 * 60 - 5)
+        self.assertEqual(metrics['skipped_overlap_total'], 0)
+        self.assertGreater(metrics['next_fire_at'], self.clock())
+
+    def test_lag_metrics(self):
+        """Test lag between fire time and dispatch is recorded."""
+        scheduler = self._make_scheduler()
+        scheduler.add_or_update('wf-a', kind='interval', interval_seconds=60)
+        self.clock.advance(65)
+        scheduler.tick()
+        metrics = scheduler.get_metrics()
+        self.assertEqual(metrics['lag_seconds']['max'], 5)
+        self.assertEqual(metrics['workflows']['wf-a']['fired'], 1)
+        self.assertIn('metrics', self.storage.objects['state.json'])
+
+    def test_sync_workflows(self):
+        """Test syncing picks up trigger nodes and drops inactive workflows."""
+        scheduler = self._make_scheduler()
+        workflow = {
+            'id': 'wf-a',
+            'is_active': True,
+            'nodes': [{'node_type': 'trigger/interval', 'config': {'interval': 5, 'unit': 'minutes'}}],
+        }
+        scheduler.sync_workflows([workflow])
+        self.assertEqual(scheduler._entries['wf-a'].interval_seconds, 300)
+
+        scheduler.sync_workflows([{**workflow, 'is_active': False}])
+        self.assertEqual(scheduler.get_metrics()['scheduled_workflows'], 0)
+
+    def test_extract_trigger_spec_from_graph_data(self):
+        """Test schedule trigger is found in LiteGraph graph data."""
+        spec = extract_trigger_spec({
+            'graph_data': {'nodes': [{'type': 'trigger/schedule', 'properties': {'cron': '0 9 * * *'}}]},
+            'settings': {'schedule_overlap_policy': 'queue'},
+        })
+        self.assertEqual(spec['kind'], 'cron')
+        self.assertEqual(spec['cron'], '0 9 * * *')
+        self.assertEqual(spec['overlap_policy'], 'queue')
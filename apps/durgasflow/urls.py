@@ -38,6 +38,7 @@ urlpatterns = [
     path('template/<uuid:template_id>/use/', views.template_use, name='template_use'),
 
     # N8n Import
+    path('import/n8n-bulk/', views.import_n8n_directory, name='import_n8n_bulk'),
     path('import/n8n/<path:workflow_path>/', views.import_n8n_workflow, name='import_n8n'),
 
     # Webhook endpoint
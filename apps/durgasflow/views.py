@@ -781,6 +781,40 @@ def import_n8n_workflow(request, workflow_path):
         return redirect('documentation:media_manager_dashboard')
 
 
+@require_super_admin
+@require_POST
+def import_n8n_directory(request):
+    """Import every n8n workflow under media/n8n in one batch."""
+    # Get user UUID from token
+    user_uuid = None
+    if hasattr(request, 'appointment360_user'):
+        user_uuid = request.appointment360_user.get('uuid')
+
+    try:
+        report = WorkflowService.import_n8n_directory(user_uuid=user_uuid)
+    except FileNotFoundError as e:
+        messages.error(request, str(e))
+        return redirect('documentation:media_manager_dashboard')
+    except Exception as e:
+        logger.error(f"N8n bulk import failed: {e}", exc_info=True)
+        messages.error(request, f'Bulk import failed due to an unexpected error: {str(e)}')
+        return redirect('documentation:media_manager_dashboard')
+
+    stats = report['mapping_stats']
+    messages.success(
+        request,
+        f'Imported {report["imported"]}/{report["total_files"]} n8n workflows in '
+        f'{report["timings"]["total_seconds"]}s. '
+        f'{stats["supported_nodes"] + stats["partially_supported_nodes"]}/{stats["total_nodes"]} nodes converted.'
+    )
+    if report['failed']:
+        messages.warning(
+            request,
+            f'{report["failed"]} file(s) failed: ' + ', '.join(e['path'] for e in report['errors'][:5])
+        )
+    return redirect('durgasflow:workflow_list')
+
+
 @csrf_exempt
 @require_http_methods(['GET', 'POST'])
 def webhook_handler(request, workflow_id, webhook_path):
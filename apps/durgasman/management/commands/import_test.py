@@ -2,7 +2,7 @@
 
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
-from apps.durgasman.services.postman_importer import import_postman_collection, import_postman_environment
+from apps.durgasman.services.postman_importer import import_postman_collections, import_postman_environment
 from apps.durgasman.services.endpoint_importer import import_endpoint_json
 import os
 from django.conf import settings
@@ -54,19 +54,24 @@ class Command(BaseCommand):
         """Test Postman collection and environment import."""
         self.stdout.write('Testing Postman imports...')
 
-        # Test collection import
-        collection_path = os.path.join(settings.MEDIA_ROOT, 'postman', 'collection', 'Contact360 API.postman_collection.json')
-        if os.path.exists(collection_path):
+        # Test collection import: every collection file, written as one batch
+        collection_dir = os.path.join(settings.MEDIA_ROOT, 'postman', 'collection')
+        collection_paths = sorted(
+            os.path.join(collection_dir, name)
+            for name in (os.listdir(collection_dir) if os.path.isdir(collection_dir) else [])
+            if name.endswith('.json')
+        )
+        if collection_paths:
             try:
-                collection = import_postman_collection(collection_path, user)
-                self.stdout.write(self.style.SUCCESS(
-                    f'✓ Imported Postman collection: {collection.name} '
-                    f'({collection.requests.count()} requests)'
-                ))
+                for collection in import_postman_collections(collection_paths, user):
+                    self.stdout.write(self.style.SUCCESS(
+                        f'✓ Imported Postman collection: {collection["name"]} '
+                        f'({len(collection["requests"])} requests)'
+                    ))
             except Exception as e:
-                self.stdout.write(self.style.ERROR(f'✗ Failed to import collection: {e}'))
+                self.stdout.write(self.style.ERROR(f'✗ Failed to import collections: {e}'))
         else:
-            self.stdout.write(self.style.WARNING(f'Postman collection not found: {collection_path}'))
+            self.stdout.write(self.style.WARNING(f'No Postman collections found in: {collection_dir}'))
 
         # Test environment import
         env_path = os.path.join(settings.MEDIA_ROOT, 'postman', 'environment', 'Contact360_Local.postman_environment.json')
@@ -74,8 +79,8 @@ class Command(BaseCommand):
             try:
                 environment = import_postman_environment(env_path, user)
                 self.stdout.write(self.style.SUCCESS(
-                    f'✓ Imported environment: {environment.name} '
-                    f'({environment.env_variables.count()} variables)'
+                    f'✓ Imported environment: {environment["name"]} '
+                    f'({len(environment.get("variables", []))} variables)'
                 ))
             except Exception as e:
                 self.stdout.write(self.style.ERROR(f'✗ Failed to import environment: {e}'))
@@ -105,7 +110,7 @@ class Command(BaseCommand):
                 try:
                     collection = import_endpoint_json(file_path, user)
                     self.stdout.write(self.style.SUCCESS(
-                        f'✓ Imported endpoint: {collection.name}'
+                        f'✓ Imported endpoint: {collection["name"]}'
                     ))
                     imported_count += 1
                 except Exception as e:
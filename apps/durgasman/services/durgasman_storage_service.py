@@ -32,24 +32,50 @@ class CollectionStorageService(S3ModelStorage):
         name: str,
         description: str = '',
         user: Optional[str] = None,
-        ai_docs: str = ''
+        ai_docs: str = '',
+        requests: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
-        """Create a new collection."""
-        collection_id = str(uuid_lib.uuid4())
-        now = datetime.utcnow().isoformat()
+        """Create a new collection, optionally with its requests in the same write."""
+        collection_data = self.build_collection_data(
+            name=name,
+            description=description,
+            user=user,
+            ai_docs=ai_docs,
+            requests=requests
+        )
+        return self.create(collection_data, item_uuid=collection_data['id'])
+    
+    def create_collections(self, collections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several collections in one batch.
         
-        collection_data = {
-            'id': collection_id,
+        Args:
+            collections: List of create_collection keyword-argument dicts
+            
+        Returns:
+            List of created collection data
+        """
+        return self.batch_create([self.build_collection_data(**collection) for collection in collections])
+    
+    def build_collection_data(
+        self,
+        name: str,
+        description: str = '',
+        user: Optional[str] = None,
+        ai_docs: str = '',
+        requests: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Build the stored document for a new collection."""
+        return {
+            'id': str(uuid_lib.uuid4()),
             'name': name,
             'description': description,
             'user': user,
             'ai_docs': ai_docs,
-            'created_at': now,
-            'requests': [],  # ApiRequest data stored as nested list
+            'created_at': datetime.utcnow().isoformat(),
+            'requests': list(requests or []),  # ApiRequest data stored as nested list
             'mocks': [],  # MockEndpoint data stored as nested list
         }
-        
-        return self.create(collection_data, item_uuid=collection_id)
     
     def get_collection(self, collection_id: str) -> Optional[Dict[str, Any]]:
         """Get collection by ID."""
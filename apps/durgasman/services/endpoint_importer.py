@@ -23,30 +23,20 @@ def import_endpoint_json(file_path: str, user_uuid: str) -> Dict[str, Any]:
     with open(file_path, 'r') as f:
         endpoint_data = json.load(f)
 
-    # Create collection for this endpoint
-    collection_name = f"Endpoint: {endpoint_data.get('endpoint_id', 'Unknown')}"
-    collection = storage.create_collection(
-        name=collection_name,
-        description=endpoint_data.get('description', ''),
-        user=user_uuid
-    )
-    
-    collection_id = collection.get('collection_id') or collection.get('id')
-    requests = []
-
     # Handle different endpoint types
     if endpoint_data.get('api_version') == 'graphql':
         request_data = _import_graphql_endpoint(endpoint_data)
     else:
         request_data = _import_rest_endpoint(endpoint_data)
     
-    requests.append(request_data)
-    
-    # Update collection with requests
-    storage.update_collection(collection_id, requests=requests)
-    
-    # Return updated collection
-    return storage.get_collection(collection_id)
+    # Create collection for this endpoint, with its request, in one write
+    collection_name = f"Endpoint: {endpoint_data.get('endpoint_id', 'Unknown')}"
+    return storage.create_collection(
+        name=collection_name,
+        description=endpoint_data.get('description', ''),
+        user=user_uuid,
+        requests=[request_data]
+    )
 
 
 def _import_graphql_endpoint(endpoint_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -154,13 +144,6 @@ def import_multiple_endpoints(file_paths: list, user_uuid: str) -> Dict[str, Any
     
     storage = CollectionStorageService()
 
-    collection = storage.create_collection(
-        name="Imported Endpoints Collection",
-        description=f"Imported from {len(file_paths)} endpoint files",
-        user=user_uuid
-    )
-    
-    collection_id = collection.get('collection_id') or collection.get('id')
     requests = []
 
     for file_path in file_paths:
@@ -180,11 +163,13 @@ def import_multiple_endpoints(file_paths: list, user_uuid: str) -> Dict[str, Any
             print(f"Error importing {file_path}: {e}")
             continue
     
-    # Update collection with all requests
-    storage.update_collection(collection_id, requests=requests)
-    
-    # Return updated collection
-    return storage.get_collection(collection_id)
+    # Create the collection with all requests in one write
+    return storage.create_collection(
+        name="Imported Endpoints Collection",
+        description=f"Imported from {len(file_paths)} endpoint files",
+        user=user_uuid,
+        requests=requests
+    )
 
 
 def generate_request_from_endpoint_data(endpoint_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,37 +1,60 @@
 """Postman Collection Importer for Durgasman."""
 
 import json
+import logging
 import uuid as uuid_lib
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 from ..services.durgasman_storage_service import CollectionStorageService
 
+logger = logging.getLogger(__name__)
+
 
 def import_postman_collection(file_path: str, user_uuid: str) -> Dict[str, Any]:
     """Import Postman collection from media/postman/collection/"""
-    # Convert user_uuid to string if needed
-    if hasattr(user_uuid, 'uuid'):
-        user_uuid = str(user_uuid.uuid)
-    elif hasattr(user_uuid, 'id'):
-        user_uuid = str(user_uuid.id)
-    else:
-        user_uuid = str(user_uuid)
-    
     storage = CollectionStorageService()
     
     with open(file_path, 'r') as f:
         data = json.load(f)
 
-    # Create collection
-    collection = storage.create_collection(
-        name=data['info']['name'],
-        description=data['info'].get('description', ''),
-        user=user_uuid
-    )
-    
-    collection_id = collection.get('collection_id') or collection.get('id')
+    # Collection and all of its requests are written in one create
+    return storage.create_collection(user=_user_id(user_uuid), **parse_postman_collection(data))
+
+
+def import_postman_collections(file_paths: List[str], user_uuid: str) -> List[Dict[str, Any]]:
+    """
+    Import several Postman collection files in one batch.
+
+    Collection objects are uploaded concurrently and the collections index is
+    written once. Files that cannot be read or parsed are logged and skipped.
+    """
+    user_uuid = _user_id(user_uuid)
+    collections = []
+    for file_path in file_paths:
+        try:
+            with open(file_path, 'r') as f:
+                data = json.load(f)
+            collections.append({**parse_postman_collection(data), 'user': user_uuid})
+        except Exception as e:
+            logger.warning(f"Skipping Postman collection {file_path}: {e}")
+
+    return CollectionStorageService().create_collections(collections)
+
+
+def _user_id(user_uuid: Any) -> str:
+    # Accept a user object or a UUID
+    if hasattr(user_uuid, 'uuid'):
+        return str(user_uuid.uuid)
+    if hasattr(user_uuid, 'id'):
+        return str(user_uuid.id)
+    return str(user_uuid)
+
+
+def parse_postman_collection(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a Postman v2.1 collection into create_collection arguments."""
     requests = []
+    now = datetime.utcnow().isoformat()
 
     def process_item(item: Dict[str, Any], folder_path: str = '') -> None:
         """Recursively process Postman items (requests and folders)."""
@@ -84,8 +107,8 @@ def import_postman_collection(file_path: str, user_uuid: str) -> Dict[str, Any]:
                 'params': params,
                 'body': body,
                 'auth_type': _extract_auth_type(request_data),
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat(),
+                'created_at': now,
+                'updated_at': now,
             })
         elif 'item' in item:
             # This is a folder
@@ -97,11 +120,11 @@ def import_postman_collection(file_path: str, user_uuid: str) -> Dict[str, Any]:
     for item in data.get('item', []):
         process_item(item)
     
-    # Update collection with requests
-    storage.update_collection(collection_id, requests=requests)
-    
-    # Return updated collection
-    return storage.get_collection(collection_id)
+    return {
+        'name': data['info']['name'],
+        'description': data['info'].get('description', ''),
+        'requests': requests,
+    }
 
 
 def _extract_auth_type(request_data: Dict[str, Any]) -> str:
@@ -7,65 +7,72 @@ from django.contrib import messages
 
 logger = logging.getLogger(__name__)
 
+# Edges per graph page; nodes shown are the ones these edges touch
+DEFAULT_EDGE_LIMIT = 500
+MAX_EDGE_LIMIT = 2000
+
 
 @login_required
 def graph_view(request):
     """Project graph visualization."""
-    from apps.documentation.services.pages_service import PagesService
-    from apps.documentation.services.endpoints_service import EndpointsService
-    from apps.documentation.services.relationships_service import RelationshipsService
+    from apps.documentation.utils.relationship_graph import query_graph
     
     try:
-        pages_service = PagesService()
-        endpoints_service = EndpointsService()
-        relationships_service = RelationshipsService()
-        
-        # Get pages and endpoints for graph nodes
-        pages_result = pages_service.list_pages(limit=200)
-        pages = pages_result.get('pages', [])
-        
-        endpoints_result = endpoints_service.list_endpoints(limit=200)
-        endpoints = endpoints_result.get('endpoints', [])
+        # Only the visible subgraph is loaded: a page of edges (optionally around a node);
+        # pages and endpoints without relationships are listed on the first page
+        limit = max(1, min(int(request.GET.get('limit', DEFAULT_EDGE_LIMIT)), MAX_EDGE_LIMIT))
+        offset = max(0, int(request.GET.get('offset', 0)))
+        subgraph = query_graph(
+            node=request.GET.get('node') or None,
+            hops=int(request.GET.get('hops', 1)),
+            node_type=request.GET.get('node_type') or None,
+            offset=offset,
+            limit=limit,
+            include_isolated=True,
+        )
         
         # Build graph nodes
         nodes = []
-        for page in pages:
-            nodes.append({
-                'id': page.get('page_id', ''),
-                'label': page.get('title', page.get('page_id', '')),
-                'type': 'page',
-                'page_type': page.get('page_type', 'docs'),
-                'group': 1
-            })
-        
-        for endpoint in endpoints:
-            nodes.append({
-                'id': endpoint.get('endpoint_id', ''),
-                'label': endpoint.get('endpoint_path', endpoint.get('endpoint_id', '')),
-                'type': 'endpoint',
-                'method': endpoint.get('method', 'QUERY'),
-                'group': 2
-            })
+        for node in subgraph['nodes']:
+            data = node.get('data', {})
+            if node['type'] == 'page':
+                nodes.append({
+                    'id': data.get('page_id', ''),
+                    'label': node.get('label') or data.get('page_id', ''),
+                    'type': 'page',
+                    'page_type': data.get('page_type') or 'docs',
+                    'group': 1
+                })
+            else:
+                nodes.append({
+                    'id': data.get('endpoint_id', ''),
+                    'label': data.get('endpoint_path') or data.get('endpoint_id', ''),
+                    'type': 'endpoint',
+                    'method': data.get('method', 'QUERY'),
+                    'group': 2
+                })
         
-        # Get relationships for edges
-        relationships = relationships_service.list_relationships(limit=500)
         edges = []
-        for rel in relationships.get('relationships', []):
+        for edge in subgraph['edges']:
             edges.append({
-                'source': rel.get('page_id', ''),
-                'target': rel.get('endpoint_id', ''),
-                'type': rel.get('relationship_type', 'references'),
+                'source': edge['source'][len('page_'):],
+                'target': edge['target'][len('endpoint_'):],
+                'type': edge.get('type', 'references'),
                 'value': 1
             })
         
+        statistics = subgraph['statistics']
         graph_data = {
             'nodes': nodes,
             'edges': edges,
             'stats': {
                 'total_nodes': len(nodes),
-                'total_edges': len(edges),
-                'pages_count': len([n for n in nodes if n.get('type') == 'page']),
-                'endpoints_count': len([n for n in nodes if n.get('type') == 'endpoint'])
+                'total_edges': statistics.get('total_edges', len(edges)),
+                'pages_count': statistics.get('pages_count', 0),
+                'endpoints_count': statistics.get('endpoints_count', 0),
+                'offset': offset,
+                'limit': limit,
+                'has_more': statistics.get('has_more', False),
             }
         }
         
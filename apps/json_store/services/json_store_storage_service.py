@@ -13,6 +13,10 @@ logger = logging.getLogger(__name__)
 class JSONStoreStorageService(S3ModelStorage):
     """Storage service for JSON store using S3 JSON storage."""
     
+    search_fields = {'key': 3.0, 'description': 1.0}
+    search_filter_fields = ('type', 'created_by')
+    search_identifier_fields = ('key',)
+    
     def __init__(self):
         """Initialize JSON store storage service."""
         super().__init__(model_name='json_store')
@@ -174,23 +178,6 @@ class JSONStoreStorageService(S3ModelStorage):
         Returns:
             List of matching JSON store dictionaries
         """
-        # Get all stores (or filtered by type)
-        filters = {}
-        if store_type:
-            filters['type'] = store_type
-        
-        result = self.list(filters=filters if filters else None, limit=None)
-        all_stores = result.get('items', [])
-        
-        # Filter by query in key or description
-        query_lower = query.lower()
-        matching_stores = []
-        for store in all_stores:
-            key = store.get('key', '').lower()
-            description = store.get('description', '').lower()
-            if query_lower in key or query_lower in description:
-                matching_stores.append(store)
-                if len(matching_stores) >= limit:
-                    break
-        
-        return matching_stores
+        filters = {'type': store_type} if store_type else None
+        result = self.indexed_search(query=query, filters=filters, limit=limit)
+        return result.get('items', [])
@@ -132,30 +132,4 @@ class KnowledgeBaseService(BaseService):
         Returns:
             List of related knowledge item dictionaries
         """
-        item = self.get_by_id(knowledge_id)
-        if not item:
-            return []
-        
-        # Find items with similar tags or pattern type
-        pattern_type = item.get('pattern_type')
-        tags = item.get('tags', [])
-        
-        # Get all items with same pattern type or overlapping tags
-        all_items = self.storage.list(filters={'pattern_type': pattern_type}, limit=None, offset=0)
-        related_items = []
-        
-        for related_item in all_items.get('items', []):
-            if related_item.get('knowledge_id') == knowledge_id:
-                continue
-            
-            # Check if tags overlap
-            related_tags = related_item.get('tags', [])
-            if tags and related_tags and set(tags) & set(related_tags):
-                related_items.append(related_item)
-            elif related_item.get('pattern_type') == pattern_type:
-                related_items.append(related_item)
-            
-            if len(related_items) >= limit:
-                break
-        
-        return related_items[:limit]
+        return self.storage.get_related_knowledge(knowledge_id, limit=limit)
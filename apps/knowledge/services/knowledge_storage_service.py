@@ -13,6 +13,10 @@ logger = logging.getLogger(__name__)
 class KnowledgeStorageService(S3ModelStorage):
     """Storage service for knowledge base items using S3 JSON storage."""
     
+    search_fields = {'title': 3.0, 'tags': 2.0, 'content': 1.0}
+    search_tag_field = 'tags'
+    search_filter_fields = ('pattern_type',)
+    
     def __init__(self):
         """Initialize knowledge storage service."""
         super().__init__(model_name='knowledge')
@@ -101,30 +105,23 @@ class KnowledgeStorageService(S3ModelStorage):
         Returns:
             List of knowledge item dictionaries
         """
-        filters = {}
-        if pattern_type:
-            filters['pattern_type'] = pattern_type
-        
-        # Get all items matching filters
-        result = self.list(filters=filters, limit=None, offset=0)
-        items = result.get('items', [])
-        
-        # Apply text search if query provided
-        if query:
-            query_lower = query.lower()
-            items = [
-                item for item in items
-                if query_lower in item.get('title', '').lower() or
-                   query_lower in item.get('content', '').lower()
-            ]
+        filters = {'pattern_type': pattern_type} if pattern_type else None
+        result = self.indexed_search(query=query, filters=filters, tags=tags, limit=limit)
+        return result.get('items', [])
+    
+    def get_related_knowledge(self, knowledge_id: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get knowledge items related to one item.
         
-        # Apply tag filter
-        if tags:
-            filtered_items = []
-            for item in items:
-                item_tags = item.get('tags', [])
-                if any(tag in item_tags for tag in tags):
-                    filtered_items.append(item)
-            items = filtered_items
+        Candidates share the item's pattern type and are ranked by shared
+        tags, then shared terms, then recency.
         
-        return items[:limit]
+        Args:
+            knowledge_id: Knowledge item ID
+            limit: Maximum results
+            
+        Returns:
+            List of related knowledge item dictionaries
+        """
+        related_ids = self.related_ids(knowledge_id, same_fields=('pattern_type',), limit=limit)
+        return self._load_items(related_ids)
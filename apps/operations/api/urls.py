@@ -7,4 +7,7 @@ app_name = 'operations_api'
 urlpatterns = [
     path('', views.operations_list_api, name='operations_list'),
     path('<str:operation_id>/', views.operations_detail_api, name='operations_detail'),
+    path('<str:operation_id>/events/', views.operation_events_api, name='operation_events'),
+    path('<str:operation_id>/cancel/', views.operation_cancel_api, name='operation_cancel'),
+    path('<str:operation_id>/resume/', views.operation_resume_api, name='operation_resume'),
 ]
@@ -0,0 +1,120 @@
+"""Operations API views: background job progress, events, cancel and resume."""
+import json
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.views.decorators.http import require_http_methods
+
+from apps.operations.services import OperationsService
+from apps.operations.services.job_runner import TERMINAL_STATUSES
+
+logger = logging.getLogger(__name__)
+
+
+def job_links(operation_id: str) -> dict:
+    """Progress (JSON), events (SSE), cancel and resume URLs of an operation."""
+    return {
+        'progress_url': reverse('operations:operations_api:operations_detail', args=[operation_id]),
+        'events_url': reverse('operations:operations_api:operation_events', args=[operation_id]),
+        'cancel_url': reverse('operations:operations_api:operation_cancel', args=[operation_id]),
+        'resume_url': reverse('operations:operations_api:operation_resume', args=[operation_id]),
+    }
+
+
+@login_required
+@require_http_methods(["GET"])
+def operations_list_api(request):
+    """GET /operations/api/?operation_type=&status=&limit="""
+    try:
+        limit = min(int(request.GET.get('limit', 50)), 200)
+    except ValueError:
+        limit = 50
+    operations = OperationsService().list_operations(
+        operation_type=request.GET.get('operation_type') or None,
+        status=request.GET.get('status') or None,
+        limit=limit,
+    )
+    return JsonResponse({'success': True, 'operations': operations})
+
+
+@login_required
+@require_http_methods(["GET"])
+def operations_detail_api(request, operation_id):
+    """GET /operations/api/<operation_id>/ - job progress for polling."""
+    progress = OperationsService().get_job_progress(operation_id)
+    if not progress:
+        return JsonResponse({'success': False, 'error': 'Operation not found'}, status=404)
+    return JsonResponse({'success': True, 'operation': progress})
+
+
+@login_required
+@require_http_methods(["GET"])
+def operation_events_api(request, operation_id):
+    """
+    GET /operations/api/<operation_id>/events/ - job progress as Server-Sent Events.
+
+    Emits a ``progress`` event whenever the progress changes and ``done`` once
+    the job finishes. The stream closes after OPERATION_EVENTS_MAX_SECONDS
+    (below the worker timeout); EventSource reconnects on its own.
+    """
+    service = OperationsService()
+    if not service.get_job_progress(operation_id):
+        return JsonResponse({'success': False, 'error': 'Operation not found'}, status=404)
+
+    poll = getattr(settings, 'OPERATION_EVENTS_POLL_SECONDS', 1.0)
+    max_seconds = getattr(settings, 'OPERATION_EVENTS_MAX_SECONDS', 25)
+
+    def frames():
+        deadline = time.monotonic() + max_seconds
+        last = None
+        while True:
+            progress = service.get_job_progress(operation_id)
+            if progress is None:
+                yield f"event: error\ndata: {json.dumps({'error': 'Operation not found'})}\n\n"
+                return
+            if progress != last:
+                last = progress
+                yield f"event: progress\ndata: {json.dumps(progress)}\n\n"
+            if progress['status'] in TERMINAL_STATUSES:
+                yield f"event: done\ndata: {json.dumps(progress)}\n\n"
+                return
+            if time.monotonic() >= deadline:
+                return
+            time.sleep(poll)
+
+    response = StreamingHttpResponse(frames(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Tell reverse proxies (nginx) not to buffer the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@login_required
+@require_http_methods(["POST"])
+def operation_cancel_api(request, operation_id):
+    """POST /operations/api/<operation_id>/cancel/"""
+    operation = OperationsService().cancel_operation(operation_id)
+    if not operation:
+        return JsonResponse({'success': False, 'error': 'Operation not found'}, status=404)
+    return JsonResponse({'success': True, 'status': operation.get('status')})
+
+
+@login_required
+@require_http_methods(["POST"])
+def operation_resume_api(request, operation_id):
+    """POST /operations/api/<operation_id>/resume/"""
+    try:
+        operation = OperationsService().resume_operation(operation_id)
+    except ValueError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=409)
+    if not operation:
+        return JsonResponse({'success': False, 'error': 'Operation not found'}, status=404)
+    return JsonResponse({
+        'success': True,
+        'status': operation.get('status'),
+        **job_links(operation_id),
+    }, status=202)
@@ -0,0 +1,198 @@
+"""
+Background jobs recorded as operations.
+
+A job is a ``BackgroundJob`` subclass that splits its work into items
+(``plan``) and handles one item at a time (``process``). The operation's
+metadata holds the job's dotted path, its params, the planned items, and a
+cursor to the next item. That makes every job:
+
+- asynchronous: the request queues ``run_job_task`` on Django-Q and returns
+  the operation right away;
+- observable: done/total, error count and the latest errors are written to
+  the operation every ``OPERATION_PROGRESS_INTERVAL`` seconds;
+- cancellable: a cancel marker is checked between items (at most once per
+  progress interval);
+- resumable: a failed, cancelled or abandoned run continues from the cursor.
+
+A run also stops after ``OPERATION_JOB_SLICE_SECONDS`` (counted from task
+entry, so planning time is included) and re-queues itself from the cursor.
+Planned items are saved before any is processed, so a run that spends its
+slice planning re-queues without planning again. No single task comes near
+the Django-Q timeout, however large the operation.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Latest per-item error messages kept on the operation (failed item indices are all kept)
+MAX_RECORDED_ERRORS = 100
+TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+class BackgroundJob:
+    """
+    Base class for operations run by ``run_job_task``.
+
+    Subclasses set ``operation_type`` and implement ``plan`` and ``process``.
+    """
+
+    operation_type = 'job'
+
+    def plan(self, params: Dict[str, Any]) -> List[Any]:
+        """Items to process, in order; must be JSON-serializable."""
+        raise NotImplementedError
+
+    def process(self, params: Dict[str, Any], item: Any) -> Optional[Dict[str, Any]]:
+        """
+        Handle one item.
+
+        Return ``{'error': message}`` (or raise) to record a failed item; any
+        other return value counts as done. Numeric values in a returned dict
+        are summed into the job's ``totals``.
+        """
+        raise NotImplementedError
+
+    def summarize(self, params: Dict[str, Any], job_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Result stored on the operation when the job completes."""
+        return {
+            'done': job_state['done'],
+            'error_count': job_state['error_count'],
+            'totals': job_state.get('totals', {}),
+        }
+
+
+def queue_job(operation_id: str) -> Optional[str]:
+    """
+    Queue ``run_job_task`` for an operation.
+
+    Returns:
+        Django-Q task ID, or None when Django-Q is unavailable and the job ran inline
+    """
+    try:
+        from django_q.tasks import async_task
+
+        task_id = async_task(
+            'apps.operations.services.job_runner.run_job_task',
+            str(operation_id),
+            task_name=f'operation_{operation_id}',
+            group='operations'
+        )
+        logger.info(f"Queued operation {operation_id} with task ID {task_id}")
+        return task_id
+    except ImportError:
+        logger.warning("Django-Q not available, running operation synchronously")
+        run_job_task(str(operation_id), time_slice=None)
+        return None
+
+
+def run_job_task(operation_id: str, time_slice: Optional[float] = -1) -> Optional[str]:
+    """
+    Django-Q entry point: run (or continue) the job of an operation.
+
+    Args:
+        operation_id: Operation whose metadata describes the job
+        time_slice: Seconds before the run re-queues itself; -1 uses
+            OPERATION_JOB_SLICE_SECONDS, None runs to the end
+
+    Returns:
+        The operation's status when this run stopped
+    """
+    from .operations_service import OperationsService
+
+    started = time.monotonic()
+    service = OperationsService()
+    storage = service.storage
+    operation = storage.get_operation(operation_id, fresh=True)
+    if not operation:
+        logger.error(f"Operation not found: {operation_id}")
+        return None
+    if operation.get('status') in TERMINAL_STATUSES:
+        return operation.get('status')
+
+    metadata = operation.get('metadata') or {}
+    job_state = metadata.get('job') or {}
+    params = job_state.get('params') or {}
+    if time_slice == -1:
+        time_slice = getattr(settings, 'OPERATION_JOB_SLICE_SECONDS', 240)
+    progress_interval = getattr(settings, 'OPERATION_PROGRESS_INTERVAL', 2.0)
+
+    def save(status: str, **fields) -> None:
+        job_state['heartbeat_at'] = timezone.now().isoformat()
+        total = job_state.get('total') or 0
+        storage.update_operation(
+            operation_id,
+            status=status,
+            progress=int(job_state['done'] * 100 / total) if total else 0,
+            metadata={**metadata, 'job': job_state},
+            **fields
+        )
+
+    try:
+        job = import_string(job_state['class'])()
+        if storage.is_cancel_requested(operation_id):
+            save('cancelled')
+            return 'cancelled'
+
+        if job_state.get('items') is None:
+            job_state.update(items=job.plan(params), cursor=0, done=0, error_count=0, errors=[], failed=[], totals={})
+            job_state['total'] = len(job_state['items'])
+        save('running')
+
+        last_saved = last_checked = time.monotonic()
+        items = job_state['items']
+        while job_state['cursor'] < len(items):
+            if time.monotonic() - last_checked >= progress_interval:
+                last_checked = time.monotonic()
+                cancelled = storage.is_cancel_requested(operation_id)
+            else:
+                cancelled = False
+            if cancelled:
+                save('cancelled')
+                logger.info(f"Operation {operation_id} cancelled at {job_state['cursor']}/{len(items)}")
+                return 'cancelled'
+            if time_slice is not None and time.monotonic() - started >= time_slice:
+                save('running')
+                queue_job(operation_id)
+                return 'running'
+
+            item = items[job_state['cursor']]
+            try:
+                outcome = job.process(params, item)
+                error = None
+                if isinstance(outcome, dict):
+                    error = outcome.get('error')
+                    totals = job_state.setdefault('totals', {})
+                    for key, value in outcome.items():
+                        if isinstance(value, (int, float)) and not isinstance(value, bool):
+                            totals[key] = totals.get(key, 0) + value
+            except Exception as e:
+                logger.warning(f"Operation {operation_id} item {item!r} failed: {e}")
+                error = str(e)
+            job_state['cursor'] += 1
+            job_state['done'] += 1
+            if error:
+                job_state['error_count'] += 1
+                job_state.setdefault('failed', []).append(job_state['cursor'] - 1)
+                job_state['errors'] = (job_state['errors'] + [{'item': item, 'error': str(error)}])[-MAX_RECORDED_ERRORS:]
+
+            if time.monotonic() - last_saved >= progress_interval:
+                save('running')
+                last_saved = time.monotonic()
+
+        metadata['result'] = job.summarize(params, job_state)
+        status = 'failed' if job_state['error_count'] and job_state['error_count'] == job_state['total'] else 'completed'
+        save(status, error_message=f"{job_state['error_count']} of {job_state['total']} items failed"
+             if job_state['error_count'] else '')
+        logger.info(f"Operation {operation_id} {status}: {job_state['done']}/{job_state['total']}")
+        return status
+    except Exception as e:
+        logger.error(f"Operation {operation_id} failed: {e}", exc_info=True)
+        service.set_error(operation_id, str(e))
+        return 'failed'
@@ -59,8 +59,15 @@ class OperationStorageService(S3ModelStorage):
         
         return self.create(operation_data, item_uuid=operation_id)
     
-    def get_operation(self, operation_id: str) -> Optional[Dict[str, Any]]:
-        """Get operation by ID."""
+    def get_operation(self, operation_id: str, fresh: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get operation by ID.
+        
+        ``fresh`` skips the Django cache and reads S3, for state written by
+        another process (a background job's progress).
+        """
+        if fresh:
+            return self._read_item(operation_id)
         return self.get(operation_id)
     
     def update_operation(self, operation_id: str, **kwargs) -> Optional[Dict[str, Any]]:
@@ -78,4 +85,31 @@ class OperationStorageService(S3ModelStorage):
     
     def delete_operation(self, operation_id: str) -> bool:
         """Delete an operation."""
+        self.clear_cancel_request(operation_id)
         return self.delete(operation_id)
+    
+    def _cancel_key(self, operation_id: str) -> str:
+        return f"{self.models_prefix}cancel/{operation_id}.json"
+    
+    def request_cancel(self, operation_id: str) -> None:
+        """
+        Flag an operation for cancellation.
+        
+        A separate marker object, so a running job's progress writes can't
+        overwrite the request.
+        """
+        self.s3_json_storage.write_json(
+            self._cancel_key(operation_id),
+            {'operation_id': operation_id, 'requested_at': datetime.utcnow().isoformat()}
+        )
+    
+    def is_cancel_requested(self, operation_id: str) -> bool:
+        """Whether cancellation was requested for an operation."""
+        return self.s3_json_storage.read_json(self._cancel_key(operation_id)) is not None
+    
+    def clear_cancel_request(self, operation_id: str) -> None:
+        """Remove an operation's cancellation marker, if any."""
+        try:
+            self.s3_json_storage.delete_json(self._cancel_key(operation_id))
+        except Exception as e:
+            logger.debug(f"No cancel marker removed for {operation_id}: {e}")
@@ -1,13 +1,24 @@
 """Operations service."""
 import logging
+from datetime import datetime, timezone as dt_timezone
 from typing import Optional, Dict, Any, List
+from django.conf import settings
 from django.utils import timezone
 from apps.core.services.base_service import BaseService
+from .job_runner import TERMINAL_STATUSES, BackgroundJob, queue_job
 from .operation_storage_service import OperationStorageService
 
 logger = logging.getLogger(__name__)
 
 
+def _seconds_since(iso_timestamp: str) -> float:
+    """Age of an ISO timestamp; naive timestamps are UTC (datetime.utcnow)."""
+    moment = datetime.fromisoformat(iso_timestamp)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=dt_timezone.utc)
+    return (datetime.now(dt_timezone.utc) - moment).total_seconds()
+
+
 class OperationsService(BaseService):
     """Service for operations management using S3 storage."""
     
@@ -161,3 +172,137 @@ class OperationsService(BaseService):
             error_message=error_message,
             completed_at=timezone.now().isoformat()
         )
+    
+    def start_job(
+        self,
+        job: BackgroundJob,
+        name: str,
+        params: Dict[str, Any] = None,
+        started_by=None
+    ) -> Dict[str, Any]:
+        """
+        Record an operation for a background job and queue it.
+        
+        Args:
+            job: Job to run (its class is stored and re-created by the worker)
+            name: Operation name
+            params: JSON-serializable job parameters
+            started_by: User who started the operation
+            
+        Returns:
+            Created operation data dictionary (status 'queued')
+        """
+        job_class = type(job)
+        operation = self.create_operation(
+            operation_type=job.operation_type,
+            name=name,
+            metadata={'job': {
+                'class': f'{job_class.__module__}.{job_class.__qualname__}',
+                'params': params or {},
+                'items': None,
+            }},
+            started_by=started_by
+        )
+        operation_id = operation['operation_id']
+        queue_job(operation_id)
+        return self.storage.get_operation(operation_id, fresh=True) or operation
+    
+    def get_job_progress(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Current progress of a background job, read from S3 (not the cache).
+        
+        Returns:
+            ``{operation_id, status, progress, done, total, error_count, errors,
+            result, error_message, started_at, completed_at}``, or None if not found
+        """
+        operation = self.storage.get_operation(operation_id, fresh=True)
+        if not operation:
+            return None
+        metadata = operation.get('metadata') or {}
+        job_state = metadata.get('job') or {}
+        return {
+            'operation_id': operation_id,
+            'operation_type': operation.get('operation_type'),
+            'name': operation.get('name'),
+            'status': operation.get('status'),
+            'progress': operation.get('progress', 0),
+            'done': job_state.get('done', 0),
+            'total': job_state.get('total'),
+            'error_count': job_state.get('error_count', 0),
+            'errors': job_state.get('errors', []),
+            'result': metadata.get('result'),
+            'error_message': operation.get('error_message', ''),
+            'started_at': operation.get('started_at'),
+            'completed_at': operation.get('completed_at'),
+        }
+    
+    def cancel_operation(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a queued or running job.
+        
+        A running job stops at its next item; a queued one is marked
+        cancelled right away.
+        
+        Returns:
+            Updated operation data dictionary, or None if not found
+        """
+        operation = self.storage.get_operation(operation_id, fresh=True)
+        if not operation:
+            return None
+        if operation.get('status') in TERMINAL_STATUSES:
+            return operation
+        self.storage.request_cancel(operation_id)
+        status = 'cancelled' if operation.get('status') == 'queued' else 'cancelling'
+        return self.storage.update_operation(operation_id, status=status)
+    
+    def resume_operation(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Continue a failed, cancelled or abandoned job from where it stopped.
+        
+        If every item was already attempted (including a completed job with
+        failed items), the failed ones are retried.
+        A 'running' job counts as abandoned once its heartbeat is older than
+        OPERATION_JOB_STALE_SECONDS (e.g. the worker was killed).
+        
+        Returns:
+            Updated operation data dictionary, or None if not found
+            
+        Raises:
+            ValueError: if the operation is not a job or is still active
+        """
+        operation = self.storage.get_operation(operation_id, fresh=True)
+        if not operation:
+            return None
+        job_state = (operation.get('metadata') or {}).get('job')
+        if not job_state:
+            raise ValueError(f"Operation {operation_id} is not a background job")
+        
+        status = operation.get('status')
+        if status in ('running', 'cancelling', 'queued'):
+            heartbeat = job_state.get('heartbeat_at') or operation.get('updated_at')
+            stale_after = getattr(settings, 'OPERATION_JOB_STALE_SECONDS', 600)
+            if heartbeat and _seconds_since(heartbeat) < stale_after:
+                raise ValueError(f"Operation {operation_id} is still {status}")
+        elif status == 'completed' and not job_state.get('error_count'):
+            raise ValueError(f"Operation {operation_id} already completed")
+        
+        items = job_state.get('items')
+        if items is not None and job_state.get('cursor', 0) >= len(items):
+            # Every item was attempted: retry the ones that failed
+            if 'failed' in job_state:
+                retry = [items[index] for index in job_state['failed']]
+            else:
+                # Jobs started before failed indices were tracked
+                retry = [error['item'] for error in job_state.get('errors', [])]
+            job_state.update(items=retry, cursor=0, done=0, error_count=0, errors=[], failed=[], total=len(retry))
+        
+        self.storage.clear_cancel_request(operation_id)
+        operation = self.storage.update_operation(
+            operation_id,
+            status='queued',
+            completed_at=None,
+            error_message='',
+            metadata={**operation.get('metadata', {}), 'job': job_state}
+        )
+        queue_job(operation_id)
+        return self.storage.get_operation(operation_id, fresh=True) or operation
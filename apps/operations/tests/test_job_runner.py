@@ -0,0 +1,139 @@
+"""Tests for background jobs recorded as operations."""
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.tests.helpers import FakeJSONStorage
+from apps.operations.services.job_runner import BackgroundJob, run_job_task
+from apps.operations.services.operation_storage_service import OperationStorageService
+from apps.operations.services.operations_service import OperationsService
+
+
+class NumbersJob(BackgroundJob):
+    """Processes params['count'] numbers; multiples of params['fail_every'] fail."""
+
+    operation_type = 'numbers'
+    processed = []
+    on_item = None
+    on_plan = None
+
+    def plan(self, params):
+        if NumbersJob.on_plan:
+            NumbersJob.on_plan()
+        return list(range(params['count']))
+
+    def process(self, params, item):
+        NumbersJob.processed.append(item)
+        if NumbersJob.on_item:
+            NumbersJob.on_item(item)
+        if params.get('fail_every') and item % params['fail_every'] == 0:
+            raise RuntimeError(f'bad {item}')
+        return {'sum': item}
+
+
+@override_settings(OPERATION_PROGRESS_INTERVAL=0)
+class JobRunnerTest(SimpleTestCase):
+
+    def setUp(self):
+        storage = OperationStorageService()
+        storage.model_name = storage.cache_prefix = f'operations-{id(self)}:'
+        storage.s3_json_storage = FakeJSONStorage()
+        # run_job_task builds its own OperationsService: share one fake-backed storage
+        patcher = mock.patch(
+            'apps.operations.services.operations_service.OperationStorageService', return_value=storage
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.queued = []
+        for module in ('operations_service', 'job_runner'):
+            patcher = mock.patch(f'apps.operations.services.{module}.queue_job', self.queued.append)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        NumbersJob.processed = []
+        NumbersJob.on_item = None
+        NumbersJob.on_plan = None
+        self.service = OperationsService()
+
+    def _start(self, **params):
+        operation = self.service.start_job(NumbersJob(), 'numbers', params=params, started_by='user-1')
+        self.assertEqual(operation['status'], 'queued')
+        self.assertEqual(self.queued, [operation['operation_id']])
+        return operation['operation_id']
+
+    def test_job_runs_to_completion_with_progress_and_errors(self):
+        operation_id = self._start(count=10, fail_every=4)
+        self.assertEqual(run_job_task(operation_id), 'completed')
+
+        progress = self.service.get_job_progress(operation_id)
+        self.assertEqual((progress['done'], progress['total'], progress['progress']), (10, 10, 100))
+        self.assertEqual(progress['error_count'], 3)
+        self.assertEqual([e['item'] for e in progress['errors']], [0, 4, 8])
+        self.assertEqual(progress['result']['totals'], {'sum': 45 - 12})
+        self.assertIsNotNone(progress['completed_at'])
+
+    def test_cancel_stops_between_items_and_resume_continues(self):
+        operation_id = self._start(count=6)
+        NumbersJob.on_item = lambda item: item == 2 and self.service.cancel_operation(operation_id)
+        self.assertEqual(run_job_task(operation_id), 'cancelled')
+        self.assertEqual(NumbersJob.processed, [0, 1, 2])
+        self.assertEqual(self.service.get_job_progress(operation_id)['status'], 'cancelled')
+
+        NumbersJob.on_item = None
+        self.service.resume_operation(operation_id)
+        self.assertEqual(self.service.get_job_progress(operation_id)['status'], 'queued')
+        self.assertEqual(run_job_task(operation_id), 'completed')
+        self.assertEqual(NumbersJob.processed, [0, 1, 2, 3, 4, 5])
+
+    def test_cancelling_a_queued_job_skips_it(self):
+        operation_id = self._start(count=3)
+        self.assertEqual(self.service.cancel_operation(operation_id)['status'], 'cancelled')
+        self.assertEqual(run_job_task(operation_id), 'cancelled')
+        self.assertEqual(NumbersJob.processed, [])
+
+    def test_run_requeues_itself_after_its_time_slice(self):
+        operation_id = self._start(count=5)
+        self.queued.clear()
+        self.assertEqual(run_job_task(operation_id, time_slice=0), 'running')
+        self.assertEqual(self.queued, [operation_id])
+        self.assertEqual(NumbersJob.processed, [])
+        self.assertEqual(run_job_task(operation_id, time_slice=None), 'completed')
+
+    def test_planning_time_counts_toward_the_slice(self):
+        """A run that spends its slice planning saves the items and re-queues."""
+        operation_id = self._start(count=5)
+        self.queued.clear()
+        clock = [1000.0]
+        NumbersJob.on_plan = lambda: clock.__setitem__(0, clock[0] + 100)
+        with mock.patch('apps.operations.services.job_runner.time.monotonic', side_effect=lambda: clock[0]):
+            self.assertEqual(run_job_task(operation_id, time_slice=60), 'running')
+        self.assertEqual(self.queued, [operation_id])
+        self.assertEqual(NumbersJob.processed, [])
+        self.assertEqual(self.service.get_job_progress(operation_id)['total'], 5)
+
+        NumbersJob.on_plan = mock.Mock()
+        self.assertEqual(run_job_task(operation_id, time_slice=None), 'completed')
+        NumbersJob.on_plan.assert_not_called()
+
+    def test_resume_retries_failed_items_and_refuses_active_jobs(self):
+        operation_id = self._start(count=4, fail_every=2)
+        self.service.storage.update_operation(operation_id, status='running')
+        with self.assertRaises(ValueError):
+            self.service.resume_operation(operation_id)
+
+        run_job_task(operation_id)
+        NumbersJob.processed = []
+        self.service.resume_operation(operation_id)
+        run_job_task(operation_id)
+        self.assertEqual(NumbersJob.processed, [0, 2])
+
+    def test_resume_retries_failures_beyond_recorded_errors(self):
+        """Error messages are capped, but every failed item is retried."""
+        operation_id = self._start(count=6, fail_every=2)
+        with mock.patch('apps.operations.services.job_runner.MAX_RECORDED_ERRORS', 1):
+            run_job_task(operation_id)
+        self.assertEqual([e['item'] for e in self.service.get_job_progress(operation_id)['errors']], [4])
+
+        NumbersJob.processed = []
+        self.service.resume_operation(operation_id)
+        run_job_task(operation_id)
+        self.assertEqual(NumbersJob.processed, [0, 2, 4])
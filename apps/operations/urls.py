@@ -1,9 +1,10 @@
 """URL configuration for operations app."""
-from django.urls import path
+from django.urls import include, path
 from . import views
 
 app_name = 'operations'
 
 urlpatterns = [
     path('', views.operations_view, name='dashboard'),
+    path('api/', include('apps.operations.api.urls')),
 ]
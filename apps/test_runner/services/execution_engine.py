@@ -0,0 +1,249 @@
+"""
+Sharded, parallel pytest execution for test suites.
+
+A suite's test files are split into shards balanced on the per-file
+durations recorded by earlier runs (longest-processing-time-first
+bin packing). Each shard runs as its own pytest process, so a suite takes
+roughly total/workers wall time. Results are read from each process's
+``-v`` output line by line as tests finish, which drives live progress.
+When a shard exits, its JUnit XML report is ingested: it is authoritative
+for final status, duration and failure message, and it supplies the new
+per-file durations.
+"""
+
+import heapq
+import logging
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Weight of the latest measurement when updating a file's recorded duration
+DURATION_SMOOTHING = 0.5
+# Failure messages kept per test
+MAX_MESSAGE_CHARS = 2000
+
+_VERBOSE_LINE = re.compile(r'^(?P<nodeid>\S.*?::\S.*?) (?P<outcome>PASSED|FAILED|ERROR|SKIPPED|XFAIL|XPASS)(?:\s|$)')
+_OUTCOME_STATUS = {
+    'PASSED': 'passed',
+    'XPASS': 'passed',
+    'FAILED': 'failed',
+    'ERROR': 'error',
+    'SKIPPED': 'skipped',
+    'XFAIL': 'skipped',
+}
+
+
+def plan_shards(files: List[str], durations: Dict[str, float], shard_count: int) -> List[List[str]]:
+    """
+    Split ``files`` into at most ``shard_count`` shards of similar total duration.
+
+    Files without a recorded duration are weighted with the mean of the known
+    ones (1s when nothing is known yet).
+    """
+    if not files:
+        return []
+    shard_count = max(1, min(shard_count, len(files)))
+    known = [durations[f] for f in files if durations.get(f)]
+    default = sum(known) / len(known) if known else 1.0
+    weighted = sorted(files, key=lambda f: durations.get(f) or default, reverse=True)
+
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    loads = [(0.0, i) for i in range(shard_count)]
+    for test_file in weighted:
+        load, i = heapq.heappop(loads)
+        shards[i].append(test_file)
+        heapq.heappush(loads, (load + (durations.get(test_file) or default), i))
+    return [shard for shard in shards if shard]
+
+
+def merge_durations(previous: Dict[str, float], measured: Dict[str, float]) -> Dict[str, float]:
+    """Exponentially smoothed per-file durations."""
+    merged = dict(previous)
+    for test_file, seconds in measured.items():
+        old = merged.get(test_file)
+        merged[test_file] = round(
+            seconds if old is None else old + DURATION_SMOOTHING * (seconds - old), 3
+        )
+    return merged
+
+
+def parse_verbose_line(line: str) -> Optional[Dict[str, str]]:
+    """Result from one line of ``pytest -v`` output, or None."""
+    match = _VERBOSE_LINE.match(line.rstrip())
+    if not match:
+        return None
+    nodeid = match.group('nodeid')
+    return {
+        'nodeid': nodeid,
+        'file': nodeid.split('::', 1)[0],
+        'status': _OUTCOME_STATUS[match.group('outcome')],
+    }
+
+
+def parse_junit_xml(path: str) -> List[Dict[str, object]]:
+    """
+    Test results from a JUnit XML report (pytest ``junit_family=xunit1``).
+
+    Returns:
+        ``{nodeid, file, name, status, duration, message}`` per test case
+    """
+    try:
+        root = ET.parse(path).getroot()
+    except (ET.ParseError, OSError) as e:
+        logger.warning(f"Could not read JUnit report {path}: {e}")
+        return []
+
+    results = []
+    for case in root.iter('testcase'):
+        name = case.get('name', '')
+        classname = case.get('classname', '')
+        test_file = case.get('file') or classname.replace('.', '/') + '.py'
+        module = test_file[:-3].replace('/', '.') if test_file.endswith('.py') else test_file
+        class_part = classname[len(module) + 1:] if classname.startswith(module + '.') else ''
+        nodeid = '::'.join(part for part in (test_file, class_part, name) if part)
+
+        status, message = 'passed', ''
+        for tag, tag_status in (('failure', 'failed'), ('error', 'error'), ('skipped', 'skipped')):
+            element = case.find(tag)
+            if element is not None:
+                status = tag_status
+                message = (element.get('message') or element.text or '')[:MAX_MESSAGE_CHARS]
+                break
+        results.append({
+            'nodeid': nodeid,
+            'file': test_file,
+            'name': name,
+            'status': status,
+            'duration': round(float(case.get('time') or 0), 3),
+            'message': message,
+        })
+    return results
+
+
+class ShardedTestExecutor:
+    """Runs test files as parallel pytest shards and reports results as they arrive."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        cwd: Optional[str] = None,
+        shard_timeout: Optional[float] = None,
+        pytest_args: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            max_workers: Parallel shards (default: TEST_RUNNER_MAX_WORKERS, 0 = CPU count)
+            cwd: Directory pytest runs in (default: BASE_DIR)
+            shard_timeout: Seconds before a shard process is killed (TEST_RUNNER_SHARD_TIMEOUT)
+            pytest_args: Extra pytest arguments
+        """
+        configured = max_workers if max_workers is not None else getattr(settings, 'TEST_RUNNER_MAX_WORKERS', 0)
+        self.max_workers = configured or os.cpu_count() or 1
+        self.cwd = str(cwd or settings.BASE_DIR)
+        self.shard_timeout = shard_timeout or getattr(settings, 'TEST_RUNNER_SHARD_TIMEOUT', 1800)
+        self.pytest_args = pytest_args or []
+
+    def run(
+        self,
+        test_files: List[str],
+        durations: Optional[Dict[str, float]] = None,
+        on_result: Optional[Callable[[Dict[str, object]], None]] = None,
+        on_shard_done: Optional[Callable[[List[Dict[str, object]]], None]] = None,
+    ) -> Dict[str, object]:
+        """
+        Run ``test_files`` and return the final results.
+
+        ``on_result`` is called (from worker threads, one call at a time) for
+        each test as its status line appears; ``on_shard_done`` with the
+        ingested JUnit results of each finished shard.
+
+        Returns:
+            ``{'tests': [...], 'file_durations': {file: seconds}, 'shards': n,
+            'wall_time': seconds}``
+        """
+        shards = plan_shards(test_files, durations or {}, self.max_workers)
+        callback_lock = threading.Lock()
+        started = time.monotonic()
+
+        def report(callback, payload):
+            if callback:
+                with callback_lock:
+                    callback(payload)
+
+        def run_shard(files: List[str]) -> List[Dict[str, object]]:
+            results = self._run_shard(files, lambda result: report(on_result, result))
+            report(on_shard_done, results)
+            return results
+
+        tests: List[Dict[str, object]] = []
+        if shards:
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                for shard_results in executor.map(run_shard, shards):
+                    tests.extend(shard_results)
+
+        file_durations: Dict[str, float] = {}
+        for test in tests:
+            file_durations[test['file']] = file_durations.get(test['file'], 0.0) + test['duration']
+        return {
+            'tests': tests,
+            'file_durations': {f: round(seconds, 3) for f, seconds in file_durations.items()},
+            'shards': len(shards),
+            'wall_time': round(time.monotonic() - started, 3),
+        }
+
+    def _command(self, files: List[str], report_path: str) -> List[str]:
+        return [
+            sys.executable, '-m', 'pytest', '-v', '-p', 'no:cacheprovider',
+            '-o', 'junit_family=xunit1', f'--junitxml={report_path}',
+            *self.pytest_args, *files,
+        ]
+
+    def _run_shard(self, files: List[str], on_result: Callable[[Dict[str, object]], None]) -> List[Dict[str, object]]:
+        fd, report_path = tempfile.mkstemp(prefix='test-shard-', suffix='.xml')
+        os.close(fd)
+        try:
+            process = subprocess.Popen(
+                self._command(files, report_path),
+                cwd=self.cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+            )
+            killer = threading.Timer(self.shard_timeout, process.kill)
+            killer.start()
+            try:
+                for line in process.stdout:
+                    result = parse_verbose_line(line)
+                    if result:
+                        on_result(result)
+                process.wait()
+            finally:
+                killer.cancel()
+                process.stdout.close()
+
+            results = parse_junit_xml(report_path)
+            if not results and process.returncode not in (0, 5):
+                # Nothing ran (collection failure, timeout): fail the shard's files
+                results = [
+                    {'nodeid': f, 'file': f, 'name': os.path.basename(f), 'status': 'error',
+                     'duration': 0.0, 'message': f'pytest exited with code {process.returncode}'}
+                    for f in files
+                ]
+            return results
+        finally:
+            try:
+                os.remove(report_path)
+            except OSError:
+                pass
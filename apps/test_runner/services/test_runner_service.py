@@ -1,10 +1,11 @@
 """Test Runner service."""
 import logging
-import subprocess
-import os
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Callable
+from django.conf import settings
 from django.utils import timezone
 from apps.core.services.base_service import BaseService
+from .execution_engine import ShardedTestExecutor, merge_durations
 from .test_storage_service import TestSuiteStorageService
 
 logger = logging.getLogger(__name__)
@@ -50,76 +51,132 @@ class TestRunnerService(BaseService):
             else:
                 user_uuid = str(user)
         
-        # Update suite status
-        self.storage.update_suite(suite_id, status='running')
-        
-        # Run tests (placeholder - would execute actual test framework)
-        # In production, this would use pytest, unittest, jest, etc.
         files_to_run = test_files or suite.get('test_files', []) or []
         
-        # Simulate test execution
-        results = self._execute_tests(files_to_run)
-        
-        # Create test run
+        # Creating the run also marks the suite as running (one write)
         test_run = self.storage.create_run(
             suite_id=suite_id,
             started_by=user_uuid,
             status='running',
-            started_at=timezone.now().isoformat()
+            started_at=timezone.now().isoformat(),
+            progress={'files_total': len(files_to_run), 'files_done': 0},
+        )
+        if not test_run:
+            raise ValueError(f"Test suite not found: {suite_id}")
+        run_id = test_run['run_id']
+        
+        results = self._execute_tests(
+            files_to_run,
+            durations=suite.get('file_durations') or {},
+            persist=lambda snapshot: self.storage.update_run(suite_id, run_id, **snapshot),
         )
         
-        # Update test run with results
-        run_status = 'completed' if results.get('failed', 0) == 0 else 'failed'
-        test_run = self.storage.update_run(
-            test_run.get('run_id'),
+        # Final results, status and learned durations in one write
+        run_status = 'completed' if results['failed'] == 0 and results['errors'] == 0 else 'failed'
+        updated_suite = self.storage.update_run(
+            suite_id,
+            run_id,
+            suite_fields={
+                'file_durations': merge_durations(
+                    suite.get('file_durations') or {}, results.pop('file_durations')
+                ),
+            },
             status=run_status,
             results=results,
-            passed=results.get('passed', 0),
-            failed=results.get('failed', 0),
-            skipped=results.get('skipped', 0),
-            total=results.get('total', 0),
-            completed_at=timezone.now().isoformat()
+            passed=results['passed'],
+            failed=results['failed'] + results['errors'],
+            skipped=results['skipped'],
+            total=results['total'],
+            progress={'files_total': len(files_to_run), 'files_done': len(files_to_run)},
+            completed_at=timezone.now().isoformat(),
         )
         
-        # Update suite status
-        self.storage.update_suite(suite_id, status=run_status)
-        
-        self.logger.info(f"Test run completed: {test_run.get('run_id')}")
+        test_run = next(
+            (run for run in (updated_suite or {}).get('runs', []) if run.get('run_id') == run_id),
+            test_run
+        )
+        self.logger.info(
+            f"Test run completed: {run_id} ({results['total']} tests, "
+            f"{results['shards']} shards, {results['wall_time']}s)"
+        )
         return test_run
     
-    def _execute_tests(self, test_files: List[str]) -> Dict[str, Any]:
+    def _execute_tests(
+        self,
+        test_files: List[str],
+        durations: Optional[Dict[str, float]] = None,
+        persist: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Dict[str, Any]:
         """
-        Execute test files (placeholder implementation).
+        Execute test files as parallel pytest shards.
+        
+        Results streamed from the shards are handed to ``persist`` in batches
+        of TEST_RUNNER_PERSIST_BATCH tests, at most every
+        TEST_RUNNER_PERSIST_INTERVAL seconds, and whenever a shard finishes.
         
         Args:
             test_files: List of test file paths
+            durations: Recorded per-file durations, used to balance shards
+            persist: Called with run fields (counts, results, progress)
             
         Returns:
             Test results dictionary
         """
-        # Placeholder - in production would execute actual test framework
-        # This is a simplified version
-        results = {
-            'passed': 0,
-            'failed': 0,
-            'skipped': 0,
-            'total': 0,
-            'tests': []
-        }
-        
-        for test_file in test_files:
-            if os.path.exists(test_file):
-                # Simulate test execution
-                results['total'] += 1
-                results['passed'] += 1
-                results['tests'].append({
-                    'file': test_file,
-                    'status': 'passed',
-                    'duration': 0.5
+        batch_size = getattr(settings, 'TEST_RUNNER_PERSIST_BATCH', 50)
+        interval = getattr(settings, 'TEST_RUNNER_PERSIST_INTERVAL', 2.0)
+        tests: Dict[str, Dict[str, Any]] = {}
+        state = {'unsaved': 0, 'saved_at': time.monotonic(), 'files_done': 0}
+        
+        def flush():
+            if persist:
+                summary = self._summarize(list(tests.values()))
+                persist({
+                    'results': summary,
+                    'passed': summary['passed'],
+                    'failed': summary['failed'] + summary['errors'],
+                    'skipped': summary['skipped'],
+                    'total': summary['total'],
+                    'progress': {'files_total': len(test_files), 'files_done': state['files_done']},
                 })
-        
+            state['unsaved'] = 0
+            state['saved_at'] = time.monotonic()
+        
+        def on_result(result):
+            tests[result['nodeid']] = result
+            state['unsaved'] += 1
+            if state['unsaved'] >= batch_size or time.monotonic() - state['saved_at'] >= interval:
+                flush()
+        
+        def on_shard_done(shard_results):
+            # JUnit results are authoritative (durations, messages, teardown errors)
+            files = {result['file'] for result in shard_results}
+            for nodeid in [n for n, t in tests.items() if t['file'] in files]:
+                del tests[nodeid]
+            for result in shard_results:
+                tests[result['nodeid']] = result
+            state['files_done'] += len(files)
+            flush()
+        
+        outcome = ShardedTestExecutor().run(
+            test_files, durations=durations, on_result=on_result, on_shard_done=on_shard_done
+        )
+        results = self._summarize(outcome['tests'])
+        results.update(
+            file_durations=outcome['file_durations'],
+            shards=outcome['shards'],
+            wall_time=outcome['wall_time'],
+        )
         return results
     
+    @staticmethod
+    def _summarize(tests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Counts per status plus the test list."""
+        counts = {'passed': 0, 'failed': 0, 'errors': 0, 'skipped': 0}
+        for test in tests:
+            key = 'errors' if test['status'] == 'error' else test['status']
+            counts[key] = counts.get(key, 0) + 1
+        return {**counts, 'total': len(tests), 'tests': tests}
+    
     def get_results(self, run_id: str) -> Optional[Dict[str, Any]]:
         """
         Get test run results.
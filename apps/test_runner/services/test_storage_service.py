@@ -69,9 +69,10 @@ class TestSuiteStorageService(S3ModelStorage):
     def create_run(
         self,
         suite_id: str,
-        started_by: Optional[str] = None
+        started_by: Optional[str] = None,
+        **fields
     ) -> Optional[Dict[str, Any]]:
-        """Create a new test run for a suite."""
+        """Create a new test run for a suite; ``fields`` override the run defaults."""
         suite = self.get_suite(suite_id)
         if not suite:
             return None
@@ -91,6 +92,7 @@ class TestSuiteStorageService(S3ModelStorage):
             'started_at': None,
             'completed_at': None,
             'created_at': now,
+            **fields,
         }
         
         # Add run to suite's runs list
@@ -98,10 +100,11 @@ class TestSuiteStorageService(S3ModelStorage):
         runs.append(run_data)
         
         # Update suite status
-        updated_suite = self.update_suite(suite_id, {
-            'runs': runs,
-            'status': 'running' if suite.get('status') == 'pending' else suite.get('status')
-        })
+        if run_data['status'] == 'running':
+            suite_status = 'running'
+        else:
+            suite_status = 'running' if suite.get('status') == 'pending' else suite.get('status')
+        updated_suite = self.update_suite(suite_id, runs=runs, status=suite_status)
         
         return run_data if updated_suite else None
     
@@ -109,9 +112,15 @@ class TestSuiteStorageService(S3ModelStorage):
         self,
         suite_id: str,
         run_id: str,
+        suite_fields: Optional[Dict[str, Any]] = None,
         **kwargs
     ) -> Optional[Dict[str, Any]]:
-        """Update a test run."""
+        """
+        Update a test run.
+
+        ``suite_fields`` are written to the suite in the same update.
+        Returns the updated suite.
+        """
         suite = self.get_suite(suite_id)
         if not suite:
             return None
@@ -143,10 +152,7 @@ class TestSuiteStorageService(S3ModelStorage):
             if run_status in ['completed', 'failed']:
                 suite_status = run_status
         
-        return self.update_suite(suite_id, {
-            'runs': runs,
-            'status': suite_status
-        })
+        return self.update_suite(suite_id, runs=runs, status=suite_status, **(suite_fields or {}))
     
     def get_runs(self, suite_id: str) -> List[Dict[str, Any]]:
         """Get all runs for a test suite."""
@@ -154,3 +160,10 @@ class TestSuiteStorageService(S3ModelStorage):
         if not suite:
             return []
         return suite.get('runs', [])
+    
+    def get_run(self, suite_id: str, run_id: str) -> Optional[Dict[str, Any]]:
+        """Get one run of a test suite."""
+        for run in self.get_runs(suite_id):
+            if run.get('run_id') == run_id:
+                return run
+        return None
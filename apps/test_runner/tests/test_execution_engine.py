@@ -0,0 +1,147 @@
+"""Tests for sharded test execution and batched run persistence."""
+import os
+import tempfile
+import textwrap
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.tests.helpers import FakeJSONStorage
+from apps.test_runner.services.execution_engine import (
+    ShardedTestExecutor,
+    merge_durations,
+    parse_junit_xml,
+    parse_verbose_line,
+    plan_shards,
+)
+from apps.test_runner.services.test_runner_service import TestRunnerService
+
+JUNIT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" tests="3">
+<testcase classname="pkg.test_a.TestThing" name="test_ok" file="pkg/test_a.py" time="0.25"/>
+<testcase classname="pkg.test_a" name="test_bad" file="pkg/test_a.py" time="1.5">
+  <failure message="assert 1 == 2">trace</failure>
+</testcase>
+<testcase classname="pkg.test_b" name="test_skip[x-1]" file="pkg/test_b.py" time="0">
+  <skipped message="not today"/>
+</testcase>
+</testsuite></testsuites>
+"""
+
+
+def _write_suite(directory, count):
+    files = []
+    for n in range(count):
+        name = f'test_mod{n}.py'
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write(textwrap.dedent(f'''
+                import pytest
+
+                def test_pass_{n}():
+                    assert True
+
+                def test_fail_{n}():
+                    assert {n} == -1
+
+                @pytest.mark.skip(reason="later")
+                def test_skip_{n}():
+                    pass
+            '''))
+        files.append(name)
+    return files
+
+
+class ShardPlanningTest(SimpleTestCase):
+
+    def test_shards_are_balanced_on_recorded_durations(self):
+        durations = {'a.py': 3, 'b.py': 9, 'c.py': 4, 'd.py': 3, 'e.py': 5}
+        shards = plan_shards(list(durations), durations, 2)
+        loads = sorted(sum(durations[f] for f in shard) for shard in shards)
+        self.assertEqual(loads, [12, 12])
+
+    def test_unknown_files_get_mean_weight_and_shards_never_empty(self):
+        shards = plan_shards(['a.py', 'b.py', 'new.py'], {'a.py': 4, 'b.py': 2}, 8)
+        self.assertEqual(len(shards), 3)
+        self.assertEqual(sorted(f for shard in shards for f in shard), ['a.py', 'b.py', 'new.py'])
+
+    def test_merge_durations_smooths_known_files(self):
+        self.assertEqual(merge_durations({'a.py': 2.0}, {'a.py': 4.0, 'b.py': 1.0}), {'a.py': 3.0, 'b.py': 1.0})
+
+
+class ReportParsingTest(SimpleTestCase):
+
+    def test_verbose_lines(self):
+        self.assertEqual(
+            parse_verbose_line('pkg/test_a.py::TestThing::test_ok PASSED          [ 50%]\n'),
+            {'nodeid': 'pkg/test_a.py::TestThing::test_ok', 'file': 'pkg/test_a.py', 'status': 'passed'},
+        )
+        self.assertEqual(parse_verbose_line('pkg/test_b.py::test_x[a b] XFAIL (reason)')['status'], 'skipped')
+        self.assertIsNone(parse_verbose_line('FAILED pkg/test_a.py::test_bad - assert 1 == 2'))
+        self.assertIsNone(parse_verbose_line('collected 3 items'))
+
+    def test_junit_report(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.xml', delete=False) as f:
+            f.write(JUNIT)
+        self.addCleanup(os.remove, f.name)
+        results = {r['nodeid']: r for r in parse_junit_xml(f.name)}
+        self.assertEqual(set(results), {
+            'pkg/test_a.py::TestThing::test_ok', 'pkg/test_a.py::test_bad', 'pkg/test_b.py::test_skip[x-1]',
+        })
+        self.assertEqual(results['pkg/test_a.py::test_bad']['status'], 'failed')
+        self.assertEqual(results['pkg/test_a.py::test_bad']['message'], 'assert 1 == 2')
+        self.assertEqual(results['pkg/test_a.py::test_bad']['duration'], 1.5)
+        self.assertEqual(results['pkg/test_b.py::test_skip[x-1]']['status'], 'skipped')
+
+
+class ShardedExecutionTest(SimpleTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.files = _write_suite(self.tmp.name, 4)
+        # The shard processes run outside this project, so don't hand them our Django settings
+        environ = mock.patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+        os.environ.pop('DJANGO_SETTINGS_MODULE', None)
+
+    def test_runs_shards_in_parallel_and_streams_results(self):
+        streamed, shards_done = [], []
+        outcome = ShardedTestExecutor(max_workers=2, cwd=self.tmp.name).run(
+            self.files, on_result=streamed.append, on_shard_done=shards_done.append
+        )
+        statuses = sorted(t['status'] for t in outcome['tests'])
+        self.assertEqual(statuses, ['failed'] * 4 + ['passed'] * 4 + ['skipped'] * 4)
+        self.assertEqual(outcome['shards'], 2)
+        self.assertEqual(len(shards_done), 2)
+        self.assertEqual(len(streamed), 12)
+        self.assertEqual(set(outcome['file_durations']), set(self.files))
+
+    @override_settings(TEST_RUNNER_PERSIST_BATCH=5, TEST_RUNNER_PERSIST_INTERVAL=60, TEST_RUNNER_MAX_WORKERS=2)
+    def test_run_tests_persists_batches_and_learns_durations(self):
+        service = TestRunnerService()
+        service.storage.model_name = service.storage.cache_prefix = f'test-suites-{id(self)}:'
+        service.storage.s3_json_storage = FakeJSONStorage()
+        suite = service.storage.create_suite('demo', test_files=self.files)
+
+        snapshots = []
+        real_update_run = service.storage.update_run
+
+        def recording_update_run(suite_id, run_id, **kwargs):
+            snapshots.append(kwargs)
+            return real_update_run(suite_id, run_id, **kwargs)
+
+        service.storage.update_run = recording_update_run
+        with override_settings(BASE_DIR=self.tmp.name):
+            run = service.run_tests(suite['suite_id'], user='user-1')
+
+        self.assertEqual(run['status'], 'failed')
+        self.assertEqual((run['passed'], run['failed'], run['skipped'], run['total']), (4, 4, 4, 12))
+        self.assertEqual(run['progress'], {'files_total': 4, 'files_done': 4})
+        # 12 streamed results in batches of 5, plus one flush per shard, plus the final write
+        self.assertLess(len(snapshots), 12)
+        self.assertIn('suite_fields', snapshots[-1])
+        stored = service.storage.get_suite(suite['suite_id'])
+        self.assertEqual(stored['status'], 'failed')
+        self.assertEqual(set(stored['file_durations']), set(self.files))
+        self.assertEqual(service.storage.get_run(suite['suite_id'], run['run_id'])['total'], 12)
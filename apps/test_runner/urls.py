@@ -6,4 +6,5 @@ app_name = 'test_runner'
 
 urlpatterns = [
     path('', views.test_runner_view, name='dashboard'),
+    path('suites/<str:suite_id>/runs/<str:run_id>/progress/', views.run_progress_api, name='run_progress_api'),
 ]
@@ -1,5 +1,7 @@
 """Test Runner views."""
+from django.http import JsonResponse
 from django.shortcuts import render
+from django.views.decorators.http import require_http_methods
 from apps.core.decorators.auth import require_super_admin
 from .services.test_storage_service import TestSuiteStorageService
 
@@ -42,3 +44,32 @@ def test_runner_view(request):
         }
     }
     return render(request, 'test_runner/dashboard.html', context)
+
+
+@require_super_admin
+@require_http_methods(["GET"])
+def run_progress_api(request, suite_id, run_id):
+    """Live progress of a test run; per-test results only with ?tests=1."""
+    run = TestSuiteStorageService().get_run(suite_id, run_id)
+    if not run:
+        return JsonResponse({'error': 'Test run not found'}, status=404)
+
+    results = dict(run.get('results') or {})
+    tests = results.pop('tests', [])
+    payload = {
+        'run_id': run_id,
+        'status': run.get('status'),
+        'passed': run.get('passed', 0),
+        'failed': run.get('failed', 0),
+        'skipped': run.get('skipped', 0),
+        'total': run.get('total', 0),
+        'progress': run.get('progress', {}),
+        'results': results,
+        'started_at': run.get('started_at'),
+        'completed_at': run.get('completed_at'),
+    }
+    if request.GET.get('tests') == '1':
+        payload['tests'] = tests
+    else:
+        payload['failures'] = [t for t in tests if t.get('status') in ('failed', 'error')]
+    return JsonResponse(payload)
@@ -222,6 +222,15 @@ else:
 
 Q_CLUSTER = _q_cluster_config
 
+# Durgasflow in-app scheduler (run with `manage.py run_durgasflow_scheduler`)
+# When enabled, schedule/interval workflows are fired by the scheduler instead
+# of per-workflow Django-Q schedules.
+DURGASFLOW_SCHEDULER_ENABLED = os.getenv('DURGASFLOW_SCHEDULER_ENABLED', 'False').lower() == 'true'
+DURGASFLOW_SCHEDULER_MAX_JITTER_SECONDS = float(os.getenv('DURGASFLOW_SCHEDULER_MAX_JITTER_SECONDS', '30'))
+DURGASFLOW_SCHEDULER_MISFIRE_GRACE_SECONDS = float(os.getenv('DURGASFLOW_SCHEDULER_MISFIRE_GRACE_SECONDS', '60'))
+DURGASFLOW_SCHEDULER_MAX_CATCH_UP_RUNS = int(os.getenv('DURGASFLOW_SCHEDULER_MAX_CATCH_UP_RUNS', '10'))
+DURGASFLOW_SCHEDULER_MAX_QUEUED_RUNS = int(os.getenv('DURGASFLOW_SCHEDULER_MAX_QUEUED_RUNS', '3'))
+
 # Django cache - Local Memory Cache by default (per-process, no Redis required)
 # Set USE_REDIS_CACHE=True and configure Redis to use Redis instead.
 _redis_location = None
@@ -270,6 +279,69 @@ AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
 S3_BUCKET_NAME = os.getenv('S3_BUCKET_NAME', 'contact360docs')
 S3_DATA_PREFIX = os.getenv('S3_DATA_PREFIX', 'data/')
 S3_DOCUMENTATION_PREFIX = os.getenv('S3_DOCUMENTATION_PREFIX', 'documentation/')
+# Shared S3 client (apps/core/services/s3_client.py); empty endpoint = AWS
+AWS_S3_ENDPOINT_URL = os.getenv('AWS_S3_ENDPOINT_URL', '')
+S3_MAX_POOL_CONNECTIONS = int(os.getenv('S3_MAX_POOL_CONNECTIONS', '50'))
+S3_RETRY_MODE = os.getenv('S3_RETRY_MODE', 'adaptive')
+S3_MAX_ATTEMPTS = int(os.getenv('S3_MAX_ATTEMPTS', '5'))
+S3_CONNECT_TIMEOUT = int(os.getenv('S3_CONNECT_TIMEOUT', '5'))
+S3_READ_TIMEOUT = int(os.getenv('S3_READ_TIMEOUT', '60'))
+S3_MULTIPART_THRESHOLD_MB = int(os.getenv('S3_MULTIPART_THRESHOLD_MB', '8'))
+S3_MULTIPART_CHUNKSIZE_MB = int(os.getenv('S3_MULTIPART_CHUNKSIZE_MB', '8'))
+S3_TRANSFER_MAX_CONCURRENCY = int(os.getenv('S3_TRANSFER_MAX_CONCURRENCY', '10'))
+# ETag-validated cache for S3JSONStorage reads; empty dir = memory-only
+S3_OBJECT_CACHE_ENABLED = os.getenv('S3_OBJECT_CACHE_ENABLED', 'True').lower() == 'true'
+S3_OBJECT_CACHE_DIR = os.getenv('S3_OBJECT_CACHE_DIR', str(BASE_DIR / '.cache' / 's3_objects'))
+S3_OBJECT_CACHE_MEMORY_ENTRIES = int(os.getenv('S3_OBJECT_CACHE_MEMORY_ENTRIES', '256'))
+# Disk budget of the S3 object cache; least recently used entries are pruned first
+S3_OBJECT_CACHE_DISK_MB = int(os.getenv('S3_OBJECT_CACHE_DISK_MB', '256'))
+# Seconds before the in-process relationship graph reloads a table even if its generation is unchanged
+RELATIONSHIP_GRAPH_MAX_AGE = int(os.getenv('RELATIONSHIP_GRAPH_MAX_AGE', '300'))
+# Write markers for API v1 ETag generations when the default cache is per-process
+DOCS_GENERATION_DIR = os.getenv('DOCS_GENERATION_DIR', str(BASE_DIR / '.cache' / 'docs_generation'))
+# Concurrent uploads used by media -> S3 sync (MediaSyncService)
+MEDIA_SYNC_MAX_WORKERS = int(os.getenv('MEDIA_SYNC_MAX_WORKERS', '8'))
+# Concurrent item GETs when S3ModelStorage.list loads a page of items
+S3_MODEL_FETCH_WORKERS = int(os.getenv('S3_MODEL_FETCH_WORKERS', '8'))
+# How long (ms) the first writer of an S3 model index waits to combine concurrent changes into one write
+S3_INDEX_WRITE_COALESCE_MS = int(os.getenv('S3_INDEX_WRITE_COALESCE_MS', '10'))
+# Conditional (ETag) index write attempts after losing a race to another process
+S3_INDEX_WRITE_MAX_RETRIES = int(os.getenv('S3_INDEX_WRITE_MAX_RETRIES', '8'))
+# Parallel pytest shards per test-runner run (0 = CPU count) and per-shard time limit (s)
+TEST_RUNNER_MAX_WORKERS = int(os.getenv('TEST_RUNNER_MAX_WORKERS', '0'))
+TEST_RUNNER_SHARD_TIMEOUT = int(os.getenv('TEST_RUNNER_SHARD_TIMEOUT', '1800'))
+# Streamed test results are saved to the run every N results or every N seconds
+TEST_RUNNER_PERSIST_BATCH = int(os.getenv('TEST_RUNNER_PERSIST_BATCH', '50'))
+TEST_RUNNER_PERSIST_INTERVAL = float(os.getenv('TEST_RUNNER_PERSIST_INTERVAL', '2'))
+# Background operation jobs: a run re-queues itself after this many seconds so it never hits the Django-Q timeout
+OPERATION_JOB_SLICE_SECONDS = int(os.getenv('OPERATION_JOB_SLICE_SECONDS', str(_q_cluster_config['timeout'] * 4 // 5)))
+# How often (s) a job saves its progress, and after how long without one a 'running' job may be resumed
+OPERATION_PROGRESS_INTERVAL = float(os.getenv('OPERATION_PROGRESS_INTERVAL', '2'))
+OPERATION_JOB_STALE_SECONDS = int(os.getenv('OPERATION_JOB_STALE_SECONDS', '600'))
+# Operation progress SSE stream: poll interval (s) and lifetime (s) before the client reconnects
+OPERATION_EVENTS_POLL_SECONDS = float(os.getenv('OPERATION_EVENTS_POLL_SECONDS', '1'))
+OPERATION_EVENTS_MAX_SECONDS = int(os.getenv('OPERATION_EVENTS_MAX_SECONDS', '25'))
+# Wall-clock cap for one streamed AI chat reply; keep below the gunicorn worker timeout
+AI_CHAT_STREAM_MAX_SECONDS = int(os.getenv('AI_CHAT_STREAM_MAX_SECONDS', '25'))
+# Concurrent in-flight requests per LLM provider (per process)
+AI_OPENAI_MAX_CONCURRENCY = int(os.getenv('AI_OPENAI_MAX_CONCURRENCY', '8'))
+AI_GEMINI_MAX_CONCURRENCY = int(os.getenv('AI_GEMINI_MAX_CONCURRENCY', '8'))
+AI_LAMBDA_MAX_CONCURRENCY = int(os.getenv('AI_LAMBDA_MAX_CONCURRENCY', '4'))
+# Seconds to wait for a provider slot before falling back to the next provider
+AI_PROVIDER_ACQUIRE_TIMEOUT = float(os.getenv('AI_PROVIDER_ACQUIRE_TIMEOUT', '10'))
+# In-process cache of one-shot LLM responses (explain/document/workflow prompts); TTL 0 disables
+AI_RESPONSE_CACHE_TTL = int(os.getenv('AI_RESPONSE_CACHE_TTL', '3600'))
+AI_RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('AI_RESPONSE_CACHE_MAX_ENTRIES', '512'))
+# How long the documentation system context prepended to chats is reused
+AI_SYSTEM_CONTEXT_TTL = int(os.getenv('AI_SYSTEM_CONTEXT_TTL', '300'))
+# Process pool size for CodebaseAnalysisService scans; 0 = CPU count
+CODEBASE_SCAN_MAX_WORKERS = int(os.getenv('CODEBASE_SCAN_MAX_WORKERS', '0'))
+# Fraction (0.0-1.0) of API responses checked by the validate_response* decorators
+RESPONSE_VALIDATION_SAMPLE_RATE = float(os.getenv('RESPONSE_VALIDATION_SAMPLE_RATE', '1.0'))
+# JSON codec (apps.core.utils.json_codec): 'auto' prefers orjson, falls back to stdlib
+JSON_CODEC_BACKEND = os.getenv('JSON_CODEC_BACKEND', 'auto')
+# Indent machine-written JSON files (media indexes, S3 objects); compact by default
+JSON_PRETTY_FILES = os.getenv('JSON_PRETTY_FILES', 'False').lower() == 'true'
 
 # Lambda API Configuration
 # LAMBDA_DOCUMENTATION_API_* removed - services now use local/S3/GraphQL directly
@@ -318,6 +390,12 @@ LOGS_API_URL = os.getenv('LOGS_API_URL', 'https://ow8pbf850l.execute-api.us-east
 LOGS_API_KEY = os.getenv('LOGS_API_KEY', 'bc7a0177de676a8e8bd98c2a0e6f96152b7b1ae1e72eb3d108ed13d5f01fd9bd')
 LOGS_API_ENABLED = bool(LOGS_API_URL and LOGS_API_KEY)
 LOGS_API_TIMEOUT = int(os.getenv('LOGS_API_TIMEOUT', '30'))
+# Keep-alive connection pool shared by all LogsApiClient instances (HTTP/2 needs the h2 package)
+LOGS_API_MAX_CONNECTIONS = int(os.getenv('LOGS_API_MAX_CONNECTIONS', '20'))
+LOGS_API_HTTP2 = os.getenv('LOGS_API_HTTP2', 'True').lower() == 'true'
+# Seconds identical statistics / log queries are served from cache (0 disables)
+LOGS_API_STATS_CACHE_TTL = int(os.getenv('LOGS_API_STATS_CACHE_TTL', '60'))
+LOGS_API_QUERY_CACHE_TTL = int(os.getenv('LOGS_API_QUERY_CACHE_TTL', '15'))
 
 
 def validate_logs_api_config():
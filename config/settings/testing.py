@@ -4,6 +4,9 @@ Testing settings for docsai project.
 These settings are used when running tests (DJANGO_ENV=testing or pytest)
 """
 
+import os
+import tempfile
+
 from .base import *  # noqa
 
 # Override base settings for testing
@@ -33,6 +36,15 @@ PASSWORD_HASHERS = [
 # Email backend - use locmem for tests
 EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
 
+# Keep the S3 object cache in memory so tests never share on-disk entries
+S3_OBJECT_CACHE_DIR = ''
+
+# Keep ETag generation markers out of the checkout
+DOCS_GENERATION_DIR = os.path.join(tempfile.gettempdir(), 'docsai-test-generation')
+
+# Commit S3 model index changes immediately instead of waiting to combine them
+S3_INDEX_WRITE_COALESCE_MS = 0
+
 # Disable logging during tests
 LOGGING = {
     'version': 1,
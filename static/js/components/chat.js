@@ -10,10 +10,11 @@ document.addEventListener('DOMContentLoaded', function() {
     const clearButton = document.getElementById('clear-chat');
     
     // Config from data attributes
-    const sessionId = container.dataset.sessionId || '';
+    let sessionId = container.dataset.sessionId || '';
     const userInitials = container.dataset.userInitials || 'U';
     const csrfToken = document.querySelector('[name=csrfmiddlewaretoken]')?.value;
     const chatEndpoint = container.dataset.chatEndpoint;
+    const chatStreamEndpoint = container.dataset.chatStreamEndpoint;
 
     let isLoading = false;
     
@@ -51,6 +52,17 @@ document.addEventListener('DOMContentLoaded', function() {
             // Show loading indicator
             const loadingId = showLoadingIndicator();
             
+            if (chatStreamEndpoint && window.ReadableStream && window.TextDecoder) {
+                try {
+                    await streamReply(message, loadingId);
+                } finally {
+                    isLoading = false;
+                    sendButton.disabled = false;
+                    input.focus();
+                }
+                return;
+            }
+            
             try {
                 const useContext = document.getElementById('use-context')?.checked || false;
                 
@@ -91,6 +103,72 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
     
+    // Relay the SSE reply from chatStreamEndpoint into one assistant bubble
+    async function streamReply(message, loadingId) {
+        let messageEl = null;
+        let text = '';
+        const removeLoading = () => {
+            const loadingEl = document.getElementById(loadingId);
+            if (loadingEl) loadingEl.remove();
+        };
+        const appendText = (chunk) => {
+            if (!messageEl) {
+                removeLoading();
+                messageEl = document.querySelector(`#${addMessage('assistant', '')} p`);
+            }
+            text += chunk;
+            messageEl.textContent = text;
+            messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        };
+        
+        try {
+            const response = await fetch(chatStreamEndpoint, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Accept': 'text/event-stream',
+                    'X-CSRFToken': csrfToken
+                },
+                body: JSON.stringify({ message: message, session_id: sessionId })
+            });
+            if (!response.ok || !response.body) throw new Error(`HTTP ${response.status}`);
+            
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            for (;;) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                let boundary;
+                while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                    const frame = buffer.slice(0, boundary);
+                    buffer = buffer.slice(boundary + 2);
+                    const event = (frame.match(/^event: (.*)$/m) || [])[1];
+                    const data = JSON.parse((frame.match(/^data: (.*)$/m) || [])[1] || '{}');
+                    if (event === 'start' && data.session_id) {
+                        sessionId = data.session_id;
+                    } else if (event === 'token') {
+                        appendText(data.content || '');
+                    } else if (event === 'done') {
+                        if (!messageEl) appendText('');
+                        // Same references block the non-streaming reply renders
+                        messageEl.insertAdjacentHTML('afterend', renderGroundingSources('assistant', data.groundingSources));
+                    } else if (event === 'error') {
+                        appendText(text ? '\n\n[Response interrupted]' : 'Sorry, I encountered an error. Please try again.');
+                    } else if (event === 'cancelled' && !text) {
+                        appendText('[Response cancelled]');
+                    }
+                }
+            }
+            if (!messageEl) appendText('');
+        } catch (error) {
+            removeLoading();
+            if (!messageEl) addMessage('assistant', 'Sorry, I encountered an error. Please try again.');
+            console.error(error);
+        }
+    }
+    
     if (clearButton) {
         clearButton.addEventListener('click', function() {
             const messages = messagesContainer.querySelectorAll('.chat-message');
@@ -99,6 +177,22 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
     
+    function renderGroundingSources(role, groundingSources) {
+        if (!groundingSources || groundingSources.length === 0) return '';
+        return `
+            <div class="mt-4 pt-4 border-t ${role === 'user' ? 'border-gray-200/20' : 'border-gray-200 dark:border-gray-600'}">
+                <p class="text-[10px] font-bold mb-2 ${role === 'user' ? 'opacity-80' : 'text-gray-500 dark:text-gray-400'} uppercase tracking-widest">Knowledge Base References:</p>
+                <div class="flex flex-wrap gap-2">
+                    ${groundingSources.map(s => `
+                        <a href="${s.uri || '#'}" target="_blank" rel="noopener noreferrer" class="text-[10px] px-3 py-1.5 rounded-lg transition-colors border ${role === 'user' ? 'bg-blue-500 hover:bg-blue-400 text-white border-blue-400' : 'bg-gray-50 dark:bg-gray-700 hover:bg-gray-100 dark:hover:bg-gray-600 text-gray-600 dark:text-gray-300 border-gray-100 dark:border-gray-600'}">
+                            ${s.title || 'Reference'}
+                        </a>
+                    `).join('')}
+                </div>
+            </div>
+        `;
+    }
+    
     function addMessage(role, content, groundingSources = []) {
         const messageId = 'msg-' + Date.now();
         const messageDiv = document.createElement('div');
@@ -107,21 +201,7 @@ document.addEventListener('DOMContentLoaded', function() {
         
         const timestamp = new Date().toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
         
-        let groundingHtml = '';
-        if (groundingSources && groundingSources.length > 0) {
-            groundingHtml = `
-                <div class="mt-4 pt-4 border-t ${role === 'user' ? 'border-gray-200/20' : 'border-gray-200 dark:border-gray-600'}">
-                    <p class="text-[10px] font-bold mb-2 ${role === 'user' ? 'opacity-80' : 'text-gray-500 dark:text-gray-400'} uppercase tracking-widest">Knowledge Base References:</p>
-                    <div class="flex flex-wrap gap-2">
-                        ${groundingSources.map(s => `
-                            <a href="${s.uri || '#'}" target="_blank" rel="noopener noreferrer" class="text-[10px] px-3 py-1.5 rounded-lg transition-colors border ${role === 'user' ? 'bg-blue-500 hover:bg-blue-400 text-white border-blue-400' : 'bg-gray-50 dark:bg-gray-700 hover:bg-gray-100 dark:hover:bg-gray-600 text-gray-600 dark:text-gray-300 border-gray-100 dark:border-gray-600'}">
-                                ${s.title || 'Reference'}
-                            </a>
-                        `).join('')}
-                    </div>
-                </div>
-            `;
-        }
+        const groundingHtml = renderGroundingSources(role, groundingSources);
         
         messageDiv.innerHTML = `
             <div class="max-w-[85%] flex gap-4 ${role === 'user' ? 'flex-row-reverse' : 'flex-row'}">